@@ -1,7 +1,12 @@
 #  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
 
+import dataclasses
+import hashlib
+import json
 import logging
-from typing import Any, Optional, Tuple
+import os
+import tempfile
+from typing import IO, Any, Callable, List, Optional, Tuple
 
 import numpy as np
 from osgeo import gdal
@@ -19,19 +24,28 @@ class GDALDigitalElevationModelTileFactory(DigitalElevationModelTileFactory):
     """
     This tile factory uses GDAL to load elevation data into numpy arrays. Any raster format supported by GDAL is
     fair game but the format must have sufficient metadata to populate the GDAL geo transform.
+
+    An optional local cache directory can be provided. Each tile is then only decoded once; the elevations are
+    written to the cache as a raw .npy file alongside a JSON sidecar containing the geo transform and summary.
+    Subsequent requests, including those from other processes sharing the cache, open the .npy file as a read-only
+    memory map so the tile is backed by the operating system's page cache instead of being decoded again.
     """
 
-    def __init__(self, tile_directory: str) -> None:
+    def __init__(self, tile_directory: str, cache_directory: Optional[str] = None) -> None:
         """
         Constructor for the factory that takes in the root location of the elevation tiles. If the root starts with
         s3:/ then GDAL's VSIS3 virtual file system will be used to read rasters directly from cloud storage.
 
         :param tile_directory: the root tile location, may be an S3 URL
+        :param cache_directory: an optional local directory used to store decoded tiles as memory mapped arrays
 
         :return: None
         """
         super().__init__()
         self.tile_directory = tile_directory
+        self.cache_directory = cache_directory
+        if self.cache_directory:
+            os.makedirs(self.cache_directory, exist_ok=True)
 
     def get_tile(
         self, tile_path: str
@@ -47,6 +61,11 @@ class GDALDigitalElevationModelTileFactory(DigitalElevationModelTileFactory):
         """
         tile_location = f"{self.tile_directory}/{tile_path}"
         tile_location = tile_location.replace("s3:/", "/vsis3", 1)
+        if self.cache_directory:
+            cached_tile = self._read_cached_tile(tile_location)
+            if cached_tile is not None:
+                return cached_tile
+
         ds = gdal.Open(tile_location)
 
         # It isn't unusual for a DEM tile set to be missing tiles for regions (particularly over the ocean). If
@@ -67,18 +86,244 @@ class GDALDigitalElevationModelTileFactory(DigitalElevationModelTileFactory):
         height, width = band_as_array.shape
         sensor_model = GDALAffineSensorModel(geo_transform)
 
-        # Compute the distance in meters from the upper left to the lower right corner. Divide that by the distance
-        # in pixels to get an approximate pixel size in meters
-        ul_corner_ecf = geodetic_to_geocentric(sensor_model.image_to_world(ImageCoordinate([0, 0]))).coordinate
-        lr_corner_ecf = geodetic_to_geocentric(sensor_model.image_to_world(ImageCoordinate([width, height]))).coordinate
-        post_spacing = np.linalg.norm(ul_corner_ecf - lr_corner_ecf) / np.sqrt(width * width + height * height)
-
         stats = raster_band.GetStatistics(True, True)
         summary = ElevationRegionSummary(
             min_elevation=stats[0],
             max_elevation=stats[1],
             no_data_value=raster_band.GetNoDataValue(),
-            post_spacing=post_spacing,
+            post_spacing=self._compute_post_spacing(sensor_model, width, height),
         )
 
+        if self.cache_directory:
+            band_as_array = self._write_cached_tile(tile_location, band_as_array, geo_transform, summary)
+
+        return band_as_array, sensor_model, summary
+
+    def get_tile_window(
+        self, tile_path: str, bounds: Tuple[float, float, float, float]
+    ) -> Tuple[Optional[Any], Optional[GDALAffineSensorModel], Optional[ElevationRegionSummary]]:
+        """
+        Retrieve the elevation values of a tile that cover a longitude, latitude window. For north-up tiles only the
+        posts inside the window, plus a small margin for interpolation, are read from the raster. If a cache
+        directory is configured the tile is decoded into the cache once and the window is a slice of the memory
+        mapped array. Tiles with rotated geo transforms are returned whole.
+
+        :param tile_path: the location of the tile to load
+        :param bounds: the (min longitude, min latitude, max longitude, max latitude) of the window in radians
+
+        :return: an array of elevation values, a sensor model, and a summary or (None, None, None)
+        """
+        if self.cache_directory:
+            elevations, sensor_model, summary = self.get_tile(tile_path)
+            if elevations is None:
+                return None, None, None
+            transform = sensor_model.transform
+            geo_transform = [
+                transform[0, 2],
+                transform[0, 0],
+                transform[0, 1],
+                transform[1, 2],
+                transform[1, 0],
+                transform[1, 1],
+            ]
+            window = self._compute_window(geo_transform, elevations.shape[1], elevations.shape[0], bounds)
+            if window is None:
+                return elevations, sensor_model, summary
+            xoff, yoff, xsize, ysize = window
+            if xsize == 0 or ysize == 0:
+                return None, None, None
+            return (
+                elevations[yoff : yoff + ysize, xoff : xoff + xsize],
+                GDALAffineSensorModel(self._offset_geo_transform(geo_transform, xoff, yoff)),
+                summary,
+            )
+
+        tile_location = f"{self.tile_directory}/{tile_path}"
+        tile_location = tile_location.replace("s3:/", "/vsis3", 1)
+        ds = gdal.Open(tile_location)
+        if not ds:
+            logging.debug(f"No DEM tile available for {tile_path}. Checked {tile_location}")
+            return None, None, None
+        geo_transform = ds.GetGeoTransform(can_return_null=True)
+        if not geo_transform:
+            logging.warning(f"DEM tile does not have geo transform metadata and can't be used: {tile_location}")
+            return None, None, None
+
+        window = self._compute_window(geo_transform, ds.RasterXSize, ds.RasterYSize, bounds)
+        if window is None:
+            return self.get_tile(tile_path)
+        xoff, yoff, xsize, ysize = window
+        if xsize == 0 or ysize == 0:
+            return None, None, None
+
+        raster_band = ds.GetRasterBand(1)
+        band_as_array = raster_band.ReadAsArray(xoff, yoff, xsize, ysize)
+        sensor_model = GDALAffineSensorModel(self._offset_geo_transform(geo_transform, xoff, yoff))
+
+        # Statistics for the whole band would require reading the full tile so the summary describes the window
+        no_data_value = raster_band.GetNoDataValue()
+        valid_elevations = band_as_array[np.isfinite(band_as_array)]
+        if no_data_value is not None:
+            valid_elevations = valid_elevations[valid_elevations != no_data_value]
+        summary = ElevationRegionSummary(
+            min_elevation=float(valid_elevations.min()) if valid_elevations.size > 0 else np.nan,
+            max_elevation=float(valid_elevations.max()) if valid_elevations.size > 0 else np.nan,
+            no_data_value=no_data_value,
+            post_spacing=self._compute_post_spacing(sensor_model, xsize, ysize),
+        )
         return band_as_array, sensor_model, summary
+
+    @staticmethod
+    def _compute_window(
+        geo_transform: Tuple, width: int, height: int, bounds: Tuple[float, float, float, float], margin: int = 2
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Find the posts of a north-up tile that cover a longitude, latitude window. A margin of posts is added on
+        each side so samplers have the neighbors they need to interpolate at the edges of the window.
+
+        :param geo_transform: the GDAL geo transform of the tile
+        :param width: the number of posts in each row of the tile
+        :param height: the number of rows in the tile
+        :param bounds: the (min longitude, min latitude, max longitude, max latitude) of the window in radians
+        :param margin: the number of extra posts to include on each side of the window
+
+        :return: the (x offset, y offset, x size, y size) of the window in posts, a zero size if the window does not
+                 overlap the tile, or None if the tile is not north-up
+        """
+        if geo_transform[2] != 0.0 or geo_transform[4] != 0.0:
+            return None
+        min_lon, min_lat, max_lon, max_lat = np.degrees(bounds)
+        columns = sorted(((min_lon - geo_transform[0]) / geo_transform[1], (max_lon - geo_transform[0]) / geo_transform[1]))
+        rows = sorted(((min_lat - geo_transform[3]) / geo_transform[5], (max_lat - geo_transform[3]) / geo_transform[5]))
+        xoff = min(max(int(np.floor(columns[0])) - margin, 0), width)
+        yoff = min(max(int(np.floor(rows[0])) - margin, 0), height)
+        xend = min(max(int(np.ceil(columns[1])) + margin + 1, 0), width)
+        yend = min(max(int(np.ceil(rows[1])) + margin + 1, 0), height)
+        return xoff, yoff, max(xend - xoff, 0), max(yend - yoff, 0)
+
+    @staticmethod
+    def _offset_geo_transform(geo_transform: Tuple, xoff: int, yoff: int) -> List[float]:
+        """
+        Shift a north-up geo transform so it describes a window starting at the given post.
+
+        :param geo_transform: the GDAL geo transform of the tile
+        :param xoff: the column of the first post in the window
+        :param yoff: the row of the first post in the window
+
+        :return: the geo transform of the window
+        """
+        return [
+            geo_transform[0] + xoff * geo_transform[1],
+            geo_transform[1],
+            0.0,
+            geo_transform[3] + yoff * geo_transform[5],
+            0.0,
+            geo_transform[5],
+        ]
+
+    @staticmethod
+    def _compute_post_spacing(sensor_model: GDALAffineSensorModel, width: int, height: int) -> float:
+        """
+        Compute the distance in meters from the upper left to the lower right corner. Divide that by the distance
+        in pixels to get an approximate pixel size in meters.
+
+        :param sensor_model: the sensor model of the elevation posts
+        :param width: the number of posts in each row
+        :param height: the number of rows
+
+        :return: the approximate post spacing in meters
+        """
+        ul_corner_ecf = geodetic_to_geocentric(sensor_model.image_to_world(ImageCoordinate([0, 0]))).coordinate
+        lr_corner_ecf = geodetic_to_geocentric(sensor_model.image_to_world(ImageCoordinate([width, height]))).coordinate
+        return np.linalg.norm(ul_corner_ecf - lr_corner_ecf) / np.sqrt(width * width + height * height)
+
+    def _cache_paths(self, tile_location: str) -> Tuple[str, str]:
+        """
+        Identify the cache files for a tile. The names include a hash of the full tile location so that factories
+        for different tile directories can safely share a cache directory.
+
+        :param tile_location: the full location of the tile
+
+        :return: the path of the elevation array and the path of its metadata sidecar
+        """
+        tile_name = os.path.splitext(os.path.basename(tile_location))[0]
+        tile_hash = hashlib.sha256(tile_location.encode("utf-8")).hexdigest()[0:16]
+        cache_path = os.path.join(self.cache_directory, f"{tile_name}-{tile_hash}")
+        return f"{cache_path}.npy", f"{cache_path}.json"
+
+    def _read_cached_tile(
+        self, tile_location: str
+    ) -> Optional[Tuple[np.ndarray, GDALAffineSensorModel, ElevationRegionSummary]]:
+        """
+        Open a previously decoded tile from the cache. The metadata sidecar is written last so its presence indicates
+        the cached tile is complete.
+
+        :param tile_location: the full location of the tile
+
+        :return: the memory mapped array of elevations, a sensor model, and a summary or None if the tile is not cached
+        """
+        array_path, metadata_path = self._cache_paths(tile_location)
+        if not os.path.exists(metadata_path):
+            return None
+        try:
+            with open(metadata_path, "r") as metadata_file:
+                metadata = json.load(metadata_file)
+            if metadata["tile_location"] != tile_location:
+                return None
+            elevations = np.load(array_path, mmap_mode="r")
+            return (
+                elevations,
+                GDALAffineSensorModel(metadata["geo_transform"]),
+                ElevationRegionSummary(**metadata["summary"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            logging.warning(f"Unable to read cached DEM tile for {tile_location}, it will be reloaded: {err}")
+            return None
+
+    def _write_cached_tile(
+        self, tile_location: str, elevations: np.ndarray, geo_transform: Tuple, summary: ElevationRegionSummary
+    ) -> np.ndarray:
+        """
+        Write a decoded tile to the cache and reopen it as a memory map. Failures to write the cache are logged and
+        the in-memory array is returned instead.
+
+        :param tile_location: the full location of the tile
+        :param elevations: the decoded elevation array
+        :param geo_transform: the GDAL geo transform of the tile
+        :param summary: the summary of the tile
+
+        :return: the memory mapped array of elevations or the original array if the cache could not be written
+        """
+        array_path, metadata_path = self._cache_paths(tile_location)
+        metadata = {
+            "tile_location": tile_location,
+            "geo_transform": list(geo_transform),
+            "summary": dataclasses.asdict(summary),
+        }
+        try:
+            self._write_atomically(array_path, lambda cache_file: np.save(cache_file, np.ascontiguousarray(elevations)))
+            self._write_atomically(metadata_path, lambda cache_file: cache_file.write(json.dumps(metadata).encode("utf-8")))
+            return np.load(array_path, mmap_mode="r")
+        except (OSError, ValueError) as err:
+            logging.warning(f"Unable to cache DEM tile for {tile_location}: {err}")
+            return elevations
+
+    @staticmethod
+    def _write_atomically(path: str, write: Callable[[IO[bytes]], Any]) -> None:
+        """
+        Write a file by writing a temporary file in the same directory and then renaming it. Concurrent readers
+        will either see the complete file or no file at all.
+
+        :param path: the final location of the file
+        :param write: a function that writes the file contents to the provided binary file object
+
+        :return: None
+        """
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), suffix=".tmp", delete=False) as temporary_file:
+            try:
+                write(temporary_file)
+            except Exception:
+                temporary_file.close()
+                os.remove(temporary_file.name)
+                raise
+        os.replace(temporary_file.name, path)
@@ -22,16 +22,19 @@ class RPCSensorModelBuilder(SensorModelBuilder):
      See STDI-0002 Volume 1 Appendix E for more detailed information.
     """
 
-    def __init__(self, xml_tres: ET.Element) -> None:
+    def __init__(self, xml_tres: ET.Element, inverse_pixel_tolerance: Optional[float] = None) -> None:
         """
         Constructor for the builder accepting the required XML TREs.
 
         :param xml_tres: the XML tres for this image
+        :param inverse_pixel_tolerance: if provided an inverse polynomial is fit to the sensor model when it is built,
+            image to world transforms use the inverse directly if its residuals are within this many pixels
 
         :return: None
         """
         super().__init__()
         self.xml_tres = xml_tres
+        self.inverse_pixel_tolerance = inverse_pixel_tolerance
 
     def build(self) -> Optional[RPCSensorModel]:
         """
@@ -56,7 +59,7 @@ class RPCSensorModelBuilder(SensorModelBuilder):
                 logging.info("RPC00B TRE SUCCESS field was not '1'. Skipping RPC sensor model build.")
                 return None
 
-            return RPCSensorModelBuilder.build_rpc_sensor_model(rpc_tre)
+            sensor_model = RPCSensorModelBuilder.build_rpc_sensor_model(rpc_tre)
 
         except ValueError as ve:
             logging.warning("Unable to parse RPC00B TRE found in XML metadata. No SensorModel created.")
@@ -64,6 +67,15 @@ class RPCSensorModelBuilder(SensorModelBuilder):
 
             return None
 
+        if self.inverse_pixel_tolerance is not None:
+            try:
+                sensor_model.fit_inverse_polynomial(pixel_tolerance=self.inverse_pixel_tolerance)
+            except ValueError as ve:
+                logging.warning("Unable to fit an inverse polynomial to the RPC sensor model. Using iterative solver.")
+                logging.warning(str(ve))
+
+        return sensor_model
+
     @staticmethod
     def build_rpc_sensor_model(rpc_tre: ET.Element) -> RPCSensorModel:
         """
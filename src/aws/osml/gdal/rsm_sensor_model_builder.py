@@ -4,8 +4,12 @@ import logging
 from typing import List, Optional
 from xml.etree import ElementTree as ET
 
+import numpy as np
+
 from aws.osml.photogrammetry import (
     RSMContext,
+    RSMGridPlane,
+    RSMGridSensorModel,
     RSMGroundDomain,
     RSMGroundDomainForm,
     RSMImageDomain,
@@ -45,23 +49,41 @@ class RSMSensorModelBuilder(SensorModelBuilder):
     See STDI-0002 Volume 1 Appendix U for more detailed information.
     """
 
-    def __init__(self, xml_tres: ET.Element) -> None:
+    def __init__(self, xml_tres: ET.Element, inverse_pixel_tolerance: Optional[float] = None) -> None:
         """
         Constructor for the builder accepting the required XML TREs.
 
         :param xml_tres: the XML tres for this image
+        :param inverse_pixel_tolerance: if provided inverse polynomials are fit to the sensor model when it is built,
+            image to world transforms use an inverse directly if its residuals are within this many pixels
 
         :return: None
         """
         super().__init__()
         self.xml_tres = xml_tres
+        self.inverse_pixel_tolerance = inverse_pixel_tolerance
 
     def build(self) -> Optional[SensorModel]:
         """
         Examine the TRE metadata for RSM information, parse the necessary values out of those TREs, and construct a
-        RSM sensor model.
+        RSM sensor model. If an inverse pixel tolerance was provided the inverse polynomials are fit to the model.
+
+        :return: a RSM Polynomial or Grid SensorModel if one can be constructed, None otherwise
+        """
+        sensor_model = self._build_rsm_sensor_model()
+        if sensor_model is not None and self.inverse_pixel_tolerance is not None:
+            try:
+                sensor_model.fit_inverse_polynomial(pixel_tolerance=self.inverse_pixel_tolerance)
+            except ValueError as ve:
+                logging.warning("Unable to fit an inverse polynomial to the RSM sensor model. Using iterative solver.")
+                logging.warning(str(ve))
+        return sensor_model
+
+    def _build_rsm_sensor_model(self) -> Optional[SensorModel]:
+        """
+        Parse the RSM TREs and construct the sensor model they describe.
 
-        :return: a RSM Polynomial SensorModel if one can be constructed, None otherwise
+        :return: a RSM Polynomial or Grid SensorModel if one can be constructed, None otherwise
         """
 
         # Check to see if an RSMIDA TRE is included with the metadata. This is a mandatory TRE that will be available
@@ -81,34 +103,42 @@ class RSMSensorModelBuilder(SensorModelBuilder):
             # will be stored in RSMPC TREs. Note that some images may have several of these TREs defined so we will
             # construct RSMPolynomialSensorModels for every TRE of this kind.
             rsmpc_tres = self.xml_tres.findall("./tre[@name='RSMPCA']")
-            rsm_polynomial_sensor_models = [
+            rsm_section_sensor_models: List[SensorModel] = [
                 RSMSensorModelBuilder._build_rsm_polynomial_sensor_model(rsmpc_tre, rsm_context) for rsmpc_tre in rsmpc_tres
             ]
-
-            # If we only have one RSM polynomial sensor model then it applies to the entire RSM domain. If we have
-            # multiple then we are dealing with a sectioned sensor model which will require additional TREs to be
-            # parsed.
-            if len(rsm_polynomial_sensor_models) > 0:
-                if len(rsm_polynomial_sensor_models) == 1:
-                    return rsm_polynomial_sensor_models[0]
-                else:
-                    # Parse RSMPI and construct a segmented polynomial sensor model
-                    rsmpi_tre = self.xml_tres.find("./tre[@name='RSMPIA']")
-                    if rsmpi_tre is None:
-                        logging.warning(
-                            "Image has multiple RSMPCA TREs but is missing a RSMPIA that assigns them to sections."
-                            "No sensor model can be built! "
-                        )
-                        return None
-                    return RSMSensorModelBuilder._build_rsm_sectioned_polynomial_sensor_model(
-                        rsmpi_tre, rsm_context, rsm_polynomial_sensor_models
-                    )
-
-            # TODO: Check for RSMGGA and RSMGIA TREs and construct a RSM grid interpolation sensor model
-            logging.warning(
-                "Image has RSMID TRE but no polynomials. Grid based RSM not implemented so no sensor model returned."
+            section_index_tre_name = "RSMPIA"
+            section_index_field_prefix = ""
+
+            # If there are no polynomials then the RSM model may instead be defined by interpolation grids stored in
+            # RSMGG TREs. As with the polynomials there may be several of these TREs defined.
+            if len(rsm_section_sensor_models) == 0:
+                rsmgg_tres = self.xml_tres.findall("./tre[@name='RSMGGA']")
+                rsm_section_sensor_models = [
+                    RSMSensorModelBuilder._build_rsm_grid_sensor_model(rsmgg_tre, rsm_context) for rsmgg_tre in rsmgg_tres
+                ]
+                section_index_tre_name = "RSMGIA"
+                section_index_field_prefix = "G"
+
+            if len(rsm_section_sensor_models) == 0:
+                logging.warning("Image has RSMID TRE but no polynomials or grids. No sensor model returned.")
+                return None
+
+            # If we only have one RSM sensor model then it applies to the entire RSM domain. If we have multiple then
+            # we are dealing with a sectioned sensor model which will require additional TREs to be parsed.
+            if len(rsm_section_sensor_models) == 1:
+                return rsm_section_sensor_models[0]
+
+            # Parse RSMPI or RSMGI and construct a sectioned sensor model
+            section_index_tre = self.xml_tres.find(f"./tre[@name='{section_index_tre_name}']")
+            if section_index_tre is None:
+                logging.warning(
+                    f"Image has multiple RSM sections but is missing a {section_index_tre_name} that assigns them to "
+                    "sections. No sensor model can be built! "
+                )
+                return None
+            return RSMSensorModelBuilder._build_rsm_sectioned_polynomial_sensor_model(
+                section_index_tre, rsm_context, rsm_section_sensor_models, field_prefix=section_index_field_prefix
             )
-            return None
 
         except ValueError as ve:
             logging.warning("Unable to parse RSM TREs found in XML metadata. No SensorModel created.")
@@ -270,15 +300,16 @@ class RSMSensorModelBuilder(SensorModelBuilder):
         """
         This private method constructs a low order RSM polynomial from a group of related fields in the RSMPIA TRE.
         These TREs have similar fields grouped by the R and C prefixes which correspond to the row or column
-        identifiers for the polynomial they're associated with.
+        identifiers for the polynomial they're associated with. The RSMGIA TRE uses the same fields with GR and GC
+        prefixes.
 
-        :param rsmpi_tre: the GDAL XML for RSMPIA
+        :param rsmpi_tre: the GDAL XML for RSMPIA or RSMGIA
         :param polynomial_prefix: the prefix identifying the polynomial
 
         :return: the low order RSM polynomial
         """
-        if polynomial_prefix not in ["R", "C"]:
-            raise ValueError(f"Unexpected prefix {polynomial_prefix}. Expecting R or C")
+        if polynomial_prefix not in ["R", "C", "GR", "GC"]:
+            raise ValueError(f"Unexpected prefix {polynomial_prefix}. Expecting R, C, GR, or GC")
 
         coefficients = []
         for coeff_suffix in ["0", "X", "Y", "Z", "XX", "XY", "XZ", "YY", "YZ", "ZZ"]:
@@ -289,22 +320,24 @@ class RSMSensorModelBuilder(SensorModelBuilder):
     def _build_rsm_sectioned_polynomial_sensor_model(
         rsmpi_tre: ET.Element,
         rsm_context: RSMContext,
-        rsm_polynomial_sensor_models: List[RSMPolynomialSensorModel],
+        rsm_section_sensor_models: List[SensorModel],
+        field_prefix: str = "",
     ) -> RSMSectionedPolynomialSensorModel:
         """
-        This private method constructs an RSM sectioned polynomial sensor model from an RSMPIA TRE, the context object,
-        and a collection of RSMPolynomialSensorModels.
+        This private method constructs an RSM sectioned sensor model from an RSMPIA or RSMGIA TRE, the context object,
+        and a collection of RSMPolynomialSensorModels or RSMGridSensorModels.
 
-        :param rsmpi_tre: the GDAL XML for RSMPCA
+        :param rsmpi_tre: the GDAL XML for RSMPIA or RSMGIA
         :param rsm_context: the corresponding RSM context
+        :param rsm_section_sensor_models: the sensor models for each section
+        :param field_prefix: the prefix on the field names, "" for RSMPIA and "G" for RSMGIA
 
-
-        :return: the RSM polynomial sensor model
+        :return: the RSM sectioned sensor model
         """
-        num_section_rows = get_tre_field_value(rsmpi_tre, "RNIS", int)
-        num_section_cols = get_tre_field_value(rsmpi_tre, "CNIS", int)
+        num_section_rows = get_tre_field_value(rsmpi_tre, f"{field_prefix}RNIS", int)
+        num_section_cols = get_tre_field_value(rsmpi_tre, f"{field_prefix}CNIS", int)
         sensor_model_grid_map = {}
-        for sensor_model in rsm_polynomial_sensor_models:
+        for sensor_model in rsm_section_sensor_models:
             sensor_model_grid_map[(sensor_model.section_row, sensor_model.section_col)] = sensor_model
 
         section_sensor_model_grid = []
@@ -318,9 +351,105 @@ class RSMSensorModelBuilder(SensorModelBuilder):
             rsm_context,
             num_section_rows,
             num_section_cols,
-            get_tre_field_value(rsmpi_tre, "RSSIZ", float),
-            get_tre_field_value(rsmpi_tre, "CSSIZ", float),
-            RSMSensorModelBuilder._build_loworder_rsm_polynomial(rsmpi_tre, "R"),
-            RSMSensorModelBuilder._build_loworder_rsm_polynomial(rsmpi_tre, "C"),
+            get_tre_field_value(rsmpi_tre, f"{field_prefix}RSSIZ", float),
+            get_tre_field_value(rsmpi_tre, f"{field_prefix}CSSIZ", float),
+            RSMSensorModelBuilder._build_loworder_rsm_polynomial(rsmpi_tre, f"{field_prefix}R"),
+            RSMSensorModelBuilder._build_loworder_rsm_polynomial(rsmpi_tre, f"{field_prefix}C"),
             section_sensor_model_grid,
         )
+
+    @staticmethod
+    def _build_rsm_grid_sensor_model(rsmgg_tre: ET.Element, rsm_context: RSMContext) -> RSMGridSensorModel:
+        """
+        This private method constructs an RSM grid sensor model from an RSMGGA TRE and the context object. The grid
+        plane offsets and grid point values are repeated groups in the TRE so they are read from the fields in
+        document order. Grid points are listed for each x in order of increasing y.
+
+        :param rsmgg_tre: the GDAL XML for RSMGGA
+        :param rsm_context: the corresponding RSM context
+
+        :return: the RSM grid sensor model
+        """
+        num_planes = get_tre_field_value(rsmgg_tre, "NPLN", int)
+        x_spacing = get_tre_field_value(rsmgg_tre, "DELTAX", float)
+        y_spacing = get_tre_field_value(rsmgg_tre, "DELTAY", float)
+        initial_x = get_tre_field_value(rsmgg_tre, "XIPLN1", float)
+        initial_y = get_tre_field_value(rsmgg_tre, "YIPLN1", float)
+        reference_row = get_tre_field_value(rsmgg_tre, "REFROW", int)
+        reference_column = get_tre_field_value(rsmgg_tre, "REFCOL", int)
+        row_fraction_digits = get_tre_field_value(rsmgg_tre, "FNUMRD", int)
+        column_fraction_digits = get_tre_field_value(rsmgg_tre, "FNUMCD", int)
+
+        # The first plane has no index offsets, the offsets of the remaining planes are listed in the TRE
+        x_index_offsets = [0]
+        y_index_offsets = [0]
+        plane_sizes: List[List[int]] = []
+        plane_rows: List[List[float]] = []
+        plane_columns: List[List[float]] = []
+        for field in rsmgg_tre.iter("field"):
+            field_name = field.get("name")
+            field_value = field.get("value", "")
+            if field_name == "IXO":
+                x_index_offsets.append(int(field_value))
+            elif field_name == "IYO":
+                y_index_offsets.append(int(field_value))
+            elif field_name == "NXPTS":
+                plane_sizes.append([int(field_value), 0])
+                plane_rows.append([])
+                plane_columns.append([])
+            elif field_name == "NYPTS" and plane_sizes:
+                plane_sizes[-1][1] = int(field_value)
+            elif field_name == "RCOORD" and plane_rows:
+                plane_rows[-1].append(
+                    RSMSensorModelBuilder._parse_grid_coordinate(field_value, reference_row, row_fraction_digits)
+                )
+            elif field_name == "CCOORD" and plane_columns:
+                plane_columns[-1].append(
+                    RSMSensorModelBuilder._parse_grid_coordinate(field_value, reference_column, column_fraction_digits)
+                )
+
+        if len(plane_sizes) != num_planes or len(x_index_offsets) != num_planes or len(y_index_offsets) != num_planes:
+            raise ValueError(f"RSMGGA TRE does not contain the expected {num_planes} grid planes")
+
+        grid_planes = []
+        for plane_index, (num_x_points, num_y_points) in enumerate(plane_sizes):
+            num_points = num_x_points * num_y_points
+            if len(plane_rows[plane_index]) != num_points or len(plane_columns[plane_index]) != num_points:
+                raise ValueError(f"RSMGGA grid plane {plane_index + 1} does not contain {num_points} points")
+            grid_planes.append(
+                RSMGridPlane(
+                    initial_x + x_index_offsets[plane_index] * x_spacing,
+                    initial_y + y_index_offsets[plane_index] * y_spacing,
+                    np.reshape(plane_rows[plane_index], (num_x_points, num_y_points)),
+                    np.reshape(plane_columns[plane_index], (num_x_points, num_y_points)),
+                )
+            )
+
+        return RSMGridSensorModel(
+            rsm_context,
+            get_tre_field_value(rsmgg_tre, "GGRSN", int),
+            get_tre_field_value(rsmgg_tre, "GGCSN", int),
+            get_tre_field_value(rsmgg_tre, "INTORD", int),
+            get_tre_field_value(rsmgg_tre, "ZPLN1", float),
+            x_spacing,
+            y_spacing,
+            get_tre_field_value(rsmgg_tre, "DELTAZ", float),
+            grid_planes,
+        )
+
+    @staticmethod
+    def _parse_grid_coordinate(value: str, reference: int, fraction_digits: int) -> float:
+        """
+        This private method converts a RSMGGA grid point value into an image coordinate. The values are integers
+        with an implied decimal point that are offset from a reference row or column. Grid points without a value
+        are filled with spaces and are returned as NaN.
+
+        :param value: the grid point value from the TRE
+        :param reference: the reference row or column
+        :param fraction_digits: the number of digits to the right of the implied decimal point
+
+        :return: the image coordinate
+        """
+        if value.strip() == "":
+            return float("nan")
+        return reference + int(value) / 10**fraction_digits
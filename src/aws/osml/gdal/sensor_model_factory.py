@@ -85,6 +85,7 @@ class SensorModelFactory:
         proj_wkt: Optional[str] = None,
         ground_control_points: Optional[List[gdal.GCP]] = None,
         selected_sensor_model_types: Optional[List[SensorModelTypes]] = None,
+        inverse_pixel_tolerance: Optional[float] = None,
     ) -> None:
         """
         Construct a builder providing whatever metadata is available from the image. All of the parameters are named and
@@ -99,6 +100,8 @@ class SensorModelFactory:
         :param proj_wkt: the well known text string of the CRS used by the image
         :param ground_control_points: a list of GDAL GCPs that identify correspondences in the image
         :param selected_sensor_model_types: a list of sensor models that should be attempted by this factory
+        :param inverse_pixel_tolerance: if provided inverse polynomials are fit to RSM and RPC sensor models when they
+            are built, image to world transforms use an inverse directly if its residuals are within this many pixels
 
         :return: None
         """
@@ -112,6 +115,7 @@ class SensorModelFactory:
         self.proj_wkt = proj_wkt
         self.ground_control_points = ground_control_points
         self.selected_sensor_model_types = selected_sensor_model_types
+        self.inverse_pixel_tolerance = inverse_pixel_tolerance
 
     def build(self) -> Optional[SensorModel]:
         """
@@ -153,9 +157,13 @@ class SensorModelFactory:
             # RSM and RPC metadata the RSM will be used because it has been developed as a replacement for RPC.
             precision_sensor_model = None
             if SensorModelTypes.RSM in self.selected_sensor_model_types:
-                precision_sensor_model = RSMSensorModelBuilder(self.xml_tres).build()
+                precision_sensor_model = RSMSensorModelBuilder(
+                    self.xml_tres, inverse_pixel_tolerance=self.inverse_pixel_tolerance
+                ).build()
             if precision_sensor_model is None and SensorModelTypes.RPC in self.selected_sensor_model_types:
-                precision_sensor_model = RPCSensorModelBuilder(self.xml_tres).build()
+                precision_sensor_model = RPCSensorModelBuilder(
+                    self.xml_tres, inverse_pixel_tolerance=self.inverse_pixel_tolerance
+                ).build()
             if precision_sensor_model is not None and chipped_image_info is not None:
                 precision_sensor_model = ChippedImageSensorModel(
                     chipped_image_info.full_image_coordinates,
@@ -28,6 +28,16 @@ interpret the pixel information they have been provided.
     # Bounds are [left_x, top_y, width, height]
     nitf_encoded_tile_bytes = tile_factory.create_encoded_tile([0, 0, 1024, 1024])
 
+When many tiles will be cut from the same image the corners of all of the planned tiles can be geolocated up front
+in a single batch. Corners shared by adjacent tiles are only computed once.
+
+.. code-block:: python
+    :caption: Example showing creation of a grid of NITF tiles
+
+    tile_windows = [[x, y, 1024, 1024] for y in range(0, ds.RasterYSize, 1024) for x in range(0, ds.RasterXSize, 1024)]
+    tile_factory.precompute_tile_corners(tile_windows)
+    nitf_tiles = [tile_factory.create_encoded_tile(tile_window) for tile_window in tile_windows]
+
 
 Image Tiling: Tiles for Display
 *******************************
@@ -68,6 +78,63 @@ the sensor models to orthorectify imagery to remove the perspective and terrain
     # Create an orthophoto for this tile
     image_bytes = viz_tile_factory.create_orthophoto_tile(geo_bbox=tile.bounds, tile_size=tile.size)
 
+By default the map tiles are projected onto a surface at the elevation of the image center. Providing an elevation
+model, for example the same DigitalElevationModel used by a Geolocator, removes the terrain effects as well. The
+control grid used to warp each tile is then refined wherever the terrain relief requires it.
+
+.. code-block:: python
+    :caption: Example showing creation of a terrain corrected map tile
+
+    ortho_tile_factory = GDALTileFactory(ds,
+                                         sensor_model,
+                                         GDALImageFormats.PNG,
+                                         GDALCompressionOptions.NONE,
+                                         output_type=gdalconst.GDT_Byte,
+                                         range_adjustment=RangeAdjustmentType.DRA,
+                                         elevation_model=elevation_model)
+    image_bytes = ortho_tile_factory.create_orthophoto_tile(geo_bbox=tile.bounds, tile_size=tile.size)
+
+Adjacent map tiles can also be created together as a meta-tile. The block of tiles is rendered with a single read of
+the source image and then cut into the individual tiles, which is much faster than creating each tile on its own.
+
+.. code-block:: python
+    :caption: Example showing creation of a 2x2 block of map tiles
+
+    # The rows of the block are ordered from north to south, WebMercatorQuad tile rows increase to the north
+    tiles = [
+        [tile_set.get_tile(MapTileId(tile_matrix=16, tile_row=row, tile_col=col)) for col in range(54816, 54818)]
+        for row in (37026, 37025)
+    ]
+    encoded_tiles = ortho_tile_factory.create_orthophoto_meta_tile(tiles)
+    image_bytes = encoded_tiles[tile_id]
+
+All of the map tiles for an image can be generated at once for a range of zoom levels. The most detailed level is
+rendered from the image on a pool of workers, each with its own handle to the dataset, and the other levels are
+downsampled from the tiles below them. The tiles are written to a sink: a directory tree, an MBTiles file, or a
+callback.
+
+.. code-block:: python
+    :caption: Example showing generation of a map tile pyramid for an image
+
+    generator = MapTilePyramidGenerator("./imagery/sample.nitf",
+                                        tile_set,
+                                        min_tile_matrix=10,
+                                        max_tile_matrix=16,
+                                        tile_factory_kwargs={"elevation_model": elevation_model},
+                                        max_workers=8)
+    with DirectoryMapTileSink("./tiles") as sink:
+        num_tiles = generator.generate(sink)
+
+Writing large numbers of small tile files is slow on many file systems and object stores so the tiles can also be
+written to a single archive. Both the MBTiles and PMTiles sinks store tiles with identical contents, which are common
+at the edges of an image, only once and can append tiles to an existing archive.
+
+.. code-block:: python
+    :caption: Example showing generation of map tiles into a PMTiles archive
+
+    with PMTilesMapTileSink("./sample.pmtiles", metadata={"name": "sample"}) as sink:
+        generator.generate(sink)
+
 .. figure:: ../images/MapTileExample-BeforeAfter.png
     :width: 600
     :alt: Original image with perspective effects and same area after orthorectification
@@ -122,16 +189,25 @@ APIs
 """
 
 from .gdal_tile_factory import GDALTileFactory
+from .map_tile_archive import MBTilesMapTileSink, PMTilesMapTileSink
+from .map_tile_pyramid import MapTilePyramidGenerator
+from .map_tile_sink import CallbackMapTileSink, DirectoryMapTileSink, MapTileSink
 from .map_tileset import MapTile, MapTileId, MapTileSet
 from .map_tileset_factory import MapTileSetFactory, WellKnownMapTileSet
 from .sar_complex_imageop import histogram_stretch, linear_mapping_complex, quarter_power_image
 
 __all__ = [
+    "CallbackMapTileSink",
+    "DirectoryMapTileSink",
     "GDALTileFactory",
+    "MBTilesMapTileSink",
     "MapTile",
     "MapTileId",
+    "MapTilePyramidGenerator",
     "MapTileSet",
     "MapTileSetFactory",
+    "MapTileSink",
+    "PMTilesMapTileSink",
     "WellKnownMapTileSet",
     "histogram_stretch",
     "quarter_power_image",
@@ -2,8 +2,9 @@
 
 import copy
 import logging
+from dataclasses import dataclass
 from secrets import token_hex
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -12,14 +13,21 @@ from scipy.interpolate import RectBivariateSpline
 
 from aws.osml.gdal import GDALCompressionOptions, GDALImageFormats, NITFDESAccessor, RangeAdjustmentType, get_type_and_scales
 from aws.osml.gdal.dynamic_range_adjustment import DRAParameters
-from aws.osml.photogrammetry import GeodeticWorldCoordinate, ImageCoordinate, SensorModel
+from aws.osml.photogrammetry import ElevationModel, GeodeticWorldCoordinateArray, ImageCoordinate, SensorModel
 
+from .map_tileset import MapTile, MapTileId
 from .sar_complex_imageop import quarter_power_image
 from .sicd_updater import SICDUpdater
 from .sidd_updater import SIDDUpdater
 
 logger = logging.getLogger(__name__)
 
+# The maximum number of times an orthophoto control grid will be subdivided when refining it to meet a pixel tolerance
+_MAX_ORTHOPHOTO_GRID_REFINEMENTS = 5
+
+# The orthophoto control grid tolerance, in pixels, used to follow the terrain when an elevation model is provided
+_DEFAULT_TERRAIN_PIXEL_TOLERANCE = 1.0
+
 
 class GDALTileFactory:
     """
@@ -35,6 +43,9 @@ class GDALTileFactory:
         tile_compression: GDALCompressionOptions = GDALCompressionOptions.NONE,
         output_type: Optional[int] = None,
         range_adjustment: RangeAdjustmentType = RangeAdjustmentType.NONE,
+        orthophoto_grid_size: int = 3,
+        orthophoto_pixel_tolerance: Optional[float] = None,
+        elevation_model: Optional[ElevationModel] = None,
     ):
         """
         Constructs a new factory capable of producing tiles from a given GDAL raster dataset.
@@ -45,7 +56,16 @@ class GDALTileFactory:
         :param tile_compression: the output tile compression
         :param output_type: the GDAL pixel type in the output tile
         :param range_adjustment: the type of scaling used to convert raw pixel values to the output range
+        :param orthophoto_grid_size: the number of control points along each side of an orthophoto tile
+        :param orthophoto_pixel_tolerance: if provided, the orthophoto control grid is refined where interpolating it
+                                           is off by more than this many pixels of the image resolution level read.
+                                           Defaults to 1 pixel when an elevation model is provided so the grid
+                                           follows the terrain relief.
+        :param elevation_model: an optional elevation model used to orthorectify tiles, if not provided the tiles are
+                                projected to the elevation of the image center
         """
+        if orthophoto_grid_size < 2:
+            raise ValueError("Orthophoto control grids must have at least 2 points on each side")
         self.tile_format = tile_format
         self.tile_compression = tile_compression
         self.raster_dataset = raster_dataset
@@ -55,6 +75,14 @@ class GDALTileFactory:
         self.sar_des_header = None
         self.range_adjustment = range_adjustment
         self.output_type = output_type
+        self.orthophoto_grid_size = orthophoto_grid_size
+        if orthophoto_pixel_tolerance is None and elevation_model is not None:
+            orthophoto_pixel_tolerance = _DEFAULT_TERRAIN_PIXEL_TOLERANCE
+        self.orthophoto_pixel_tolerance = orthophoto_pixel_tolerance
+        self.elevation_model = elevation_model
+        self._default_elevation: Optional[float] = None
+        # DMS strings of the tile corners that have already been geolocated keyed by their (x, y) image coordinate
+        self.tile_corner_dms: Dict[Tuple[int, int], str] = {}
 
         if self.raster_dataset.GetDriver().ShortName == "NITF":
             xml_des = self.raster_dataset.GetMetadata("xml:DES")
@@ -161,46 +189,121 @@ class GDALTileFactory:
         :param tile_size: the shape of the output tile (width, height)
         :return: the encoded image tile or None if one could not be produced
         """
+        # Setup an evenly spaced control grid across the map tile. Note that the latitude and pixel row values have
+        # been adjusted because the 0, 0 pixel is in the upper left corner of the map tile and as the image row
+        # increases the latitude should decrease. That is why the latitudes range from max to min while all other
+        # values range from min to max.
         min_lon, min_lat, max_lon, max_lat = geo_bbox
+        grid_fractions = np.linspace(0.0, 1.0, self.orthophoto_grid_size)
+        control_grid = _OrthophotoControlGrid(
+            column_pixels=grid_fractions * (tile_size[0] - 1),
+            column_longitudes=min_lon + grid_fractions * (max_lon - min_lon),
+            row_pixels=grid_fractions * (tile_size[1] - 1),
+            row_latitudes=max_lat - grid_fractions * (max_lat - min_lat),
+        )
+        output_tile_pixels = self._create_orthophoto_pixels(control_grid, tile_size)
+        if output_tile_pixels is None:
+            return None
+        return self._encode_orthophoto_pixels(output_tile_pixels)
+
+    def create_orthophoto_meta_tile(self, map_tiles: List[List[MapTile]]) -> Dict[MapTileId, Optional[bytearray]]:
+        """
+        This method creates a block of adjacent orthorectified map tiles at once. The block is rendered as a single
+        large meta-tile with one read of the source pixels, one normalization pass, and one remapping before it is
+        cut into the individual tiles. This avoids repeating those steps, and re-reading the overlapping source
+        pixels, for each tile.
+
+        Each tile in the block is mapped to the world exactly as it would be by create_orthophoto_tile even if the
+        spacing of the tiles is not linear in latitude (e.g. WebMercatorQuad). Since the dynamic range adjustment
+        uses the statistics of the whole block the tiles will not have visible seams between them.
 
-        # Setup 2 grids of the same size, the first is for longitude/latitude coordinates and the second is pixel
-        # coordinates. These grids are evenly spaced across the map tile. Note that the latitude and pixel row
-        # grids have been adjusted because the 0, 0 pixel is in the upper left corner of the map tile and as the
-        # image row increases the latitude should decrease. That is why the world_y grid ranges from max to min
-        # while all other grids range from min to max.
-        nx, ny = (3, 3)
-        world_x = np.linspace(min_lon, max_lon, nx)
-        world_y = np.linspace(max_lat, min_lat, ny)
-        world_xv, world_yv = np.meshgrid(world_x, world_y)
-
-        pixel_x = np.linspace(0, tile_size[0] - 1, nx)
-        pixel_y = np.linspace(0, tile_size[1] - 1, ny)
-
-        # Use the sensor model to compute the image pixel location that corresponds to each
-        # world coordinate in the map tile grid. Separate those results into arrays of the x, y
-        # component. Note that if an external elevation model is not provided this code will
-        # use a default elevation provided by the sensor model for a location at the center of
-        # the image.
-        center_x = self.raster_dataset.RasterXSize / 2
-        center_y = self.raster_dataset.RasterYSize / 2
-        geo_image_center = self.sensor_model.image_to_world(ImageCoordinate([center_y, center_x]))
-
-        def world_to_image_func(lon, lat):
-            # TODO: Assign the elevation from a DEM
-            default_elevation = geo_image_center.elevation
-            return self.sensor_model.world_to_image(GeodeticWorldCoordinate([lon, lat, default_elevation]))
+        IMPORTANT: This is an experimental API that may change in future minor releases of the toolkit. It has the
+        same limitations as create_orthophoto_tile.
 
+        :param map_tiles: the rows of tiles in the block from north to south, each row ordered from west to east. All
+                          tiles must have the same size.
+        :return: the encoded image tile, or None if one could not be produced, for each tile in the block
+        """
+        if not map_tiles or not map_tiles[0] or any(len(tile_row) != len(map_tiles[0]) for tile_row in map_tiles):
+            raise ValueError("Meta-tiles must be a non-empty rectangular block of map tiles")
+        tile_width, tile_height = map_tiles[0][0].size
+        if any(tuple(map_tile.size) != (tile_width, tile_height) for tile_row in map_tiles for map_tile in tile_row):
+            raise ValueError("All of the map tiles in a meta-tile must be the same size")
+        num_rows = len(map_tiles)
+        num_cols = len(map_tiles[0])
+
+        # Place the control grid of each tile in the columns and rows of the meta-tile. The last pixel of a tile and
+        # the first pixel of the next tile share the same longitude (or latitude) so each tile is mapped exactly as
+        # it would be on its own.
+        grid_fractions = np.linspace(0.0, 1.0, self.orthophoto_grid_size)
+        column_bounds = [map_tile.bounds for map_tile in map_tiles[0]]
+        row_bounds = [tile_row[0].bounds for tile_row in map_tiles]
+        control_grid = _OrthophotoControlGrid(
+            column_pixels=np.concatenate([col * tile_width + grid_fractions * (tile_width - 1) for col in range(num_cols)]),
+            column_longitudes=np.concatenate(
+                [min_lon + grid_fractions * (max_lon - min_lon) for min_lon, _, max_lon, _ in column_bounds]
+            ),
+            row_pixels=np.concatenate([row * tile_height + grid_fractions * (tile_height - 1) for row in range(num_rows)]),
+            row_latitudes=np.concatenate(
+                [max_lat - grid_fractions * (max_lat - min_lat) for _, min_lat, _, max_lat in row_bounds]
+            ),
+        )
+        meta_tile_pixels = self._create_orthophoto_pixels(control_grid, (num_cols * tile_width, num_rows * tile_height))
+        if meta_tile_pixels is None:
+            if num_rows * num_cols == 1:
+                return {map_tiles[0][0].id: None}
+            # Part of the block may be beyond the area the sensor model can handle so fall back to creating the
+            # tiles individually
+            return {
+                map_tile.id: self.create_orthophoto_tile(geo_bbox=map_tile.bounds, tile_size=map_tile.size)
+                for tile_row in map_tiles
+                for map_tile in tile_row
+            }
+
+        encoded_tiles = {}
+        for row, tile_row in enumerate(map_tiles):
+            for col, map_tile in enumerate(tile_row):
+                tile_pixels = meta_tile_pixels[
+                    row * tile_height : (row + 1) * tile_height, col * tile_width : (col + 1) * tile_width
+                ]
+                if tile_pixels.ndim > 2 and tile_pixels.shape[2] == 4 and not tile_pixels[..., 3].any():
+                    # No part of this tile overlaps the image
+                    encoded_tiles[map_tile.id] = None
+                else:
+                    encoded_tiles[map_tile.id] = self._encode_orthophoto_pixels(np.ascontiguousarray(tile_pixels))
+        return encoded_tiles
+
+    def _create_orthophoto_pixels(
+        self, control_grid: "_OrthophotoControlGrid", output_size: Tuple[int, int]
+    ) -> Optional[np.ndarray]:
+        """
+        Create the pixels of an orthorectified tile. The control grid defines the relationship between the pixels of
+        the output and locations in the world. Image coordinates for the grid are computed using the sensor model
+        and then interpolated to warp the image into the output.
+
+        :param control_grid: the control grid of the output tile
+        :param output_size: the shape of the output (width, height)
+        :return: the 8-bit output pixels with an alpha band or None if the output does not overlap the image
+        """
+        tile_size = output_size
+
+        # Use the sensor model to compute the image pixel location that corresponds to each world coordinate in the
+        # control grid. The elevations of the grid points come from the elevation model if one was provided.
+        # Otherwise, and for any points the elevation model does not cover, this code will use a default
+        # elevation provided by the sensor model for a location at the center of the image.
         try:
-            world_to_image_func_vectorized = np.vectorize(world_to_image_func)
-            src_coords = world_to_image_func_vectorized(world_xv, world_yv)
-            src_x = np.vectorize(lambda image_coord: image_coord.x)(src_coords)
-            src_y = np.vectorize(lambda image_coord: image_coord.y)(src_coords)
+            src_coords = self._world_to_image_grid(*np.meshgrid(control_grid.column_longitudes, control_grid.row_latitudes))
         except Exception as e:
             # Unable to convert the map tile coordinates to image coordinates using the sensor model.
             # This usually means at least one coordinate isn't near the image and fell outside the range
             # of values the sensor model could create. No map tile can be created from this image.
-            logger.debug("Unable to convert map tile coordinates to image coordinates.", e)
+            logger.debug(f"Unable to convert map tile coordinates to image coordinates: {e}")
             return None
+        if not np.all(np.isfinite(src_coords)):
+            logger.debug("Unable to convert map tile coordinates to image coordinates.")
+            return None
+        src_x = src_coords[..., 0]
+        src_y = src_coords[..., 1]
 
         # Find min/max x and y for this grid and check to make sure it actually overlaps the image.
         src_bbox = (
@@ -226,12 +329,30 @@ class GDALTileFactory:
         # requested map tile. Note that this must be done before the source bounding box is clipped to the
         # actual image extend otherwise tiles that only overlap on the edge of the image may be read from a
         # very different resolution level than the other tiles at a similar map zoom level.
-        def find_appropriate_r_level(src_bbox, tile_width) -> int:
-            src_dim = np.min([src_bbox[2] - src_bbox[0], src_bbox[3] - src_bbox[1]])
-            return int(np.max([0, int(np.floor(np.log2(src_dim / tile_width)))]))
+        # The scale is compared along both axes so blocks of several map tiles select the same level as a
+        # single tile would.
+        def find_appropriate_r_level(src_bbox, output_size) -> int:
+            src_scale = np.min([(src_bbox[2] - src_bbox[0]) / output_size[0], (src_bbox[3] - src_bbox[1]) / output_size[1]])
+            return int(np.max([0, int(np.floor(np.log2(src_scale)))]))
 
         num_overviews = self.raster_dataset.GetRasterBand(1).GetOverviewCount()
-        r_level = min(find_appropriate_r_level(src_bbox, tile_size[0]), num_overviews)
+        r_level = min(find_appropriate_r_level(src_bbox, tile_size), num_overviews)
+
+        if self.orthophoto_pixel_tolerance is not None:
+            try:
+                control_grid, src_coords = self._refine_orthophoto_grid(
+                    control_grid, src_coords, self.orthophoto_pixel_tolerance * 2**r_level
+                )
+                src_x = src_coords[..., 0]
+                src_y = src_coords[..., 1]
+                src_bbox = (
+                    int(np.floor(np.min(src_x))),
+                    int(np.floor(np.min(src_y))),
+                    int(np.ceil(np.max(src_x))),
+                    int(np.ceil(np.max(src_y))),
+                )
+            except Exception as e:
+                logger.debug(f"Unable to refine the orthophoto control grid, using the initial grid: {e}")
 
         src_bbox = (
             max(src_bbox[0], 0),
@@ -275,17 +396,20 @@ class GDALTileFactory:
 
         # Create 2D linear interpolators that map the pixels in the map tile to x and y values in the source image.
         # This will allow us to efficiently generate the maps needed by the opencv::remap function for every pixel
-        # in the destination image.
-        src_x_interpolator = RectBivariateSpline(pixel_x, pixel_y, src_x, kx=1, ky=1)
-        src_y_interpolator = RectBivariateSpline(pixel_x, pixel_y, src_y, kx=1, ky=1)
+        # in the destination image. The control grid values are indexed by [row, column] so the interpolators take
+        # map tile pixel rows first.
+        pixel_x = control_grid.column_pixels
+        pixel_y = control_grid.row_pixels
+        src_x_interpolator = RectBivariateSpline(pixel_y, pixel_x, src_x, kx=1, ky=1)
+        src_y_interpolator = RectBivariateSpline(pixel_y, pixel_x, src_y, kx=1, ky=1)
 
         # Create the map1 and map2 arrays that capture the non-linear relationship between each pixel in the map tile
         # (dst) to pixels in the original image (src). See opencv::remap documentation for definitions of these
-        # parameters.
+        # parameters. Both arrays have the (height, width) shape of the map tile.
         dst_x = np.linspace(0, tile_size[0] - 1, tile_size[0])
         dst_y = np.linspace(0, tile_size[1] - 1, tile_size[1])
-        map1 = src_x_interpolator(dst_x, dst_y).astype(np.float32)
-        map2 = src_y_interpolator(dst_x, dst_y).astype(np.float32)
+        map1 = src_x_interpolator(dst_y, dst_x).astype(np.float32)
+        map2 = src_y_interpolator(dst_y, dst_x).astype(np.float32)
 
         logger.debug(
             f"Sanity check remap array sizes. They should match the desired map tile size {tile_size[0]}x{tile_size[1]}"
@@ -321,10 +445,102 @@ class GDALTileFactory:
             # add alpha mask
             output_tile_pixels = np.dstack((output_tile_pixels, alpha_mask))
 
+        return output_tile_pixels
+
+    @staticmethod
+    def _encode_orthophoto_pixels(output_tile_pixels: np.ndarray) -> Optional[bytearray]:
+        """
+        Encode the pixels of an orthorectified tile.
+
+        :param output_tile_pixels: the 8-bit tile pixels
+        :return: the encoded image tile or None if it could not be encoded
+        """
         # TODO: Formats other than PNG?
         is_success, image_bytes = cv2.imencode(".png", output_tile_pixels)
         return image_bytes if is_success else None
 
+    def _get_default_elevation(self) -> float:
+        """
+        Get the default elevation used for orthophoto tiles. This is the elevation assigned to the center of the
+        image, it is computed once and reused for every tile.
+
+        :return: the default elevation in meters
+        """
+        if self._default_elevation is None:
+            center = ImageCoordinate([self.raster_dataset.RasterXSize / 2, self.raster_dataset.RasterYSize / 2])
+            self._default_elevation = float(
+                self.sensor_model.image_to_world(center, elevation_model=self.elevation_model).elevation
+            )
+        return self._default_elevation
+
+    def _world_to_image_grid(self, longitudes: np.ndarray, latitudes: np.ndarray) -> np.ndarray:
+        """
+        Compute the image coordinates of points in a map tile using a single batched call to the sensor model. If
+        the factory has an elevation model the elevations of all the points are also looked up in one batch.
+
+        :param longitudes: the longitudes of the points in radians
+        :param latitudes: the latitudes of the points in radians, must have the same shape as the longitudes
+        :return: the x, y image coordinates of the points in an array with an additional dimension of size 2
+        """
+        world_coordinates = np.empty((longitudes.size, 3), dtype=np.float64)
+        world_coordinates[:, 0] = longitudes.ravel()
+        world_coordinates[:, 1] = latitudes.ravel()
+        world_coordinates[:, 2] = self._get_default_elevation()
+        if self.elevation_model is not None:
+            self.elevation_model.set_elevations(world_coordinates)
+        image_coordinates = self.sensor_model.world_to_image_batch(world_coordinates)
+        return image_coordinates.reshape(longitudes.shape + (2,))
+
+    def _refine_orthophoto_grid(
+        self, control_grid: "_OrthophotoControlGrid", src_coords: np.ndarray, pixel_tolerance: float
+    ) -> Tuple["_OrthophotoControlGrid", np.ndarray]:
+        """
+        Refine an orthophoto control grid until linear interpolation between its points is accurate. Each pass
+        computes the exact image coordinates halfway between the current points and then adds the grid columns and
+        rows where the interpolated values are off by more than the tolerance. Columns and rows that are already
+        accurate are not subdivided, so with an elevation model the grid only becomes dense where the terrain relief
+        displaces the image.
+
+        :param control_grid: the current control grid
+        :param src_coords: the image coordinates of the grid points indexed by [row, column]
+        :param pixel_tolerance: the largest acceptable interpolation error in full resolution image pixels
+        :return: the refined control grid and the image coordinates of its points
+        """
+        for _ in range(_MAX_ORTHOPHOTO_GRID_REFINEMENTS):
+            fine_grid = control_grid.subdivided()
+
+            # Compute the exact image coordinates of every new point in a single batch
+            fine_coords = np.empty((fine_grid.row_pixels.size, fine_grid.column_pixels.size, 2))
+            fine_coords[::2, ::2] = src_coords
+            new_points = np.ones(fine_coords.shape[0:2], dtype=bool)
+            new_points[::2, ::2] = False
+            fine_longitudes, fine_latitudes = np.meshgrid(fine_grid.column_longitudes, fine_grid.row_latitudes)
+            fine_coords[new_points] = self._world_to_image_grid(fine_longitudes[new_points], fine_latitudes[new_points])
+            if not np.all(np.isfinite(fine_coords)):
+                break
+
+            # Compare those to the values that would have been interpolated from the current grid
+            interpolated_coords = fine_coords.copy()
+            interpolated_coords[::2, 1::2] = (src_coords[:, :-1] + src_coords[:, 1:]) / 2.0
+            interpolated_coords[1::2, ::2] = (src_coords[:-1, :] + src_coords[1:, :]) / 2.0
+            interpolated_coords[1::2, 1::2] = (
+                src_coords[:-1, :-1] + src_coords[:-1, 1:] + src_coords[1:, :-1] + src_coords[1:, 1:]
+            ) / 4.0
+            error = np.linalg.norm(fine_coords - interpolated_coords, axis=2)
+            refine_columns = np.max(error[:, 1::2], axis=0) > pixel_tolerance
+            refine_rows = np.max(error[1::2, :], axis=1) > pixel_tolerance
+            if not refine_columns.any() and not refine_rows.any():
+                break
+
+            keep_columns = np.ones(fine_grid.column_pixels.size, dtype=bool)
+            keep_columns[1::2] = refine_columns
+            keep_rows = np.ones(fine_grid.row_pixels.size, dtype=bool)
+            keep_rows[1::2] = refine_rows
+            control_grid = fine_grid.select(keep_columns, keep_rows)
+            src_coords = fine_coords[keep_rows][:, keep_columns]
+
+        return control_grid, src_coords
+
     def _read_from_rlevel_as_array(
         self, scaled_bbox: Tuple[int, int, int, int], r_level: int, band_numbers: Optional[List[int]] = None
     ) -> np.array:
@@ -487,6 +703,50 @@ class GDALTileFactory:
         normalized_pixel = np.clip(normalized_pixel, 0.0, 255.0)
         return normalized_pixel.astype(np.uint8)
 
+    def precompute_tile_corners(self, src_windows: Iterable[List[int]]) -> None:
+        """
+        Geolocate the corners of a planned set of tiles using a single batched call to the sensor model. Adjacent tiles
+        share corners so each unique corner is only computed once. The results are reused when the IGEOLO values of
+        the tiles are created.
+
+        :param src_windows: the [left_x, top_y, width, height] bounds of each planned tile
+        :return: None
+        """
+        if self.sensor_model is None:
+            return
+        self._geolocate_tile_corners(
+            {tile_corner for src_window in src_windows for tile_corner in self._get_tile_corners(src_window)}
+        )
+
+    @staticmethod
+    def _get_tile_corners(src_window: List[int]) -> List[Tuple[int, int]]:
+        """
+        Get the image coordinates of a tile's corners in the order needed for IGEOLO: (0,0), (Max X, 0),
+        (Max X, Max Y), (0, Max Y).
+
+        :param src_window: the [left_x, top_y, width, height] bounds of this tile
+        :return: the (x, y) image coordinates of the four corners
+        """
+        return [
+            (src_window[0], src_window[1]),
+            (src_window[0] + src_window[2], src_window[1]),
+            (src_window[0] + src_window[2], src_window[1] + src_window[3]),
+            (src_window[0], src_window[1] + src_window[3]),
+        ]
+
+    def _geolocate_tile_corners(self, tile_corners: Iterable[Tuple[int, int]]) -> None:
+        """
+        Geolocate and format any of the tile corners that have not already been computed.
+
+        :param tile_corners: the (x, y) image coordinates of the corners
+        :return: None
+        """
+        new_corners = list({tile_corner for tile_corner in tile_corners if tile_corner not in self.tile_corner_dms})
+        if not new_corners:
+            return
+        world_coordinates = self.sensor_model.image_to_world_batch(np.array(new_corners, dtype=np.float64))
+        self.tile_corner_dms.update(zip(new_corners, GeodeticWorldCoordinateArray(world_coordinates).to_dms_strings()))
+
     def _create_new_igeolo(self, src_window: List[int]) -> str:
         """
         Create a new 60 character string representing the corner coordinates of this tile. The string conforms to
@@ -499,20 +759,14 @@ class GDALTileFactory:
         degrees, minutes, and seconds of longitude with Y representing East or West (E for East, W for West),
         respectively.
 
+        Corners computed by precompute_tile_corners are reused, any others are geolocated together in one batch.
+
         :param src_window: the [left_x, top_y, width, height] bounds of this tile
         :return: the 60 character IGEOLO geographic coordinate string
         """
-        tile_corners = [
-            [src_window[0], src_window[1]],
-            [src_window[0] + src_window[2], src_window[1]],
-            [src_window[0] + src_window[2], src_window[1] + src_window[3]],
-            [src_window[0], src_window[1] + src_window[3]],
-        ]
-        dms_coords = []
-        for coord in tile_corners:
-            geodetic_tile_corner = self.sensor_model.image_to_world(ImageCoordinate(coord))
-            dms_coords.append(geodetic_tile_corner.to_dms_string())
-        return "".join(dms_coords)
+        tile_corners = self._get_tile_corners(src_window)
+        self._geolocate_tile_corners(tile_corners)
+        return "".join(self.tile_corner_dms[tile_corner] for tile_corner in tile_corners)
 
     def _create_gdal_translate_kwargs(self) -> Dict[str, Any]:
         """
@@ -579,3 +833,57 @@ class GDALTileFactory:
         gdal_translate_kwargs["creationOptions"] = creation_options
 
         return gdal_translate_kwargs
+
+
+@dataclass
+class _OrthophotoControlGrid:
+    """
+    The control grid used to warp an image into an orthophoto. Each column of the grid has a pixel location in the
+    output and a longitude while each row has a pixel location and a latitude.
+    """
+
+    column_pixels: np.ndarray
+    column_longitudes: np.ndarray
+    row_pixels: np.ndarray
+    row_latitudes: np.ndarray
+
+    def subdivided(self) -> "_OrthophotoControlGrid":
+        """
+        Create a grid with additional columns and rows halfway between each of the current ones.
+
+        :return: the subdivided control grid
+        """
+        return _OrthophotoControlGrid(
+            column_pixels=_insert_midpoints(self.column_pixels),
+            column_longitudes=_insert_midpoints(self.column_longitudes),
+            row_pixels=_insert_midpoints(self.row_pixels),
+            row_latitudes=_insert_midpoints(self.row_latitudes),
+        )
+
+    def select(self, columns: np.ndarray, rows: np.ndarray) -> "_OrthophotoControlGrid":
+        """
+        Create a grid from a subset of the columns and rows of this grid.
+
+        :param columns: a boolean mask of the columns to keep
+        :param rows: a boolean mask of the rows to keep
+        :return: the selected control grid
+        """
+        return _OrthophotoControlGrid(
+            column_pixels=self.column_pixels[columns],
+            column_longitudes=self.column_longitudes[columns],
+            row_pixels=self.row_pixels[rows],
+            row_latitudes=self.row_latitudes[rows],
+        )
+
+
+def _insert_midpoints(values: np.ndarray) -> np.ndarray:
+    """
+    Insert the midpoint between each pair of adjacent values.
+
+    :param values: the original values
+    :return: the values with midpoints added at the odd indexes
+    """
+    result = np.empty(2 * values.size - 1)
+    result[::2] = values
+    result[1::2] = (values[:-1] + values[1:]) / 2.0
+    return result
@@ -0,0 +1,631 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import gzip
+import hashlib
+import json
+import math
+import os
+import shutil
+import sqlite3
+import struct
+import tempfile
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple
+
+from .map_tile_sink import MapTileSink
+from .map_tileset import MapTileId
+
+# The number of tiles written to an MBTiles file in each transaction
+_DEFAULT_MBTILES_BATCH_SIZE = 1000
+
+# PMTiles v3 constants, see: https://github.com/protomaps/PMTiles/blob/main/spec/v3/spec.md
+_PMTILES_MAGIC = b"PMTiles"
+_PMTILES_VERSION = 3
+_PMTILES_HEADER_LENGTH = 127
+_PMTILES_MAX_ROOT_DIRECTORY_LENGTH = 16384 - _PMTILES_HEADER_LENGTH
+_PMTILES_COMPRESSION_NONE = 1
+_PMTILES_COMPRESSION_GZIP = 2
+_PMTILES_TILE_TYPES = {"mvt": 1, "png": 2, "jpg": 3, "jpeg": 3, "webp": 4, "avif": 5}
+_PMTILES_HEADER_FORMAT = "<7sB11Q6B4iB2i"
+
+
+def _tile_content_id(tile_data: bytes) -> str:
+    """
+    Compute the identifier used to recognize tiles with the same content.
+
+    :param tile_data: the encoded tile
+    :return: the hex digest of the tile contents
+    """
+    return hashlib.sha256(tile_data).hexdigest()
+
+
+class MBTilesMapTileSink(MapTileSink):
+    """
+    This sink writes map tiles into an MBTiles file, a SQLite database with a table of tiles. MBTiles numbers tile
+    rows from the south (the TMS convention) which matches the numbering of WebMercatorQuadMapTileSet so the tile ids
+    are written unchanged. See: https://github.com/mapbox/mbtiles-spec
+
+    Tiles are written in batches, each in its own transaction. By default the tile contents are deduplicated: the
+    images are stored once, keyed by a hash of their contents, and a tiles view joins them to the map of tile ids.
+    This is the layout used by most MBTiles tools and keeps files small when many tiles are empty or constant.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        metadata: Optional[Dict[str, str]] = None,
+        append: bool = False,
+        deduplicate: bool = True,
+        batch_size: int = _DEFAULT_MBTILES_BATCH_SIZE,
+    ) -> None:
+        """
+        Construct a sink that writes tiles to an MBTiles file.
+
+        :param file_path: the path of the MBTiles file
+        :param metadata: optional values for the metadata table (e.g. name, format, bounds), a new file is named
+                         after the file and has a format of png unless these are provided
+        :param append: add tiles to an existing file instead of replacing it, existing tiles with the same id are
+                       overwritten. The layout of an existing file is kept regardless of the deduplicate setting.
+        :param deduplicate: store each distinct tile image once
+        :param batch_size: the number of tiles written in each transaction
+        """
+        if batch_size < 1:
+            raise ValueError("MBTiles batches must contain at least 1 tile")
+        if not append and os.path.exists(file_path):
+            os.remove(file_path)
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(file_path)
+        self._pending_tiles: List[Tuple[int, int, int, str, bytes]] = []
+        self._written_content_ids: Set[str] = set()
+
+        existing_tiles_type = self.connection.execute("SELECT type FROM sqlite_master WHERE name = 'tiles'").fetchone()
+        if existing_tiles_type is not None:
+            self.deduplicate = existing_tiles_type[0] == "view"
+        else:
+            self.deduplicate = deduplicate
+            self._create_schema()
+
+        all_metadata = {}
+        if existing_tiles_type is None:
+            # The MBTiles specification requires a name and format for every file
+            all_metadata = {"name": os.path.splitext(os.path.basename(file_path))[0], "format": "png"}
+        if metadata:
+            all_metadata.update(metadata)
+        with self.connection:
+            self.connection.executemany("DELETE FROM metadata WHERE name = ?", [(name,) for name in all_metadata])
+            self.connection.executemany("INSERT INTO metadata (name, value) VALUES (?, ?)", all_metadata.items())
+
+    def _create_schema(self) -> None:
+        """
+        Create the tables of a new MBTiles file.
+        """
+        with self.connection:
+            self.connection.execute("CREATE TABLE metadata (name TEXT, value TEXT)")
+            self.connection.execute("CREATE UNIQUE INDEX metadata_index ON metadata (name)")
+            if self.deduplicate:
+                self.connection.execute(
+                    "CREATE TABLE map (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_id TEXT)"
+                )
+                self.connection.execute("CREATE UNIQUE INDEX map_index ON map (zoom_level, tile_column, tile_row)")
+                self.connection.execute("CREATE TABLE images (tile_data BLOB, tile_id TEXT)")
+                self.connection.execute("CREATE UNIQUE INDEX images_id ON images (tile_id)")
+                self.connection.execute(
+                    "CREATE VIEW tiles AS SELECT map.zoom_level AS zoom_level, map.tile_column AS tile_column, "
+                    "map.tile_row AS tile_row, images.tile_data AS tile_data "
+                    "FROM map JOIN images ON images.tile_id = map.tile_id"
+                )
+            else:
+                self.connection.execute(
+                    "CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB)"
+                )
+                self.connection.execute("CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row)")
+
+    def write_tile(self, tile_id: MapTileId, tile_data: bytes) -> None:
+        """
+        Add an encoded map tile to the current batch, writing the batch once it is full.
+
+        :param tile_id: the id of the tile
+        :param tile_data: the encoded tile
+        """
+        content_id = _tile_content_id(tile_data) if self.deduplicate else ""
+        self._pending_tiles.append((tile_id.tile_matrix, tile_id.tile_col, tile_id.tile_row, content_id, tile_data))
+        if len(self._pending_tiles) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the current batch of tiles in a single transaction.
+        """
+        if not self._pending_tiles:
+            return
+        with self.connection:
+            if self.deduplicate:
+                new_images = {}
+                for _, _, _, content_id, tile_data in self._pending_tiles:
+                    if content_id not in self._written_content_ids:
+                        new_images[content_id] = tile_data
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO images (tile_data, tile_id) VALUES (?, ?)",
+                    [(sqlite3.Binary(tile_data), content_id) for content_id, tile_data in new_images.items()],
+                )
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO map (zoom_level, tile_column, tile_row, tile_id) VALUES (?, ?, ?, ?)",
+                    [pending_tile[0:4] for pending_tile in self._pending_tiles],
+                )
+                self._written_content_ids.update(new_images.keys())
+            else:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data) VALUES (?, ?, ?, ?)",
+                    [
+                        (zoom_level, tile_column, tile_row, sqlite3.Binary(tile_data))
+                        for zoom_level, tile_column, tile_row, _, tile_data in self._pending_tiles
+                    ],
+                )
+        self._pending_tiles = []
+
+    def close(self) -> None:
+        """
+        Write any remaining tiles and close the database. Images that are no longer used by any tile because the
+        tiles were overwritten are removed.
+        """
+        if self.connection is not None:
+            self.flush()
+            if self.deduplicate:
+                with self.connection:
+                    self.connection.execute("DELETE FROM images WHERE tile_id NOT IN (SELECT tile_id FROM map)")
+            self.connection.close()
+            self.connection = None
+
+
+@dataclass
+class _PMTilesEntry:
+    """
+    An entry in a PMTiles directory. A run of run_length consecutive tile ids share the same data, entries with a
+    run_length of 0 point to a leaf directory instead of tile data.
+    """
+
+    tile_id: int
+    offset: int
+    length: int
+    run_length: int
+
+
+class PMTilesMapTileSink(MapTileSink):
+    """
+    This sink writes map tiles into a single file PMTiles (version 3) archive. Tile contents are deduplicated and the
+    archive is clustered: the tile data is stored in the order of the tiles' Hilbert curve ids so readers can fetch
+    neighboring tiles with a single range request. See: https://github.com/protomaps/PMTiles
+
+    Tiles can arrive in any order so they are spooled to a temporary file and the archive is assembled when the sink
+    is closed. PMTiles numbers tile rows from the north (the XYZ convention) so the rows of WebMercatorQuadMapTileSet
+    are flipped as they are written.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        append: bool = False,
+        tile_format: str = "png",
+    ) -> None:
+        """
+        Construct a sink that writes tiles to a PMTiles archive.
+
+        :param file_path: the path of the PMTiles file
+        :param metadata: optional values for the JSON metadata of the archive (e.g. name, attribution)
+        :param append: add tiles to an existing archive instead of replacing it, existing tiles with the same id are
+                       overwritten
+        :param tile_format: the format of the tiles, one of mvt, png, jpg, webp, or avif
+        """
+        if tile_format not in _PMTILES_TILE_TYPES:
+            raise ValueError(f"Unsupported PMTiles tile format: {tile_format}")
+        self.file_path = file_path
+        self.tile_format = tile_format
+        self.metadata: Dict[str, Any] = {}
+        self._spool: Optional[BinaryIO] = tempfile.TemporaryFile()
+        self._spool_contents: Dict[str, Tuple[int, int]] = {}
+        self._tile_contents: Dict[int, str] = {}
+        self._min_zoom: Optional[int] = None
+        self._max_zoom: Optional[int] = None
+        self._bounds: Optional[Tuple[float, float, float, float]] = None
+
+        if append and os.path.exists(file_path):
+            self._load_archive(file_path)
+        if metadata:
+            self.metadata.update(metadata)
+
+    def write_tile(self, tile_id: MapTileId, tile_data: bytes) -> None:
+        """
+        Add an encoded map tile to the archive.
+
+        :param tile_id: the id of the tile
+        :param tile_data: the encoded tile
+        """
+        zoom = tile_id.tile_matrix
+        x = tile_id.tile_col
+        y = (1 << zoom) - 1 - tile_id.tile_row
+        self._add_tile(_zxy_to_pmtiles_tile_id(zoom, x, y), tile_data)
+        self._update_extents(zoom, zoom, _xyz_tile_bounds(zoom, x, y))
+
+    def close(self) -> None:
+        """
+        Assemble the archive and release the temporary storage.
+        """
+        if self._spool is None:
+            return
+        try:
+            temp_path = self.file_path + ".tmp"
+            with open(temp_path, "wb") as archive:
+                self._write_archive(archive)
+            os.replace(temp_path, self.file_path)
+        finally:
+            self._spool.close()
+            self._spool = None
+
+    def _add_tile(self, pmtiles_tile_id: int, tile_data: bytes) -> None:
+        """
+        Spool the contents of a tile unless identical contents have already been seen.
+
+        :param pmtiles_tile_id: the Hilbert curve id of the tile
+        :param tile_data: the encoded tile
+        """
+        content_id = _tile_content_id(tile_data)
+        if content_id not in self._spool_contents:
+            self._spool.seek(0, os.SEEK_END)
+            self._spool_contents[content_id] = (self._spool.tell(), len(tile_data))
+            self._spool.write(tile_data)
+        self._tile_contents[pmtiles_tile_id] = content_id
+
+    def _update_extents(self, min_zoom: int, max_zoom: int, bounds: Tuple[float, float, float, float]) -> None:
+        """
+        Grow the zoom range and geographic bounds recorded in the archive header.
+
+        :param min_zoom: the least detailed zoom level
+        :param max_zoom: the most detailed zoom level
+        :param bounds: the (min_lon, min_lat, max_lon, max_lat) bounds in degrees
+        """
+        self._min_zoom = min_zoom if self._min_zoom is None else min(self._min_zoom, min_zoom)
+        self._max_zoom = max_zoom if self._max_zoom is None else max(self._max_zoom, max_zoom)
+        if self._bounds is None:
+            self._bounds = bounds
+        else:
+            self._bounds = (
+                min(self._bounds[0], bounds[0]),
+                min(self._bounds[1], bounds[1]),
+                max(self._bounds[2], bounds[2]),
+                max(self._bounds[3], bounds[3]),
+            )
+
+    def _load_archive(self, file_path: str) -> None:
+        """
+        Load the tiles, metadata, and extents of an existing archive so new tiles can be added to it.
+
+        :param file_path: the path of the existing PMTiles file
+        """
+        with open(file_path, "rb") as archive:
+            header = _read_pmtiles_header(archive)
+            for entry in _read_pmtiles_entries(archive, header):
+                archive.seek(header["tile_data_offset"] + entry.offset)
+                tile_data = archive.read(entry.length)
+                for pmtiles_tile_id in range(entry.tile_id, entry.tile_id + entry.run_length):
+                    self._add_tile(pmtiles_tile_id, tile_data)
+            archive.seek(header["json_metadata_offset"])
+            self.metadata = json.loads(
+                _decompress(archive.read(header["json_metadata_length"]), header["internal_compression"])
+            )
+        if header["addressed_tiles_count"] > 0:
+            self._update_extents(
+                header["min_zoom"],
+                header["max_zoom"],
+                (
+                    header["min_lon_e7"] / 1e7,
+                    header["min_lat_e7"] / 1e7,
+                    header["max_lon_e7"] / 1e7,
+                    header["max_lat_e7"] / 1e7,
+                ),
+            )
+
+    def _write_archive(self, archive: BinaryIO) -> None:
+        """
+        Write the complete archive: header, root directory, metadata, leaf directories, and the clustered tile data.
+
+        :param archive: the output file
+        """
+        # Copy the tile data in tile id order, reusing the data of tiles with the same contents, and build the
+        # directory entries. Consecutive tiles with the same contents become a single run.
+        tile_data_file = tempfile.TemporaryFile()
+        try:
+            entries: List[_PMTilesEntry] = []
+            data_contents: Dict[str, Tuple[int, int]] = {}
+            for pmtiles_tile_id in sorted(self._tile_contents.keys()):
+                content_id = self._tile_contents[pmtiles_tile_id]
+                if content_id not in data_contents:
+                    spool_offset, length = self._spool_contents[content_id]
+                    self._spool.seek(spool_offset)
+                    data_contents[content_id] = (tile_data_file.tell(), length)
+                    tile_data_file.write(self._spool.read(length))
+                offset, length = data_contents[content_id]
+                previous = entries[-1] if entries else None
+                if (
+                    previous is not None
+                    and previous.offset == offset
+                    and previous.tile_id + previous.run_length == pmtiles_tile_id
+                ):
+                    previous.run_length += 1
+                else:
+                    entries.append(_PMTilesEntry(pmtiles_tile_id, offset, length, 1))
+
+            root_directory, leaf_directories = _build_pmtiles_directories(entries)
+            json_metadata = gzip.compress(json.dumps(self.metadata).encode("utf-8"))
+            tile_data_length = tile_data_file.tell()
+
+            root_offset = _PMTILES_HEADER_LENGTH
+            metadata_offset = root_offset + len(root_directory)
+            leaf_offset = metadata_offset + len(json_metadata)
+            tile_data_offset = leaf_offset + len(leaf_directories)
+            min_lon, min_lat, max_lon, max_lat = self._bounds or (0.0, 0.0, 0.0, 0.0)
+            min_zoom = self._min_zoom or 0
+            header = struct.pack(
+                _PMTILES_HEADER_FORMAT,
+                _PMTILES_MAGIC,
+                _PMTILES_VERSION,
+                root_offset,
+                len(root_directory),
+                metadata_offset,
+                len(json_metadata),
+                leaf_offset,
+                len(leaf_directories),
+                tile_data_offset,
+                tile_data_length,
+                len(self._tile_contents),
+                len(entries),
+                len(data_contents),
+                1,  # clustered
+                _PMTILES_COMPRESSION_GZIP,
+                _PMTILES_COMPRESSION_NONE,
+                _PMTILES_TILE_TYPES[self.tile_format],
+                min_zoom,
+                self._max_zoom or 0,
+                round(min_lon * 1e7),
+                round(min_lat * 1e7),
+                round(max_lon * 1e7),
+                round(max_lat * 1e7),
+                min_zoom,
+                round((min_lon + max_lon) / 2 * 1e7),
+                round((min_lat + max_lat) / 2 * 1e7),
+            )
+            archive.write(header)
+            archive.write(root_directory)
+            archive.write(json_metadata)
+            archive.write(leaf_directories)
+            tile_data_file.seek(0)
+            shutil.copyfileobj(tile_data_file, archive)
+        finally:
+            tile_data_file.close()
+
+
+def _zxy_to_pmtiles_tile_id(zoom: int, x: int, y: int) -> int:
+    """
+    Compute the PMTiles tile id of a tile. Tile ids count the tiles of all lower zoom levels and then follow a
+    Hilbert curve across the tiles of the zoom level.
+
+    :param zoom: the zoom level
+    :param x: the tile column
+    :param y: the tile row numbered from the north
+    :return: the tile id
+    """
+    if x < 0 or y < 0 or x >= (1 << zoom) or y >= (1 << zoom):
+        raise ValueError(f"Tile {x}, {y} is outside of zoom level {zoom}")
+    tile_id = ((1 << (2 * zoom)) - 1) // 3
+    s = 1 << zoom >> 1
+    while s > 0:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        tile_id += s * s * ((3 * rx) ^ ry)
+        if ry == 0:
+            if rx == 1:
+                x = s - 1 - x
+                y = s - 1 - y
+            x, y = y, x
+        s >>= 1
+    return tile_id
+
+
+def _read_pmtiles_header(archive: BinaryIO) -> Dict[str, int]:
+    """
+    Read the header of a PMTiles archive.
+
+    :param archive: the archive file
+    :return: the header fields
+    """
+    archive.seek(0)
+    values = struct.unpack(_PMTILES_HEADER_FORMAT, archive.read(_PMTILES_HEADER_LENGTH))
+    if values[0] != _PMTILES_MAGIC or values[1] != _PMTILES_VERSION:
+        raise ValueError("File is not a version 3 PMTiles archive")
+    names = [
+        "root_offset",
+        "root_length",
+        "json_metadata_offset",
+        "json_metadata_length",
+        "leaf_directory_offset",
+        "leaf_directory_length",
+        "tile_data_offset",
+        "tile_data_length",
+        "addressed_tiles_count",
+        "tile_entries_count",
+        "tile_contents_count",
+        "clustered",
+        "internal_compression",
+        "tile_compression",
+        "tile_type",
+        "min_zoom",
+        "max_zoom",
+        "min_lon_e7",
+        "min_lat_e7",
+        "max_lon_e7",
+        "max_lat_e7",
+        "center_zoom",
+        "center_lon_e7",
+        "center_lat_e7",
+    ]
+    return dict(zip(names, values[2:]))
+
+
+def _read_pmtiles_entries(archive: BinaryIO, header: Dict[str, int]) -> List[_PMTilesEntry]:
+    """
+    Read all of the tile entries of a PMTiles archive, following the root directory into any leaf directories.
+
+    :param archive: the archive file
+    :param header: the header of the archive
+    :return: the tile entries in tile id order
+    """
+
+    def read_directory(offset: int, length: int) -> List[_PMTilesEntry]:
+        archive.seek(offset)
+        return _deserialize_pmtiles_directory(_decompress(archive.read(length), header["internal_compression"]))
+
+    entries = []
+    for entry in read_directory(header["root_offset"], header["root_length"]):
+        if entry.run_length == 0:
+            entries.extend(read_directory(header["leaf_directory_offset"] + entry.offset, entry.length))
+        else:
+            entries.append(entry)
+    return entries
+
+
+def _build_pmtiles_directories(entries: List[_PMTilesEntry]) -> Tuple[bytes, bytes]:
+    """
+    Serialize the directories of an archive. If the entries do not fit in the root directory they are split into
+    leaf directories that the root directory points to.
+
+    :param entries: the tile entries in tile id order
+    :return: the root directory and the concatenated leaf directories
+    """
+    root_directory = _serialize_pmtiles_directory(entries)
+    if len(root_directory) <= _PMTILES_MAX_ROOT_DIRECTORY_LENGTH:
+        return root_directory, b""
+
+    leaf_size = 4096
+    while True:
+        root_entries = []
+        leaf_directories = bytearray()
+        for start in range(0, len(entries), leaf_size):
+            leaf_directory = _serialize_pmtiles_directory(entries[start : start + leaf_size])
+            root_entries.append(_PMTilesEntry(entries[start].tile_id, len(leaf_directories), len(leaf_directory), 0))
+            leaf_directories.extend(leaf_directory)
+        root_directory = _serialize_pmtiles_directory(root_entries)
+        if len(root_directory) <= _PMTILES_MAX_ROOT_DIRECTORY_LENGTH:
+            return root_directory, bytes(leaf_directories)
+        leaf_size *= 2
+
+
+def _serialize_pmtiles_directory(entries: List[_PMTilesEntry]) -> bytes:
+    """
+    Serialize and compress a PMTiles directory. The tile ids are delta encoded and offsets that directly follow the
+    previous entry are written as 0.
+
+    :param entries: the directory entries in tile id order
+    :return: the gzip compressed directory
+    """
+    buffer = bytearray()
+    _write_varint(buffer, len(entries))
+    last_tile_id = 0
+    for entry in entries:
+        _write_varint(buffer, entry.tile_id - last_tile_id)
+        last_tile_id = entry.tile_id
+    for entry in entries:
+        _write_varint(buffer, entry.run_length)
+    for entry in entries:
+        _write_varint(buffer, entry.length)
+    for index, entry in enumerate(entries):
+        if index > 0 and entry.offset == entries[index - 1].offset + entries[index - 1].length:
+            _write_varint(buffer, 0)
+        else:
+            _write_varint(buffer, entry.offset + 1)
+    return gzip.compress(bytes(buffer))
+
+
+def _deserialize_pmtiles_directory(buffer: bytes) -> List[_PMTilesEntry]:
+    """
+    Parse an uncompressed PMTiles directory.
+
+    :param buffer: the directory
+    :return: the directory entries
+    """
+    position = 0
+
+    def read_varint() -> int:
+        nonlocal position
+        value = 0
+        shift = 0
+        while True:
+            byte = buffer[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    num_entries = read_varint()
+    entries = []
+    last_tile_id = 0
+    for _ in range(num_entries):
+        last_tile_id += read_varint()
+        entries.append(_PMTilesEntry(last_tile_id, 0, 0, 0))
+    for entry in entries:
+        entry.run_length = read_varint()
+    for entry in entries:
+        entry.length = read_varint()
+    for index, entry in enumerate(entries):
+        offset = read_varint()
+        if offset == 0 and index > 0:
+            entry.offset = entries[index - 1].offset + entries[index - 1].length
+        else:
+            entry.offset = offset - 1
+    return entries
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    """
+    Append an unsigned LEB128 variable length integer to a buffer.
+
+    :param buffer: the buffer
+    :param value: the non-negative integer
+    """
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _decompress(data: bytes, compression: int) -> bytes:
+    """
+    Decompress a PMTiles directory or metadata block.
+
+    :param data: the compressed data
+    :param compression: the PMTiles compression type
+    :return: the uncompressed data
+    """
+    if compression == _PMTILES_COMPRESSION_GZIP:
+        return gzip.decompress(data)
+    if compression == _PMTILES_COMPRESSION_NONE:
+        return data
+    raise ValueError(f"Unsupported PMTiles compression type: {compression}")
+
+
+def _xyz_tile_bounds(zoom: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """
+    Compute the bounds of a spherical mercator tile numbered from the north.
+
+    :param zoom: the zoom level
+    :param x: the tile column
+    :param y: the tile row
+    :return: the (min_lon, min_lat, max_lon, max_lat) bounds in degrees
+    """
+    num_tiles = 1 << zoom
+
+    def tile_latitude(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1.0 - 2.0 * row / num_tiles))))
+
+    return x / num_tiles * 360.0 - 180.0, tile_latitude(y + 1), (x + 1) / num_tiles * 360.0 - 180.0, tile_latitude(y)
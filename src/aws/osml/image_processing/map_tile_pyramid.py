@@ -0,0 +1,429 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+import shapely
+from osgeo import gdalconst
+
+from aws.osml.gdal import GDALCompressionOptions, GDALImageFormats, RangeAdjustmentType, load_gdal_dataset
+from aws.osml.photogrammetry import GeodeticWorldCoordinate
+
+from .gdal_tile_factory import GDALTileFactory
+from .map_tile_sink import MapTileSink
+from .map_tileset import MapTile, MapTileId, MapTileSet
+
+logger = logging.getLogger(__name__)
+
+# The number of points sampled along each edge of the image when computing its footprint
+_FOOTPRINT_POINTS_PER_EDGE = 8
+
+# Tile factory options used unless they are overridden, map tiles are 8-bit PNG images
+_DEFAULT_TILE_FACTORY_KWARGS = {
+    "tile_format": GDALImageFormats.PNG,
+    "tile_compression": GDALCompressionOptions.NONE,
+    "output_type": gdalconst.GDT_Byte,
+    "range_adjustment": RangeAdjustmentType.DRA,
+}
+
+# The tile factory of each worker. GDAL datasets can not be shared between threads so every worker opens its own.
+_worker_state = threading.local()
+
+
+class MapTilePyramidGenerator:
+    """
+    This class renders every map tile that intersects the footprint of an image for a range of tile matrices (zoom
+    levels). Tiles at the most detailed level are orthorectified from the image in blocks of adjacent tiles (see
+    GDALTileFactory.create_orthophoto_meta_tile) while each coarser level is built by downsampling the tiles of the
+    level below it instead of reading the image again.
+
+    The work is spread across a pool of threads or processes. Each worker opens its own handle to the image, the
+    rendered tiles are passed to the sink from the calling thread so sinks do not need to be thread safe. The blocks
+    are rendered in quadtree order and each coarser tile is created as soon as the tiles it contains are done, so
+    only the tiles waiting on their siblings are held in memory regardless of the size of the image.
+
+    Note that the tile set is assumed to be a quadtree where the tile at (row, col) in one tile matrix covers tiles
+    (2*row, 2*col) through (2*row+1, 2*col+1) in the next one. This is true of WebMercatorQuad.
+    """
+
+    def __init__(
+        self,
+        image_path: str,
+        tile_set: MapTileSet,
+        min_tile_matrix: int,
+        max_tile_matrix: int,
+        tile_factory_kwargs: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        meta_tile_size: int = 4,
+    ) -> None:
+        """
+        Construct a generator for the map tiles of an image.
+
+        :param image_path: the path to the image, may be a local path or a virtual file system (e.g. /vsis3/...)
+        :param tile_set: the map tile set to generate tiles for
+        :param min_tile_matrix: the least detailed tile matrix (zoom level) to generate
+        :param max_tile_matrix: the most detailed tile matrix (zoom level) to generate
+        :param tile_factory_kwargs: optional keyword arguments for the GDALTileFactory of each worker, by default the
+                                    tiles are 8-bit PNG images with a dynamic range adjustment. These must be
+                                    picklable (e.g. an elevation model) when a process pool is used.
+        :param max_workers: the maximum number of workers, defaults to the executor's default
+        :param use_processes: render the tiles in a process pool instead of a thread pool
+        :param meta_tile_size: the number of tiles along each side of the blocks rendered together
+        """
+        if min_tile_matrix < 0 or max_tile_matrix < min_tile_matrix:
+            raise ValueError(f"Invalid tile matrix range: {min_tile_matrix} to {max_tile_matrix}")
+        if meta_tile_size < 1:
+            raise ValueError("Meta-tiles must contain at least 1 tile")
+        self.image_path = image_path
+        self.tile_set = tile_set
+        self.min_tile_matrix = min_tile_matrix
+        self.max_tile_matrix = max_tile_matrix
+        self.tile_factory_kwargs = dict(_DEFAULT_TILE_FACTORY_KWARGS)
+        if tile_factory_kwargs:
+            self.tile_factory_kwargs.update(tile_factory_kwargs)
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.meta_tile_size = meta_tile_size
+
+    def generate(self, sink: MapTileSink) -> int:
+        """
+        Render the map tiles and write them to a sink. Tiles that do not contain any part of the image are skipped.
+
+        :param sink: the destination for the rendered tiles
+        :return: the number of tiles written
+        """
+        meta_tiles = self.get_meta_tiles(self._get_footprint_coordinates(), self.max_tile_matrix)
+        pending_parents = _PendingParentTiles(
+            [map_tile.id for meta_tile in meta_tiles for tile_row in meta_tile for map_tile in tile_row],
+            self.min_tile_matrix,
+        )
+
+        # Only a few blocks are rendered ahead of the ones being written so the finished tiles do not pile up
+        max_running_meta_tiles = 2 * (self.max_workers or os.cpu_count() or 1)
+        meta_tile_iterator = iter(meta_tiles)
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        num_tiles = 0
+        with executor_class(
+            max_workers=self.max_workers,
+            initializer=_initialize_worker,
+            initargs=(self.image_path, self.tile_factory_kwargs),
+        ) as executor:
+            # Maps each running future to True if it is rendering a block of tiles or False if it is downsampling
+            running: Dict[Future, bool] = {}
+            num_running_meta_tiles = 0
+            while True:
+                while num_running_meta_tiles < max_running_meta_tiles:
+                    meta_tile = next(meta_tile_iterator, None)
+                    if meta_tile is None:
+                        break
+                    running[executor.submit(_render_meta_tile, meta_tile)] = True
+                    num_running_meta_tiles += 1
+                if not running:
+                    break
+
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if running.pop(future):
+                        num_running_meta_tiles -= 1
+                    for tile_id, tile_data in future.result():
+                        num_tiles += self._add_tile(executor, running, pending_parents, tile_id, tile_data, sink)
+
+        logger.debug(f"Wrote {num_tiles} tiles holding at most {pending_parents.max_held_tiles} tiles in memory")
+        return num_tiles
+
+    def get_meta_tiles(
+        self, footprint_coordinates: List[GeodeticWorldCoordinate], tile_matrix: int
+    ) -> List[List[List[MapTile]]]:
+        """
+        Group the map tiles that intersect an image footprint into blocks of adjacent tiles. The blocks are aligned
+        to multiples of the meta-tile size and returned in quadtree order so the tiles that make up a coarser tile
+        are rendered close together; a power of 2 meta-tile size keeps every coarser tile within as few blocks as
+        possible. Blocks only extend as far as the tiles that intersect the footprint.
+
+        :param footprint_coordinates: the boundary of the image footprint
+        :param tile_matrix: the tile matrix (zoom level)
+        :return: the blocks of tiles, each a list of rows of tiles from north to south
+        """
+        min_col, min_row, max_col, max_row = self.tile_set.get_tile_matrix_limits_for_area(
+            boundary_coordinates=footprint_coordinates, tile_matrix=tile_matrix
+        )
+        footprint = shapely.Polygon([(coordinate.longitude, coordinate.latitude) for coordinate in footprint_coordinates])
+        meta_tiles = []
+        for block_row in range(min_row // self.meta_tile_size, max_row // self.meta_tile_size + 1):
+            for block_col in range(min_col // self.meta_tile_size, max_col // self.meta_tile_size + 1):
+                block_tiles = {
+                    (tile_row, tile_col): self.tile_set.get_tile(
+                        MapTileId(tile_matrix=tile_matrix, tile_row=tile_row, tile_col=tile_col)
+                    )
+                    for tile_row in range(
+                        max(block_row * self.meta_tile_size, min_row),
+                        min((block_row + 1) * self.meta_tile_size, max_row + 1),
+                    )
+                    for tile_col in range(
+                        max(block_col * self.meta_tile_size, min_col),
+                        min((block_col + 1) * self.meta_tile_size, max_col + 1),
+                    )
+                }
+                tile_boxes = shapely.box(*np.array([map_tile.bounds for map_tile in block_tiles.values()]).T)
+                intersecting = [
+                    key
+                    for key, intersects in zip(block_tiles.keys(), shapely.intersects(tile_boxes, footprint))
+                    if intersects
+                ]
+                if not intersecting:
+                    continue
+                rows = [key[0] for key in intersecting]
+                cols = [key[1] for key in intersecting]
+                meta_tiles.append(
+                    (
+                        _quadtree_order(block_row, block_col),
+                        _order_tiles(
+                            [
+                                [block_tiles[(tile_row, tile_col)] for tile_col in range(min(cols), max(cols) + 1)]
+                                for tile_row in range(min(rows), max(rows) + 1)
+                            ]
+                        ),
+                    )
+                )
+        return [meta_tile for _, meta_tile in sorted(meta_tiles, key=lambda item: item[0])]
+
+    def _get_footprint_coordinates(self) -> List[GeodeticWorldCoordinate]:
+        """
+        Compute the boundary of the image in the world by sampling points along the edges of the image.
+
+        :return: the world coordinates of the boundary in order around the image
+        """
+        raster_dataset, sensor_model = load_gdal_dataset(self.image_path)
+        if sensor_model is None:
+            raise ValueError(f"Unable to create map tiles for an image without a sensor model: {self.image_path}")
+        width = raster_dataset.RasterXSize
+        height = raster_dataset.RasterYSize
+        steps = np.linspace(0.0, 1.0, _FOOTPRINT_POINTS_PER_EDGE, endpoint=False)
+        image_coordinates = np.concatenate(
+            [
+                np.column_stack((steps * width, np.zeros_like(steps))),
+                np.column_stack((np.full_like(steps, width), steps * height)),
+                np.column_stack(((1.0 - steps) * width, np.full_like(steps, height))),
+                np.column_stack((np.zeros_like(steps), (1.0 - steps) * height)),
+            ]
+        )
+        world_coordinates = sensor_model.image_to_world_batch(
+            image_coordinates, elevation_model=self.tile_factory_kwargs.get("elevation_model")
+        )
+        return [GeodeticWorldCoordinate(world_coordinate) for world_coordinate in world_coordinates]
+
+    def _add_tile(
+        self,
+        executor: Executor,
+        running: Dict[Future, bool],
+        pending_parents: "_PendingParentTiles",
+        tile_id: MapTileId,
+        tile_data: Optional[bytes],
+        sink: MapTileSink,
+    ) -> int:
+        """
+        Write a finished tile to the sink and start downsampling its parent once all of the parent's tiles are done.
+        Parents that would be empty are finished immediately, which may in turn finish their own parents.
+
+        :param executor: the executor to run the work on
+        :param running: the running futures, new downsampling work is added to it
+        :param pending_parents: the tiles waiting for their siblings to be finished
+        :param tile_id: the id of the finished tile
+        :param tile_data: the encoded tile or None if the tile is empty
+        :param sink: the destination for the tiles
+        :return: the number of tiles written
+        """
+        num_tiles = 0
+        while True:
+            if tile_data is not None:
+                sink.write_tile(tile_id, tile_data)
+                num_tiles += 1
+            completed = pending_parents.add(tile_id, tile_data)
+            if completed is None:
+                return num_tiles
+            parent_id, child_tiles = completed
+            if all(child_data is None for child_data in child_tiles.values()):
+                tile_id, tile_data = parent_id, None
+                continue
+
+            children = _order_tiles(
+                [
+                    [
+                        self.tile_set.get_tile(
+                            MapTileId(
+                                tile_matrix=parent_id.tile_matrix + 1,
+                                tile_row=2 * parent_id.tile_row + row_offset,
+                                tile_col=2 * parent_id.tile_col + col_offset,
+                            )
+                        )
+                        for col_offset in range(2)
+                    ]
+                    for row_offset in range(2)
+                ]
+            )
+            children_data = [[child_tiles.get(child.id) for child in child_row] for child_row in children]
+            future = executor.submit(
+                _downsample_tiles, parent_id, children_data, tuple(self.tile_set.get_tile(parent_id).size)
+            )
+            running[future] = False
+            return num_tiles
+
+
+class _PendingParentTiles:
+    """
+    This class holds finished map tiles until all of the tiles that make up their parent in the next less detailed
+    tile matrix are finished. The parents that will be created and the number of tiles each of them contains are
+    known up front from the tiles that will be rendered in the most detailed tile matrix.
+    """
+
+    def __init__(self, tile_ids: List[MapTileId], min_tile_matrix: int) -> None:
+        """
+        Construct the collection for the tiles of a pyramid.
+
+        :param tile_ids: the ids of the tiles that will be rendered in the most detailed tile matrix
+        :param min_tile_matrix: the least detailed tile matrix of the pyramid
+        """
+        self.min_tile_matrix = min_tile_matrix
+        self.expected_children: Dict[MapTileId, int] = {}
+        level_ids = set(tile_ids)
+        while level_ids and next(iter(level_ids)).tile_matrix > min_tile_matrix:
+            parent_ids = [_get_parent_id(tile_id) for tile_id in level_ids]
+            for parent_id in parent_ids:
+                self.expected_children[parent_id] = self.expected_children.get(parent_id, 0) + 1
+            level_ids = set(parent_ids)
+        self.children: Dict[MapTileId, Dict[MapTileId, Optional[bytes]]] = {}
+        self.num_held_tiles = 0
+        self.max_held_tiles = 0
+
+    def add(
+        self, tile_id: MapTileId, tile_data: Optional[bytes]
+    ) -> Optional[Tuple[MapTileId, Dict[MapTileId, Optional[bytes]]]]:
+        """
+        Add a finished tile. If it was the last tile its parent was waiting on the parent is released.
+
+        :param tile_id: the id of the finished tile
+        :param tile_data: the encoded tile or None if the tile is empty
+        :return: the parent id and its finished tiles if the parent is ready to be created, otherwise None
+        """
+        if tile_id.tile_matrix <= self.min_tile_matrix:
+            return None
+        parent_id = _get_parent_id(tile_id)
+        child_tiles = self.children.setdefault(parent_id, {})
+        child_tiles[tile_id] = tile_data
+        if tile_data is not None:
+            self.num_held_tiles += 1
+            self.max_held_tiles = max(self.max_held_tiles, self.num_held_tiles)
+        if len(child_tiles) < self.expected_children[parent_id]:
+            return None
+
+        del self.children[parent_id]
+        del self.expected_children[parent_id]
+        self.num_held_tiles -= sum(child_data is not None for child_data in child_tiles.values())
+        return parent_id, child_tiles
+
+
+def _get_parent_id(tile_id: MapTileId) -> MapTileId:
+    """
+    Get the id of the tile that contains a tile in the next less detailed tile matrix.
+
+    :param tile_id: the id of the tile
+    :return: the id of its parent
+    """
+    return MapTileId(tile_matrix=tile_id.tile_matrix - 1, tile_row=tile_id.tile_row // 2, tile_col=tile_id.tile_col // 2)
+
+
+def _quadtree_order(tile_row: int, tile_col: int) -> int:
+    """
+    Compute a sort key that orders tiles along a Z-order curve by interleaving the bits of the row and column. Every
+    quadtree node is then a contiguous run of the ordering so its tiles are all finished close together.
+
+    :param tile_row: the row of the tile
+    :param tile_col: the column of the tile
+    :return: the sort key
+    """
+    key = 0
+    for bit in range(max(tile_row.bit_length(), tile_col.bit_length())):
+        key |= ((tile_row >> bit) & 1) << (2 * bit + 1) | ((tile_col >> bit) & 1) << (2 * bit)
+    return key
+
+
+def _order_tiles(map_tiles: List[List[MapTile]]) -> List[List[MapTile]]:
+    """
+    Arrange a rectangular block of map tiles into rows from north to south with each row ordered from west to east.
+    The direction that tile rows are numbered in depends on the tile set so the bounds of the tiles are used.
+
+    :param map_tiles: the rows of tiles in the block
+    :return: the rows of tiles from north to south
+    """
+    # Bounds are (min_lon, min_lat, max_lon, max_lat)
+    if len(map_tiles) > 1 and map_tiles[1][0].bounds[3] > map_tiles[0][0].bounds[3]:
+        map_tiles = map_tiles[::-1]
+    if len(map_tiles[0]) > 1 and map_tiles[0][1].bounds[0] < map_tiles[0][0].bounds[0]:
+        map_tiles = [tile_row[::-1] for tile_row in map_tiles]
+    return map_tiles
+
+
+def _initialize_worker(image_path: str, tile_factory_kwargs: Dict[str, Any]) -> None:
+    """
+    Open the image and create the tile factory used by a worker.
+
+    :param image_path: the path to the image
+    :param tile_factory_kwargs: the keyword arguments for the tile factory
+    """
+    raster_dataset, sensor_model = load_gdal_dataset(image_path)
+    _worker_state.tile_factory = GDALTileFactory(raster_dataset, sensor_model, **tile_factory_kwargs)
+
+
+def _render_meta_tile(map_tiles: List[List[MapTile]]) -> List[Tuple[MapTileId, Optional[bytes]]]:
+    """
+    Render a block of map tiles using the tile factory of the current worker.
+
+    :param map_tiles: the rows of tiles in the block from north to south
+    :return: the id and encoded tile, or None if the tile is empty, for each tile in the block
+    """
+    encoded_tiles = _worker_state.tile_factory.create_orthophoto_meta_tile(map_tiles)
+    return [(tile_id, bytes(tile_data) if tile_data is not None else None) for tile_id, tile_data in encoded_tiles.items()]
+
+
+def _downsample_tiles(
+    tile_id: MapTileId, children: List[List[Optional[bytes]]], tile_size: Tuple[int, int]
+) -> List[Tuple[MapTileId, Optional[bytes]]]:
+    """
+    Create a map tile by combining and downsampling the 2x2 block of tiles it contains in the next tile matrix. The
+    color channels are weighted by their alpha values so the edges of the image do not blend with the empty pixels
+    around it.
+
+    :param tile_id: the id of the tile to create
+    :param children: the encoded child tiles as rows from north to south, None for missing tiles
+    :param tile_size: the size of the tile (width, height)
+    :return: the id and encoded tile, or None if the tile is empty
+    """
+    width, height = tile_size
+    combined = np.zeros((2 * height, 2 * width, 4), dtype=np.float32)
+    for row, child_row in enumerate(children):
+        for col, child_data in enumerate(child_row):
+            if child_data is None:
+                continue
+            child_pixels = cv2.imdecode(np.frombuffer(child_data, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+            if child_pixels.ndim == 2:
+                child_pixels = np.dstack((child_pixels, child_pixels, child_pixels))
+            if child_pixels.shape[2] == 3:
+                child_pixels = np.dstack((child_pixels, np.full(child_pixels.shape[0:2], 255, dtype=np.uint8)))
+            combined[row * height : (row + 1) * height, col * width : (col + 1) * width] = child_pixels
+
+    alpha = combined[..., 3:4] / 255.0
+    combined[..., 0:3] *= alpha
+    downsampled = cv2.resize(combined, (width, height), interpolation=cv2.INTER_AREA)
+    downsampled_alpha = downsampled[..., 3:4] / 255.0
+    if not np.any(downsampled_alpha > 0):
+        return [(tile_id, None)]
+    np.divide(downsampled[..., 0:3], downsampled_alpha, out=downsampled[..., 0:3], where=downsampled_alpha > 0)
+    output_pixels = np.clip(np.rint(downsampled), 0, 255).astype(np.uint8)
+    is_success, image_bytes = cv2.imencode(".png", output_pixels)
+    return [(tile_id, bytes(image_bytes) if is_success else None)]
@@ -0,0 +1,100 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import os
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from .map_tileset import MapTileId
+
+
+class MapTileSink(ABC):
+    """
+    This class provides an abstract interface to a destination for rendered map tiles. Sinks are used as context
+    managers so any buffered tiles are flushed when they are closed.
+    """
+
+    @abstractmethod
+    def write_tile(self, tile_id: MapTileId, tile_data: bytes) -> None:
+        """
+        Write an encoded map tile.
+
+        :param tile_id: the id of the tile
+        :param tile_data: the encoded tile
+        """
+
+    def close(self) -> None:
+        """
+        Flush and release any resources held by this sink. The default implementation does nothing.
+        """
+
+    def __enter__(self) -> "MapTileSink":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class DirectoryMapTileSink(MapTileSink):
+    """
+    This sink writes each map tile to its own file in a {tile_matrix}/{tile_col}/{tile_row} directory tree, the same
+    z/x/y layout used by most web map clients. The rows are numbered as they are in the tile set.
+    """
+
+    def __init__(self, root_directory: str, file_extension: str = "png") -> None:
+        """
+        Construct a sink that writes tiles under a root directory.
+
+        :param root_directory: the directory that will contain the tiles
+        :param file_extension: the extension of the tile files
+        """
+        self.root_directory = root_directory
+        self.file_extension = file_extension
+
+    def get_tile_path(self, tile_id: MapTileId) -> str:
+        """
+        Get the path of the file for a map tile.
+
+        :param tile_id: the id of the tile
+        :return: the path to the tile file
+        """
+        return os.path.join(
+            self.root_directory,
+            str(tile_id.tile_matrix),
+            str(tile_id.tile_col),
+            f"{tile_id.tile_row}.{self.file_extension}",
+        )
+
+    def write_tile(self, tile_id: MapTileId, tile_data: bytes) -> None:
+        """
+        Write an encoded map tile to its file, creating the directories as needed.
+
+        :param tile_id: the id of the tile
+        :param tile_data: the encoded tile
+        """
+        tile_path = self.get_tile_path(tile_id)
+        os.makedirs(os.path.dirname(tile_path), exist_ok=True)
+        with open(tile_path, "wb") as tile_file:
+            tile_file.write(tile_data)
+
+
+class CallbackMapTileSink(MapTileSink):
+    """
+    This sink passes each map tile to a callback function.
+    """
+
+    def __init__(self, callback: Callable[[MapTileId, bytes], None]) -> None:
+        """
+        Construct a sink that hands the tiles to a callback.
+
+        :param callback: the function called with the id and encoded data of every tile
+        """
+        self.callback = callback
+
+    def write_tile(self, tile_id: MapTileId, tile_data: bytes) -> None:
+        """
+        Pass an encoded map tile to the callback.
+
+        :param tile_id: the id of the tile
+        :param tile_data: the encoded tile
+        """
+        self.callback(tile_id, tile_data)
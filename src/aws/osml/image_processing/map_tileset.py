@@ -6,7 +6,7 @@ from dataclasses import dataclass
 
 from aws.osml.photogrammetry import GeodeticWorldCoordinate
 
-MapTileId = namedtuple("TildId", "tile_matrix tile_row tile_col")
+MapTileId = namedtuple("MapTileId", "tile_matrix tile_row tile_col")
 MapTileId.__doc__ = """
 This type represents the unique id of a map tile within a map tile set. It is implemented as a named tuple to make
 use of that constructs immutability and hashing features.
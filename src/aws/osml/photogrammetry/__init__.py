@@ -14,8 +14,8 @@ the image. In the current implementation support is provided for:
 * **SAR Sensor Independent Models**: Models as defined by the SICD and SIDD standards with metadata found in the NITF XML data segment.
 * **Perspective and Affine Projections**: Simple matrix based projections that can be computed from geolocations of the 4 image corners or `tags found in GeoTIFF images <https://docs.ogc.org/is/19-008r4/19-008r4.html#_geotiff_tags_for_coordinate_transformations>`_.
 
-*Note that the current implementation does not support the RSM Grid based sensor models or the adjustable parameter
-options. These features will be added in a future release.*
+*Note that the current implementation does not support the RSM adjustable parameter options. This feature will be
+added in a future release.*
 
 .. figure:: ../images/Photogrammetry-OODiagram.png
    :width: 400
@@ -109,17 +109,26 @@ APIs
 
 """
 
+from .approximated_sensor_model import ApproximatedSensorModel
 from .chipped_image_sensor_model import ChippedImageSensorModel
 from .composite_sensor_model import CompositeSensorModel
 from .conditional_elevation_model import ConditionalElevationModel
 from .coordinates import (
     GeodeticWorldCoordinate,
+    GeodeticWorldCoordinateArray,
     ImageCoordinate,
+    ImageCoordinateArray,
     WorldCoordinate,
+    WorldCoordinateArray,
     geocentric_to_geodetic,
+    geocentric_to_geodetic_array,
     geodetic_to_geocentric,
+    geodetic_to_geocentric_array,
 )
 from .defaulted_sensor_model import DefaultedSensorModel
+from .dem_tile_availability import DEMTileAvailabilityIndex
+from .dem_tile_cache import DEMTileCache, DEMTileCacheStatistics
+from .dem_tile_sampler import DEMInterpolationMethod, DEMTileSampler
 from .digital_elevation_model import DigitalElevationModel, DigitalElevationModelTileFactory, DigitalElevationModelTileSet
 from .elevation_model import ConstantElevationModel, ElevationModel, ElevationRegionSummary
 from .elevation_offset_provider import ConstantOffsetProvider, ElevationOffsetProvider
@@ -132,6 +141,8 @@ from .offset_elevation_model import OffsetElevationModel
 from .projective_sensor_model import ProjectiveSensorModel
 from .replacement_sensor_model import (
     RSMContext,
+    RSMGridPlane,
+    RSMGridSensorModel,
     RSMGroundDomain,
     RSMGroundDomainForm,
     RSMImageDomain,
@@ -140,7 +151,7 @@ from .replacement_sensor_model import (
     RSMPolynomialSensorModel,
     RSMSectionedPolynomialSensorModel,
 )
-from .rpc_sensor_model import RPCPolynomial, RPCSensorModel
+from .rpc_sensor_model import InverseRationalPolynomial, RPCPolynomial, RPCSensorModel
 from .sensor_model import SensorModel, SensorModelOptions
 from .sicd_sensor_model import (
     COAProjectionSet,
@@ -156,10 +167,16 @@ from .sicd_sensor_model import (
 from .srtm_dem_tile_set import SRTMTileSet
 
 __all__ = [
+    "ApproximatedSensorModel",
     "ChippedImageSensorModel",
     "CompositeSensorModel",
     "ConditionalElevationModel",
     "ConstantElevationModel",
+    "DEMInterpolationMethod",
+    "DEMTileAvailabilityIndex",
+    "DEMTileCache",
+    "DEMTileCacheStatistics",
+    "DEMTileSampler",
     "DigitalElevationModel",
     "DigitalElevationModelTileFactory",
     "DigitalElevationModelTileSet",
@@ -171,8 +188,11 @@ __all__ = [
     "GDALAffineSensorModel",
     "GenericDEMTileSet",
     "GeodeticWorldCoordinate",
+    "GeodeticWorldCoordinateArray",
     "INCAProjectionSet",
     "ImageCoordinate",
+    "ImageCoordinateArray",
+    "InverseRationalPolynomial",
     "MultiElevationModel",
     "PFAProjectionSet",
     "PlaneProjectionSet",
@@ -183,6 +203,8 @@ __all__ = [
     "RPCPolynomial",
     "RPCSensorModel",
     "RSMContext",
+    "RSMGridPlane",
+    "RSMGridSensorModel",
     "RSMGroundDomain",
     "RSMGroundDomainForm",
     "RSMImageDomain",
@@ -196,6 +218,9 @@ __all__ = [
     "SensorModel",
     "SensorModelOptions",
     "WorldCoordinate",
+    "WorldCoordinateArray",
     "geocentric_to_geodetic",
+    "geocentric_to_geodetic_array",
     "geodetic_to_geocentric",
+    "geodetic_to_geocentric_array",
 ]
@@ -0,0 +1,421 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import operator
+from math import ceil, pi
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from cachetools import LRUCache, cachedmethod
+
+from .coordinates import GeodeticWorldCoordinate, ImageCoordinate, as_coordinate_array, normalize_geodetic_coordinates
+from .elevation_model import ElevationModel
+from .math_utils import lagrange_interpolation_weights
+from .sensor_model import SensorModel
+
+
+class ApproximatedSensorModel(SensorModel):
+    """
+    This sensor model wraps another sensor model and approximates its transforms by interpolating dense lookup grids.
+    The image to world grid samples the wrapped model at regularly spaced pixels across the full image using a single
+    elevation model. The world to image grid samples the wrapped model at regularly spaced longitudes and latitudes
+    across the image footprint at two elevations bracketing the footprint.
+
+    The grids are split into cells that are only computed when a coordinate inside them is first transformed and the
+    most recently used cells are kept in memory. This allows images that only have small regions of interest to avoid
+    the cost of computing the full grid. Coordinates that fall outside the grids, or image to world requests that use
+    a different elevation model, are passed on to the wrapped sensor model. As with any other sensor model, image to
+    world requests without an elevation model do not use one; pass the grid's elevation model to use the grid.
+
+    The largest differences (in pixels) between the interpolated and exact transforms are measured at points between
+    the grid samples as each cell is computed and are available as max_image_to_world_error and
+    max_world_to_image_error.
+    """
+
+    def __init__(
+        self,
+        inner_sensor_model: SensorModel,
+        image_width: int,
+        image_height: int,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+        grid_spacing: float = 32.0,
+        cell_size: int = 16,
+        interpolation_order: int = 3,
+        cell_cache_size: int = 256,
+        elevation_margin: float = 100.0,
+    ) -> None:
+        """
+        Create the approximated model. No grid cells are computed until they are needed.
+
+        :param inner_sensor_model: the sensor model being approximated
+        :param image_width: the width of the image in pixels
+        :param image_height: the height of the image in pixels
+        :param elevation_model: the elevation model used to compute the image to world grid
+        :param options: optional dictionary of hints passed to the inner sensor model when computing the grids
+        :param grid_spacing: the distance between grid samples in pixels
+        :param cell_size: the number of grid intervals along each side of a cell
+        :param interpolation_order: 1 for bilinear interpolation, 3 for bicubic interpolation
+        :param cell_cache_size: the number of cells of each grid to keep in memory
+        :param elevation_margin: distance (meters) the world to image grid extends beyond the footprint elevations
+
+        :return: None
+        """
+        super().__init__()
+        self.inner_sensor_model = inner_sensor_model
+        self.image_width = image_width
+        self.image_height = image_height
+        self.elevation_model = elevation_model
+        self.options = options
+        self.grid_spacing = grid_spacing
+        self.cell_size = cell_size
+        self.interpolation_order = interpolation_order
+        self.elevation_margin = elevation_margin
+
+        # Both grids have the same number of intervals. Each cell also includes a one sample border shared with its
+        # neighbors so that the cubic interpolation windows never extend past the edge of a cell.
+        self.num_grid_columns = max(1, ceil(image_width / grid_spacing))
+        self.num_grid_rows = max(1, ceil(image_height / grid_spacing))
+        self.num_cell_columns = ceil(self.num_grid_columns / cell_size)
+        self.num_cell_rows = ceil(self.num_grid_rows / cell_size)
+
+        self.image_cell_cache: LRUCache = LRUCache(maxsize=cell_cache_size)
+        self.world_cell_cache: LRUCache = LRUCache(maxsize=cell_cache_size)
+        self.max_image_to_world_error = 0.0
+        self.max_world_to_image_error = 0.0
+        self._world_grid_bounds: Optional[np.ndarray] = None
+        self._world_grid_initialized = False
+
+    def image_to_world(
+        self,
+        image_coordinate: ImageCoordinate,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> GeodeticWorldCoordinate:
+        """
+        This function returns the longitude, latitude, elevation world coordinate associated with the x, y coordinate
+        of any pixel in the image.
+
+        :param image_coordinate: the x, y image coordinate
+        :param elevation_model: optional elevation model, the grid is only used if this is the grid's elevation model
+                                (including None when the grid was computed without an elevation model)
+        :param options: optional dictionary of hints passed to the inner sensor model if it is used
+
+        :return: the longitude, latitude, elevation world coordinate
+        """
+        world_coordinates = self.image_to_world_batch(
+            image_coordinate.coordinate.reshape(1, 2), elevation_model=elevation_model, options=options
+        )
+        return GeodeticWorldCoordinate(world_coordinates[0])
+
+    def world_to_image(self, world_coordinate: GeodeticWorldCoordinate) -> ImageCoordinate:
+        """
+        This function returns the x, y image coordinate associated with a given longitude, latitude, elevation world
+        coordinate.
+
+        :param world_coordinate: the longitude, latitude, elevation world coordinate
+
+        :return: the x, y image coordinate
+        """
+        return ImageCoordinate(self.world_to_image_batch(world_coordinate.coordinate.reshape(1, 3))[0])
+
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This function returns the longitude, latitude, elevation world coordinates associated with an array of x, y
+        image coordinates. Coordinates inside the image are interpolated from the image to world grid.
+
+        :param image_coordinates: an Nx2 array of x, y image coordinates
+        :param elevation_model: optional elevation model, the grid is only used if this is the grid's elevation model
+                                (including None when the grid was computed without an elevation model)
+        :param options: optional dictionary of hints passed to the inner sensor model if it is used
+
+        :return: an Nx3 array of longitude, latitude, elevation world coordinates
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        if elevation_model is not self.elevation_model:
+            return self.inner_sensor_model.image_to_world_batch(
+                image_coordinates, elevation_model=elevation_model, options=options
+            )
+
+        world_coordinates = np.full((image_coordinates.shape[0], 3), np.nan, dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            in_grid = (
+                np.all(image_coordinates >= 0.0, axis=1)
+                & (image_coordinates[:, 0] <= self.image_width)
+                & (image_coordinates[:, 1] <= self.image_height)
+            )
+        grid_positions = image_coordinates[in_grid] / self.grid_spacing
+        grid_world_coordinates = np.empty((grid_positions.shape[0], 3), dtype=np.float64)
+        for cell_row, cell_column, members in self._group_by_cell(grid_positions):
+            cell = self.get_image_to_world_cell(cell_row, cell_column)
+            grid_world_coordinates[members] = self._interpolate_cell(
+                cell, grid_positions[members] - self._cell_origin(cell_row, cell_column)
+            )
+        world_coordinates[in_grid] = normalize_geodetic_coordinates(grid_world_coordinates)
+
+        exact = ~np.all(np.isfinite(world_coordinates), axis=1)
+        if np.any(exact):
+            world_coordinates[exact] = self.inner_sensor_model.image_to_world_batch(
+                image_coordinates[exact],
+                elevation_model=self.elevation_model,
+                options=options if options is not None else self.options,
+            )
+        return world_coordinates
+
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function returns the x, y image coordinates associated with an array of longitude, latitude, elevation
+        world coordinates. Coordinates inside the footprint of the image and the elevation range of the grid are
+        interpolated from the world to image grid.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an Nx2 array of x, y image coordinates
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        image_coordinates = np.full((world_coordinates.shape[0], 2), np.nan, dtype=np.float64)
+
+        bounds = self._get_world_grid_bounds()
+        if bounds is not None:
+            min_lon, min_lat, min_elevation, max_lon, max_lat, max_elevation = bounds
+            grid_positions = np.column_stack(
+                [
+                    (_wrap_longitudes(world_coordinates[:, 0], min_lon) - min_lon)
+                    / (max_lon - min_lon)
+                    * self.num_grid_columns,
+                    (world_coordinates[:, 1] - min_lat) / (max_lat - min_lat) * self.num_grid_rows,
+                ]
+            )
+            elevation_fractions = (world_coordinates[:, 2] - min_elevation) / (max_elevation - min_elevation)
+            with np.errstate(invalid="ignore"):
+                in_grid = (
+                    np.all(grid_positions >= 0.0, axis=1)
+                    & (grid_positions[:, 0] <= self.num_grid_columns)
+                    & (grid_positions[:, 1] <= self.num_grid_rows)
+                    & (elevation_fractions >= 0.0)
+                    & (elevation_fractions <= 1.0)
+                )
+            grid_image_coordinates = np.empty((np.count_nonzero(in_grid), 2), dtype=np.float64)
+            for cell_row, cell_column, members in self._group_by_cell(grid_positions[in_grid]):
+                cell = self.get_world_to_image_cell(cell_row, cell_column)
+                grid_image_coordinates[members] = self._interpolate_layers(
+                    cell,
+                    grid_positions[in_grid][members] - self._cell_origin(cell_row, cell_column),
+                    elevation_fractions[in_grid][members],
+                )
+            image_coordinates[in_grid] = grid_image_coordinates
+
+        exact = ~np.all(np.isfinite(image_coordinates), axis=1)
+        if np.any(exact):
+            image_coordinates[exact] = self.inner_sensor_model.world_to_image_batch(world_coordinates[exact])
+        return image_coordinates
+
+    @cachedmethod(operator.attrgetter("image_cell_cache"))
+    def get_image_to_world_cell(self, cell_row: int, cell_column: int) -> np.ndarray:
+        """
+        Compute the world coordinates for the grid samples in one cell of the image to world grid. The longitudes are
+        unwrapped so cells crossing the antimeridian can be interpolated. Note that the results of this method are
+        cached by cell.
+
+        :param cell_row: the row of the cell
+        :param cell_column: the column of the cell
+
+        :return: an array of world coordinates shaped (cell_size + 3, cell_size + 3, 3)
+        """
+        num_samples = self.cell_size + 3
+        grid_positions = self._cell_sample_positions(cell_row, cell_column)
+        world_coordinates = self.inner_sensor_model.image_to_world_batch(
+            grid_positions * self.grid_spacing, elevation_model=self.elevation_model, options=self.options
+        )
+        finite_longitudes = world_coordinates[np.isfinite(world_coordinates[:, 0]), 0]
+        if finite_longitudes.size > 0:
+            world_coordinates[:, 0] = _wrap_longitudes(world_coordinates[:, 0], finite_longitudes[0])
+        cell = world_coordinates.reshape(num_samples, num_samples, 3)
+
+        # Measure the error of the interpolation at the centers of the intervals along the diagonal of the cell
+        check_positions = np.repeat(np.arange(self.cell_size, dtype=np.float64)[:, np.newaxis] + 1.5, 2, axis=1)
+        check_world_coordinates = normalize_geodetic_coordinates(self._interpolate_cell(cell, check_positions))
+        check_image_coordinates = (check_positions + self._cell_origin(cell_row, cell_column)) * self.grid_spacing
+        errors = np.linalg.norm(
+            self.inner_sensor_model.world_to_image_batch(check_world_coordinates) - check_image_coordinates, axis=1
+        )
+        if np.any(np.isfinite(errors)):
+            self.max_image_to_world_error = max(self.max_image_to_world_error, float(np.nanmax(errors)))
+        return cell
+
+    @cachedmethod(operator.attrgetter("world_cell_cache"))
+    def get_world_to_image_cell(self, cell_row: int, cell_column: int) -> np.ndarray:
+        """
+        Compute the image coordinates for the grid samples in one cell of the world to image grid. Each sample is
+        projected at both the minimum and maximum elevation of the grid. Note that the results of this method are
+        cached by cell.
+
+        :param cell_row: the row of the cell
+        :param cell_column: the column of the cell
+
+        :return: an array of image coordinates shaped (cell_size + 3, cell_size + 3, 4) containing the x, y at the
+                 minimum elevation followed by the x, y at the maximum elevation
+        """
+        num_samples = self.cell_size + 3
+        min_elevation, max_elevation = self._world_grid_bounds[[2, 5]]
+        lonlat = self._grid_positions_to_lonlat(self._cell_sample_positions(cell_row, cell_column))
+        layers = [
+            self.inner_sensor_model.world_to_image_batch(
+                np.column_stack([lonlat, np.full(lonlat.shape[0], elevation)])
+            ).reshape(num_samples, num_samples, 2)
+            for elevation in [min_elevation, max_elevation]
+        ]
+        cell = np.concatenate(layers, axis=2)
+
+        # Measure the error of the interpolation at the centers of the intervals along the diagonal of the cell and
+        # halfway between the two elevations
+        check_positions = np.repeat(np.arange(self.cell_size, dtype=np.float64)[:, np.newaxis] + 1.5, 2, axis=1)
+        check_image_coordinates = self._interpolate_layers(cell, check_positions, np.full(self.cell_size, 0.5))
+        check_lonlat = self._grid_positions_to_lonlat(check_positions + self._cell_origin(cell_row, cell_column))
+        check_world_coordinates = np.column_stack(
+            [check_lonlat, np.full(self.cell_size, (min_elevation + max_elevation) / 2.0)]
+        )
+        errors = np.linalg.norm(
+            self.inner_sensor_model.world_to_image_batch(check_world_coordinates) - check_image_coordinates, axis=1
+        )
+        if np.any(np.isfinite(errors)):
+            self.max_world_to_image_error = max(self.max_world_to_image_error, float(np.nanmax(errors)))
+        return cell
+
+    def _get_world_grid_bounds(self) -> Optional[np.ndarray]:
+        """
+        Compute the bounds of the world to image grid the first time they are needed. The longitude and latitude
+        bounds are found by projecting samples along the edges of the image and the elevation bounds are the range of
+        elevations of those samples extended by the elevation margin.
+
+        :return: the [min lon, min lat, min elevation, max lon, max lat, max elevation] or None if unavailable
+        """
+        if not self._world_grid_initialized:
+            self._world_grid_initialized = True
+            xs = np.arange(self.num_grid_columns + 1, dtype=np.float64) * self.image_width / self.num_grid_columns
+            ys = np.arange(self.num_grid_rows + 1, dtype=np.float64) * self.image_height / self.num_grid_rows
+            edge_coordinates = np.concatenate(
+                [
+                    np.column_stack([xs, np.zeros_like(xs)]),
+                    np.column_stack([xs, np.full_like(xs, self.image_height)]),
+                    np.column_stack([np.zeros_like(ys), ys]),
+                    np.column_stack([np.full_like(ys, self.image_width), ys]),
+                ]
+            )
+            edge_world_coordinates = self.inner_sensor_model.image_to_world_batch(
+                edge_coordinates, elevation_model=self.elevation_model, options=self.options
+            )
+            edge_world_coordinates = edge_world_coordinates[np.all(np.isfinite(edge_world_coordinates), axis=1)]
+            if edge_world_coordinates.shape[0] > 0:
+                edge_world_coordinates[:, 0] = _wrap_longitudes(edge_world_coordinates[:, 0], edge_world_coordinates[0, 0])
+                min_bounds = np.min(edge_world_coordinates, axis=0) - [0.0, 0.0, self.elevation_margin]
+                max_bounds = np.max(edge_world_coordinates, axis=0) + [0.0, 0.0, self.elevation_margin]
+                if np.all(max_bounds > min_bounds):
+                    self._world_grid_bounds = np.concatenate([min_bounds, max_bounds])
+        return self._world_grid_bounds
+
+    def _grid_positions_to_lonlat(self, grid_positions: np.ndarray) -> np.ndarray:
+        """
+        Convert positions in the world to image grid into longitude, latitude values.
+
+        :param grid_positions: an Nx2 array of grid positions (column, row)
+
+        :return: an Nx2 array of longitude, latitude values in radians
+        """
+        min_lon, min_lat, _, max_lon, max_lat, _ = self._world_grid_bounds
+        return np.column_stack(
+            [
+                min_lon + grid_positions[:, 0] * (max_lon - min_lon) / self.num_grid_columns,
+                min_lat + grid_positions[:, 1] * (max_lat - min_lat) / self.num_grid_rows,
+            ]
+        )
+
+    def _cell_origin(self, cell_row: int, cell_column: int) -> np.ndarray:
+        """
+        Get the grid position of the first sample in a cell. This is one sample before the cell's first interval.
+
+        :param cell_row: the row of the cell
+        :param cell_column: the column of the cell
+
+        :return: the grid position (column, row) of the first sample
+        """
+        return np.array([cell_column * self.cell_size - 1, cell_row * self.cell_size - 1], dtype=np.float64)
+
+    def _cell_sample_positions(self, cell_row: int, cell_column: int) -> np.ndarray:
+        """
+        Get the grid positions of all samples in a cell in row major order.
+
+        :param cell_row: the row of the cell
+        :param cell_column: the column of the cell
+
+        :return: an Nx2 array of grid positions (column, row)
+        """
+        offsets = np.arange(self.cell_size + 3, dtype=np.float64)
+        columns, rows = np.meshgrid(offsets, offsets)
+        return np.column_stack([columns.ravel(), rows.ravel()]) + self._cell_origin(cell_row, cell_column)
+
+    def _group_by_cell(self, grid_positions: np.ndarray) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """
+        Generate the groups of grid positions that fall in each cell. Positions on the far edge of the grid are
+        assigned to the last cell.
+
+        :param grid_positions: an Nx2 array of grid positions (column, row)
+
+        :return: a generator of (cell row, cell column, indexes of the positions in the cell)
+        """
+        cell_columns = np.clip(np.floor(grid_positions[:, 0] / self.cell_size), 0, self.num_cell_columns - 1)
+        cell_rows = np.clip(np.floor(grid_positions[:, 1] / self.cell_size), 0, self.num_cell_rows - 1)
+        cells = np.column_stack([cell_rows, cell_columns]).astype(int)
+        unique_cells, cell_assignments = np.unique(cells, axis=0, return_inverse=True)
+        cell_assignments = cell_assignments.reshape(-1)
+        for cell_number, (cell_row, cell_column) in enumerate(unique_cells):
+            yield int(cell_row), int(cell_column), np.flatnonzero(cell_assignments == cell_number)
+
+    def _interpolate_cell(self, cell: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        """
+        Interpolate the values stored in a cell using Lagrange polynomials of the configured order.
+
+        :param cell: an array of values shaped (rows, columns, components)
+        :param positions: an Nx2 array of positions (column, row) relative to the first sample in the cell
+
+        :return: an Nx(components) array of interpolated values
+        """
+        column_indexes, column_weights, _ = lagrange_interpolation_weights(
+            positions[:, 0], cell.shape[1], self.interpolation_order
+        )
+        row_indexes, row_weights, _ = lagrange_interpolation_weights(
+            positions[:, 1], cell.shape[0], self.interpolation_order
+        )
+        values = cell[row_indexes[:, :, np.newaxis], column_indexes[:, np.newaxis, :]]
+        return np.einsum("na,nb,nabk->nk", row_weights, column_weights, values)
+
+    def _interpolate_layers(self, cell: np.ndarray, positions: np.ndarray, elevation_fractions: np.ndarray) -> np.ndarray:
+        """
+        Interpolate the image coordinates stored in a world to image cell. The image coordinates are interpolated in
+        each elevation layer and then blended linearly between the layers.
+
+        :param cell: an array of image coordinates shaped (rows, columns, 4)
+        :param positions: an Nx2 array of positions (column, row) relative to the first sample in the cell
+        :param elevation_fractions: the N fractional positions between the minimum and maximum elevations
+
+        :return: an Nx2 array of image coordinates
+        """
+        values = self._interpolate_cell(cell, positions)
+        return values[:, 0:2] + elevation_fractions[:, np.newaxis] * (values[:, 2:4] - values[:, 0:2])
+
+
+def _wrap_longitudes(longitudes: np.ndarray, reference_longitude: float) -> np.ndarray:
+    """
+    Express longitudes as the closest equivalent angle to a reference longitude.
+
+    :param longitudes: the longitudes in radians
+    :param reference_longitude: the reference longitude in radians
+
+    :return: the wrapped longitudes in radians
+    """
+    return reference_longitude + np.mod(longitudes - reference_longitude + pi, 2.0 * pi) - pi
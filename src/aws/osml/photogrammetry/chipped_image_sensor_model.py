@@ -3,8 +3,9 @@
 from typing import Any, Dict, List, Optional
 
 import numpy as np
+import numpy.typing as npt
 
-from .coordinates import GeodeticWorldCoordinate, ImageCoordinate
+from .coordinates import GeodeticWorldCoordinate, ImageCoordinate, as_coordinate_array
 from .elevation_model import ElevationModel
 from .sensor_model import SensorModel
 from .transforms import ProjectiveTransform
@@ -28,7 +29,9 @@ class ChippedImageSensorModel(SensorModel):
         coordinates of the chip itself. Normally the chip coordinates will be based on the size of the chipped image
         (i.e. [0,0], [0, height] ...). It is important to make sure the coordinates are in the same order.
 
-        Note that this formulation also allows the chipped images to be scaled differently than the original.
+        Note that this formulation also allows the chipped images to be scaled differently than the original. If the
+        full image sensor model is itself a chipped image sensor model the two chip transforms are combined so
+        coordinates are converted to the original image in a single step.
 
         :param original_image_coordinates: locations in image related to chipped image bounds
         :param chipped_image_coordinates: bounds of the chipped image
@@ -37,10 +40,15 @@ class ChippedImageSensorModel(SensorModel):
         :return: None
         """
         super().__init__()
-        self.full_image_sensor_model = full_image_sensor_model
         src_coordinates = [image_coordinate.coordinate for image_coordinate in original_image_coordinates]
         dst_coordinates = [image_coordinate.coordinate for image_coordinate in chipped_image_coordinates]
-        self.full_to_chip_transform = ProjectiveTransform.estimate(np.vstack(src_coordinates), np.vstack(dst_coordinates))
+        full_to_chip_transform = ProjectiveTransform.estimate(np.vstack(src_coordinates), np.vstack(dst_coordinates))
+        if isinstance(full_image_sensor_model, ChippedImageSensorModel):
+            # Collapse a chip of a chip into a single transform from the original image
+            full_to_chip_transform = full_image_sensor_model.full_to_chip_transform.then(full_to_chip_transform)
+            full_image_sensor_model = full_image_sensor_model.full_image_sensor_model
+        self.full_image_sensor_model = full_image_sensor_model
+        self.full_to_chip_transform = full_to_chip_transform
 
     def image_to_world(
         self,
@@ -58,8 +66,9 @@ class ChippedImageSensorModel(SensorModel):
 
         :return: the longitude, latitude, elevation world coordinate
         """
-        full_coords = self.full_to_chip_transform.inverse(np.array([image_coordinate.coordinate]))
-        full_image_coordinate = ImageCoordinate(full_coords[0])
+        full_image_coordinate = ImageCoordinate(
+            self.full_to_chip_transform.inverse_point(image_coordinate.x, image_coordinate.y)
+        )
         return self.full_image_sensor_model.image_to_world(
             full_image_coordinate, elevation_model=elevation_model, options=options
         )
@@ -74,6 +83,37 @@ class ChippedImageSensorModel(SensorModel):
         :return: the x, y image coordinate
         """
         full_image_coordinate = self.full_image_sensor_model.world_to_image(world_coordinate)
-        chip_coords = self.full_to_chip_transform.forward(np.array([full_image_coordinate.coordinate]))
-        chipped_image_coordinate = ImageCoordinate(chip_coords[0])
-        return chipped_image_coordinate
+        return ImageCoordinate(self.full_to_chip_transform.forward_point(full_image_coordinate.x, full_image_coordinate.y))
+
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This function converts an array of chip coordinates to full image coordinates and then passes them on to the
+        batch image_to_world of the full image sensor model.
+
+        :param image_coordinates: an Nx2 array of x, y image coordinates
+        :param elevation_model: an elevation model used to transform the coordinates
+        :param options: a dictionary of options that will be passed on to the full image sensor model
+
+        :return: an Nx3 array of longitude, latitude, elevation world coordinates
+        """
+        full_image_coordinates = self.full_to_chip_transform.inverse(as_coordinate_array(image_coordinates, 2))
+        return self.full_image_sensor_model.image_to_world_batch(
+            full_image_coordinates, elevation_model=elevation_model, options=options
+        )
+
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function uses the batch world_to_image of the full image sensor model and then converts the resulting
+        full image coordinates into chip coordinates.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an Nx2 array of x, y image coordinates
+        """
+        full_image_coordinates = self.full_image_sensor_model.world_to_image_batch(world_coordinates)
+        return self.full_to_chip_transform.forward(full_image_coordinates)
@@ -3,6 +3,9 @@
 
 from typing import Any, Dict, Optional
 
+import numpy as np
+import numpy.typing as npt
+
 from .coordinates import GeodeticWorldCoordinate, ImageCoordinate
 from .elevation_model import ElevationModel
 from .sensor_model import SensorModel, SensorModelOptions
@@ -66,3 +69,38 @@ class CompositeSensorModel(SensorModel):
         :return: the x, y image coordinate
         """
         return self.precision_sensor_model.world_to_image(world_coordinate)
+
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This function first calls the approximate model's image_to_world_batch function to get initial guesses for
+        every coordinate and then passes those to the more accurate model as an Nx2 'initial_guess' option.
+
+        :param image_coordinates: an Nx2 array of x, y image coordinates
+        :param elevation_model: an optional elevation model used to transform the coordinates
+        :param options: the options that will be augmented and then passed along
+
+        :return: an Nx3 array of longitude, latitude, elevation world coordinates
+        """
+        approximate_coords = self.approximate_sensor_model.image_to_world_batch(
+            image_coordinates, elevation_model=elevation_model, options=options
+        )
+        updated_options = options.copy() if options is not None else {}
+        updated_options[SensorModelOptions.INITIAL_GUESS] = approximate_coords[:, 0:2]
+        return self.precision_sensor_model.image_to_world_batch(
+            image_coordinates, elevation_model=elevation_model, options=updated_options
+        )
+
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This is just a pass through to the more accurate sensor model's world_to_image_batch.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an Nx2 array of x, y image coordinates
+        """
+        return self.precision_sensor_model.world_to_image_batch(world_coordinates)
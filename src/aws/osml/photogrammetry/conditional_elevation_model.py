@@ -1,6 +1,9 @@
 #  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
 
-from typing import Optional
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
 
 from .coordinates import GeodeticWorldCoordinate
 from .elevation_model import ElevationModel, ElevationRegionSummary
@@ -42,6 +45,29 @@ class ConditionalElevationModel(ElevationModel):
             return self.inner_elevation_model.set_elevation(world_coordinate)
         return False
 
+    def get_elevations(self, longitudes: npt.ArrayLike, latitudes: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get elevations using the inner model for the locations that pass the condition.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: an array of elevations (NaN where unavailable) and a boolean mask of the valid elevations
+        """
+        longitudes, latitudes = np.broadcast_arrays(
+            np.asarray(longitudes, dtype=np.float64), np.asarray(latitudes, dtype=np.float64)
+        )
+        elevations = np.full(longitudes.shape, np.nan, dtype=np.float64)
+        valid = np.zeros(longitudes.shape, dtype=bool)
+        passed = self.em_condition.are_true(
+            np.column_stack([longitudes.ravel(), latitudes.ravel(), np.zeros(longitudes.size)])
+        ).reshape(longitudes.shape)
+        if passed.any():
+            elevations[passed], valid[passed] = self.inner_elevation_model.get_elevations(
+                longitudes[passed], latitudes[passed]
+            )
+        return elevations, valid
+
     def describe_region(
         self,
         world_coordinate: GeodeticWorldCoordinate,
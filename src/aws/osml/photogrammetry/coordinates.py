@@ -1,10 +1,12 @@
 #  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
 #  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
 
+import math
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
 import numpy as np
 import numpy.typing as npt
 import pyproj
-from pyproj.enums import TransformDirection
 
 
 class WorldCoordinate:
@@ -14,6 +16,8 @@ class WorldCoordinate:
     Earth-Centered Earth-Fixed or coordinates based on a local tangent plane).
     """
 
+    __slots__ = ("coordinate",)
+
     def __init__(self, coordinate: npt.ArrayLike = None) -> None:
         """
         Constructs a world coordinate from an x, y, z triple. The triple can be expressed as a List or any other
@@ -101,6 +105,8 @@ class GeodeticWorldCoordinate(WorldCoordinate):
     #. Any unknown directives will be ignored
     """
 
+    __slots__ = ()
+
     def __init__(self, coordinate: npt.ArrayLike = None) -> None:
         """
         Constructs a geodetic world coordinate from a longitude, latitude, elevation triple. The longitude and
@@ -153,78 +159,8 @@ class GeodeticWorldCoordinate(WorldCoordinate):
 
     def __format__(self, format_spec: str) -> str:
         if format_spec is None or format_spec == "":
-            format_spec = "%ld%lm%ls%lH %od%om%os%oH %E"
-
-        lat_degrees = np.degrees(self.latitude)
-        lh = "N"
-        if lat_degrees < 0:
-            lat_degrees *= -1.0
-            lh = "S"
-        ld = int(round(lat_degrees, 6))
-        lm = int(round(lat_degrees - ld, 6) * 60)
-        ls = int(round(lat_degrees - ld - lm / 60, 6) * 3600)
-
-        lon_degrees = np.degrees(self.longitude)
-        oh = "E"
-        if lon_degrees < 0:
-            lon_degrees *= -1.0
-            oh = "W"
-        od = int(round(lon_degrees, 6))
-        om = int(round(lon_degrees - od, 6) * 60)
-        os = int(round(lon_degrees - od - om / 60, 6) * 3600)
-
-        result = []
-        i = 0
-        while i < len(format_spec):
-            if format_spec[i] == "%" and (i + 1) < len(format_spec):
-                i += 1
-                directive = format_spec[i]
-                if directive == "L":
-                    result.append(str(self.latitude))
-                elif directive == "O":
-                    result.append(str(self.longitude))
-                elif directive == "l":
-                    if (i + 1) < len(format_spec) and format_spec[i + 1] in ["d", "m", "s", "h", "H"]:
-                        i += 1
-                        part = format_spec[i]
-                        if part == "d":
-                            result.append(format(ld, "02d"))
-                        elif part == "m":
-                            result.append(format(lm, "02d"))
-                        elif part == "s":
-                            result.append(format(ls, "02d"))
-                        elif part == "h":
-                            result.append(lh.lower())
-                        else:
-                            # part must equal 'H'
-                            result.append(lh)
-                    else:
-                        result.append(str(lat_degrees))
-                elif directive == "o":
-                    if (i + 1) < len(format_spec) and format_spec[i + 1] in ["d", "m", "s", "h", "H"]:
-                        i += 1
-                        part = format_spec[i]
-                        if part == "d":
-                            result.append(format(od, "03d"))
-                        elif part == "m":
-                            result.append(format(om, "02d"))
-                        elif part == "s":
-                            result.append(format(os, "02d"))
-                        elif part == "h":
-                            result.append(oh.lower())
-                        else:
-                            # part must equal 'H'
-                            result.append(oh)
-                    else:
-                        result.append(str(lon_degrees))
-                elif directive == "E":
-                    result.append(str(self.elevation))
-                elif directive == "%":
-                    result.append("%")
-            else:
-                result.append(format_spec[i])
-            i += 1
-        return "".join(result)
+            format_spec = DEFAULT_GEODETIC_FORMAT_SPEC
+        return _format_geodetic_coordinates(self.coordinate.reshape(1, 3), format_spec)[0]
 
     def normalized(self) -> "GeodeticWorldCoordinate":
         """
@@ -260,68 +196,192 @@ class GeodeticWorldCoordinate(WorldCoordinate):
 
         :return: the new geodetic world coordinate
         """
-        wc = self.normalized()
-        lat = wc.latitude
-        lon = wc.longitude
-        # Adjust longitude by 360 amount to barely pass min_lon.
-        lon += np.ceil((min_lon - lon) / (2 * np.pi)) * 2 * np.pi
-        if lon > max_lon:
-            # Last shot is flipping latitude.
-            lon -= np.pi
-            if lon < min_lon:
-                raise ValueError(f"{self.longitude} not in {min_lon}:{max_lon}.")
-            # else
-            lat = np.pi - lat
-        # For latitude, first try 360 normalization.
-        tlat = lat + np.ceil((min_lat - lat) / (2 * np.pi)) * 2 * np.pi
-        if tlat > max_lat:
-            # If that fails, check changing sides.
-            lon += np.pi
-            lon += np.ceil((min_lon - lon) / (2 * np.pi)) * 2 * np.pi
-            if lon > max_lon:
-                raise ValueError(f"({self.longitude}, {self.latitude}) not in ({min_lon}:{max_lon}, {min_lat}:{max_lat}).")
-            # else
-            lat = np.pi - lat
-            lat += np.ceil((min_lat - lat) / (2 * np.pi)) * 2 * np.pi
-            if lat > max_lat:
-                raise ValueError(f"{self.latitude} not in {min_lat}:{max_lat}.")
-        else:
-            lat = tlat
         return self.__class__(
-            (
-                lon,
-                lat,
-                wc.elevation,
-            ),
+            range_adjust_geodetic_coordinates(self.coordinate.reshape(1, 3), min_lon, max_lon, min_lat, max_lat)[0]
         )
 
 
-# These are common definitions of projections used by Pyproj. They are used when converting between an Earth Centered
-# Earth Fixed (ECEF or geocentric) coordinate system that uses cartesian coordinates and a longitude, latitude based
-# geographic coordinate system. Both of these systems use the WGS84 datum which is a widely used standard among our
-# customers
+# This is the format used when a GeodeticWorldCoordinate is formatted without a format specification
+DEFAULT_GEODETIC_FORMAT_SPEC = "%ld%lm%ls%lH %od%om%os%oH %E"
+
+
+def _parse_geodetic_format(format_spec: str) -> List[Tuple[bool, str]]:
+    """
+    Splits a geodetic format specification into its literal characters and % directives.
+
+    :param format_spec: the format specification, see GeodeticWorldCoordinate for the supported directives
+
+    :return: a list of (is_directive, value) tuples where value is the directive without the leading %
+    """
+    tokens = []
+    i = 0
+    while i < len(format_spec):
+        if format_spec[i] == "%" and (i + 1) < len(format_spec):
+            i += 1
+            directive = format_spec[i]
+            if directive in ["l", "o"] and (i + 1) < len(format_spec) and format_spec[i + 1] in ["d", "m", "s", "h", "H"]:
+                i += 1
+                directive += format_spec[i]
+            tokens.append((True, directive))
+        else:
+            tokens.append((False, format_spec[i]))
+        i += 1
+    return tokens
+
+
+def _round_6(values: np.ndarray) -> np.ndarray:
+    """
+    Rounds values to 6 decimal places matching the results of Python's round(). The NumPy equivalent can differ for
+    values within floating point error of a tie so those values are rounded individually.
+
+    :param values: the values to round
+
+    :return: the rounded values
+    """
+    rounded = np.round(values, 6)
+    scaled = values * 1e6
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-3
+    for index in np.flatnonzero(near_tie):
+        rounded.flat[index] = round(float(values.flat[index]), 6)
+    return rounded
+
+
+def _dms_fields(angles: np.ndarray, prefix: str, degree_digits: int, hemispheres: Tuple[str, str]) -> Dict[str, List[str]]:
+    """
+    Computes the formatted fields of an array of angles for the degrees, minutes, seconds directives.
+
+    :param angles: the angles in radians
+    :param prefix: the directive prefix, l for latitude or o for longitude
+    :param degree_digits: the number of digits used for the degrees
+    :param hemispheres: the hemisphere letters used for positive and negative angles
+
+    :return: the formatted values for each directive keyed by the directive
+    """
+    angle_degrees = np.degrees(angles)
+    negative = angle_degrees < 0
+    angle_degrees = np.where(negative, -angle_degrees, angle_degrees)
+    d = np.trunc(_round_6(angle_degrees))
+    m = np.trunc(_round_6(angle_degrees - d) * 60)
+    s = np.trunc(_round_6(angle_degrees - d - m / 60) * 3600)
+    hemisphere = np.where(negative, hemispheres[1], hemispheres[0]).tolist()
+    return {
+        prefix: [str(value) for value in angle_degrees.tolist()],
+        f"{prefix}d": [format(value, f"0{degree_digits}d") for value in d.astype(np.int64).tolist()],
+        f"{prefix}m": [format(value, "02d") for value in m.astype(np.int64).tolist()],
+        f"{prefix}s": [format(value, "02d") for value in s.astype(np.int64).tolist()],
+        f"{prefix}h": [value.lower() for value in hemisphere],
+        f"{prefix}H": hemisphere,
+    }
+
+
+def _format_geodetic_coordinates(geodetic_coordinates: np.ndarray, format_spec: str) -> List[str]:
+    """
+    Formats an array of geodetic coordinates. The numeric fields are computed for all the coordinates at once
+    and then combined with the literal parts of the format specification.
+
+    :param geodetic_coordinates: an Nx3 array of geodetic coordinates (radians, radians, meters)
+    :param format_spec: the format specification, see GeodeticWorldCoordinate for the supported directives
+
+    :return: the formatted coordinates
+    """
+    tokens = _parse_geodetic_format(format_spec)
+    directives = {value for is_directive, value in tokens if is_directive}
+    count = geodetic_coordinates.shape[0]
+    fields: Dict[str, List[str]] = {"%": ["%"] * count}
+    if directives & {"l", "ld", "lm", "ls", "lh", "lH"}:
+        fields.update(_dms_fields(geodetic_coordinates[:, 1], "l", 2, ("N", "S")))
+    if directives & {"o", "od", "om", "os", "oh", "oH"}:
+        fields.update(_dms_fields(geodetic_coordinates[:, 0], "o", 3, ("E", "W")))
+    if "L" in directives:
+        fields["L"] = [str(value) for value in geodetic_coordinates[:, 1].tolist()]
+    if "O" in directives:
+        fields["O"] = [str(value) for value in geodetic_coordinates[:, 0].tolist()]
+    if "E" in directives:
+        fields["E"] = [str(value) for value in geodetic_coordinates[:, 2].tolist()]
+
+    # Unknown directives are ignored
+    parts = [fields.get(value, [""] * count) if is_directive else [value] * count for is_directive, value in tokens]
+    return ["".join(coordinate_parts) for coordinate_parts in zip(*parts)] if parts else [""] * count
+
+
+# These are common definitions of projections used by Pyproj. They describe an Earth Centered Earth Fixed (ECEF or
+# geocentric) coordinate system that uses cartesian coordinates and a longitude, latitude based geographic coordinate
+# system. Both of these systems use the WGS84 datum which is a widely used standard among our customers. Conversions
+# between the two are computed in closed form below since calling Pyproj for individual points is comparatively slow.
 ECEF_PROJ = pyproj.Proj(proj="geocent", ellps="WGS84", datum="WGS84")
 LLA_PROJ = pyproj.Proj(proj="latlong", ellps="WGS84", datum="WGS84")
 GEODETIC_TO_GEOCENTRIC_TRANSFORM = pyproj.Transformer.from_proj(LLA_PROJ, ECEF_PROJ)
 
+# Defining parameters of the WGS84 ellipsoid, see NGA.STND.0036_1.0.0_WGS84
+WGS84_SEMI_MAJOR_AXIS = 6378137.0
+WGS84_FLATTENING = 1.0 / 298.257223563
+WGS84_ECCENTRICITY_SQUARED = WGS84_FLATTENING * (2.0 - WGS84_FLATTENING)
+_WGS84_SEMI_MINOR_AXIS = WGS84_SEMI_MAJOR_AXIS * (1.0 - WGS84_FLATTENING)
+_WGS84_SECOND_ECCENTRICITY_SQUARED = WGS84_ECCENTRICITY_SQUARED / (1.0 - WGS84_ECCENTRICITY_SQUARED)
+
+# The number of refinements of Bowring's latitude estimate used when converting geocentric to geodetic coordinates
+_BOWRING_ITERATIONS = 2
+
+
+def _bowring_latitude_terms(p, z):
+    """
+    Estimates the geodetic latitude of geocentric points using Bowring's method. The latitude is kept as the two
+    terms of an arctangent so the iterations need only arithmetic and square roots. This works on either floats or
+    NumPy arrays.
+
+    :param p: the distance of each point from the Earth's axis of rotation in meters
+    :param z: the ECEF z component of each point in meters
+
+    :return: the terms (sin_term, cos_term) where latitude = atan2(sin_term, cos_term)
+    """
+    sin_term = z
+    cos_term = p * (1.0 - WGS84_ECCENTRICITY_SQUARED)
+    for _ in range(_BOWRING_ITERATIONS):
+        # Sine and cosine of the reduced (parametric) latitude of the current estimate
+        reduced_sin = (1.0 - WGS84_FLATTENING) * sin_term
+        reduced_norm = (cos_term * cos_term + reduced_sin * reduced_sin) ** 0.5
+        sin_beta = reduced_sin / reduced_norm
+        cos_beta = cos_term / reduced_norm
+        sin_term = z + _WGS84_SECOND_ECCENTRICITY_SQUARED * _WGS84_SEMI_MINOR_AXIS * sin_beta * sin_beta * sin_beta
+        cos_term = p - WGS84_ECCENTRICITY_SQUARED * WGS84_SEMI_MAJOR_AXIS * cos_beta * cos_beta * cos_beta
+    return sin_term, cos_term
+
+
+def _geodetic_elevation(p, z, sin_term, cos_term):
+    """
+    Computes the height above the ellipsoid of geocentric points with a known latitude. This form remains stable
+    near the poles. This works on either floats or NumPy arrays.
+
+    :param p: the distance of each point from the Earth's axis of rotation in meters
+    :param z: the ECEF z component of each point in meters
+    :param sin_term: the arctangent terms of the latitude from _bowring_latitude_terms
+    :param cos_term: the arctangent terms of the latitude from _bowring_latitude_terms
+
+    :return: the elevation of each point in meters
+    """
+    norm = (sin_term * sin_term + cos_term * cos_term) ** 0.5
+    sin_lat = sin_term / norm
+    cos_lat = cos_term / norm
+    return p * cos_lat + z * sin_lat - WGS84_SEMI_MAJOR_AXIS * (1.0 - WGS84_ECCENTRICITY_SQUARED * sin_lat * sin_lat) ** 0.5
+
 
 def geocentric_to_geodetic(ecef_world_coordinate: WorldCoordinate) -> GeodeticWorldCoordinate:
     """
     Converts a ECEF world coordinate (x, y, z) in meters into a (longitude, latitude, elevation) geodetic coordinate
-    with units of radians, radians, meters.
+    with units of radians, radians, meters. The latitude and elevation of the Earth's center are undefined and are
+    returned as NaN to match geocentric_to_geodetic_array.
 
     :param ecef_world_coordinate: the geocentric coordinate
 
     :return: the geodetic coordinate
     """
+    x, y, z = ecef_world_coordinate.coordinate.tolist()
+    p = math.hypot(x, y)
+    if p == 0.0 and z == 0.0:
+        return GeodeticWorldCoordinate([math.atan2(y, x), math.nan, math.nan])
+    sin_term, cos_term = _bowring_latitude_terms(p, z)
     return GeodeticWorldCoordinate(
-        GEODETIC_TO_GEOCENTRIC_TRANSFORM.transform(
-            ecef_world_coordinate.x,
-            ecef_world_coordinate.y,
-            ecef_world_coordinate.z,
-            radians=True,
-            direction=TransformDirection.INVERSE,
-        )
+        [math.atan2(y, x), math.atan2(sin_term, cos_term), _geodetic_elevation(p, z, sin_term, cos_term)]
     )
 
 
@@ -334,17 +394,201 @@ def geodetic_to_geocentric(geodetic_coordinate: GeodeticWorldCoordinate) -> Worl
 
     :return: the geocentric coordinate
     """
+    longitude, latitude, elevation = geodetic_coordinate.coordinate.tolist()
+    sin_lat = math.sin(latitude)
+    cos_lat = math.cos(latitude)
+    prime_vertical_radius = WGS84_SEMI_MAJOR_AXIS / math.sqrt(1.0 - WGS84_ECCENTRICITY_SQUARED * sin_lat * sin_lat)
     return WorldCoordinate(
-        GEODETIC_TO_GEOCENTRIC_TRANSFORM.transform(
-            geodetic_coordinate.longitude,
-            geodetic_coordinate.latitude,
-            geodetic_coordinate.elevation,
-            radians=True,
-            direction=TransformDirection.FORWARD,
+        [
+            (prime_vertical_radius + elevation) * cos_lat * math.cos(longitude),
+            (prime_vertical_radius + elevation) * cos_lat * math.sin(longitude),
+            (prime_vertical_radius * (1.0 - WGS84_ECCENTRICITY_SQUARED) + elevation) * sin_lat,
+        ]
+    )
+
+
+def geocentric_to_geodetic_array(ecef_coordinates: npt.ArrayLike) -> np.ndarray:
+    """
+    Converts an array of ECEF world coordinates [[x, y, z], ...] in meters into an array of geodetic coordinates
+    [[longitude, latitude, elevation], ...] with units of radians, radians, meters.
+
+    The latitude is found using Bowring's method which converges to well below a millimeter after two iterations for
+    points from near the surface of the Earth out past geosynchronous orbit. The latitude and elevation of the Earth's
+    center are undefined and are returned as NaN.
+
+    :param ecef_coordinates: an Nx3 array of geocentric coordinates
+
+    :return: an Nx3 array of geodetic coordinates
+    """
+    ecef_coordinates = as_coordinate_array(ecef_coordinates, 3)
+    x = ecef_coordinates[:, 0]
+    y = ecef_coordinates[:, 1]
+    z = ecef_coordinates[:, 2]
+    p = np.hypot(x, y)
+    with np.errstate(invalid="ignore"):
+        sin_term, cos_term = _bowring_latitude_terms(p, z)
+        elevation = _geodetic_elevation(p, z, sin_term, cos_term)
+    return np.column_stack((np.arctan2(y, x), np.arctan2(sin_term, cos_term), elevation))
+
+
+def geodetic_to_geocentric_array(geodetic_coordinates: npt.ArrayLike) -> np.ndarray:
+    """
+    Converts an array of geodetic coordinates [[longitude, latitude, elevation], ...] with units of radians, radians,
+    meters into an array of ECEF / geocentric world coordinates [[x, y, z], ...] in meters.
+
+    :param geodetic_coordinates: an Nx3 array of geodetic coordinates
+
+    :return: an Nx3 array of geocentric coordinates
+    """
+    geodetic_coordinates = as_coordinate_array(geodetic_coordinates, 3)
+    longitude = geodetic_coordinates[:, 0]
+    latitude = geodetic_coordinates[:, 1]
+    elevation = geodetic_coordinates[:, 2]
+    sin_lat = np.sin(latitude)
+    cos_lat = np.cos(latitude)
+    prime_vertical_radius = WGS84_SEMI_MAJOR_AXIS / np.sqrt(1.0 - WGS84_ECCENTRICITY_SQUARED * sin_lat * sin_lat)
+    return np.column_stack(
+        (
+            (prime_vertical_radius + elevation) * cos_lat * np.cos(longitude),
+            (prime_vertical_radius + elevation) * cos_lat * np.sin(longitude),
+            (prime_vertical_radius * (1.0 - WGS84_ECCENTRICITY_SQUARED) + elevation) * sin_lat,
         )
     )
 
 
+def geodetic_to_geocentric_jacobian(geodetic_coordinates: npt.ArrayLike) -> np.ndarray:
+    """
+    Computes the partial derivatives of the WGS84 ECEF coordinates (x, y, z) with respect to the geodetic coordinates
+    (longitude, latitude, elevation) for an array of geodetic coordinates. These are the closed form derivatives of the
+    geodetic to geocentric equations using the prime vertical (N) and meridional (M) radii of curvature.
+
+    :param geodetic_coordinates: an Nx3 array of geodetic coordinates (radians, radians, meters)
+
+    :return: an Nx3x3 array where [i, j, k] is the derivative of ECEF component j with respect to geodetic component k
+    """
+    geodetic_coordinates = as_coordinate_array(geodetic_coordinates, 3)
+    longitude = geodetic_coordinates[:, 0]
+    latitude = geodetic_coordinates[:, 1]
+    elevation = geodetic_coordinates[:, 2]
+    sin_lon = np.sin(longitude)
+    cos_lon = np.cos(longitude)
+    sin_lat = np.sin(latitude)
+    cos_lat = np.cos(latitude)
+
+    w_squared = 1.0 - WGS84_ECCENTRICITY_SQUARED * sin_lat * sin_lat
+    prime_vertical_radius = WGS84_SEMI_MAJOR_AXIS / np.sqrt(w_squared)
+    meridional_radius = WGS84_SEMI_MAJOR_AXIS * (1.0 - WGS84_ECCENTRICITY_SQUARED) / (w_squared * np.sqrt(w_squared))
+
+    jacobians = np.zeros((geodetic_coordinates.shape[0], 3, 3), dtype=np.float64)
+    jacobians[:, 0, 0] = -(prime_vertical_radius + elevation) * cos_lat * sin_lon
+    jacobians[:, 1, 0] = (prime_vertical_radius + elevation) * cos_lat * cos_lon
+    jacobians[:, 0, 1] = -(meridional_radius + elevation) * sin_lat * cos_lon
+    jacobians[:, 1, 1] = -(meridional_radius + elevation) * sin_lat * sin_lon
+    jacobians[:, 2, 1] = (meridional_radius + elevation) * cos_lat
+    jacobians[:, 0, 2] = cos_lat * cos_lon
+    jacobians[:, 1, 2] = cos_lat * sin_lon
+    jacobians[:, 2, 2] = sin_lat
+    return jacobians
+
+
+def normalize_geodetic_coordinates(geodetic_coordinates: npt.ArrayLike) -> np.ndarray:
+    """
+    Normalizes an array of geodetic coordinates so latitude is between -90 / 90 and longitude is between -180 / 180.
+    This is the array equivalent of GeodeticWorldCoordinate.normalized().
+
+    :param geodetic_coordinates: an Nx3 array of geodetic coordinates (radians, radians, meters)
+
+    :return: a new Nx3 array of normalized geodetic coordinates
+    """
+    normalized_coordinates = as_coordinate_array(geodetic_coordinates, 3).copy()
+    lon = normalized_coordinates[:, 0]
+    # Normalize latitude to -180 to 180 first.
+    lat = (normalized_coordinates[:, 1] + np.pi) % (2 * np.pi) - np.pi
+    # Adjust to -90 to 90 if needed, rotating longitude.
+    over_pole = np.abs(lat) > np.pi / 2
+    lat = np.where(over_pole, np.sign(lat) * np.pi - lat, lat)
+    lon = np.where(over_pole, lon + np.pi, lon)
+    # Normalize longitude to -180 to 180.
+    normalized_coordinates[:, 0] = (lon + np.pi) % (2 * np.pi) - np.pi
+    normalized_coordinates[:, 1] = lat
+    return normalized_coordinates
+
+
+def range_adjust_geodetic_coordinates(
+    geodetic_coordinates: npt.ArrayLike, min_lon: float, max_lon: float, min_lat: float, max_lat: float
+) -> np.ndarray:
+    """
+    Adjusts an array of geodetic coordinates so latitude and longitude are between user input ranges. This is the
+    array equivalent of GeodeticWorldCoordinate.range_adjusted().
+
+    :param geodetic_coordinates: an Nx3 array of geodetic coordinates (radians, radians, meters)
+    :param min_lon: the lower bound, in radians, of the new longitude range
+    :param max_lon: the upper bound, in radians, of the new longitude range
+    :param min_lat: the lower bound, in radians, of the new latitude range
+    :param max_lat: the upper bound, in radians, of the new latitude range
+
+    :return: a new Nx3 array of adjusted geodetic coordinates
+    """
+    original_coordinates = as_coordinate_array(geodetic_coordinates, 3)
+    adjusted_coordinates = normalize_geodetic_coordinates(original_coordinates)
+    lon = adjusted_coordinates[:, 0]
+    lat = adjusted_coordinates[:, 1]
+    # Adjust longitude by 360 amount to barely pass min_lon.
+    lon = lon + np.ceil((min_lon - lon) / (2 * np.pi)) * 2 * np.pi
+    # Last shot is flipping latitude.
+    flipped = lon > max_lon
+    lon = np.where(flipped, lon - np.pi, lon)
+    failed = flipped & (lon < min_lon)
+    if np.any(failed):
+        index = np.flatnonzero(failed)[0]
+        raise ValueError(f"{original_coordinates[index, 0]} not in {min_lon}:{max_lon}.")
+    lat = np.where(flipped, np.pi - lat, lat)
+
+    # For latitude, first try 360 normalization.
+    tlat = lat + np.ceil((min_lat - lat) / (2 * np.pi)) * 2 * np.pi
+    # If that fails, check changing sides.
+    change_sides = tlat > max_lat
+    side_lon = lon + np.pi
+    side_lon += np.ceil((min_lon - side_lon) / (2 * np.pi)) * 2 * np.pi
+    failed = change_sides & (side_lon > max_lon)
+    if np.any(failed):
+        index = np.flatnonzero(failed)[0]
+        raise ValueError(
+            f"({original_coordinates[index, 0]}, {original_coordinates[index, 1]}) not in "
+            f"({min_lon}:{max_lon}, {min_lat}:{max_lat})."
+        )
+    side_lat = np.pi - lat
+    side_lat += np.ceil((min_lat - side_lat) / (2 * np.pi)) * 2 * np.pi
+    failed = change_sides & (side_lat > max_lat)
+    if np.any(failed):
+        index = np.flatnonzero(failed)[0]
+        raise ValueError(f"{original_coordinates[index, 1]} not in {min_lat}:{max_lat}.")
+
+    adjusted_coordinates[:, 0] = np.where(change_sides, side_lon, lon)
+    adjusted_coordinates[:, 1] = np.where(change_sides, side_lat, tlat)
+    return adjusted_coordinates
+
+
+def as_coordinate_array(coordinates: npt.ArrayLike, num_components: int) -> np.ndarray:
+    """
+    Converts the input into a floating point array of shape Nx(num_components). This is used to validate inputs to
+    the batch (array) versions of the coordinate transforms. A single coordinate is promoted to a 1xN array.
+
+    :param coordinates: the array like collection of coordinates
+    :param num_components: the number of components each coordinate must have (e.g. 2 for x, y and 3 for x, y, z)
+
+    :return: the coordinates as a 2D array of float64 values
+    """
+    coordinate_array = np.asarray(coordinates, dtype=np.float64)
+    if coordinate_array.ndim == 1:
+        coordinate_array = coordinate_array.reshape(1, -1)
+    if coordinate_array.ndim != 2 or coordinate_array.shape[1] != num_components:
+        raise ValueError(
+            f"Coordinate arrays must have shape (N, {num_components}). Array with shape {coordinate_array.shape} provided."
+        )
+    return coordinate_array
+
+
 class ImageCoordinate:
     """
     This image coordinate system convention is defined as follows. The upper left corner of the upper left pixel
@@ -357,6 +601,8 @@ class ImageCoordinate:
     discrete image coordinates (R,C) = (5,8).
     """
 
+    __slots__ = ("coordinate",)
+
     def __init__(self, coordinate: npt.ArrayLike = None) -> None:
         """
         Constructs an image coordinate from an x, y tuple. The tuple can be expressed as a List or any other
@@ -408,3 +654,251 @@ class ImageCoordinate:
 
     def __repr__(self):
         return f"ImageCoordinate(coordinate={np.array_repr(self.coordinate)})"
+
+
+class WorldCoordinateArray:
+    """
+    A WorldCoordinateArray holds N world coordinates as a single Nx3 array. It provides the same component accessors
+    as WorldCoordinate but each returns a column of values so operations on large numbers of coordinates can be
+    vectorized instead of looping over individual objects. Arrays are accepted anywhere the batch transforms accept
+    an Nx3 array of coordinates.
+    """
+
+    __slots__ = ("coordinates",)
+
+    _element_type = WorldCoordinate
+
+    def __init__(self, coordinates: npt.ArrayLike = None) -> None:
+        """
+        Constructs a world coordinate array from an Nx3 array of x, y, z values. Float64 arrays with the correct shape
+        are wrapped without copying.
+
+        :param coordinates: the x, y, z components of each coordinate
+
+        :return: None
+        """
+        if coordinates is None:
+            coordinates = np.zeros((0, 3), dtype=np.float64)
+        self.coordinates = as_coordinate_array(coordinates, 3)
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable[WorldCoordinate]):
+        """
+        Constructs an array from a collection of individual coordinates.
+
+        :param coordinates: the coordinates to combine
+
+        :return: the new coordinate array
+        """
+        return cls(np.array([coordinate.coordinate for coordinate in coordinates], dtype=np.float64).reshape(-1, 3))
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.coordinates[:, 0]
+
+    @x.setter
+    def x(self, value: npt.ArrayLike) -> None:
+        self.coordinates[:, 0] = value
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.coordinates[:, 1]
+
+    @y.setter
+    def y(self, value: npt.ArrayLike) -> None:
+        self.coordinates[:, 1] = value
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.coordinates[:, 2]
+
+    @z.setter
+    def z(self, value: npt.ArrayLike) -> None:
+        self.coordinates[:, 2] = value
+
+    def __array__(self, dtype: Optional[npt.DTypeLike] = None, copy: Optional[bool] = None) -> np.ndarray:
+        if dtype is None or np.dtype(dtype) == self.coordinates.dtype:
+            return self.coordinates.copy() if copy else self.coordinates
+        return self.coordinates.astype(dtype)
+
+    def __len__(self) -> int:
+        return self.coordinates.shape[0]
+
+    def __getitem__(self, index: Union[int, slice, npt.ArrayLike]):
+        if isinstance(index, (int, np.integer)):
+            return self._element_type(self.coordinates[index])
+        return self.__class__(self.coordinates[index])
+
+    def __iter__(self) -> Iterator[WorldCoordinate]:
+        for coordinate in self.coordinates:
+            yield self._element_type(coordinate)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(coordinates={np.array_repr(self.coordinates)})"
+
+
+class GeodeticWorldCoordinateArray(WorldCoordinateArray):
+    """
+    A GeodeticWorldCoordinateArray holds N geodetic coordinates as a single Nx3 array of longitude, latitude, and
+    elevation. As with GeodeticWorldCoordinate the longitude and latitude are in radians while elevation is meters
+    above the ellipsoid. The coordinates can be formatted using the same % directives as GeodeticWorldCoordinate.
+    """
+
+    __slots__ = ()
+
+    _element_type = GeodeticWorldCoordinate
+
+    @property
+    def longitude(self) -> np.ndarray:
+        return self.x
+
+    @longitude.setter
+    def longitude(self, value: npt.ArrayLike) -> None:
+        self.x = value
+
+    @property
+    def latitude(self) -> np.ndarray:
+        return self.y
+
+    @latitude.setter
+    def latitude(self, value: npt.ArrayLike) -> None:
+        self.y = value
+
+    @property
+    def elevation(self) -> np.ndarray:
+        return self.z
+
+    @elevation.setter
+    def elevation(self, value: npt.ArrayLike) -> None:
+        self.z = value
+
+    def format(self, format_spec: Optional[str] = None) -> List[str]:
+        """
+        Formats every coordinate in this array. The results are identical to formatting each GeodeticWorldCoordinate
+        individually.
+
+        :param format_spec: the format specification, see GeodeticWorldCoordinate for the supported directives
+
+        :return: the formatted coordinate strings
+        """
+        if format_spec is None or format_spec == "":
+            format_spec = DEFAULT_GEODETIC_FORMAT_SPEC
+        return _format_geodetic_coordinates(self.coordinates, format_spec)
+
+    def to_dms_strings(self) -> List[str]:
+        """
+        Outputs each coordinate in the format ddmmssXdddmmssY. See GeodeticWorldCoordinate.to_dms_string().
+
+        :return: the formatted coordinate strings
+        """
+        return self.format("%ld%lm%ls%lH%od%om%os%oH")
+
+    def normalized(self) -> "GeodeticWorldCoordinateArray":
+        """
+        Return a new GeodeticWorldCoordinateArray that normalizes latitude between -90 / 90 and longitude between
+        -180 / 180.
+
+        :return: the new geodetic world coordinate array
+        """
+        return self.__class__(normalize_geodetic_coordinates(self.coordinates))
+
+    def range_adjusted(
+        self, min_lon: float, max_lon: float, min_lat: float, max_lat: float
+    ) -> "GeodeticWorldCoordinateArray":
+        """
+        Return a new GeodeticWorldCoordinateArray that normalizes latitude and longitude between user input ranges.
+
+        :param min_lon: the lower bound, in radians, of the new longitude range
+        :param max_lon: the upper bound, in radians, of the new longitude range
+        :param min_lat: the lower bound, in radians, of the new latitude range
+        :param max_lat: the upper bound, in radians, of the new latitude range
+
+        :return: the new geodetic world coordinate array
+        """
+        return self.__class__(range_adjust_geodetic_coordinates(self.coordinates, min_lon, max_lon, min_lat, max_lat))
+
+
+class ImageCoordinateArray:
+    """
+    An ImageCoordinateArray holds N image coordinates as a single Nx2 array of x (column), y (row) values. It provides
+    the same component accessors as ImageCoordinate but each returns a column of values. Arrays are accepted anywhere
+    the batch transforms accept an Nx2 array of image coordinates.
+    """
+
+    __slots__ = ("coordinates",)
+
+    def __init__(self, coordinates: npt.ArrayLike = None) -> None:
+        """
+        Constructs an image coordinate array from an Nx2 array of x, y values. Float64 arrays with the correct shape
+        are wrapped without copying.
+
+        :param coordinates: the x, y components of each coordinate
+
+        :return: None
+        """
+        if coordinates is None:
+            coordinates = np.zeros((0, 2), dtype=np.float64)
+        self.coordinates = as_coordinate_array(coordinates, 2)
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable[ImageCoordinate]) -> "ImageCoordinateArray":
+        """
+        Constructs an array from a collection of individual coordinates.
+
+        :param coordinates: the coordinates to combine
+
+        :return: the new coordinate array
+        """
+        return cls(np.array([coordinate.coordinate for coordinate in coordinates], dtype=np.float64).reshape(-1, 2))
+
+    @property
+    def c(self) -> np.ndarray:
+        return self.coordinates[:, 0]
+
+    @c.setter
+    def c(self, value: npt.ArrayLike) -> None:
+        self.coordinates[:, 0] = value
+
+    @property
+    def r(self) -> np.ndarray:
+        return self.coordinates[:, 1]
+
+    @r.setter
+    def r(self, value: npt.ArrayLike) -> None:
+        self.coordinates[:, 1] = value
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.c
+
+    @x.setter
+    def x(self, value: npt.ArrayLike) -> None:
+        self.c = value
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.r
+
+    @y.setter
+    def y(self, value: npt.ArrayLike) -> None:
+        self.r = value
+
+    def __array__(self, dtype: Optional[npt.DTypeLike] = None, copy: Optional[bool] = None) -> np.ndarray:
+        if dtype is None or np.dtype(dtype) == self.coordinates.dtype:
+            return self.coordinates.copy() if copy else self.coordinates
+        return self.coordinates.astype(dtype)
+
+    def __len__(self) -> int:
+        return self.coordinates.shape[0]
+
+    def __getitem__(self, index: Union[int, slice, npt.ArrayLike]):
+        if isinstance(index, (int, np.integer)):
+            return ImageCoordinate(self.coordinates[index])
+        return self.__class__(self.coordinates[index])
+
+    def __iter__(self) -> Iterator[ImageCoordinate]:
+        for coordinate in self.coordinates:
+            yield ImageCoordinate(coordinate)
+
+    def __repr__(self):
+        return f"ImageCoordinateArray(coordinates={np.array_repr(self.coordinates)})"
@@ -1,9 +1,12 @@
 #  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
 
 import math
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from .coordinates import GeodeticWorldCoordinate, ImageCoordinate
+import numpy as np
+import numpy.typing as npt
+
+from .coordinates import GeodeticWorldCoordinate, ImageCoordinate, as_coordinate_array
 from .elevation_model import ElevationModel
 from .sensor_model import SensorModel, SensorModelOptions
 
@@ -49,23 +52,8 @@ class DefaultedSensorModel(SensorModel):
 
         :return: the longitude, latitude, elevation world coordinate
         """
-        if options is None:
-            new_options = self.options
-        elif self.options is None:
-            new_options = options
-        else:
-            new_options = {**self.options, **options}
-        ignore_default_elevation_model = False
-        if new_options is not None:
-            ignore_default_elevation_model = new_options.get(
-                SensorModelOptions.IGNORE_DEFAULT_ELEVATION_MODEL,
-                False,
-            )
-        return self.inner_sensor_model.image_to_world(
-            image_coordinate,
-            self.elevation_model if elevation_model is None and not ignore_default_elevation_model else elevation_model,
-            new_options,
-        )
+        new_elevation_model, new_options = self._apply_defaults(elevation_model, options)
+        return self.inner_sensor_model.image_to_world(image_coordinate, new_elevation_model, new_options)
 
     def world_to_image(
         self,
@@ -84,3 +72,67 @@ class DefaultedSensorModel(SensorModel):
             self.elevation_model.set_elevation(new_world_coordinate)
             return self.inner_sensor_model.world_to_image(new_world_coordinate)
         return self.inner_sensor_model.world_to_image(world_coordinate)
+
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This function returns the longitude, latitude, elevation world coordinates associated with an array of x, y
+        coordinates in the full image.
+
+        :param image_coordinates: an Nx2 array of x, y full image coordinates
+        :param elevation_model: optional elevation model used to transform the coordinates
+        :param options: optional dictionary of hints, passed to nested sensor models
+
+        :return: an Nx3 array of longitude, latitude, elevation world coordinates
+        """
+        new_elevation_model, new_options = self._apply_defaults(elevation_model, options)
+        return self.inner_sensor_model.image_to_world_batch(image_coordinates, new_elevation_model, new_options)
+
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function returns the x, y full image coordinates associated with an array of longitude, latitude,
+        elevation world coordinates. Any NaN elevations will be set by the default elevation model if it exists.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an Nx2 array of x, y full image coordinates
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        missing_elevations = np.isnan(world_coordinates[:, 2])
+        if np.any(missing_elevations) and self.elevation_model is not None:
+            world_coordinates = world_coordinates.copy()
+            missing_coordinates = world_coordinates[missing_elevations]
+            self.elevation_model.set_elevations(missing_coordinates)
+            world_coordinates[missing_elevations] = missing_coordinates
+        return self.inner_sensor_model.world_to_image_batch(world_coordinates)
+
+    def _apply_defaults(
+        self, elevation_model: Optional[ElevationModel], options: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[ElevationModel], Optional[Dict[str, Any]]]:
+        """
+        Merge the default elevation model and options with the values provided by the caller.
+
+        :param elevation_model: elevation model provided by the caller
+        :param options: options provided by the caller, these take precedence over the defaults
+
+        :return: the elevation model and options that should be passed to the inner sensor model
+        """
+        if options is None:
+            new_options = self.options
+        elif self.options is None:
+            new_options = options
+        else:
+            new_options = {**self.options, **options}
+        ignore_default_elevation_model = False
+        if new_options is not None:
+            ignore_default_elevation_model = new_options.get(
+                SensorModelOptions.IGNORE_DEFAULT_ELEVATION_MODEL,
+                False,
+            )
+        if elevation_model is None and not ignore_default_elevation_model:
+            elevation_model = self.elevation_model
+        return elevation_model, new_options
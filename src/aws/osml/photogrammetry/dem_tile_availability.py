@@ -0,0 +1,109 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import logging
+import os
+import re
+from typing import Iterable, Optional, Set, Tuple
+
+# Patterns used to find the 1-degree cell in a tile name. Names either put the hemisphere before the degrees (e.g.
+# n47_e034_1arc_v3.tif, SRTM1N00E006V3, dted/w044/s23.dt2) or after them (e.g. 115e/45s.dt2), in either order.
+_CELL_PATTERNS = [
+    (re.compile(r"([NS])(\d{1,2})(?!\d)[^A-Z0-9]?([EW])(\d{1,3})(?!\d)", re.IGNORECASE), (0, 1, 2, 3)),
+    (re.compile(r"([EW])(\d{1,3})(?!\d)[^A-Z0-9]?([NS])(\d{1,2})(?!\d)", re.IGNORECASE), (2, 3, 0, 1)),
+    (re.compile(r"(?<!\d)(\d{1,3})([EW])[^A-Z0-9]?(\d{1,2})([NS])", re.IGNORECASE), (3, 2, 1, 0)),
+    (re.compile(r"(?<!\d)(\d{1,2})([NS])[^A-Z0-9]?(\d{1,3})([EW])", re.IGNORECASE), (1, 0, 3, 2)),
+]
+
+
+class DEMTileAvailabilityIndex:
+    """
+    This class records which 1-degree cells of a DEM actually have tiles. DEMs with global scope rarely have data for
+    every cell (e.g. there are no tiles over open ocean) so tile sets can consult this index to skip the cost of
+    trying to load tiles that do not exist. Cells are identified by the integer degrees of their southwest corner.
+    """
+
+    def __init__(self, cells: Iterable[Tuple[int, int]] = ()) -> None:
+        """
+        Construct an index from a collection of available cells.
+
+        :param cells: the (latitude degrees, longitude degrees) of the southwest corner of each available cell
+
+        :return: None
+        """
+        self.cells: Set[Tuple[int, int]] = {(int(latitude), int(longitude)) for latitude, longitude in cells}
+
+    @classmethod
+    def from_tile_names(cls, tile_names: Iterable[str]) -> "DEMTileAvailabilityIndex":
+        """
+        Construct an index from a collection of tile names or paths. Names that do not identify a cell are ignored.
+
+        :param tile_names: the names of the available tiles
+
+        :return: the availability index
+        """
+        index = cls()
+        for tile_name in tile_names:
+            tile_name = tile_name.strip()
+            if not tile_name:
+                continue
+            cell = cls.parse_cell(tile_name)
+            if cell is None:
+                logging.debug(f"Unable to identify the DEM cell for tile {tile_name}")
+                continue
+            index.cells.add(cell)
+        return index
+
+    @classmethod
+    def from_listing_file(cls, listing_path: str) -> "DEMTileAvailabilityIndex":
+        """
+        Construct an index from a text file that lists one available tile per line.
+
+        :param listing_path: the location of the listing file
+
+        :return: the availability index
+        """
+        with open(listing_path, "r") as listing_file:
+            return cls.from_tile_names(listing_file)
+
+    @classmethod
+    def from_directory(cls, tile_directory: str) -> "DEMTileAvailabilityIndex":
+        """
+        Construct an index by scanning a local directory tree for tiles.
+
+        :param tile_directory: the root directory of the tile set
+
+        :return: the availability index
+        """
+        return cls.from_tile_names(
+            os.path.relpath(os.path.join(root, file_name), tile_directory)
+            for root, _, file_names in os.walk(tile_directory)
+            for file_name in file_names
+        )
+
+    @staticmethod
+    def parse_cell(tile_name: str) -> Optional[Tuple[int, int]]:
+        """
+        Identify the 1-degree cell named by a tile.
+
+        :param tile_name: the name or path of the tile
+
+        :return: the (latitude degrees, longitude degrees) of the cell's southwest corner or None if not found
+        """
+        for pattern, (latitude_hemisphere, latitude_degrees, longitude_hemisphere, longitude_degrees) in _CELL_PATTERNS:
+            match = pattern.search(tile_name)
+            if match:
+                groups = match.groups()
+                latitude = int(groups[latitude_degrees])
+                longitude = int(groups[longitude_degrees])
+                if groups[latitude_hemisphere].upper() == "S":
+                    latitude = -latitude
+                if groups[longitude_hemisphere].upper() == "W":
+                    longitude = -longitude
+                return latitude, longitude
+        return None
+
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        return cell in self.cells
+
+    def __len__(self) -> int:
+        return len(self.cells)
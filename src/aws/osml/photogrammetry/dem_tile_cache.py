@@ -0,0 +1,205 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from cachetools import LRUCache
+
+
+@dataclass
+class DEMTileCacheStatistics:
+    """
+    This class contains a snapshot of the counters maintained by a DEMTileCache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    current_size: int
+    max_size: int
+    tile_count: int
+    missing_hits: int = 0
+    missing_tile_count: int = 0
+
+
+class _EvictionCountingLRUCache(LRUCache):
+    """
+    A LRU cache that counts the items it evicts to stay within its size limit.
+    """
+
+    def __init__(self, maxsize: int, getsizeof: Optional[Callable[[Any], int]] = None) -> None:
+        super().__init__(maxsize=maxsize, getsizeof=getsizeof)
+        self.evictions = 0
+
+    def popitem(self):
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+
+class DEMTileCache:
+    """
+    This class is a thread safe LRU cache for loaded DEM tiles. The cache can be bounded either by the number of
+    tiles or, when a getsizeof function is provided, by the total size (e.g. bytes) of the tiles. Loading is single
+    flight: if several threads miss on the same tile at the same time only one of them loads it while the others
+    wait for and share the result.
+
+    Results that indicate a tile is missing can be kept in a separate negative cache bounded by count. Remembering
+    that a tile doesn't exist is cheap so those results shouldn't push real tiles out of the main cache.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        getsizeof: Optional[Callable[[Any], int]] = None,
+        is_missing: Optional[Callable[[Any], bool]] = None,
+        missing_cache_size: int = 10000,
+    ) -> None:
+        """
+        Construct an empty cache.
+
+        :param max_size: the maximum total size of the cached tiles
+        :param getsizeof: an optional function returning the size of a cached value, each value counts as 1 if not
+                          provided
+        :param is_missing: an optional function identifying values for missing tiles that belong in the negative cache
+        :param missing_cache_size: the maximum number of missing tiles to remember
+
+        :return: None
+        """
+        if max_size <= 0 or missing_cache_size <= 0:
+            raise ValueError("DEM tile cache size must be positive")
+        self.lock = threading.Lock()
+        self._getsizeof = getsizeof
+        self._is_missing = is_missing
+        self._cache = _EvictionCountingLRUCache(maxsize=max_size, getsizeof=getsizeof)
+        self._missing_cache = LRUCache(maxsize=missing_cache_size)
+        self._loading: Dict[Hashable, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.missing_hits = 0
+
+    def get(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Get a value from the cache, loading it on a miss. Values larger than the whole cache are returned but not
+        retained.
+
+        :param key: the key of the value, typically a tile path
+        :param load: a function that loads the value if it is not cached
+
+        :return: the cached or newly loaded value
+        """
+        with self.lock:
+            try:
+                value = self._cache[key]
+                self.hits += 1
+                return value
+            except KeyError:
+                pass
+            try:
+                value = self._missing_cache[key]
+                self.missing_hits += 1
+                return value
+            except KeyError:
+                pass
+            future = self._loading.get(key)
+            is_loader = future is None
+            if is_loader:
+                future = Future()
+                self._loading[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not is_loader:
+            return future.result()
+
+        try:
+            value = load()
+        except BaseException as err:
+            with self.lock:
+                del self._loading[key]
+            future.set_exception(err)
+            raise
+
+        with self.lock:
+            if self._is_missing is not None and self._is_missing(value):
+                self._missing_cache[key] = value
+            else:
+                try:
+                    self._cache[key] = value
+                except ValueError:
+                    # The value is too large to ever fit in this cache
+                    pass
+            del self._loading[key]
+        future.set_result(value)
+        return value
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a value from the cache without loading it on a miss. Finding the value counts as a hit.
+
+        :param key: the key of the value, typically a tile path
+
+        :return: the cached value or None if it is not cached
+        """
+        with self.lock:
+            try:
+                value = self._cache[key]
+                self.hits += 1
+                return value
+            except KeyError:
+                pass
+            try:
+                value = self._missing_cache[key]
+                self.missing_hits += 1
+                return value
+            except KeyError:
+                return None
+
+    def clear(self) -> None:
+        """
+        Remove all the cached values, including the record of missing tiles. Loads that are in progress are not
+        affected.
+
+        :return: None
+        """
+        with self.lock:
+            self._cache.clear()
+            self._missing_cache.clear()
+
+    def statistics(self) -> DEMTileCacheStatistics:
+        """
+        Get a snapshot of the cache counters. Threads that wait for another thread's load of the same tile are
+        counted as hits.
+
+        :return: the current hit, miss, and eviction counts along with the size of the cache
+        """
+        with self.lock:
+            return DEMTileCacheStatistics(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self._cache.evictions,
+                current_size=int(self._cache.currsize),
+                max_size=int(self._cache.maxsize),
+                tile_count=len(self._cache),
+                missing_hits=self.missing_hits,
+                missing_tile_count=len(self._missing_cache),
+            )
+
+    def __getstate__(self):
+        # Locks and in-progress loads can't be shared with another process so copies of the cache start empty
+        return {
+            "max_size": int(self._cache.maxsize),
+            "getsizeof": self._getsizeof,
+            "is_missing": self._is_missing,
+            "missing_cache_size": int(self._missing_cache.maxsize),
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._cache)
@@ -0,0 +1,225 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+from enum import Enum
+from math import degrees, floor, isfinite, nan
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .coordinates import GeodeticWorldCoordinate
+from .gdal_sensor_model import GDALAffineSensorModel
+from .sensor_model import SensorModel
+
+
+class DEMInterpolationMethod(str, Enum):
+    """
+    The interpolation methods supported when sampling elevations between the posts of a DEM tile.
+    """
+
+    BILINEAR = "bilinear"
+    BICUBIC = "bicubic"
+
+
+class DEMTileSampler:
+    """
+    This class interpolates elevations from a single DEM tile. It stores the raw elevation array along with the
+    transform from world to grid coordinates and computes bilinear (or bicubic) interpolation directly with NumPy
+    indexing. Elevation lookups are in the innermost loop of many image to world calculations so this avoids the
+    per-call overhead of the general purpose SciPy interpolators.
+
+    Grid coordinates outside the tile are clamped to the nearest edge. When no data values are propagated the
+    interpolated elevation is NaN if any of the posts used to compute it (the 4 posts of the enclosing cell for
+    bilinear, the surrounding 16 posts for bicubic) are missing.
+    """
+
+    def __init__(
+        self,
+        elevations: npt.ArrayLike,
+        sensor_model: SensorModel,
+        no_data_value: Optional[float] = None,
+        propagate_nans: bool = True,
+        interpolation_method: DEMInterpolationMethod = DEMInterpolationMethod.BILINEAR,
+    ) -> None:
+        """
+        Construct the sampler from a tile of elevation data.
+
+        :param elevations: the 2D array of elevation posts indexed by [row, column]
+        :param sensor_model: the sensor model that converts world coordinates to grid coordinates for this tile
+        :param no_data_value: the value used to mark missing elevation posts
+        :param propagate_nans: True if missing posts should result in NaN elevations
+        :param interpolation_method: the interpolation method to use between posts
+
+        :return: None
+        """
+        # The elevations are used as provided (e.g. a read-only memory map shared with other processes) unless no
+        # data posts need to be replaced with NaN. Values are converted to floating point as they are interpolated.
+        elevations = np.asarray(elevations)
+        if elevations.ndim != 2 or elevations.size == 0:
+            raise ValueError("DEM tile elevations must be a non-empty 2D array")
+        if not elevations.flags.c_contiguous:
+            elevations = np.ascontiguousarray(elevations)
+        if propagate_nans and no_data_value is not None:
+            nan_mask = np.isclose(elevations, no_data_value)
+            if nan_mask.any():
+                elevations = elevations.astype(np.float64)
+                elevations[nan_mask] = np.nan
+        self.elevations = elevations
+        self.height, self.width = elevations.shape
+        self.sensor_model = sensor_model
+        self.interpolation_method = DEMInterpolationMethod(interpolation_method)
+
+        # Most DEM tiles are georeferenced with a simple affine transform from longitude, latitude degrees. In that
+        # case the world to grid conversion is just the inverse of that transform, so we keep the coefficients here
+        # and skip the sensor model entirely.
+        self.inv_transform: Optional[np.ndarray] = None
+        self._inv_coefficients: Optional[Tuple[float, ...]] = None
+        if isinstance(sensor_model, GDALAffineSensorModel) and sensor_model.image_to_wgs84 is None:
+            self.inv_transform = sensor_model.inv_transform[0:2, :].copy()
+            self._inv_coefficients = tuple(self.inv_transform.ravel().tolist())
+
+    def __call__(self, x: npt.ArrayLike, y: npt.ArrayLike, grid: bool = True) -> np.ndarray:
+        """
+        Interpolate elevations at grid coordinates using the same calling convention as the SciPy interpolators
+        previously used for DEM tiles.
+
+        :param x: the x (column) grid coordinates
+        :param y: the y (row) grid coordinates
+        :param grid: True if the elevations should be evaluated on the grid formed by the x and y values, False if
+                     they should be evaluated at each x, y pair
+
+        :return: the interpolated elevations
+        """
+        if grid:
+            x, y = np.meshgrid(np.atleast_1d(x), np.atleast_1d(y), indexing="ij")
+        return self.interpolate(x, y)
+
+    def interpolate(self, x: npt.ArrayLike, y: npt.ArrayLike) -> np.ndarray:
+        """
+        Interpolate elevations at arrays of grid coordinates.
+
+        :param x: the x (column) grid coordinates
+        :param y: the y (row) grid coordinates
+
+        :return: the interpolated elevations, NaN where they are unavailable
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+        finite = np.isfinite(x) & np.isfinite(y)
+        x = np.clip(np.where(finite, x, 0.0), 0.0, self.width - 1)
+        y = np.clip(np.where(finite, y, 0.0), 0.0, self.height - 1)
+
+        # Grid coordinates that fall exactly on the last row or column are assigned to the last full cell
+        x0 = np.minimum(x.astype(np.intp), max(self.width - 2, 0))
+        y0 = np.minimum(y.astype(np.intp), max(self.height - 2, 0))
+        tx = x - x0
+        ty = y - y0
+
+        values = self.elevations.ravel()
+        if self.interpolation_method == DEMInterpolationMethod.BICUBIC:
+            columns = np.clip(x0[..., np.newaxis] + np.arange(-1, 3), 0, self.width - 1)
+            rows = np.clip(y0[..., np.newaxis] + np.arange(-1, 3), 0, self.height - 1)
+            posts = values[rows[..., :, np.newaxis] * self.width + columns[..., np.newaxis, :]]
+            elevations = np.einsum("...j,...i,...ji->...", _cubic_weights(ty), _cubic_weights(tx), posts)
+        else:
+            x1 = np.minimum(x0 + 1, self.width - 1)
+            y1 = np.minimum(y0 + 1, self.height - 1)
+            top = values[y0 * self.width + x0] * (1.0 - tx) + values[y0 * self.width + x1] * tx
+            bottom = values[y1 * self.width + x0] * (1.0 - tx) + values[y1 * self.width + x1] * tx
+            elevations = top * (1.0 - ty) + bottom * ty
+
+        return np.where(finite, elevations, np.nan)
+
+    def world_to_grid(self, longitudes: npt.ArrayLike, latitudes: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert arrays of longitude, latitude values into grid coordinates for this tile.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: the x (column) and y (row) grid coordinates
+        """
+        longitudes, latitudes = np.broadcast_arrays(
+            np.asarray(longitudes, dtype=np.float64), np.asarray(latitudes, dtype=np.float64)
+        )
+        if self.inv_transform is not None:
+            longitudes = np.degrees(longitudes)
+            latitudes = np.degrees(latitudes)
+            x = self.inv_transform[0, 0] * longitudes + self.inv_transform[0, 1] * latitudes + self.inv_transform[0, 2]
+            y = self.inv_transform[1, 0] * longitudes + self.inv_transform[1, 1] * latitudes + self.inv_transform[1, 2]
+            return x, y
+
+        image_coordinates = self.sensor_model.world_to_image_batch(
+            np.column_stack([longitudes.ravel(), latitudes.ravel(), np.zeros(longitudes.size)])
+        )
+        return image_coordinates[:, 0].reshape(longitudes.shape), image_coordinates[:, 1].reshape(longitudes.shape)
+
+    def sample(self, longitudes: npt.ArrayLike, latitudes: npt.ArrayLike) -> np.ndarray:
+        """
+        Interpolate elevations at arrays of longitude, latitude values.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: the interpolated elevations, NaN where they are unavailable
+        """
+        return self.interpolate(*self.world_to_grid(longitudes, latitudes))
+
+    def elevation_at(self, geodetic_world_coordinate: GeodeticWorldCoordinate) -> float:
+        """
+        Interpolate the elevation at a single world coordinate. The bilinear case is computed with plain Python
+        arithmetic since the fixed overhead of NumPy calls dominates the cost of a single lookup.
+
+        :param geodetic_world_coordinate: the world coordinate of interest
+
+        :return: the interpolated elevation, NaN if it is unavailable
+        """
+        if self._inv_coefficients is not None:
+            a, b, c, d, e, f = self._inv_coefficients
+            longitude = degrees(geodetic_world_coordinate.longitude)
+            latitude = degrees(geodetic_world_coordinate.latitude)
+            x = a * longitude + b * latitude + c
+            y = d * longitude + e * latitude + f
+        else:
+            image_coordinate = self.sensor_model.world_to_image(geodetic_world_coordinate)
+            x = float(image_coordinate.x)
+            y = float(image_coordinate.y)
+
+        if self.interpolation_method != DEMInterpolationMethod.BILINEAR:
+            return float(self.interpolate(x, y))
+        if not (isfinite(x) and isfinite(y)):
+            return nan
+
+        x = min(max(x, 0.0), self.width - 1.0)
+        y = min(max(y, 0.0), self.height - 1.0)
+        x0 = min(floor(x), max(self.width - 2, 0))
+        y0 = min(floor(y), max(self.height - 2, 0))
+        x1 = min(x0 + 1, self.width - 1)
+        y1 = min(y0 + 1, self.height - 1)
+        tx = x - x0
+        ty = y - y0
+
+        item = self.elevations.item
+        top = item(y0, x0) * (1.0 - tx) + item(y0, x1) * tx
+        bottom = item(y1, x0) * (1.0 - tx) + item(y1, x1) * tx
+        return top * (1.0 - ty) + bottom * ty
+
+
+def _cubic_weights(t: np.ndarray) -> np.ndarray:
+    """
+    Compute the Catmull-Rom cubic convolution weights for the 4 posts surrounding each fractional offset.
+
+    :param t: the fractional offsets in [0, 1] from the second of the 4 posts
+
+    :return: an array with a trailing dimension of 4 containing the weight of each post
+    """
+    t2 = t * t
+    t3 = t2 * t
+    return np.stack(
+        [
+            -0.5 * t3 + t2 - 0.5 * t,
+            1.5 * t3 - 2.5 * t2 + 1.0,
+            -1.5 * t3 + 2.0 * t2 + 0.5 * t,
+            0.5 * t3 - 0.5 * t2,
+        ],
+        axis=-1,
+    )
@@ -4,19 +4,26 @@
 # TODO: Add typing for ArrayLike once Numpy upgraded to 1.20+
 # from numpy.typing import ArrayLike
 
-import operator
+import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from math import ceil, floor, radians
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
-from cachetools import LRUCache, cachedmethod
-from scipy.interpolate import RectBivariateSpline, RegularGridInterpolator
+import shapely
 
 from .coordinates import GeodeticWorldCoordinate
+from .dem_tile_cache import DEMTileCache
+from .dem_tile_sampler import DEMInterpolationMethod, DEMTileSampler
 from .elevation_model import ElevationModel, ElevationRegionSummary
+from .gdal_sensor_model import GDALAffineSensorModel
 from .sensor_model import SensorModel
 
+logger = logging.getLogger(__name__)
+
 
 class DigitalElevationModelTileSet(ABC):
     """
@@ -43,6 +50,85 @@ class DigitalElevationModelTileSet(ABC):
         :return: the tile path or None if the DEM does not have coverage for this location
         """
 
+    def find_tile_ids(self, longitudes: np.ndarray, latitudes: np.ndarray) -> Tuple[List[Optional[str]], np.ndarray]:
+        """
+        Identifies the tiles for arrays of longitude, latitude values. The default implementation loops over the
+        locations calling find_tile_id. Implementations that can group locations more efficiently should override it.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: the list of distinct tile paths (None for locations without coverage) and, for each location, the
+                 index of its tile path in that list
+        """
+        tile_ids: List[Optional[str]] = []
+        tile_indexes = {}
+        inverse = np.empty(len(longitudes), dtype=np.int64)
+        for index, (longitude, latitude) in enumerate(zip(longitudes, latitudes)):
+            tile_id = self.find_tile_id(GeodeticWorldCoordinate([longitude, latitude, 0.0]))
+            if tile_id not in tile_indexes:
+                tile_indexes[tile_id] = len(tile_ids)
+                tile_ids.append(tile_id)
+            inverse[index] = tile_indexes[tile_id]
+        return tile_ids, inverse
+
+    def _find_tile_ids_by_cell(
+        self, longitudes: np.ndarray, latitudes: np.ndarray, cell_size_degrees: float = 1.0
+    ) -> Tuple[List[Optional[str]], np.ndarray]:
+        """
+        Implementation of find_tile_ids for tile sets where every tile covers a regular cell of longitude, latitude
+        degrees. The locations are grouped by cell and find_tile_id is only called once, at the cell center, for
+        each distinct cell.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+        :param cell_size_degrees: the size of the cell covered by each tile
+
+        :return: the list of distinct tile paths and, for each location, the index of its tile path in that list
+        """
+        cells = np.floor(np.column_stack([np.degrees(longitudes), np.degrees(latitudes)]) / cell_size_degrees)
+        finite = np.all(np.isfinite(cells), axis=1)
+        cells[~finite] = np.nan
+        unique_cells, inverse = np.unique(cells, axis=0, return_inverse=True)
+        tile_ids = [
+            (
+                self.find_tile_id(GeodeticWorldCoordinate([*np.radians((cell + 0.5) * cell_size_degrees), 0.0]))
+                if np.all(np.isfinite(cell))
+                else None
+            )
+            for cell in unique_cells
+        ]
+        return tile_ids, inverse.reshape(-1)
+
+    def find_tile_ids_in_region(self, region: shapely.Geometry, sample_spacing: float = radians(0.25)) -> List[str]:
+        """
+        Identifies the tiles needed to cover a region. The region is sampled with a regular lattice of locations
+        along with its densified boundary and the distinct tiles for those locations are returned. The sample
+        spacing should be smaller than the tiles in this tile set.
+
+        :param region: the region of interest with coordinates of longitude, latitude in radians
+        :param sample_spacing: the distance between sample locations in radians
+
+        :return: the distinct tile paths that have coverage in the region
+        """
+        if sample_spacing <= 0:
+            raise ValueError("Region sample spacing must be positive")
+        if region.is_empty:
+            return []
+        min_longitude, min_latitude, max_longitude, max_latitude = region.bounds
+        longitudes, latitudes = np.meshgrid(
+            _inclusive_range(min_longitude, max_longitude, sample_spacing),
+            _inclusive_range(min_latitude, max_latitude, sample_spacing),
+        )
+        longitudes = longitudes.ravel()
+        latitudes = latitudes.ravel()
+        inside = shapely.intersects_xy(region, longitudes, latitudes)
+        boundary = shapely.get_coordinates(shapely.segmentize(region, sample_spacing))
+        tile_ids, _ = self.find_tile_ids(
+            np.concatenate([longitudes[inside], boundary[:, 0]]), np.concatenate([latitudes[inside], boundary[:, 1]])
+        )
+        return [tile_id for tile_id in tile_ids if tile_id]
+
 
 class DigitalElevationModelTileFactory(ABC):
     """
@@ -68,6 +154,21 @@ class DigitalElevationModelTileFactory(ABC):
         :return: an array of elevation values, a sensor model, and a summary
         """
 
+    def get_tile_window(
+        self, tile_path: str, bounds: Tuple[float, float, float, float]
+    ) -> Tuple[Optional[Any], Optional[SensorModel], Optional[ElevationRegionSummary]]:
+        """
+        Retrieve the elevation values of a tile that cover a longitude, latitude window along with a sensor model for
+        that part of the tile. The default implementation loads the whole tile; factories that are able to read part
+        of a tile should override this so only the posts needed for the window are read.
+
+        :param tile_path: the location of the tile to load
+        :param bounds: the (min longitude, min latitude, max longitude, max latitude) of the window in radians
+
+        :return: an array of elevation values, a sensor model, and a summary
+        """
+        return self.get_tile(tile_path)
+
 
 class DigitalElevationModel(ElevationModel):
     """
@@ -85,6 +186,10 @@ class DigitalElevationModel(ElevationModel):
         tile_factory: DigitalElevationModelTileFactory,
         raster_cache_size: int = 10,
         propagate_nans: bool = True,
+        interpolation_method: DEMInterpolationMethod = DEMInterpolationMethod.BILINEAR,
+        raster_cache_bytes: Optional[int] = None,
+        prefetch_workers: int = 4,
+        missing_tile_cache_size: int = 10000,
     ) -> None:
         """
         This constructor accepts a tile set and a tile factory which specify how to index into and
@@ -96,17 +201,42 @@ class DigitalElevationModel(ElevationModel):
         :param tile_factory: DigitalElevationModelTileFactory = a class used to load DEM tile and convert to numpy array
         :param raster_cache_size: int = the number of DEM arrays to store in memory preventing frequent loading
         :param propagate_nans: bool = propagate missing data in elevation array
+        :param interpolation_method: DEMInterpolationMethod = the interpolation used between elevation posts
+        :param raster_cache_bytes: Optional[int] = if provided the DEM arrays kept in memory are limited by their total
+            size in bytes instead of by raster_cache_size
+        :param prefetch_workers: int = the number of background threads used to prefetch tiles
+        :param missing_tile_cache_size: int = the number of missing tiles to remember, these are tracked separately
+            so they don't displace DEM arrays from the cache
 
         :return: None
         """
         super().__init__()
         self.tile_set = tile_set
         self.tile_factory = tile_factory
-        self.raster_cache: LRUCache = LRUCache(maxsize=raster_cache_size)
         self.propagate_nans = propagate_nans
-        # TODO: Think about raster_cache_size parameter. This is the number of rasters we will keep open at any
-        #       one time. Look at the size of those tiles and add a comment about how much memory will be used by this
-        #       setting. Pick a default that is reasonable and also likely to cover most images
+        self.interpolation_method = DEMInterpolationMethod(interpolation_method)
+        # Tiles vary widely in size (a 1 arc-second DTED level 2 tile is ~26 MB of 16-bit posts while a 3 arc-second
+        # tile is ~3 MB) so a byte budget is the better bound when tiles from different resolutions are mixed.
+        self.raster_cache = DEMTileCache(
+            raster_cache_bytes if raster_cache_bytes is not None else raster_cache_size,
+            getsizeof=_interpolation_grid_nbytes if raster_cache_bytes is not None else None,
+            is_missing=_is_missing_tile,
+            missing_cache_size=missing_tile_cache_size,
+        )
+        self.prefetch_workers = prefetch_workers
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_lock = threading.Lock()
+
+    def __getstate__(self):
+        # The background threads and locks are specific to this process
+        state = self.__dict__.copy()
+        state["_prefetch_executor"] = None
+        del state["_prefetch_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._prefetch_lock = threading.Lock()
 
     def set_elevation(self, geodetic_world_coordinate: GeodeticWorldCoordinate) -> bool:
         """
@@ -126,8 +256,7 @@ class DigitalElevationModel(ElevationModel):
         interpolation_grid, sensor_model, summary = self.get_interpolation_grid(tile_id)
 
         if interpolation_grid is not None and sensor_model is not None:
-            image_coordinate = sensor_model.world_to_image(geodetic_world_coordinate)
-            elevation = interpolation_grid(image_coordinate.x, image_coordinate.y)[0][0]
+            elevation = interpolation_grid.elevation_at(geodetic_world_coordinate)
             if np.isnan(elevation):
                 return False
             geodetic_world_coordinate.elevation = elevation
@@ -136,6 +265,206 @@ class DigitalElevationModel(ElevationModel):
         # else can't set elevation without grid / model
         return False
 
+    def get_elevations(self, longitudes: npt.ArrayLike, latitudes: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        This method looks up the surface elevations for arrays of longitude, latitude values. The locations are
+        grouped by tile so each tile is only looked up once and all the locations that fall in it are interpolated
+        together.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: an array of elevations (NaN where unavailable) and a boolean mask of the valid elevations
+        """
+        longitudes, latitudes = np.broadcast_arrays(
+            np.asarray(longitudes, dtype=np.float64), np.asarray(latitudes, dtype=np.float64)
+        )
+        shape = longitudes.shape
+        longitudes = longitudes.ravel()
+        latitudes = latitudes.ravel()
+        elevations = np.full(longitudes.shape, np.nan, dtype=np.float64)
+        if longitudes.size == 0:
+            return elevations.reshape(shape), np.zeros(shape, dtype=bool)
+
+        tile_ids, tile_indexes = self.tile_set.find_tile_ids(longitudes, latitudes)
+        for tile_index, tile_id in enumerate(tile_ids):
+            if not tile_id:
+                continue
+            interpolation_grid, sensor_model, summary = self.get_interpolation_grid(tile_id)
+            if interpolation_grid is None or sensor_model is None:
+                continue
+            in_tile = np.flatnonzero(tile_indexes == tile_index)
+            elevations[in_tile] = interpolation_grid.sample(longitudes[in_tile], latitudes[in_tile])
+
+        return elevations.reshape(shape), np.isfinite(elevations).reshape(shape)
+
+    def prefetch(
+        self,
+        region: Union[shapely.Geometry, Tuple[float, float, float, float]],
+        sample_spacing: float = radians(0.25),
+    ) -> List[Future]:
+        """
+        Start loading the tiles needed to cover a region into the raster cache using a pool of background threads.
+        This allows the tiles to be fetched concurrently before they are needed; requests for a tile that is still
+        being loaded wait for the background load instead of loading it again. The region should be small enough
+        for its tiles to fit in the raster cache. The background threads are kept until close() is called.
+
+        :param region: the region of interest as a geometry or a (min longitude, min latitude, max longitude,
+                       max latitude) bounding box with all values in radians
+        :param sample_spacing: the distance in radians between the locations used to identify tiles in the region
+
+        :return: futures that complete as each tile is loaded
+        """
+        if not isinstance(region, shapely.Geometry):
+            region = shapely.box(*region)
+        tile_ids = self.tile_set.find_tile_ids_in_region(region, sample_spacing=sample_spacing)
+        if not tile_ids:
+            return []
+
+        with self._prefetch_lock:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=self.prefetch_workers, thread_name_prefix="dem-prefetch"
+                )
+            executor = self._prefetch_executor
+        return [executor.submit(self.get_interpolation_grid, tile_id) for tile_id in tile_ids]
+
+    def close(self) -> None:
+        """
+        Stop the background threads used to prefetch tiles after any pending loads finish. The tiles already in the
+        raster cache are kept and a later call to prefetch will start a new pool of threads.
+        """
+        with self._prefetch_lock:
+            executor = self._prefetch_executor
+            self._prefetch_executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "DigitalElevationModel":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def get_elevation_window(
+        self, bounds: Tuple[float, float, float, float], post_spacing_degrees: Optional[float] = None
+    ) -> Optional[DEMTileSampler]:
+        """
+        Assemble a single contiguous elevation grid covering a longitude, latitude window that may span several DEM
+        tiles. The result can be used to sample the entire region with one vectorized interpolation without
+        resolving the tile for each location.
+
+        Tiles that are already in the raster cache are used as they are. Otherwise only the part of each tile that
+        covers the window is read using the tile factory's get_tile_window; these partial tiles are not added to the
+        raster cache.
+
+        The mosaic posts are aligned with the finest north-up affine tile in the window unless a post spacing is
+        provided. Tiles that share that grid are copied directly. Other tiles (different resolutions, rotated or
+        non-affine georeferencing) are resampled with their own interpolation to fill any posts that are still
+        missing.
+
+        :param bounds: the (min longitude, min latitude, max longitude, max latitude) of the window in radians
+        :param post_spacing_degrees: an optional spacing of the mosaic posts in degrees
+
+        :return: a sampler for the mosaic or None if the DEM has no tiles in the window
+        """
+        min_longitude, min_latitude, max_longitude, max_latitude = np.degrees(bounds)
+        if min_longitude > max_longitude or min_latitude > max_latitude:
+            raise ValueError("Elevation window bounds must be ordered (min lon, min lat, max lon, max lat)")
+
+        tiles = []
+        for tile_id in self.tile_set.find_tile_ids_in_region(shapely.box(*bounds)):
+            sampler = self._get_window_sampler(tile_id, bounds)
+            if sampler is not None:
+                tiles.append(sampler)
+        if not tiles:
+            return None
+
+        north_up_tiles = [tile for tile in tiles if _is_north_up(tile.sensor_model)]
+        if post_spacing_degrees is not None:
+            longitude_spacing = latitude_spacing = float(post_spacing_degrees)
+            origin_longitude = origin_latitude = 0.0
+        elif north_up_tiles:
+            reference_transform = min(
+                north_up_tiles, key=lambda tile: tile.sensor_model.transform[0, 0]
+            ).sensor_model.transform
+            longitude_spacing = reference_transform[0, 0]
+            latitude_spacing = -reference_transform[1, 1]
+            origin_longitude = reference_transform[0, 2]
+            origin_latitude = reference_transform[1, 2]
+        else:
+            raise ValueError("A post spacing is required to mosaic DEM tiles that are not north up affine grids")
+        if longitude_spacing <= 0 or latitude_spacing <= 0:
+            raise ValueError("DEM mosaic post spacing must be positive")
+
+        # Expand the window outward to the nearest posts of the mosaic grid so all of it can be interpolated
+        first_column = floor((min_longitude - origin_longitude) / longitude_spacing + _GRID_TOLERANCE)
+        last_column = ceil((max_longitude - origin_longitude) / longitude_spacing - _GRID_TOLERANCE)
+        first_row = floor((origin_latitude - max_latitude) / latitude_spacing + _GRID_TOLERANCE)
+        last_row = ceil((origin_latitude - min_latitude) / latitude_spacing - _GRID_TOLERANCE)
+        window_longitude = origin_longitude + first_column * longitude_spacing
+        window_latitude = origin_latitude - first_row * latitude_spacing
+        height = max(last_row - first_row, 0) + 1
+        width = max(last_column - first_column, 0) + 1
+        mosaic = np.full((height, width), np.nan, dtype=np.float64)
+
+        for tile in tiles:
+            if tile in north_up_tiles:
+                transform = tile.sensor_model.transform
+                column_offset = (transform[0, 2] - window_longitude) / longitude_spacing
+                row_offset = (window_latitude - transform[1, 2]) / latitude_spacing
+                if (
+                    np.isclose(transform[0, 0], longitude_spacing, rtol=_GRID_TOLERANCE, atol=0.0)
+                    and np.isclose(-transform[1, 1], latitude_spacing, rtol=_GRID_TOLERANCE, atol=0.0)
+                    and abs(column_offset - round(column_offset)) < _GRID_TOLERANCE
+                    and abs(row_offset - round(row_offset)) < _GRID_TOLERANCE
+                ):
+                    column_offset = int(round(column_offset))
+                    row_offset = int(round(row_offset))
+                    columns = slice(max(column_offset, 0), min(column_offset + tile.width, width))
+                    rows = slice(max(row_offset, 0), min(row_offset + tile.height, height))
+                    if columns.start < columns.stop and rows.start < rows.stop:
+                        mosaic[rows, columns] = tile.elevations[
+                            rows.start - row_offset : rows.stop - row_offset,
+                            columns.start - column_offset : columns.stop - column_offset,
+                        ]
+                    continue
+
+            missing_rows, missing_columns = np.nonzero(np.isnan(mosaic))
+            x, y = tile.world_to_grid(
+                np.radians(window_longitude + missing_columns * longitude_spacing),
+                np.radians(window_latitude - missing_rows * latitude_spacing),
+            )
+            in_tile = (x >= 0) & (x <= tile.width - 1) & (y >= 0) & (y <= tile.height - 1)
+            mosaic[missing_rows[in_tile], missing_columns[in_tile]] = tile.interpolate(x[in_tile], y[in_tile])
+
+        return DEMTileSampler(
+            mosaic,
+            GDALAffineSensorModel([window_longitude, longitude_spacing, 0.0, window_latitude, 0.0, -latitude_spacing]),
+            propagate_nans=self.propagate_nans,
+            interpolation_method=self.interpolation_method,
+        )
+
+    def _get_window_sampler(self, tile_path: str, bounds: Tuple[float, float, float, float]) -> Optional[DEMTileSampler]:
+        """
+        Get a sampler for the part of a tile that covers a window. A tile that is already cached is used in full,
+        otherwise only the window is read from the tile factory.
+
+        :param tile_path: the location of the tile
+        :param bounds: the (min longitude, min latitude, max longitude, max latitude) of the window in radians
+
+        :return: the tile sampler or None if the tile is not available
+        """
+        cached_grid = self.raster_cache.peek(tile_path)
+        if cached_grid is not None:
+            return cached_grid[0]
+        try:
+            elevations_array, sensor_model, summary = self.tile_factory.get_tile_window(tile_path, bounds)
+        except Exception as err:
+            logger.warning(f"Unable to load DEM tile {tile_path}: {err}")
+            return None
+        return self._create_interpolation_grid(elevations_array, sensor_model, summary)[0]
+
     def describe_region(self, geodetic_world_coordinate: GeodeticWorldCoordinate) -> Optional[ElevationRegionSummary]:
         """
         Get a summary of the region near the provided world coordinate
@@ -151,10 +480,9 @@ class DigitalElevationModel(ElevationModel):
         interpolation_grid, sensor_model, summary = self.get_interpolation_grid(tile_id)
         return summary
 
-    @cachedmethod(operator.attrgetter("raster_cache"))
     def get_interpolation_grid(
         self, tile_path: str
-    ) -> Tuple[Optional[Callable[[float, float], npt.NDArray]], Optional[SensorModel], Optional[ElevationRegionSummary]]:
+    ) -> Tuple[Optional[DEMTileSampler], Optional[SensorModel], Optional[ElevationRegionSummary]]:
         """
         This method loads and converts an array of elevation values into a class that can
         interpolate values that lie between measured elevations. The sensor model is also
@@ -164,37 +492,118 @@ class DigitalElevationModel(ElevationModel):
         Note that the results of this method are cached by tile_id. It is very common for
         the set_elevation() method to be called multiple times for locations that are in a
         narrow region of interest. This will prevent unnecessary repeated loading of tiles.
+        The cache is thread safe and concurrent requests for the same tile only load it once.
+
+        Tiles the tile factory reports as unavailable are remembered in the cache's record of missing tiles. Errors
+        raised while loading a tile (e.g. a transient I/O failure) are not cached so the next request tries again.
 
         :param tile_path: the location of the tile to load
 
-        :return: the cached interpolation object, sensor model, and summary
+        :return: the cached tile sampler, sensor model, and summary
         """
         try:
-            elevations_array, sensor_model, summary = self.tile_factory.get_tile(tile_path)
-        except Exception:
-            elevations_array, sensor_model, summary = (None, None, None)
+            return self.raster_cache.get(tile_path, lambda: self._load_interpolation_grid(tile_path))
+        except Exception as err:
+            logger.warning(f"Unable to load DEM tile {tile_path}: {err}")
+            return None, None, None
+
+    def _load_interpolation_grid(
+        self, tile_path: str
+    ) -> Tuple[Optional[DEMTileSampler], Optional[SensorModel], Optional[ElevationRegionSummary]]:
+        """
+        Load a tile from the tile factory and wrap it in a sampler. Tiles that the factory reports as unavailable
+        result in a tuple of None values so the cache can remember they are missing. Errors raised by the factory
+        are passed on so they are not cached.
+
+        :param tile_path: the location of the tile to load
+
+        :return: the tile sampler, sensor model, and summary
+        """
+        return self._create_interpolation_grid(*self.tile_factory.get_tile(tile_path))
+
+    def _create_interpolation_grid(
+        self, elevations_array: Optional[Any], sensor_model: Optional[SensorModel], summary: Optional[ElevationRegionSummary]
+    ) -> Tuple[Optional[DEMTileSampler], Optional[SensorModel], Optional[ElevationRegionSummary]]:
+        """
+        Wrap the elevations returned by the tile factory in a sampler.
+
+        :param elevations_array: the elevation values or None if the tile is not available
+        :param sensor_model: the sensor model of the elevation values
+        :param summary: the summary of the tile
+
+        :return: the tile sampler, sensor model, and summary or a tuple of None values if the tile is not available
+        """
         if elevations_array is not None and sensor_model is not None:
-            height, width = elevations_array.shape
-            if self.propagate_nans:
-                nan_mask = np.isclose(elevations_array, summary.no_data_value)
-                if nan_mask.any():
-                    elevations_array = elevations_array.astype(np.float64)
-                    elevations_array[nan_mask] = np.nan
-                    interpolator = RegularGridInterpolator((np.arange(width), np.arange(height)), elevations_array.T)
-                    xs = interpolator.grid[0][np.array([0, -1])]
-                    ys = interpolator.grid[1][np.array([0, -1])]
-
-                    def interpolation_grid(x, y):
-                        return interpolator(
-                            (
-                                np.clip(x, a_min=np.min(xs), a_max=np.max(xs)),
-                                np.clip(y, a_min=np.min(ys), a_max=np.max(ys)),
-                            )
-                        )[np.newaxis, np.newaxis, ...]
-
-                    return interpolation_grid, sensor_model, summary
-            x = range(0, width)
-            y = range(0, height)
-            return RectBivariateSpline(x, y, elevations_array.T, kx=1, ky=1), sensor_model, summary
+            sampler = DEMTileSampler(
+                elevations_array,
+                sensor_model,
+                no_data_value=summary.no_data_value if summary is not None else None,
+                propagate_nans=self.propagate_nans,
+                interpolation_method=self.interpolation_method,
+            )
+            return sampler, sensor_model, summary
         else:
             return None, None, None
+
+
+# Tolerance, in fractions of a post, used when aligning DEM tiles with a mosaic grid
+_GRID_TOLERANCE = 1e-6
+
+
+def _is_north_up(sensor_model: SensorModel) -> bool:
+    """
+    Check if a tile is georeferenced by a north up affine transform directly from longitude, latitude degrees.
+
+    :param sensor_model: the sensor model of the tile
+
+    :return: True if the tile grid is aligned with lines of longitude and latitude
+    """
+    return (
+        isinstance(sensor_model, GDALAffineSensorModel)
+        and sensor_model.image_to_wgs84 is None
+        and sensor_model.transform[0, 1] == 0.0
+        and sensor_model.transform[1, 0] == 0.0
+        and sensor_model.transform[0, 0] > 0.0
+        and sensor_model.transform[1, 1] < 0.0
+    )
+
+
+def _inclusive_range(start: float, stop: float, step: float) -> np.ndarray:
+    """
+    Create evenly spaced values from start to stop, always including stop.
+
+    :param start: the first value
+    :param stop: the last value
+    :param step: the maximum spacing between values
+
+    :return: the array of values
+    """
+    count = int(np.ceil((stop - start) / step)) + 1
+    return np.linspace(start, stop, max(count, 2)) if stop > start else np.array([start])
+
+
+def _interpolation_grid_nbytes(
+    interpolation_grid: Tuple[Optional[DEMTileSampler], Optional[SensorModel], Optional[ElevationRegionSummary]]
+) -> int:
+    """
+    Compute the size of a cached tile as the number of bytes in its elevation array.
+
+    :param interpolation_grid: the tile sampler, sensor model, and summary tuple
+
+    :return: the size of the tile in bytes
+    """
+    sampler = interpolation_grid[0]
+    return int(sampler.elevations.nbytes) if sampler is not None else 0
+
+
+def _is_missing_tile(
+    interpolation_grid: Tuple[Optional[DEMTileSampler], Optional[SensorModel], Optional[ElevationRegionSummary]]
+) -> bool:
+    """
+    Identify the cached results for tiles that could not be loaded.
+
+    :param interpolation_grid: the tile sampler, sensor model, and summary tuple
+
+    :return: True if the tile is missing
+    """
+    return interpolation_grid[0] is None
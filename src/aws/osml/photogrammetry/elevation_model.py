@@ -3,9 +3,12 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple, Union
 
-from .coordinates import GeodeticWorldCoordinate
+import numpy as np
+import numpy.typing as npt
+
+from .coordinates import GeodeticWorldCoordinate, GeodeticWorldCoordinateArray
 
 
 @dataclass
@@ -41,6 +44,47 @@ class ElevationModel(ABC):
         :return: True if the elevation was updated, else False
         """
 
+    def get_elevations(self, longitudes: npt.ArrayLike, latitudes: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        This method looks up the surface elevations for arrays of longitude, latitude values. The default
+        implementation loops over the locations calling set_elevation so it will work for any elevation model.
+        Implementations that can process many locations at once should override it.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: an array of elevations (NaN where unavailable) and a boolean mask of the valid elevations
+        """
+        longitudes, latitudes = np.broadcast_arrays(
+            np.asarray(longitudes, dtype=np.float64), np.asarray(latitudes, dtype=np.float64)
+        )
+        elevations = np.full(longitudes.shape, np.nan, dtype=np.float64)
+        valid = np.zeros(longitudes.shape, dtype=bool)
+        for index in np.ndindex(longitudes.shape):
+            world_coordinate = GeodeticWorldCoordinate([longitudes[index], latitudes[index], 0.0])
+            if self.set_elevation(world_coordinate):
+                elevations[index] = world_coordinate.elevation
+                valid[index] = True
+        return elevations, valid
+
+    def set_elevations(self, world_coordinates: Union[np.ndarray, GeodeticWorldCoordinateArray]) -> np.ndarray:
+        """
+        This method updates the elevation column of an Nx3 array of longitude, latitude, elevation coordinates in
+        place to match the surface elevations. Elevations are left unchanged for any locations that this model
+        does not have a value for.
+
+        :param world_coordinates: the Nx3 array or GeodeticWorldCoordinateArray of coordinates to update
+
+        :return: a boolean mask that is True for each coordinate that was updated
+        """
+        if isinstance(world_coordinates, GeodeticWorldCoordinateArray):
+            world_coordinates = world_coordinates.coordinates
+        if not isinstance(world_coordinates, np.ndarray) or world_coordinates.ndim != 2 or world_coordinates.shape[1] != 3:
+            raise ValueError("World coordinates must be provided as an (N, 3) numpy array so they can be updated in place.")
+        elevations, valid = self.get_elevations(world_coordinates[:, 0], world_coordinates[:, 1])
+        world_coordinates[valid, 2] = elevations[valid]
+        return valid
+
     @abstractmethod
     def describe_region(self, world_coordinate: GeodeticWorldCoordinate) -> Optional[ElevationRegionSummary]:
         """
@@ -78,6 +122,18 @@ class ConstantElevationModel(ElevationModel):
         world_coordinate.elevation = self.constant_elevation
         return True
 
+    def get_elevations(self, longitudes: npt.ArrayLike, latitudes: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the constant elevation for every longitude, latitude.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: an array of elevations and a boolean mask of the valid elevations
+        """
+        shape = np.broadcast_shapes(np.shape(longitudes), np.shape(latitudes))
+        return np.full(shape, self.constant_elevation, dtype=np.float64), np.ones(shape, dtype=bool)
+
     def describe_region(self, world_coordinate: GeodeticWorldCoordinate) -> Optional[ElevationRegionSummary]:
         """
         Get a summary of the region near the provided world coordinate
@@ -2,7 +2,10 @@
 
 from abc import ABC, abstractmethod
 
-from .coordinates import GeodeticWorldCoordinate
+import numpy as np
+import numpy.typing as npt
+
+from .coordinates import GeodeticWorldCoordinate, as_coordinate_array
 
 
 class ElevationOffsetProvider(ABC):
@@ -24,6 +27,22 @@ class ElevationOffsetProvider(ABC):
         :return: meters above WGS84 ellipsoid
         """
 
+    def get_offsets(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        Provide WGS84 height offsets, in meters, for an array of coordinates. The default implementation loops over
+        the coordinates calling get_offset. Implementations that can process many coordinates at once should
+        override it.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an array of N offsets in meters above WGS84 ellipsoid
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        return np.array(
+            [self.get_offset(GeodeticWorldCoordinate(world_coordinate)) for world_coordinate in world_coordinates],
+            dtype=np.float64,
+        ).reshape(world_coordinates.shape[0])
+
 
 class ConstantOffsetProvider(ElevationOffsetProvider):
     """
@@ -50,3 +69,13 @@ class ConstantOffsetProvider(ElevationOffsetProvider):
         :return: meters above WGS84 ellipsoid
         """
         return self.constant_offset
+
+    def get_offsets(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        Provide the constant WGS84 height offset for every coordinate.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an array of N offsets in meters above WGS84 ellipsoid
+        """
+        return np.full(as_coordinate_array(world_coordinates, 3).shape[0], self.constant_offset, dtype=np.float64)
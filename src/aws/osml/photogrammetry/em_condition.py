@@ -2,7 +2,10 @@
 
 from abc import ABC, abstractmethod
 
-from .coordinates import GeodeticWorldCoordinate
+import numpy as np
+import numpy.typing as npt
+
+from .coordinates import GeodeticWorldCoordinate, as_coordinate_array
 
 
 class ElevationModelCondition(ABC):
@@ -23,6 +26,21 @@ class ElevationModelCondition(ABC):
         :return: True if condition passes, else False
         """
 
+    def are_true(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        Return if the condition is True for each coordinate in an array. The default implementation loops over the
+        coordinates calling is_true. Implementations that can process many coordinates at once should override it.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: a boolean array that is True for each coordinate that passes the condition
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        return np.array(
+            [self.is_true(GeodeticWorldCoordinate(world_coordinate)) for world_coordinate in world_coordinates],
+            dtype=bool,
+        ).reshape(world_coordinates.shape[0])
+
 
 class EMConditionFalse(ElevationModelCondition):
     """
@@ -42,6 +60,16 @@ class EMConditionFalse(ElevationModelCondition):
         """
         return False
 
+    def are_true(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        Always returns False for every coordinate.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an array of False values
+        """
+        return np.zeros(as_coordinate_array(world_coordinates, 3).shape[0], dtype=bool)
+
 
 class EMConditionTrue(ElevationModelCondition):
     """
@@ -60,3 +88,13 @@ class EMConditionTrue(ElevationModelCondition):
         :return: True
         """
         return True
+
+    def are_true(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        Always returns True for every coordinate.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an array of True values
+        """
+        return np.ones(as_coordinate_array(world_coordinates, 3).shape[0], dtype=bool)
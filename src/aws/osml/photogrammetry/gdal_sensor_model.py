@@ -4,10 +4,11 @@ from math import degrees, radians
 from typing import Any, Dict, List, Optional
 
 import numpy as np
+import numpy.typing as npt
 import pyproj
 from pyproj.enums import TransformDirection
 
-from .coordinates import LLA_PROJ, GeodeticWorldCoordinate, ImageCoordinate
+from .coordinates import LLA_PROJ, GeodeticWorldCoordinate, ImageCoordinate, as_coordinate_array
 from .elevation_model import ElevationModel
 from .sensor_model import SensorModel
 
@@ -121,3 +122,63 @@ class GDALAffineSensorModel(SensorModel):
             image_crs_coordinate = np.array((degrees(world_coordinate.longitude), degrees(world_coordinate.latitude), 1.0))
         xy_coordinate = np.matmul(self.inv_transform, image_crs_coordinate)
         return ImageCoordinate([xy_coordinate[0], xy_coordinate[1]])
+
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This function returns the longitude, latitude, elevation world coordinates associated with an array of x, y
+        image coordinates. The affine transform (and optional CRS transform) are applied to all coordinates at once.
+
+        :param image_coordinates: an Nx2 array of x, y image coordinates
+        :param elevation_model: an optional elevation model used to transform the coordinates
+        :param options: an optional dictionary of hints, does not support any hints
+        :return: an Nx3 array of longitude, latitude, elevation world coordinates
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        image_crs_coordinates = image_coordinates @ self.transform[0:2, 0:2].T + self.transform[0:2, 2]
+        if self.image_to_wgs84 is not None:
+            longitudes, latitudes, _ = self.image_to_wgs84.transform(
+                image_crs_coordinates[:, 0],
+                image_crs_coordinates[:, 1],
+                np.ones(image_crs_coordinates.shape[0]),
+                radians=False,
+                direction=TransformDirection.FORWARD,
+            )
+        else:
+            longitudes = image_crs_coordinates[:, 0]
+            latitudes = image_crs_coordinates[:, 1]
+
+        world_coordinates = np.column_stack(
+            [np.radians(longitudes), np.radians(latitudes), np.zeros(image_coordinates.shape[0])]
+        )
+        if elevation_model:
+            elevation_model.set_elevations(world_coordinates)
+
+        return world_coordinates
+
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function returns the x, y image coordinates associated with an array of longitude, latitude, elevation
+        world coordinates. The elevation component is ignored by this sensor model.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an Nx2 array of x, y image coordinates
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        longitudes = np.degrees(world_coordinates[:, 0])
+        latitudes = np.degrees(world_coordinates[:, 1])
+        if self.image_to_wgs84 is not None:
+            longitudes, latitudes, _ = self.image_to_wgs84.transform(
+                longitudes,
+                latitudes,
+                np.ones(world_coordinates.shape[0]),
+                radians=False,
+                direction=TransformDirection.INVERSE,
+            )
+        image_crs_coordinates = np.column_stack([longitudes, latitudes])
+        return image_crs_coordinates @ self.inv_transform[0:2, 0:2].T + self.inv_transform[0:2, 2]
@@ -1,9 +1,12 @@
 #  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
 
 from math import degrees, floor, radians
-from typing import Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from .coordinates import GeodeticWorldCoordinate
+from .dem_tile_availability import DEMTileAvailabilityIndex
 from .digital_elevation_model import DigitalElevationModelTileSet
 
 
@@ -19,6 +22,7 @@ class GenericDEMTileSet(DigitalElevationModelTileSet):
         max_latitude_degrees: float = 90.0,
         min_longitude_degrees: float = -180.0,
         max_longitude_degrees: float = 180.0,
+        availability_index: Optional[DEMTileAvailabilityIndex] = None,
     ) -> None:
         """
         Construct a tile set from a limited collection of configurable parameters. This implementation uses the
@@ -28,7 +32,7 @@ class GenericDEMTileSet(DigitalElevationModelTileSet):
         which would match some common 1-degree cell based DEM file hierarchies.
 
         :param format_spec: the format specification for the GeodeteticWorldCoordinate
-
+        :param availability_index: an optional index of the cells that have tiles, other cells are assumed missing
 
         :return: None
         """
@@ -38,6 +42,7 @@ class GenericDEMTileSet(DigitalElevationModelTileSet):
         self.max_latitude_degrees = max_latitude_degrees
         self.min_longitude_degrees = min_longitude_degrees
         self.max_longitude_degrees = max_longitude_degrees
+        self.availability_index = availability_index
 
     def find_tile_id(self, geodetic_world_coordinate: GeodeticWorldCoordinate) -> Optional[str]:
         """
@@ -60,5 +65,21 @@ class GenericDEMTileSet(DigitalElevationModelTileSet):
         ):
             return None
 
+        if self.availability_index is not None and (latitude_degrees, longitude_degrees) not in self.availability_index:
+            return None
+
         ul_coordinate = GeodeticWorldCoordinate([radians(longitude_degrees), radians(latitude_degrees), 0.0])
         return f"{ul_coordinate:{self.format_string}}"
+
+    def find_tile_ids(self, longitudes: np.ndarray, latitudes: np.ndarray) -> Tuple[List[Optional[str]], np.ndarray]:
+        """
+        Identifies the tiles for arrays of longitude, latitude values. Each tile covers a 1-degree cell so the tile
+        id is only created once for each distinct cell.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: the list of distinct tile paths (None for locations without coverage) and, for each location, the
+                 index of its tile path in that list
+        """
+        return self._find_tile_ids_by_cell(longitudes, latitudes, cell_size_degrees=1.0)
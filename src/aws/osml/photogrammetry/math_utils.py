@@ -1,7 +1,10 @@
 #  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
 
 from math import sqrt
-from typing import List
+from typing import Callable, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
 
 
 def equilateral_triangle(centroid: List[float], size: float) -> List[List[float]]:
@@ -23,3 +26,87 @@ def equilateral_triangle(centroid: List[float], size: float) -> List[List[float]
     ]
 
     return [[centroid[0] + coord[0], centroid[1] + coord[1]] for coord in sized_triangle_at_origin]
+
+
+def newton_raphson_2d(
+    residual_function: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]],
+    initial_guesses: npt.ArrayLike,
+    tolerance: float,
+    max_iterations: int = 20,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve N independent systems of two nonlinear equations in two unknowns using the Newton-Raphson method. All of
+    the systems are iterated together. A system is removed from the active set once the norm of its residual is
+    below the tolerance or as soon as the iteration can not continue (non-finite values or a singular Jacobian).
+
+    The residual function is called with the current Mx2 estimates for the active systems and the indexes of those
+    systems in the original input. It must return the Mx2 residuals and the Mx2x2 Jacobians of those residuals with
+    respect to the unknowns.
+
+    :param residual_function: function computing (residuals, jacobians) for the active systems
+    :param initial_guesses: Nx2 array of starting values for the unknowns
+    :param tolerance: a system has converged once the norm of its residual is less than this value
+    :param max_iterations: the maximum number of Newton steps to take
+
+    :return: the Nx2 array of solutions and a boolean mask identifying the systems that converged
+    """
+    solutions = np.array(initial_guesses, dtype=np.float64).reshape(-1, 2)
+    converged = np.zeros(solutions.shape[0], dtype=bool)
+    active = np.arange(solutions.shape[0])
+    for iteration in range(max_iterations + 1):
+        if active.size == 0:
+            break
+        residuals, jacobians = residual_function(solutions[active], active)
+
+        finite = np.all(np.isfinite(residuals), axis=1) & np.all(np.isfinite(jacobians), axis=(1, 2))
+        done = finite & (np.linalg.norm(np.where(finite[:, np.newaxis], residuals, 0.0), axis=1) < tolerance)
+        converged[active[done]] = True
+
+        remaining = finite & ~done
+        if iteration == max_iterations or not np.any(remaining):
+            break
+        determinants = np.linalg.det(jacobians[remaining])
+        solvable = np.abs(determinants) > np.finfo(np.float64).tiny
+        remaining[remaining] = solvable
+
+        active = active[remaining]
+        steps = np.linalg.solve(jacobians[remaining], -residuals[remaining][:, :, np.newaxis])[:, :, 0]
+        solutions[active] += steps
+
+    return solutions, converged
+
+
+def lagrange_interpolation_weights(
+    positions: npt.ArrayLike, num_samples: int, order: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the weights needed to interpolate a set of regularly spaced samples with a Lagrange polynomial. Each
+    position is expressed in units of the sample spacing relative to the first sample and is interpolated using the
+    window of order + 1 samples centered on it. Windows are shifted inward at the ends of the samples so positions
+    outside the samples are extrapolated from the closest window. The order is reduced if there are not enough
+    samples to support it.
+
+    :param positions: N positions to interpolate, in units of the sample spacing from the first sample
+    :param num_samples: the number of samples available
+    :param order: the order of the interpolating polynomial (1 = linear, 3 = cubic, ...)
+
+    :return: the Nx(order+1) sample indexes, interpolation weights, and derivatives of the interpolation weights
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1)
+    order = max(0, min(order, num_samples - 1))
+    starts = np.floor(np.nan_to_num(positions) - (order - 1) / 2.0)
+    starts = np.clip(starts, 0, num_samples - 1 - order).astype(int)
+
+    # Build the Lagrange basis polynomials one factor at a time, applying the product rule to track the derivatives
+    nodes = np.arange(order + 1)
+    differences = (positions - starts)[:, np.newaxis] - nodes
+    weights = np.ones((positions.shape[0], order + 1), dtype=np.float64)
+    derivatives = np.zeros((positions.shape[0], order + 1), dtype=np.float64)
+    for node in nodes:
+        for other_node in nodes[nodes != node]:
+            derivatives[:, node] = (derivatives[:, node] * differences[:, other_node] + weights[:, node]) / (
+                node - other_node
+            )
+            weights[:, node] *= differences[:, other_node] / (node - other_node)
+
+    return starts[:, np.newaxis] + nodes, weights, derivatives
@@ -1,6 +1,9 @@
 #  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
 
 from .coordinates import GeodeticWorldCoordinate
 from .elevation_model import ElevationModel, ElevationRegionSummary
@@ -35,6 +38,30 @@ class MultiElevationModel(ElevationModel):
                 return True
         return False
 
+    def get_elevations(self, longitudes: npt.ArrayLike, latitudes: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get elevations by using multiple inner models. Each model is only asked for the locations that the models
+        before it could not provide an elevation for.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: an array of elevations (NaN where unavailable) and a boolean mask of the valid elevations
+        """
+        longitudes, latitudes = np.broadcast_arrays(
+            np.asarray(longitudes, dtype=np.float64), np.asarray(latitudes, dtype=np.float64)
+        )
+        elevations = np.full(longitudes.shape, np.nan, dtype=np.float64)
+        valid = np.zeros(longitudes.shape, dtype=bool)
+        for elevation_model in self.elevation_models:
+            missing = ~valid
+            if not missing.any():
+                break
+            model_elevations, model_valid = elevation_model.get_elevations(longitudes[missing], latitudes[missing])
+            elevations[missing] = np.where(model_valid, model_elevations, np.nan)
+            valid[missing] = model_valid
+        return elevations, valid
+
     def describe_region(self, geodetic_world_coordinate: GeodeticWorldCoordinate) -> Optional[ElevationRegionSummary]:
         """
         Unimplemented summary of region near the provided world coordinate
@@ -1,8 +1,11 @@
 #  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
 
-from typing import Optional
+from typing import Optional, Tuple
 
-from .coordinates import GeodeticWorldCoordinate
+import numpy as np
+import numpy.typing as npt
+
+from .coordinates import GeodeticWorldCoordinate, normalize_geodetic_coordinates
 from .elevation_model import ElevationModel, ElevationRegionSummary
 
 
@@ -38,6 +41,26 @@ class NormalizedElevationModel(ElevationModel):
             return True
         return False
 
+    def get_elevations(self, longitudes: npt.ArrayLike, latitudes: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get elevations using normalized coordinates for the inner model.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: an array of elevations (NaN where unavailable) and a boolean mask of the valid elevations
+        """
+        longitudes, latitudes = np.broadcast_arrays(
+            np.asarray(longitudes, dtype=np.float64), np.asarray(latitudes, dtype=np.float64)
+        )
+        normalized_coordinates = normalize_geodetic_coordinates(
+            np.column_stack([longitudes.ravel(), latitudes.ravel(), np.zeros(longitudes.size)])
+        )
+        elevations, valid = self.inner_elevation_model.get_elevations(
+            normalized_coordinates[:, 0], normalized_coordinates[:, 1]
+        )
+        return elevations.reshape(longitudes.shape), valid.reshape(longitudes.shape)
+
     def describe_region(
         self,
         world_coordinate: GeodeticWorldCoordinate,
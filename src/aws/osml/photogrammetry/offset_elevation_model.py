@@ -1,6 +1,9 @@
 #  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
 
-from typing import Optional
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
 
 from .coordinates import GeodeticWorldCoordinate
 from .elevation_model import ElevationModel, ElevationRegionSummary
@@ -41,6 +44,24 @@ class OffsetElevationModel(ElevationModel):
             return True
         return False
 
+    def get_elevations(self, longitudes: npt.ArrayLike, latitudes: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get elevations using the inner model + offsets.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: an array of elevations (NaN where unavailable) and a boolean mask of the valid elevations
+        """
+        elevations, valid = self.inner_elevation_model.get_elevations(longitudes, latitudes)
+        if valid.any():
+            longitudes, latitudes = np.broadcast_arrays(longitudes, latitudes)
+            world_coordinates = np.column_stack(
+                [np.ravel(longitudes)[valid.ravel()], np.ravel(latitudes)[valid.ravel()], elevations[valid]]
+            )
+            elevations[valid] += self.offset_provider.get_offsets(world_coordinates)
+        return elevations, valid
+
     def describe_region(
         self,
         world_coordinate: GeodeticWorldCoordinate,
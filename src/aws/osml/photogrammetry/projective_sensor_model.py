@@ -3,8 +3,9 @@
 from typing import Any, Dict, List, Optional
 
 import numpy as np
+import numpy.typing as npt
 
-from .coordinates import GeodeticWorldCoordinate, ImageCoordinate
+from .coordinates import GeodeticWorldCoordinate, ImageCoordinate, as_coordinate_array
 from .elevation_model import ElevationModel
 from .sensor_model import SensorModel
 from .transforms import ProjectiveTransform
@@ -52,8 +53,8 @@ class ProjectiveSensorModel(SensorModel):
 
         :return: the longitude, latitude, elevation world coordinate
         """
-        world_coords = self.lonlat_to_xy_transform.inverse(np.array([image_coordinate.coordinate]))
-        world_coordinate = GeodeticWorldCoordinate(np.append(world_coords[0], [0]))
+        longitude, latitude = self.lonlat_to_xy_transform.inverse_point(image_coordinate.x, image_coordinate.y)
+        world_coordinate = GeodeticWorldCoordinate([longitude, latitude, 0.0])
         if elevation_model:
             elevation_model.set_elevation(world_coordinate)
         return world_coordinate
@@ -67,6 +68,41 @@ class ProjectiveSensorModel(SensorModel):
 
         :return: the x, y image coordinate
         """
-        image_coords = self.lonlat_to_xy_transform.forward(np.array([world_coordinate.coordinate[0:2]]))
-        image_coordinate = ImageCoordinate(image_coords[0])
-        return image_coordinate
+        return ImageCoordinate(
+            self.lonlat_to_xy_transform.forward_point(world_coordinate.longitude, world_coordinate.latitude)
+        )
+
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This function returns the longitude, latitude, elevation world coordinates associated with an array of x, y
+        image coordinates.
+
+        :param image_coordinates: an Nx2 array of x, y image coordinates
+        :param elevation_model: optional elevation model used to transform the coordinates
+        :param options: optional dictionary of hints, this camera does not support any hints
+
+        :return: an Nx3 array of longitude, latitude, elevation world coordinates
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        world_coordinates = np.zeros((image_coordinates.shape[0], 3), dtype=np.float64)
+        world_coordinates[:, 0:2] = self.lonlat_to_xy_transform.inverse(image_coordinates)
+        if elevation_model:
+            elevation_model.set_elevations(world_coordinates)
+        return world_coordinates
+
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function returns the x, y image coordinates associated with an array of longitude, latitude, elevation
+        world coordinates.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an Nx2 array of x, y image coordinates
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        return self.lonlat_to_xy_transform.forward(world_coordinates[:, 0:2])
@@ -1,28 +1,44 @@
 #  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
 #  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
 
-from abc import ABC
+import logging
+from abc import ABC, abstractmethod
 from enum import Enum
 from math import floor, pi, radians, sqrt
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
+import numpy.typing as npt
 from scipy.optimize import minimize
 
 from .coordinates import (
     GeodeticWorldCoordinate,
     ImageCoordinate,
     WorldCoordinate,
+    as_coordinate_array,
     geocentric_to_geodetic,
+    geocentric_to_geodetic_array,
     geodetic_to_geocentric,
+    geodetic_to_geocentric_array,
+    geodetic_to_geocentric_jacobian,
+    normalize_geodetic_coordinates,
 )
 from .elevation_model import ConstantElevationModel, ElevationModel
-from .math_utils import equilateral_triangle
+from .math_utils import equilateral_triangle, lagrange_interpolation_weights, newton_raphson_2d
 from .multi_elevation_model import MultiElevationModel
 from .normalized_elevation_model import NormalizedElevationModel
+from .rpc_sensor_model import (
+    INVERSE_POLYNOMIAL_GRID_SIZE,
+    INVERSE_POLYNOMIAL_PIXEL_TOLERANCE,
+    InverseRationalPolynomial,
+)
 from .sensor_model import SensorModel, SensorModelOptions
 
-# TODO: Add Support for Grid Based RSM Sensor Models
+logger = logging.getLogger(__name__)
+
+# Image to world solutions are accepted once they reproject to within this distance (in pixels) of the target
+RSM_IMAGE_TO_WORLD_PIXEL_TOLERANCE = 0.0001
+
 # TODO: Add Support for Adjustable RSM Sensor Models
 # TODO: Add Support for Error Assessments
 # TODO: Add typing for ArrayLike inputs once Numpy upgraded to 1.20+
@@ -232,6 +248,74 @@ class RSMGroundDomain:
 
         return world_coordinate
 
+    def geodetic_to_ground_domain_coordinates(self, geodetic_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function converts an array of WGS-84 geodetic world coordinates into world coordinates that use the
+        domain coordinate system for this sensor model. It is the batch equivalent of
+        geodetic_to_ground_domain_coordinate.
+
+        :param geodetic_coordinates: an Nx3 array of WGS-84 longitude, latitude, elevation
+
+        :return: an Nx3 array of x, y, z domain coordinates
+        """
+        geodetic_coordinates = as_coordinate_array(geodetic_coordinates, 3)
+        if self.ground_domain_form == RSMGroundDomainForm.RECTANGULAR:
+            if self.rectangular_coordinate_origin is None or self.rectangular_coordinate_unit_vectors is None:
+                raise TypeError("Rectangular ground domain missing origin or unit vectors")
+
+            coordinates_relative_to_origin = (
+                geodetic_to_geocentric_array(geodetic_coordinates) - self.rectangular_coordinate_origin.coordinate
+            )
+            return coordinates_relative_to_origin @ self.rectangular_coordinate_unit_vectors.T
+        elif self.ground_domain_form == RSMGroundDomainForm.GEODETIC_2PI:
+            ground_domain_coordinates = geodetic_coordinates.copy()
+            ground_domain_coordinates[:, 0] = (ground_domain_coordinates[:, 0] + 2 * pi) % (2 * pi)
+            return ground_domain_coordinates
+        else:
+            return geodetic_coordinates.copy()
+
+    def geodetic_to_ground_domain_jacobian(self, geodetic_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function computes the partial derivatives of the ground domain coordinates (x, y, z) with respect to the
+        WGS-84 geodetic coordinates (longitude, latitude, elevation) for an array of geodetic coordinates.
+
+        :param geodetic_coordinates: an Nx3 array of WGS-84 longitude, latitude, elevation
+
+        :return: an Nx3x3 array where [i, j, k] is the derivative of domain component j with respect to geodetic
+                 component k
+        """
+        geodetic_coordinates = as_coordinate_array(geodetic_coordinates, 3)
+        if self.ground_domain_form == RSMGroundDomainForm.RECTANGULAR:
+            if self.rectangular_coordinate_origin is None or self.rectangular_coordinate_unit_vectors is None:
+                raise TypeError("Rectangular ground domain missing origin or unit vectors")
+
+            return self.rectangular_coordinate_unit_vectors @ geodetic_to_geocentric_jacobian(geodetic_coordinates)
+        else:
+            return np.broadcast_to(np.identity(3), (geodetic_coordinates.shape[0], 3, 3)).copy()
+
+    def ground_domain_coordinates_to_geodetic(self, ground_domain_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function converts an array of x, y, z coordinates defined in the ground domain of this sensor model into
+        WGS-84 longitude, latitude, elevation coordinates. It is the batch equivalent of
+        ground_domain_coordinate_to_geodetic.
+
+        :param ground_domain_coordinates: an Nx3 array of x, y, z domain coordinates
+
+        :return: an Nx3 array of WGS-84 longitude, latitude, elevation coordinates
+        """
+        ground_domain_coordinates = as_coordinate_array(ground_domain_coordinates, 3)
+        if self.ground_domain_form == RSMGroundDomainForm.RECTANGULAR:
+            if self.rectangular_coordinate_origin is None or self.rectangular_coordinate_unit_vectors is None:
+                raise TypeError("Rectangular ground domain missing origin or unit vectors")
+
+            ecef_coordinates = (
+                ground_domain_coordinates @ self.rectangular_coordinate_unit_vectors_inverse.T
+                + self.rectangular_coordinate_origin.coordinate
+            )
+            return geocentric_to_geodetic_array(ecef_coordinates)
+        else:
+            return ground_domain_coordinates.copy()
+
 
 class RSMContext:
     """
@@ -295,6 +379,15 @@ class RSMPolynomial:
         self.max_power_z = max_power_z
         self.coefficients = coefficients
 
+        # Precompute the x, y, z power of each term in the order the coefficients are defined. These are used to
+        # gather columns from per-component power tables when evaluating the polynomial for arrays of coordinates.
+        powers_z, powers_y, powers_x = np.meshgrid(
+            np.arange(max_power_z + 1), np.arange(max_power_y + 1), np.arange(max_power_x + 1), indexing="ij"
+        )
+        self.term_powers_x = powers_x.ravel()
+        self.term_powers_y = powers_y.ravel()
+        self.term_powers_z = powers_z.ravel()
+
     def evaluate(self, normalized_world_coordinate: WorldCoordinate) -> float:
         """
         This function evaluates the polynomial for the given world coordinate by summing up the result of applying
@@ -322,6 +415,85 @@ class RSMPolynomial:
         # fmt: on
         return result
 
+    def evaluate_array(self, normalized_world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function evaluates the polynomial for an array of normalized world coordinates. It is equivalent to
+        calling evaluate on each coordinate but the monomial basis for all coordinates is computed in one pass and
+        then combined with the coefficients using a single matrix product.
+
+        :param normalized_world_coordinates: an Nx3 array of normalized world coordinates
+
+        :return: an array containing the N resulting values
+        """
+        return self.monomial_basis(normalized_world_coordinates) @ np.asarray(self.coefficients, dtype=np.float64)
+
+    @property
+    def max_powers(self) -> Tuple[int, int, int]:
+        """
+        The maximum powers of x, y, and z. Polynomials with the same maximum powers share the same monomial basis.
+
+        :return: the (max_power_x, max_power_y, max_power_z) tuple
+        """
+        return self.max_power_x, self.max_power_y, self.max_power_z
+
+    def monomial_basis(self, normalized_world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        Compute the value of every monomial term in this polynomial for an array of normalized world coordinates.
+        Power tables for each component are built with repeated multiplication and then the columns for each term
+        are gathered and multiplied together. The columns are in the same order as the coefficients.
+
+        :param normalized_world_coordinates: an Nx3 array of normalized world coordinates
+
+        :return: an NxM array of monomial values where M is the number of coefficients
+        """
+        normalized_world_coordinates = as_coordinate_array(normalized_world_coordinates, 3)
+        x_powers = RSMPolynomial.power_table(normalized_world_coordinates[:, 0], self.max_power_x)
+        y_powers = RSMPolynomial.power_table(normalized_world_coordinates[:, 1], self.max_power_y)
+        z_powers = RSMPolynomial.power_table(normalized_world_coordinates[:, 2], self.max_power_z)
+        return x_powers[:, self.term_powers_x] * y_powers[:, self.term_powers_y] * z_powers[:, self.term_powers_z]
+
+    def monomial_basis_partials(
+        self, normalized_world_coordinates: npt.ArrayLike
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute the partial derivatives of every monomial term in this polynomial with respect to x, y, and z for an
+        array of normalized world coordinates. Multiplying these by the coefficients gives the partial derivatives of
+        the polynomial.
+
+        :param normalized_world_coordinates: an Nx3 array of normalized world coordinates
+
+        :return: three NxM arrays containing the d/dx, d/dy, and d/dz monomial values
+        """
+        normalized_world_coordinates = as_coordinate_array(normalized_world_coordinates, 3)
+        x_powers = RSMPolynomial.power_table(normalized_world_coordinates[:, 0], self.max_power_x)
+        y_powers = RSMPolynomial.power_table(normalized_world_coordinates[:, 1], self.max_power_y)
+        z_powers = RSMPolynomial.power_table(normalized_world_coordinates[:, 2], self.max_power_z)
+        x_terms = x_powers[:, self.term_powers_x]
+        y_terms = y_powers[:, self.term_powers_y]
+        z_terms = z_powers[:, self.term_powers_z]
+
+        # d/dx x^i = i * x^(i-1), the max() keeps the index valid for the constant terms which have a 0 multiplier
+        d_dx = self.term_powers_x * x_powers[:, np.maximum(self.term_powers_x - 1, 0)] * y_terms * z_terms
+        d_dy = self.term_powers_y * x_terms * y_powers[:, np.maximum(self.term_powers_y - 1, 0)] * z_terms
+        d_dz = self.term_powers_z * x_terms * y_terms * z_powers[:, np.maximum(self.term_powers_z - 1, 0)]
+        return d_dx, d_dy, d_dz
+
+    @staticmethod
+    def power_table(values: np.ndarray, max_power: int) -> np.ndarray:
+        """
+        Build a table containing the powers 0 through max_power of each value.
+
+        :param values: an array of N values
+        :param max_power: the maximum power to compute
+
+        :return: an Nx(max_power + 1) array where column p contains values ** p
+        """
+        table = np.empty((values.shape[0], max_power + 1), dtype=np.float64)
+        table[:, 0] = 1.0
+        for power in range(1, max_power + 1):
+            table[:, power] = table[:, power - 1] * values
+        return table
+
     def __call__(self, *args, **kwargs):
         """
         This makes the polynomial object callable such that it can be applied to a world coordinate directly e.g.
@@ -376,6 +548,31 @@ class RSMLowOrderPolynomial:
         result += self.coefficients[9] * world_coordinate.z * world_coordinate.z  # ZZ
         return result
 
+    def evaluate_array(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function evaluates the polynomial for an array of world coordinates.
+
+        :param world_coordinates: an Nx3 array of world coordinates
+
+        :return: an array containing the N resulting values
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        x = world_coordinates[:, 0]
+        y = world_coordinates[:, 1]
+        z = world_coordinates[:, 2]
+
+        result = np.full(x.shape, self.coefficients[0], dtype=np.float64)  # constant
+        result += self.coefficients[1] * x  # X
+        result += self.coefficients[2] * y  # Y
+        result += self.coefficients[3] * z  # Z
+        result += self.coefficients[4] * x * x  # XX
+        result += self.coefficients[5] * x * y  # XY
+        result += self.coefficients[6] * x * z  # XZ
+        result += self.coefficients[7] * y * y  # YY
+        result += self.coefficients[8] * y * z  # YZ
+        result += self.coefficients[9] * z * z  # ZZ
+        return result
+
     def __call__(self, *args, **kwargs):
         """
         This makes the polynomial object callable such that it can be applied to a world coordinate directly e.g.
@@ -405,72 +602,65 @@ class RSMSensorModel(SensorModel, ABC):
         self.context = context
 
 
-class RSMPolynomialSensorModel(RSMSensorModel):
+class RSMGroundDomainSensorModel(RSMSensorModel, ABC):
     """
-    This is an implementation of a Rational Polynomial Camera as defined in section 10.3.3.1.1 of the Manual of
-    Photogrammetry Sixth Edition.
+    This is an abstract base for the RSM sensor models that directly map ground domain coordinates to image
+    coordinates (i.e. the polynomial and grid models). Subclasses supply the ground to image function and its partial
+    derivatives; the world to image and image to world transforms are built on top of those functions.
     """
 
-    def __init__(
-        self,
-        context: RSMContext,
-        section_row: int,
-        section_col: int,
-        row_norm_offset: float,
-        column_norm_offset: float,
-        x_norm_offset: float,
-        y_norm_offset: float,
-        z_norm_offset: float,
-        row_norm_scale: float,
-        column_norm_scale: float,
-        x_norm_scale: float,
-        y_norm_scale: float,
-        z_norm_scale: float,
-        row_numerator_poly: RSMPolynomial,
-        row_denominator_poly: RSMPolynomial,
-        column_numerator_poly: RSMPolynomial,
-        column_denominator_poly: RSMPolynomial,
-    ) -> None:
+    def __init__(self, context: RSMContext) -> None:
         """
-        This constructs the sensor model using parameters normally found in the NITF RSMPC TRE.
+        Constructor that accepts the RSM context as an input.
 
         :param context: contextual information describing the collection environment
-        :param section_row: image row section number that the sensor model applies to
-        :param section_col: image col section number that the sensor model applies to
-        :param row_norm_offset: offset used to normalize/denormalize image row components
-        :param column_norm_offset: offset used to normalize/denormalize image column components
-        :param x_norm_offset: offset used to normalize/denormalize world x components
-        :param y_norm_offset: offset used to normalize/denormalize world y components
-        :param z_norm_offset: offset used to normalize/denormalize world z components
-        :param row_norm_scale: scale used to normalize/denormalize image row components
-        :param column_norm_scale: scale used to normalize/denormalize image column components
-        :param x_norm_scale: scale used to normalize/denormalize world x components
-        :param y_norm_scale: scale used to normalize/denormalize world y components
-        :param z_norm_scale: scale used to normalize/denormalize world z components
-        :param row_numerator_poly: polynomial used as the numerator in row calculations
-        :param row_denominator_poly: polynomial used as the denominator in row calculations
-        :param column_numerator_poly: polynomial used as the numerator in column calculations
-        :param column_denominator_poly: polynomial used as the denominator in column calculations
 
         :return: None
         """
         super().__init__(context)
-        self.section_row = section_row
-        self.section_col = section_col
-        self.row_norm_offset = row_norm_offset
-        self.column_norm_offset = column_norm_offset
-        self.x_norm_offset = x_norm_offset
-        self.y_norm_offset = y_norm_offset
-        self.z_norm_offset = z_norm_offset
-        self.row_norm_scale = row_norm_scale
-        self.column_norm_scale = column_norm_scale
-        self.x_norm_scale = x_norm_scale
-        self.y_norm_scale = y_norm_scale
-        self.z_norm_scale = z_norm_scale
-        self.row_numerator_poly = row_numerator_poly
-        self.row_denominator_poly = row_denominator_poly
-        self.column_numerator_poly = column_numerator_poly
-        self.column_denominator_poly = column_denominator_poly
+
+        # An optional inverse fit to the ground to image function that replaces the iterative image to world solver
+        self.inverse_polynomial: Optional[InverseRationalPolynomial] = None
+        self.inverse_pixel_tolerance = INVERSE_POLYNOMIAL_PIXEL_TOLERANCE
+
+    def fit_inverse_polynomial(
+        self,
+        grid_size: Sequence[int] = INVERSE_POLYNOMIAL_GRID_SIZE,
+        pixel_tolerance: float = INVERSE_POLYNOMIAL_PIXEL_TOLERANCE,
+        image_bounds: Optional[Sequence[float]] = None,
+    ) -> InverseRationalPolynomial:
+        """
+        Fit an inverse rational polynomial to this sensor model. The inverse is fit on a grid of coordinates spanning
+        the box containing the ground domain vertices. Once fit, image to world transforms use the inverse directly if
+        its residuals are within the pixel tolerance. Otherwise the inverse is used to compute the initial guesses for
+        the iterative solver.
+
+        :param grid_size: the number of x, y, and z samples in the ground domain grid
+        :param pixel_tolerance: the maximum residual (in pixels) of an inverse that can be used without iteration
+        :param image_bounds: optional [min x, min y, max x, max y] covered by this model, defaults to the image domain
+
+        :return: the fitted inverse, its residuals are available as rms_residual and max_residual
+        """
+        ground_domain = self.context.ground_domain
+        if image_bounds is None:
+            image_domain = self.context.image_domain
+            image_bounds = [image_domain.min_column, image_domain.min_row, image_domain.max_column, image_domain.max_row]
+
+        vertices = np.array([vertex.coordinate for vertex in ground_domain.ground_domain_vertices], dtype=np.float64)
+        lower_bounds = np.min(vertices, axis=0)
+        upper_bounds = np.max(vertices, axis=0)
+        self.inverse_polynomial = InverseRationalPolynomial.fit(
+            self,
+            ground_domain.ground_domain_coordinates_to_geodetic(
+                InverseRationalPolynomial.grid_coordinates(lower_bounds, upper_bounds, grid_size)
+            ),
+            ground_domain.ground_domain_coordinates_to_geodetic(
+                InverseRationalPolynomial.grid_coordinates(lower_bounds, upper_bounds, grid_size, staggered=True)
+            ),
+            image_bounds=image_bounds,
+        )
+        self.inverse_pixel_tolerance = pixel_tolerance
+        return self.inverse_polynomial
 
     def world_to_image(self, geodetic_coordinate: GeodeticWorldCoordinate) -> ImageCoordinate:
         """
@@ -487,6 +677,18 @@ class RSMPolynomialSensorModel(RSMSensorModel):
         world_coordinate = self.context.ground_domain.geodetic_to_ground_domain_coordinate(geodetic_coordinate)
         return self.ground_domain_to_image(world_coordinate)
 
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function transforms an array of geodetic world coordinates (longitude, latitude, elevation) into an
+        array of image coordinates (x, y).
+
+        :param world_coordinates: an Nx3 array of world coordinates (longitude, latitude, elevation)
+
+        :return: an Nx2 array of image coordinates (x, y)
+        """
+        domain_coordinates = self.context.ground_domain.geodetic_to_ground_domain_coordinates(world_coordinates)
+        return self.ground_domain_to_image_batch(domain_coordinates)
+
     def image_to_world(
         self,
         image_coordinate: ImageCoordinate,
@@ -494,10 +696,12 @@ class RSMPolynomialSensorModel(RSMSensorModel):
         options: Optional[Dict[str, Any]] = None,
     ) -> GeodeticWorldCoordinate:
         """
-        This function implements the image to world transform by iteratively invoking world to image within a
-        minimization routine to find a matching image coordinate. The longitude and latitude parameters are searched
-        independently while the elevation of the world coordinate comes from the surface provided with the ground
-        domain.
+        This function implements the image to world transform using a Newton-Raphson iteration driven by the analytic
+        partial derivatives of the ground to image function. The longitude and latitude parameters are solved for while
+        the elevation of the world coordinate comes from the elevation model or the surface provided with the ground
+        domain. If the iteration does not converge the transform falls back to a minimization routine that iteratively
+        invokes world to image to find a matching image coordinate. If an inverse polynomial has been fit to this
+        sensor model it is evaluated first and the iteration is only needed when the inverse is not accurate enough.
 
         :param image_coordinate: the image coordinate (x, y)
         :param elevation_model: an optional elevation model used transform the coordinate
@@ -505,16 +709,192 @@ class RSMPolynomialSensorModel(RSMSensorModel):
 
         :return: the corresponding world coordinate
         """
+        elevation_model = self._select_elevation_model(elevation_model)
+        initial_guess = self._get_initial_guesses(options, 1)[0]
 
+        world_coordinates, converged = self._solve_image_to_world(
+            image_coordinate.coordinate.reshape(1, 2), elevation_model, initial_guess.reshape(1, 2)
+        )
+        if converged[0]:
+            return GeodeticWorldCoordinate(world_coordinates[0])
+
+        return self._minimize_image_to_world(image_coordinate, elevation_model, initial_guess, options)
+
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This function implements the image to world transform for an array of image coordinates. All coordinates are
+        solved together using the Newton-Raphson iteration. Any coordinates that fail to converge are then solved
+        individually using the minimization routine.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevation_model: an optional elevation model used transform the coordinates
+        :param options: optional hints, supports initial_guess (either [lon, lat] or an Nx2 array) and
+                        initial_search_distance
+
+        :return: an Nx3 array of world coordinates (longitude, latitude, elevation)
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        elevation_model = self._select_elevation_model(elevation_model)
+        initial_guesses = self._get_initial_guesses(options, image_coordinates.shape[0])
+
+        world_coordinates, converged = self._solve_image_to_world(image_coordinates, elevation_model, initial_guesses)
+        for index in np.flatnonzero(~converged):
+            world_coordinates[index] = self._minimize_image_to_world(
+                ImageCoordinate(image_coordinates[index]), elevation_model, initial_guesses[index], options
+            ).coordinate
+
+        return world_coordinates
+
+    def _select_elevation_model(self, elevation_model: Optional[ElevationModel]) -> ElevationModel:
+        """
+        Combine the caller's elevation model with the default elevation model of the ground domain.
+
+        :param elevation_model: the optional elevation model provided by the caller
+
+        :return: the elevation model to use when transforming image coordinates
+        """
         if elevation_model is None:
-            elevation_model = self.context.ground_domain.default_elevation_model
-        else:
-            elevation_model = MultiElevationModel(
-                [
-                    NormalizedElevationModel(elevation_model),
-                    self.context.ground_domain.default_elevation_model,
-                ],
+            return self.context.ground_domain.default_elevation_model
+        return MultiElevationModel(
+            [
+                NormalizedElevationModel(elevation_model),
+                self.context.ground_domain.default_elevation_model,
+            ],
+        )
+
+    def _get_initial_guesses(self, options: Optional[Dict[str, Any]], num_coordinates: int) -> np.ndarray:
+        """
+        Select initial guesses for the image to world search. If the caller has not provided a guess we use a location
+        at the center of face 1 in the ground domain. Face 1 is defined as the plane V1->V3->V4->V2 so taking a
+        location at the center of the diagonal V1->V4 should start the search off at the center of the ground domain.
+
+        :param options: optional hints that may contain the initial_guess
+        :param num_coordinates: the number of image coordinates being transformed
+
+        :return: an Nx2 array of (longitude, latitude) guesses in radians
+        """
+        initial_guess = options.get(SensorModelOptions.INITIAL_GUESS) if options is not None else None
+        if initial_guess is None:
+            v1 = self.context.ground_domain.geodetic_ground_domain_vertices[0]
+            v4 = self.context.ground_domain.geodetic_ground_domain_vertices[3]
+            initial_guess = [(v1.longitude + v4.longitude) / 2.0, (v1.latitude + v4.latitude) / 2.0]
+        return np.broadcast_to(np.asarray(initial_guess, dtype=np.float64), (num_coordinates, 2)).copy()
+
+    def _lonlat_to_world_coordinates(self, lonlat: np.ndarray, elevation_model: ElevationModel) -> np.ndarray:
+        """
+        Expand an array of (longitude, latitude) values into world coordinates with elevations assigned by the
+        elevation model.
+
+        :param lonlat: an Nx2 array of longitude, latitude values in radians
+        :param elevation_model: the elevation model used to assign the elevations
+
+        :return: an Nx3 array of world coordinates (longitude, latitude, elevation)
+        """
+        world_coordinates = np.column_stack([lonlat, np.zeros(lonlat.shape[0])])
+        elevation_model.set_elevations(world_coordinates)
+        return world_coordinates
+
+    def _solve_image_to_world(
+        self, image_coordinates: np.ndarray, elevation_model: ElevationModel, initial_guesses: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve for the world coordinates of an array of image coordinates. The inverse polynomial is used if one has
+        been fit to this sensor model, otherwise the solution comes from the Newton-Raphson iteration.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevation_model: the elevation model used to assign elevations
+        :param initial_guesses: an Nx2 array of (longitude, latitude) guesses in radians
+
+        :return: the Nx3 array of normalized world coordinates and a mask identifying the coordinates that converged
+        """
+        if self.inverse_polynomial is not None:
+            return self._solve_image_to_world_with_inverse(image_coordinates, elevation_model, initial_guesses)
+        return self._newton_image_to_world(image_coordinates, elevation_model, initial_guesses)
+
+    def _solve_image_to_world_with_inverse(
+        self, image_coordinates: np.ndarray, elevation_model: ElevationModel, initial_guesses: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve for the world coordinates of an array of image coordinates using the inverse polynomial. If the inverse
+        is accurate enough its solutions are returned directly, otherwise they become the initial guesses for the
+        Newton-Raphson iteration.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevation_model: the elevation model used to assign elevations
+        :param initial_guesses: an Nx2 array of (longitude, latitude) guesses used if the inverse fails
+
+        :return: the Nx3 array of normalized world coordinates and a mask identifying the coordinates that converged
+        """
+        world_coordinates, converged = self.inverse_polynomial.image_to_world(image_coordinates, elevation_model)
+        if self.inverse_polynomial.max_residual > self.inverse_pixel_tolerance:
+            converged[:] = False
+
+        remaining = np.flatnonzero(~converged)
+        if remaining.size > 0:
+            inverse_guesses = world_coordinates[remaining, 0:2]
+            usable_guesses = np.all(np.isfinite(inverse_guesses), axis=1)
+            initial_guesses = initial_guesses[remaining]
+            initial_guesses[usable_guesses] = inverse_guesses[usable_guesses]
+            world_coordinates[remaining], converged[remaining] = self._newton_image_to_world(
+                image_coordinates[remaining], elevation_model, initial_guesses
             )
+        return normalize_geodetic_coordinates(world_coordinates), converged
+
+    def _newton_image_to_world(
+        self, image_coordinates: np.ndarray, elevation_model: ElevationModel, initial_guesses: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve for the world coordinates of an array of image coordinates using a Newton-Raphson iteration on the
+        geodetic longitude and latitude. The Jacobian is the product of the ground to image partials with respect
+        to the ground domain coordinates and the partials of the ground domain coordinates with respect to longitude
+        and latitude. At each step the elevation of the current estimate is taken from the elevation model and held
+        fixed while the step is computed.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevation_model: the elevation model used to assign elevations
+        :param initial_guesses: an Nx2 array of (longitude, latitude) guesses in radians
+
+        :return: the Nx3 array of normalized world coordinates and a mask identifying the coordinates that converged
+        """
+        ground_domain = self.context.ground_domain
+
+        def residuals_and_jacobians(lonlat: np.ndarray, indexes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            world_coordinates = self._lonlat_to_world_coordinates(lonlat, elevation_model)
+            domain_coordinates = ground_domain.geodetic_to_ground_domain_coordinates(world_coordinates)
+            new_image_coordinates, domain_jacobians = self.ground_domain_to_image_with_jacobian(domain_coordinates)
+            lonlat_jacobians = ground_domain.geodetic_to_ground_domain_jacobian(world_coordinates)[:, :, 0:2]
+            return new_image_coordinates - image_coordinates[indexes], domain_jacobians @ lonlat_jacobians
+
+        lonlat, converged = newton_raphson_2d(
+            residuals_and_jacobians, initial_guesses, tolerance=RSM_IMAGE_TO_WORLD_PIXEL_TOLERANCE
+        )
+        world_coordinates = self._lonlat_to_world_coordinates(lonlat, elevation_model)
+        return normalize_geodetic_coordinates(world_coordinates), converged
+
+    def _minimize_image_to_world(
+        self,
+        image_coordinate: ImageCoordinate,
+        elevation_model: ElevationModel,
+        initial_guess: np.ndarray,
+        options: Optional[Dict[str, Any]],
+    ) -> GeodeticWorldCoordinate:
+        """
+        This function implements the image to world transform by iteratively invoking world to image within a
+        bounded minimization routine to find a matching image coordinate. It is slower than the Newton-Raphson
+        iteration but is more tolerant of poor initial guesses so it is used as a fallback.
+
+        :param image_coordinate: the image coordinate (x, y)
+        :param elevation_model: the elevation model used to assign elevations
+        :param initial_guess: the (longitude, latitude) guess in radians
+        :param options: optional hints, supports initial_search_distance
+
+        :return: the corresponding world coordinate
+        """
 
         # This is the function we will be minimizing. Given a longitude, latitude coordinate we invoke the
         # world_to_image function to get a projection of that location in the image. Then we compute the
@@ -528,29 +908,23 @@ class RSMPolynomialSensorModel(RSMSensorModel):
                 (image_coordinate.x - new_image_coordinate.x) ** 2 + (image_coordinate.y - new_image_coordinate.y) ** 2
             )
 
-        # Select an initial guess that is at the center of face 1 in the ground domain. Face 1 is defined as the
-        # plane V1->V3->V4->V2 so taking a location at the center of the diagonal V1->V4 should start the search off
-        # at the center of the ground domain.
-        v1 = self.context.ground_domain.geodetic_ground_domain_vertices[0]
-        v4 = self.context.ground_domain.geodetic_ground_domain_vertices[3]
-        initial_guess = options.get(SensorModelOptions.INITIAL_GUESS) if options is not None else None
-        if initial_guess is None:
-            initial_guess = np.array([(v1.longitude + v4.longitude) / 2.0, (v1.latitude + v4.latitude) / 2.0])
-        if isinstance(initial_guess, List):
-            initial_guess = np.array(initial_guess)
+        # Round trip the initial guess through the ground domain, so it is expressed in the same longitude range as
+        # the bounds of the search
         initial_guess = self.context.ground_domain.ground_domain_coordinate_to_geodetic(
             self.context.ground_domain.geodetic_to_ground_domain_coordinate(
-                GeodeticWorldCoordinate(initial_guess.tolist() + [0.0]),
+                GeodeticWorldCoordinate(list(initial_guess) + [0.0]),
             ),
         ).coordinate[:2]
 
+        v1 = self.context.ground_domain.geodetic_ground_domain_vertices[0]
+        v4 = self.context.ground_domain.geodetic_ground_domain_vertices[3]
         initial_search_distance = options.get(SensorModelOptions.INITIAL_SEARCH_DISTANCE) if options is not None else None
         if initial_search_distance is None:
             initial_search_distance = sqrt(((v1.longitude - v4.longitude) ** 2) + ((v1.latitude - v4.latitude) ** 2))
 
         # Iteratively adjust the initial guess to minimize the distance to the target image coordinate. We are only
         # allowing the x,y components to vary here and the z is fixed to the elevation model used by the ground
-        # domain. The starting simplex is estimated as a triangle centered in the ground domain.
+        # domain. The starting simplex is estimated as a triangle centered on the initial guess.
         res = minimize(
             distance_to_target_coordinate,
             initial_guess,
@@ -579,6 +953,105 @@ class RSMPolynomialSensorModel(RSMSensorModel):
 
         return world_coordinate.normalized()
 
+    @abstractmethod
+    def ground_domain_to_image(self, domain_coordinate: WorldCoordinate) -> ImageCoordinate:
+        """
+        This function transforms a ground domain coordinate into an image coordinate.
+
+        :param domain_coordinate: the ground domain coordinate (x, y, z)
+
+        :return: the image coordinate (x, y)
+        """
+
+    @abstractmethod
+    def ground_domain_to_image_batch(self, domain_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function transforms an array of ground domain coordinates into an array of image coordinates.
+
+        :param domain_coordinates: an Nx3 array of ground domain coordinates (x, y, z)
+
+        :return: an Nx2 array of image coordinates (x, y)
+        """
+
+    @abstractmethod
+    def ground_domain_to_image_with_jacobian(self, domain_coordinates: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        This function transforms an array of ground domain coordinates into an array of image coordinates and also
+        computes the partial derivatives of the image coordinates with respect to the ground domain coordinates.
+
+        :param domain_coordinates: an Nx3 array of ground domain coordinates (x, y, z)
+
+        :return: the Nx2 array of image coordinates (x, y) and the Nx2x3 array of Jacobians
+        """
+
+
+class RSMPolynomialSensorModel(RSMGroundDomainSensorModel):
+    """
+    This is an implementation of a Rational Polynomial Camera as defined in section 10.3.3.1.1 of the Manual of
+    Photogrammetry Sixth Edition.
+    """
+
+    def __init__(
+        self,
+        context: RSMContext,
+        section_row: int,
+        section_col: int,
+        row_norm_offset: float,
+        column_norm_offset: float,
+        x_norm_offset: float,
+        y_norm_offset: float,
+        z_norm_offset: float,
+        row_norm_scale: float,
+        column_norm_scale: float,
+        x_norm_scale: float,
+        y_norm_scale: float,
+        z_norm_scale: float,
+        row_numerator_poly: RSMPolynomial,
+        row_denominator_poly: RSMPolynomial,
+        column_numerator_poly: RSMPolynomial,
+        column_denominator_poly: RSMPolynomial,
+    ) -> None:
+        """
+        This constructs the sensor model using parameters normally found in the NITF RSMPC TRE.
+
+        :param context: contextual information describing the collection environment
+        :param section_row: image row section number that the sensor model applies to
+        :param section_col: image col section number that the sensor model applies to
+        :param row_norm_offset: offset used to normalize/denormalize image row components
+        :param column_norm_offset: offset used to normalize/denormalize image column components
+        :param x_norm_offset: offset used to normalize/denormalize world x components
+        :param y_norm_offset: offset used to normalize/denormalize world y components
+        :param z_norm_offset: offset used to normalize/denormalize world z components
+        :param row_norm_scale: scale used to normalize/denormalize image row components
+        :param column_norm_scale: scale used to normalize/denormalize image column components
+        :param x_norm_scale: scale used to normalize/denormalize world x components
+        :param y_norm_scale: scale used to normalize/denormalize world y components
+        :param z_norm_scale: scale used to normalize/denormalize world z components
+        :param row_numerator_poly: polynomial used as the numerator in row calculations
+        :param row_denominator_poly: polynomial used as the denominator in row calculations
+        :param column_numerator_poly: polynomial used as the numerator in column calculations
+        :param column_denominator_poly: polynomial used as the denominator in column calculations
+
+        :return: None
+        """
+        super().__init__(context)
+        self.section_row = section_row
+        self.section_col = section_col
+        self.row_norm_offset = row_norm_offset
+        self.column_norm_offset = column_norm_offset
+        self.x_norm_offset = x_norm_offset
+        self.y_norm_offset = y_norm_offset
+        self.z_norm_offset = z_norm_offset
+        self.row_norm_scale = row_norm_scale
+        self.column_norm_scale = column_norm_scale
+        self.x_norm_scale = x_norm_scale
+        self.y_norm_scale = y_norm_scale
+        self.z_norm_scale = z_norm_scale
+        self.row_numerator_poly = row_numerator_poly
+        self.row_denominator_poly = row_denominator_poly
+        self.column_numerator_poly = column_numerator_poly
+        self.column_denominator_poly = column_denominator_poly
+
     def ground_domain_to_image(self, domain_coordinate: WorldCoordinate) -> ImageCoordinate:
         """
         This function implements the polynomial ground-to-image transform as defined by section 10.3.3.1.1 of the
@@ -597,6 +1070,111 @@ class RSMPolynomialSensorModel(RSMSensorModel):
         )
         return self.denormalize_image_coordinate(ImageCoordinate([norm_column, norm_row]))
 
+    def ground_domain_to_image_batch(self, domain_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function is the batch equivalent of ground_domain_to_image. The rational polynomials are evaluated for
+        all coordinates at once.
+
+        :param domain_coordinates: an Nx3 array of ground domain coordinates (x, y, z)
+
+        :return: an Nx2 array of image coordinates (x, y)
+        """
+        domain_coordinates = as_coordinate_array(domain_coordinates, 3)
+        norm_domain_coordinates = (domain_coordinates - [self.x_norm_offset, self.y_norm_offset, self.z_norm_offset]) / [
+            self.x_norm_scale,
+            self.y_norm_scale,
+            self.z_norm_scale,
+        ]
+        row_num, row_den, column_num, column_den = self.evaluate_polynomials(norm_domain_coordinates)
+        norm_rows = row_num / row_den
+        norm_columns = column_num / column_den
+        return np.column_stack(
+            [
+                RSMPolynomialSensorModel.denormalize(norm_columns, self.column_norm_offset, self.column_norm_scale),
+                RSMPolynomialSensorModel.denormalize(norm_rows, self.row_norm_offset, self.row_norm_scale),
+            ]
+        )
+
+    def ground_domain_to_image_with_jacobian(self, domain_coordinates: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        This function is a version of ground_domain_to_image_batch that also computes the partial derivatives of the
+        image coordinates with respect to the ground domain coordinates. The quotient rule is applied to the analytic
+        partials of the polynomials and then the normalization scale factors are applied.
+
+        :param domain_coordinates: an Nx3 array of ground domain coordinates (x, y, z)
+
+        :return: the Nx2 array of image coordinates (x, y) and the Nx2x3 array of Jacobians
+        """
+        domain_coordinates = as_coordinate_array(domain_coordinates, 3)
+        norm_scales = np.array([self.x_norm_scale, self.y_norm_scale, self.z_norm_scale])
+        norm_domain_coordinates = (
+            domain_coordinates - [self.x_norm_offset, self.y_norm_offset, self.z_norm_offset]
+        ) / norm_scales
+
+        polynomials = [
+            self.row_numerator_poly,
+            self.row_denominator_poly,
+            self.column_numerator_poly,
+            self.column_denominator_poly,
+        ]
+        values = self.evaluate_polynomials(norm_domain_coordinates)
+        partials = []
+        partial_bases: Dict[Tuple[int, int, int], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        for polynomial in polynomials:
+            if polynomial.max_powers not in partial_bases:
+                partial_bases[polynomial.max_powers] = polynomial.monomial_basis_partials(norm_domain_coordinates)
+            coefficients = np.asarray(polynomial.coefficients, dtype=np.float64)
+            partials.append(np.column_stack([basis @ coefficients for basis in partial_bases[polynomial.max_powers]]))
+        row_num, row_den, column_num, column_den = values
+        row_num_partials, row_den_partials, column_num_partials, column_den_partials = partials
+
+        image_coordinates = np.column_stack(
+            [
+                column_num / column_den * self.column_norm_scale + self.column_norm_offset,
+                row_num / row_den * self.row_norm_scale + self.row_norm_offset,
+            ]
+        )
+
+        # Quotient rule: d(N/D) = (dN * D - N * dD) / D^2, then chain through the normalization of the inputs and the
+        # denormalization of the outputs
+        jacobians = np.empty((domain_coordinates.shape[0], 2, 3), dtype=np.float64)
+        jacobians[:, 0, :] = (
+            (column_num_partials * column_den[:, np.newaxis] - column_num[:, np.newaxis] * column_den_partials)
+            / (column_den * column_den)[:, np.newaxis]
+            * self.column_norm_scale
+            / norm_scales
+        )
+        jacobians[:, 1, :] = (
+            (row_num_partials * row_den[:, np.newaxis] - row_num[:, np.newaxis] * row_den_partials)
+            / (row_den * row_den)[:, np.newaxis]
+            * self.row_norm_scale
+            / norm_scales
+        )
+        return image_coordinates, jacobians
+
+    def evaluate_polynomials(self, norm_domain_coordinates: np.ndarray) -> List[np.ndarray]:
+        """
+        Evaluate the row numerator, row denominator, column numerator, and column denominator polynomials for an
+        array of normalized ground domain coordinates. Polynomials that have the same maximum powers share a single
+        monomial basis computation.
+
+        :param norm_domain_coordinates: an Nx3 array of normalized ground domain coordinates
+
+        :return: the values of the [row_num, row_den, column_num, column_den] polynomials
+        """
+        bases: Dict[Tuple[int, int, int], np.ndarray] = {}
+        results = []
+        for polynomial in [
+            self.row_numerator_poly,
+            self.row_denominator_poly,
+            self.column_numerator_poly,
+            self.column_denominator_poly,
+        ]:
+            if polynomial.max_powers not in bases:
+                bases[polynomial.max_powers] = polynomial.monomial_basis(norm_domain_coordinates)
+            results.append(bases[polynomial.max_powers] @ np.asarray(polynomial.coefficients, dtype=np.float64))
+        return results
+
     def normalize_world_coordinate(self, world_coordinate: WorldCoordinate) -> WorldCoordinate:
         """
         This is a helper function used to normalize a world coordinate for use with the polynomials in this sensor
@@ -680,6 +1258,222 @@ class RSMPolynomialSensorModel(RSMSensorModel):
         return value * scale + offset
 
 
+class RSMGridPlane:
+    """
+    This class holds one plane of an RSM ground-to-image interpolation grid as defined in the NITF RSMGG TRE. Each
+    plane is a regular grid of image coordinates sampled at a constant ground domain z. The first grid point is
+    located at (initial_x, initial_y) and the remaining points are separated by the grid spacing of the sensor model.
+    """
+
+    def __init__(
+        self,
+        initial_x: float,
+        initial_y: float,
+        row_coordinates: npt.ArrayLike,
+        column_coordinates: npt.ArrayLike,
+    ) -> None:
+        """
+        Constructor for a single grid plane.
+
+        :param initial_x: the ground domain x of the first grid point in this plane
+        :param initial_y: the ground domain y of the first grid point in this plane
+        :param row_coordinates: an array of image rows indexed by [x point, y point], NaN for missing points
+        :param column_coordinates: an array of image columns indexed by [x point, y point], NaN for missing points
+
+        :return: None
+        """
+        self.initial_x = initial_x
+        self.initial_y = initial_y
+        self.row_coordinates = np.asarray(row_coordinates, dtype=np.float64)
+        self.column_coordinates = np.asarray(column_coordinates, dtype=np.float64)
+        if self.row_coordinates.ndim != 2 or self.row_coordinates.shape != self.column_coordinates.shape:
+            raise ValueError("RSM grid plane row and column coordinates must be 2D arrays with the same shape")
+
+        # The columns and rows are stacked as (x, y) image coordinates so a single gather retrieves both
+        self.image_coordinates = np.stack([self.column_coordinates, self.row_coordinates], axis=-1)
+
+    @property
+    def num_x_points(self) -> int:
+        """
+        :return: the number of grid points along the ground domain x axis
+        """
+        return self.row_coordinates.shape[0]
+
+    @property
+    def num_y_points(self) -> int:
+        """
+        :return: the number of grid points along the ground domain y axis
+        """
+        return self.row_coordinates.shape[1]
+
+    def interpolate(
+        self,
+        domain_xy: np.ndarray,
+        x_spacing: float,
+        y_spacing: float,
+        interpolation_order: int,
+        compute_partials: bool = False,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Interpolate the image coordinates at an array of ground domain (x, y) locations in this plane. Lagrange
+        interpolation of the requested order is applied along each axis of the grid.
+
+        :param domain_xy: an Nx2 array of ground domain (x, y) locations
+        :param x_spacing: the distance between grid points along the ground domain x axis
+        :param y_spacing: the distance between grid points along the ground domain y axis
+        :param interpolation_order: the order of the Lagrange interpolation
+        :param compute_partials: True if the partial derivatives with respect to x and y should be computed
+
+        :return: the Nx2 array of image coordinates (x, y) and the Nx2x2 partials if requested, otherwise None
+        """
+        x_indexes, x_weights, x_weight_partials = lagrange_interpolation_weights(
+            (domain_xy[:, 0] - self.initial_x) / x_spacing, self.num_x_points, interpolation_order
+        )
+        y_indexes, y_weights, y_weight_partials = lagrange_interpolation_weights(
+            (domain_xy[:, 1] - self.initial_y) / y_spacing, self.num_y_points, interpolation_order
+        )
+
+        # Gather the neighborhood of grid points surrounding each location and combine them with the weights
+        neighborhoods = self.image_coordinates[x_indexes[:, :, np.newaxis], y_indexes[:, np.newaxis, :]]
+        image_coordinates = np.einsum("na,nb,nabk->nk", x_weights, y_weights, neighborhoods)
+        if not compute_partials:
+            return image_coordinates, None
+
+        partials = np.empty((domain_xy.shape[0], 2, 2), dtype=np.float64)
+        partials[:, :, 0] = np.einsum("na,nb,nabk->nk", x_weight_partials, y_weights, neighborhoods) / x_spacing
+        partials[:, :, 1] = np.einsum("na,nb,nabk->nk", x_weights, y_weight_partials, neighborhoods) / y_spacing
+        return image_coordinates, partials
+
+
+class RSMGridSensorModel(RSMGroundDomainSensorModel):
+    """
+    This is an implementation of the RSM grid sensor model as defined in STDI-0002 Volume 1 Appendix U. The ground to
+    image function is a set of grid planes, each holding the image coordinates of regularly spaced ground domain
+    locations at a constant z. Image coordinates are interpolated within the two planes bracketing a location and
+    then linearly interpolated between those planes.
+    """
+
+    def __init__(
+        self,
+        context: RSMContext,
+        section_row: int,
+        section_col: int,
+        interpolation_order: int,
+        initial_z: float,
+        x_spacing: float,
+        y_spacing: float,
+        z_spacing: float,
+        grid_planes: List[RSMGridPlane],
+    ) -> None:
+        """
+        This constructs the sensor model using parameters normally found in the NITF RSMGG TRE.
+
+        :param context: contextual information describing the collection environment
+        :param section_row: image row section number that the sensor model applies to
+        :param section_col: image col section number that the sensor model applies to
+        :param interpolation_order: the order of the Lagrange interpolation used within each grid plane
+        :param initial_z: the ground domain z of the first grid plane
+        :param x_spacing: the distance between grid points along the ground domain x axis
+        :param y_spacing: the distance between grid points along the ground domain y axis
+        :param z_spacing: the distance between grid planes along the ground domain z axis
+        :param grid_planes: the grid planes ordered by increasing z
+
+        :return: None
+        """
+        super().__init__(context)
+        if len(grid_planes) == 0:
+            raise ValueError("RSM grid sensor models require at least one grid plane")
+        self.section_row = section_row
+        self.section_col = section_col
+        self.interpolation_order = interpolation_order
+        self.initial_z = initial_z
+        self.x_spacing = x_spacing
+        self.y_spacing = y_spacing
+        self.z_spacing = z_spacing
+        self.grid_planes = grid_planes
+
+    def ground_domain_to_image(self, domain_coordinate: WorldCoordinate) -> ImageCoordinate:
+        """
+        This function interpolates the image coordinate of a ground domain coordinate from the grid planes.
+
+        :param domain_coordinate: the ground domain coordinate (x, y, z)
+
+        :return: the image coordinate (x, y)
+        """
+        return ImageCoordinate(self.ground_domain_to_image_batch(domain_coordinate.coordinate)[0])
+
+    def ground_domain_to_image_batch(self, domain_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function is the batch equivalent of ground_domain_to_image. All coordinates falling between the same
+        pair of grid planes are interpolated together.
+
+        :param domain_coordinates: an Nx3 array of ground domain coordinates (x, y, z)
+
+        :return: an Nx2 array of image coordinates (x, y)
+        """
+        image_coordinates, _ = self._interpolate_grid(as_coordinate_array(domain_coordinates, 3))
+        return image_coordinates
+
+    def ground_domain_to_image_with_jacobian(self, domain_coordinates: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        This function is a version of ground_domain_to_image_batch that also computes the partial derivatives of the
+        image coordinates with respect to the ground domain coordinates. The derivatives of the interpolating
+        polynomials are used within each plane and the z partials come from the difference between the planes.
+
+        :param domain_coordinates: an Nx3 array of ground domain coordinates (x, y, z)
+
+        :return: the Nx2 array of image coordinates (x, y) and the Nx2x3 array of Jacobians
+        """
+        return self._interpolate_grid(as_coordinate_array(domain_coordinates, 3), compute_jacobians=True)
+
+    def _interpolate_grid(
+        self, domain_coordinates: np.ndarray, compute_jacobians: bool = False
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Interpolate the image coordinates of an array of ground domain coordinates. Each coordinate is assigned to the
+        pair of grid planes bracketing its z value (the outermost pair for coordinates above or below the grid) and is
+        linearly interpolated between the values found in those planes.
+
+        :param domain_coordinates: an Nx3 array of ground domain coordinates (x, y, z)
+        :param compute_jacobians: True if the Nx2x3 Jacobians should also be computed
+
+        :return: the Nx2 array of image coordinates (x, y) and the Jacobians if requested, otherwise None
+        """
+        num_coordinates = domain_coordinates.shape[0]
+        num_planes = len(self.grid_planes)
+        if num_planes > 1:
+            plane_positions = (domain_coordinates[:, 2] - self.initial_z) / self.z_spacing
+            lower_planes = np.clip(np.floor(np.nan_to_num(plane_positions)), 0, num_planes - 2).astype(int)
+            upper_fractions = plane_positions - lower_planes
+        else:
+            lower_planes = np.zeros(num_coordinates, dtype=int)
+            upper_fractions = np.zeros(num_coordinates, dtype=np.float64)
+
+        image_coordinates = np.zeros((num_coordinates, 2), dtype=np.float64)
+        jacobians = np.zeros((num_coordinates, 2, 3), dtype=np.float64) if compute_jacobians else None
+        for plane_index, grid_plane in enumerate(self.grid_planes):
+            is_lower = lower_planes == plane_index
+            members = np.flatnonzero(is_lower | (lower_planes + 1 == plane_index))
+            if members.size == 0:
+                continue
+            plane_image_coordinates, plane_partials = grid_plane.interpolate(
+                domain_coordinates[members, 0:2],
+                self.x_spacing,
+                self.y_spacing,
+                self.interpolation_order,
+                compute_partials=compute_jacobians,
+            )
+            plane_weights = np.where(is_lower[members], 1.0 - upper_fractions[members], upper_fractions[members])
+            image_coordinates[members] += plane_weights[:, np.newaxis] * plane_image_coordinates
+            if compute_jacobians:
+                jacobians[members, :, 0:2] += plane_weights[:, np.newaxis, np.newaxis] * plane_partials
+                if num_planes > 1:
+                    plane_weight_partials = np.where(is_lower[members], -1.0, 1.0) / self.z_spacing
+                    jacobians[members, :, 2] += plane_weight_partials[:, np.newaxis] * plane_image_coordinates
+
+        return image_coordinates, jacobians
+
+
 class RSMSectionedPolynomialSensorModel(RSMSensorModel):
     """
     This is an implementation of a sectioned sensor model that splits overall RSM domain into multiple regions each
@@ -700,8 +1494,8 @@ class RSMSectionedPolynomialSensorModel(RSMSensorModel):
         section_sensor_models: List[List[SensorModel]],
     ) -> None:
         """
-        This constructs the sensor model using parameters normally found in the NITF RSMPI TRE. Note that the
-        per-section sensor models should be constructed from their individual RSMPC TREs.
+        This constructs the sensor model using parameters normally found in the NITF RSMPI or RSMGI TREs. Note that
+        the per-section sensor models should be constructed from their individual RSMPC or RSMGG TREs.
 
         :param context: contextual information describing the collection environment
         :param row_num_image_sections: the number of row image sections
@@ -723,6 +1517,46 @@ class RSMSectionedPolynomialSensorModel(RSMSensorModel):
         self.column_polynomial = column_polynomial
         self.section_sensor_models = section_sensor_models
 
+    def fit_inverse_polynomial(
+        self,
+        grid_size: Sequence[int] = INVERSE_POLYNOMIAL_GRID_SIZE,
+        pixel_tolerance: float = INVERSE_POLYNOMIAL_PIXEL_TOLERANCE,
+    ) -> List[List[Optional[InverseRationalPolynomial]]]:
+        """
+        Fit an inverse rational polynomial to each of the section sensor models. Each inverse only covers the image
+        section serviced by its sensor model. Sections that can not be fit continue to use the iterative solver.
+
+        :param grid_size: the number of x, y, and z samples in the ground domain grid
+        :param pixel_tolerance: the maximum residual (in pixels) of an inverse that can be used without iteration
+
+        :return: the fitted inverses for each section, None if a section could not be fit
+        """
+        image_domain = self.context.image_domain
+        inverse_polynomials = []
+        for row_section_index, row_sensor_models in enumerate(self.section_sensor_models):
+            row_inverse_polynomials = []
+            for column_section_index, section_sensor_model in enumerate(row_sensor_models):
+                inverse_polynomial = None
+                if isinstance(section_sensor_model, RSMGroundDomainSensorModel):
+                    min_column = image_domain.min_column + column_section_index * self.column_section_size
+                    min_row = image_domain.min_row + row_section_index * self.row_section_size
+                    try:
+                        inverse_polynomial = section_sensor_model.fit_inverse_polynomial(
+                            grid_size=grid_size,
+                            pixel_tolerance=pixel_tolerance,
+                            image_bounds=[
+                                min_column,
+                                min_row,
+                                min_column + self.column_section_size,
+                                min_row + self.row_section_size,
+                            ],
+                        )
+                    except ValueError as ve:
+                        logger.debug(f"Inverse not fit for section ({row_section_index}, {column_section_index}): {ve}")
+                row_inverse_polynomials.append(inverse_polynomial)
+            inverse_polynomials.append(row_inverse_polynomials)
+        return inverse_polynomials
+
     def world_to_image(self, geodetic_coordinate: GeodeticWorldCoordinate) -> ImageCoordinate:
         """
         This function transforms a geodetic world coordinate (longitude, latitude, elevation) into an image coordinate
@@ -747,6 +1581,34 @@ class RSMSectionedPolynomialSensorModel(RSMSensorModel):
         # Use the selected sensor model to complete the full precision world to image transformation
         return section_sensor_model.world_to_image(geodetic_coordinate)
 
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function transforms an array of geodetic world coordinates (longitude, latitude, elevation) into an array
+        of image coordinates (x, y). The low order polynomials are used to assign each coordinate to a section and
+        then all coordinates in a section are passed to that section's sensor model in a single batch.
+
+        :param world_coordinates: an Nx3 array of world coordinates (longitude, latitude, elevation)
+
+        :return: an Nx2 array of image coordinates (x, y)
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        domain_coordinates = self.context.ground_domain.geodetic_to_ground_domain_coordinates(world_coordinates)
+        approximate_image_coordinates = np.column_stack(
+            [
+                self.column_polynomial.evaluate_array(domain_coordinates),
+                self.row_polynomial.evaluate_array(domain_coordinates),
+            ]
+        )
+        column_section_indexes, row_section_indexes = self.get_section_indexes(approximate_image_coordinates)
+
+        image_coordinates = np.empty((world_coordinates.shape[0], 2), dtype=np.float64)
+        for row_section_index, column_section_index, members in self._group_by_section(
+            column_section_indexes, row_section_indexes
+        ):
+            section_sensor_model = self.section_sensor_models[row_section_index][column_section_index]
+            image_coordinates[members] = section_sensor_model.world_to_image_batch(world_coordinates[members])
+        return image_coordinates
+
     def image_to_world(
         self,
         image_coordinate: ImageCoordinate,
@@ -771,6 +1633,43 @@ class RSMSectionedPolynomialSensorModel(RSMSensorModel):
         # Use the selected sensor model to complete the full precision image to world transformation
         return section_camera.image_to_world(image_coordinate, elevation_model=elevation_model, options=options)
 
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This function implements the image to world transform for an array of image coordinates. The coordinates are
+        grouped by image section and each group is passed to the sensor model for that section in a single batch.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevation_model: optional elevation model used to transform the coordinates
+        :param options: optional dictionary of hints passed on to the section sensor models
+
+        :return: an Nx3 array of world coordinates (longitude, latitude, elevation)
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        initial_guesses = options.get(SensorModelOptions.INITIAL_GUESS) if options is not None else None
+        per_coordinate_guesses = initial_guesses is not None and np.ndim(initial_guesses) == 2
+
+        column_section_indexes, row_section_indexes = self.get_section_indexes(image_coordinates)
+        world_coordinates = np.empty((image_coordinates.shape[0], 3), dtype=np.float64)
+        for row_section_index, column_section_index, members in self._group_by_section(
+            column_section_indexes, row_section_indexes
+        ):
+            section_options = options
+            if per_coordinate_guesses:
+                section_options = {
+                    **options,
+                    SensorModelOptions.INITIAL_GUESS: np.asarray(initial_guesses)[members],
+                }
+            section_sensor_model = self.section_sensor_models[row_section_index][column_section_index]
+            world_coordinates[members] = section_sensor_model.image_to_world_batch(
+                image_coordinates[members], elevation_model=elevation_model, options=section_options
+            )
+        return world_coordinates
+
     def get_section_index(self, image_coordinate: ImageCoordinate) -> Tuple[int, int]:
         """
         Use the equations from STDO-0002 Volume 1 Appendix U Section 6.3 to calculate the section of this image
@@ -796,3 +1695,40 @@ class RSMSectionedPolynomialSensorModel(RSMSensorModel):
             column_section_index = self.column_num_image_sections - 1
 
         return column_section_index, row_section_index
+
+    def get_section_indexes(self, image_coordinates: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        This is the batch equivalent of get_section_index. Values outside the normal sections are clamped to use the
+        sensor model from the closest section available.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+
+        :return: arrays of the column and row section indexes
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        row_section_indexes = np.floor(
+            (image_coordinates[:, 1] - self.context.image_domain.min_row) / self.row_section_size
+        ).astype(int)
+        column_section_indexes = np.floor(
+            (image_coordinates[:, 0] - self.context.image_domain.min_column) / self.column_section_size
+        ).astype(int)
+        return (
+            np.clip(column_section_indexes, 0, self.column_num_image_sections - 1),
+            np.clip(row_section_indexes, 0, self.row_num_image_sections - 1),
+        )
+
+    @staticmethod
+    def _group_by_section(column_section_indexes: np.ndarray, row_section_indexes: np.ndarray):
+        """
+        Generate the groups of coordinates that fall in each section.
+
+        :param column_section_indexes: the column section index of each coordinate
+        :param row_section_indexes: the row section index of each coordinate
+
+        :return: a generator of (row section index, column section index, indexes of the coordinates in the section)
+        """
+        sections = np.column_stack([row_section_indexes, column_section_indexes])
+        unique_sections, section_assignments = np.unique(sections, axis=0, return_inverse=True)
+        section_assignments = section_assignments.reshape(-1)
+        for section_number, (row_section_index, column_section_index) in enumerate(unique_sections):
+            yield int(row_section_index), int(column_section_index), np.flatnonzero(section_assignments == section_number)
@@ -1,10 +1,12 @@
 #  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
 #  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
 
-from math import degrees, radians, sqrt
-from typing import Any, Dict, List, Optional, Tuple
+import logging
+from math import degrees, pi, radians, sqrt
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
+import numpy.typing as npt
 from scipy.optimize import minimize
 
 from . import (
@@ -15,9 +17,30 @@ from . import (
     MultiElevationModel,
     WorldCoordinate,
 )
-from .math_utils import equilateral_triangle
+from .coordinates import as_coordinate_array
+from .math_utils import equilateral_triangle, newton_raphson_2d
 from .sensor_model import SensorModel, SensorModelOptions
 
+logger = logging.getLogger(__name__)
+
+# Image to world solutions are accepted once they reproject to within this distance (in pixels) of the target
+RPC_IMAGE_TO_WORLD_PIXEL_TOLERANCE = 0.0001
+
+# Default number of (longitude, latitude, elevation) samples along each axis of the grid used to fit an inverse
+INVERSE_POLYNOMIAL_GRID_SIZE = (21, 21, 6)
+
+# Inverse solutions are used directly once the fit reprojects to within this distance (in pixels) of the samples
+INVERSE_POLYNOMIAL_PIXEL_TOLERANCE = 0.01
+
+# Elevations assigned to an inverse solution are accepted once they change by less than this amount (in meters)
+INVERSE_POLYNOMIAL_ELEVATION_TOLERANCE = 0.01
+
+# Samples that project outside the image bounds by more than this fraction of the image size are not used in the fit
+INVERSE_POLYNOMIAL_IMAGE_MARGIN = 0.1
+
+# Number of terms in an RPC00B polynomial
+RPC_NUM_MONOMIALS = 20
+
 
 class RPCPolynomial:
     def __init__(self, coefficients: List[float]) -> None:
@@ -71,6 +94,130 @@ class RPCPolynomial:
         result += self.coefficients[19] * h_val * h_val * h_val  # HHH
         return result
 
+    def evaluate_array(self, normalized_world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function evaluates the polynomial for an array of normalized world coordinates. It is equivalent to
+        calling evaluate on each coordinate but the monomial basis for all coordinates is computed in one pass and
+        then combined with the coefficients using a single matrix product.
+
+        :param normalized_world_coordinates: an Nx3 array of normalized world coordinates
+
+        :return: an array containing the N resulting values
+        """
+        return RPCPolynomial.monomial_basis(normalized_world_coordinates) @ np.asarray(self.coefficients, dtype=np.float64)
+
+    def evaluate_partials_array(self, normalized_world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function evaluates the partial derivatives of the polynomial with respect to each of the normalized world
+        coordinate components (L, P, H) for an array of normalized world coordinates.
+
+        :param normalized_world_coordinates: an Nx3 array of normalized world coordinates
+
+        :return: an Nx3 array containing the partial derivatives [d/dL, d/dP, d/dH] for each coordinate
+        """
+        coefficients = np.asarray(self.coefficients, dtype=np.float64)
+        return np.column_stack(
+            [basis @ coefficients for basis in RPCPolynomial.monomial_basis_partials(normalized_world_coordinates)]
+        )
+
+    @staticmethod
+    def monomial_basis(normalized_world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        Compute the 20 RPC00B monomials (1, L, P, H, LP, ... HHH) for an array of normalized world coordinates. The
+        columns are in the same order as the polynomial coefficients so the result can be multiplied by a coefficient
+        vector (or a matrix with one coefficient vector per column) to evaluate polynomials that share this basis.
+
+        :param normalized_world_coordinates: an Nx3 array of normalized world coordinates
+
+        :return: an Nx20 array of monomial values
+        """
+        normalized_world_coordinates = as_coordinate_array(normalized_world_coordinates, 3)
+        l_val = normalized_world_coordinates[:, 0]
+        p_val = normalized_world_coordinates[:, 1]
+        h_val = normalized_world_coordinates[:, 2]
+        ll = l_val * l_val
+        pp = p_val * p_val
+        hh = h_val * h_val
+        lp = l_val * p_val
+
+        basis = np.empty((normalized_world_coordinates.shape[0], 20), dtype=np.float64)
+        basis[:, 0] = 1.0  # constant
+        basis[:, 1] = l_val  # L
+        basis[:, 2] = p_val  # P
+        basis[:, 3] = h_val  # H
+        basis[:, 4] = lp  # LP
+        basis[:, 5] = l_val * h_val  # LH
+        basis[:, 6] = p_val * h_val  # PH
+        basis[:, 7] = ll  # LL
+        basis[:, 8] = pp  # PP
+        basis[:, 9] = hh  # HH
+        basis[:, 10] = lp * h_val  # LPH
+        basis[:, 11] = ll * l_val  # LLL
+        basis[:, 12] = l_val * pp  # LPP
+        basis[:, 13] = l_val * hh  # LHH
+        basis[:, 14] = ll * p_val  # LLP
+        basis[:, 15] = pp * p_val  # PPP
+        basis[:, 16] = p_val * hh  # PHH
+        basis[:, 17] = ll * h_val  # LLH
+        basis[:, 18] = pp * h_val  # PPH
+        basis[:, 19] = hh * h_val  # HHH
+        return basis
+
+    @staticmethod
+    def monomial_basis_partials(normalized_world_coordinates: npt.ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute the partial derivatives of the 20 RPC00B monomials with respect to L, P, and H for an array of
+        normalized world coordinates. Multiplying these by a coefficient vector gives the partial derivatives of the
+        polynomial.
+
+        :param normalized_world_coordinates: an Nx3 array of normalized world coordinates
+
+        :return: three Nx20 arrays containing the d/dL, d/dP, and d/dH monomial values
+        """
+        normalized_world_coordinates = as_coordinate_array(normalized_world_coordinates, 3)
+        l_val = normalized_world_coordinates[:, 0]
+        p_val = normalized_world_coordinates[:, 1]
+        h_val = normalized_world_coordinates[:, 2]
+        num_coordinates = normalized_world_coordinates.shape[0]
+
+        d_dl = np.zeros((num_coordinates, 20), dtype=np.float64)
+        d_dl[:, 1] = 1.0  # L
+        d_dl[:, 4] = p_val  # LP
+        d_dl[:, 5] = h_val  # LH
+        d_dl[:, 7] = 2.0 * l_val  # LL
+        d_dl[:, 10] = p_val * h_val  # LPH
+        d_dl[:, 11] = 3.0 * l_val * l_val  # LLL
+        d_dl[:, 12] = p_val * p_val  # LPP
+        d_dl[:, 13] = h_val * h_val  # LHH
+        d_dl[:, 14] = 2.0 * l_val * p_val  # LLP
+        d_dl[:, 17] = 2.0 * l_val * h_val  # LLH
+
+        d_dp = np.zeros((num_coordinates, 20), dtype=np.float64)
+        d_dp[:, 2] = 1.0  # P
+        d_dp[:, 4] = l_val  # LP
+        d_dp[:, 6] = h_val  # PH
+        d_dp[:, 8] = 2.0 * p_val  # PP
+        d_dp[:, 10] = l_val * h_val  # LPH
+        d_dp[:, 12] = 2.0 * l_val * p_val  # LPP
+        d_dp[:, 14] = l_val * l_val  # LLP
+        d_dp[:, 15] = 3.0 * p_val * p_val  # PPP
+        d_dp[:, 16] = h_val * h_val  # PHH
+        d_dp[:, 18] = 2.0 * p_val * h_val  # PPH
+
+        d_dh = np.zeros((num_coordinates, 20), dtype=np.float64)
+        d_dh[:, 3] = 1.0  # H
+        d_dh[:, 5] = l_val  # LH
+        d_dh[:, 6] = p_val  # PH
+        d_dh[:, 9] = 2.0 * h_val  # HH
+        d_dh[:, 10] = l_val * p_val  # LPH
+        d_dh[:, 13] = 2.0 * l_val * h_val  # LHH
+        d_dh[:, 16] = 2.0 * p_val * h_val  # PHH
+        d_dh[:, 17] = l_val * l_val  # LLH
+        d_dh[:, 18] = p_val * p_val  # PPH
+        d_dh[:, 19] = 3.0 * h_val * h_val  # HHH
+
+        return d_dl, d_dp, d_dh
+
     def __call__(self, *args, **kwargs) -> float:
         """
         This makes the polynomial object callable such that it can be applied to a world coordinate directly e.g.
@@ -83,6 +230,309 @@ class RPCPolynomial:
         return self.evaluate(args[0])
 
 
+class InverseRationalPolynomial:
+    """
+    An inverse rational polynomial maps an image coordinate and an elevation (x, y, elevation) directly to the
+    longitude and latitude of a location on the ground. It is fit to a sensor model by projecting a dense grid of world
+    coordinates into the image and solving for the polynomial coefficients using least squares. Once fit the image to
+    world transform for any elevation is a closed form evaluation instead of an iterative search.
+
+    The polynomials use the same 20 term cubic basis as the RPC00B polynomials with the normalized x, y, and elevation
+    taking the place of L, P, and H. The residuals of the fit (in pixels) are measured by reprojecting the inverse
+    solutions for a second grid offset from the samples used to fit the polynomials.
+    """
+
+    def __init__(
+        self,
+        image_offsets: npt.ArrayLike,
+        image_scales: npt.ArrayLike,
+        elevation_offset: float,
+        elevation_scale: float,
+        lonlat_offsets: npt.ArrayLike,
+        lonlat_scales: npt.ArrayLike,
+        coefficients: npt.ArrayLike,
+        rms_residual: float,
+        max_residual: float,
+    ) -> None:
+        """
+        Construct an inverse from its normalization parameters and coefficients. Most users will create instances
+        using the fit function.
+
+        :param image_offsets: offsets used to normalize the x, y image coordinates
+        :param image_scales: scales used to normalize the x, y image coordinates
+        :param elevation_offset: offset used to normalize the elevation
+        :param elevation_scale: scale used to normalize the elevation
+        :param lonlat_offsets: offsets used to denormalize the longitude, latitude results (radians)
+        :param lonlat_scales: scales used to denormalize the longitude, latitude results (radians)
+        :param coefficients: 20x4 matrix of the longitude numerator, longitude denominator, latitude numerator, and
+                             latitude denominator coefficients
+        :param rms_residual: root mean square reprojection error of the fit in pixels
+        :param max_residual: maximum reprojection error of the fit in pixels
+
+        :return: None
+        """
+        self.image_offsets = np.asarray(image_offsets, dtype=np.float64)
+        self.image_scales = np.asarray(image_scales, dtype=np.float64)
+        self.elevation_offset = elevation_offset
+        self.elevation_scale = elevation_scale
+        self.lonlat_offsets = np.asarray(lonlat_offsets, dtype=np.float64)
+        self.lonlat_scales = np.asarray(lonlat_scales, dtype=np.float64)
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        self.rms_residual = rms_residual
+        self.max_residual = max_residual
+
+    def evaluate(self, image_coordinates: npt.ArrayLike, elevations: npt.ArrayLike) -> np.ndarray:
+        """
+        Compute the longitude and latitude for an array of image coordinates at the given elevations.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevations: the N elevations in meters
+
+        :return: an Nx2 array of (longitude, latitude) values in radians
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        norm_coordinates = np.column_stack(
+            [
+                (image_coordinates - self.image_offsets) / self.image_scales,
+                (np.asarray(elevations, dtype=np.float64).reshape(-1) - self.elevation_offset) / self.elevation_scale,
+            ]
+        )
+        lon_num, lon_den, lat_num, lat_den = (RPCPolynomial.monomial_basis(norm_coordinates) @ self.coefficients).T
+        return np.column_stack([lon_num / lon_den, lat_num / lat_den]) * self.lonlat_scales + self.lonlat_offsets
+
+    def image_to_world(
+        self, image_coordinates: npt.ArrayLike, elevation_model: ElevationModel, max_iterations: int = 5
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the world coordinates of an array of image coordinates that lie on the surface of an elevation model.
+        The elevation of each location depends on its longitude and latitude so the inverse is evaluated repeatedly,
+        each time using the elevations found at the previous solutions, until the elevations stop changing.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevation_model: the elevation model used to assign elevations
+        :param max_iterations: the maximum number of times the inverse is evaluated
+
+        :return: the Nx3 array of world coordinates and a mask identifying the coordinates with stable elevations
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        elevations = np.full(image_coordinates.shape[0], self.elevation_offset, dtype=np.float64)
+        converged = np.zeros(image_coordinates.shape[0], dtype=bool)
+        for iteration in range(max_iterations):
+            world_coordinates = np.column_stack([self.evaluate(image_coordinates, elevations), elevations])
+            new_elevations = self._assign_elevations(world_coordinates, elevation_model)
+            converged = np.abs(new_elevations - elevations) < INVERSE_POLYNOMIAL_ELEVATION_TOLERANCE
+            elevations = new_elevations
+            if np.all(converged):
+                break
+
+        world_coordinates[:, 2] = elevations
+        return world_coordinates, converged & np.all(np.isfinite(world_coordinates), axis=1)
+
+    @staticmethod
+    def _assign_elevations(world_coordinates: np.ndarray, elevation_model: ElevationModel) -> np.ndarray:
+        """
+        Look up the elevation of each longitude, latitude in an array of world coordinates.
+
+        :param world_coordinates: an Nx3 array of world coordinates (longitude, latitude, elevation)
+        :param elevation_model: the elevation model used to assign the elevations
+
+        :return: the N elevations
+        """
+        elevations = world_coordinates[:, 2].copy()
+        finite = np.flatnonzero(np.all(np.isfinite(world_coordinates), axis=1))
+        finite_elevations, valid = elevation_model.get_elevations(world_coordinates[finite, 0], world_coordinates[finite, 1])
+        elevations[finite[valid]] = finite_elevations[valid]
+        return elevations
+
+    @staticmethod
+    def fit(
+        sensor_model: SensorModel,
+        world_coordinates: npt.ArrayLike,
+        check_world_coordinates: npt.ArrayLike,
+        image_bounds: Optional[Sequence[float]] = None,
+        num_reweighting_iterations: int = 2,
+    ) -> "InverseRationalPolynomial":
+        """
+        Fit an inverse to a sensor model. The world coordinates are projected into the image using the sensor model's
+        world_to_image_batch function and the rational polynomials are solved for by linearizing the problem
+        (N - t * D = 0 with the constant term of D fixed at 1) and applying least squares. The linearized equations are
+        then reweighted by the inverse of the denominator and solved again so the final fit minimizes the error of the
+        rational function rather than the error of the linearized equations.
+
+        :param sensor_model: the sensor model providing the world to image transform
+        :param world_coordinates: an Nx3 array of world coordinates (longitude, latitude, elevation) used for the fit
+        :param check_world_coordinates: an Mx3 array of world coordinates used to measure the residuals of the fit
+        :param image_bounds: optional [min x, min y, max x, max y] of the image region the inverse should cover
+        :param num_reweighting_iterations: the number of times the least squares problem is reweighted
+
+        :return: the fitted inverse
+        """
+        world_coordinates, image_coordinates = InverseRationalPolynomial._project_samples(
+            sensor_model, world_coordinates, image_bounds
+        )
+        if world_coordinates.shape[0] < 2 * RPC_NUM_MONOMIALS:
+            raise ValueError(
+                f"Unable to fit inverse polynomial. {world_coordinates.shape[0]} samples project into the image, "
+                f"at least {2 * RPC_NUM_MONOMIALS} required."
+            )
+
+        # Longitudes are wrapped to be continuous with the first sample so fits that cross the antimeridian remain
+        # smooth. The evaluated longitudes may therefore need to be normalized by the caller.
+        world_coordinates[:, 0] = InverseRationalPolynomial._wrap_longitudes(
+            world_coordinates[:, 0], world_coordinates[0, 0]
+        )
+        image_offsets, image_scales = InverseRationalPolynomial._normalization_parameters(image_coordinates)
+        elevation_offset, elevation_scale = InverseRationalPolynomial._normalization_parameters(world_coordinates[:, 2])
+        lonlat_offsets, lonlat_scales = InverseRationalPolynomial._normalization_parameters(world_coordinates[:, 0:2])
+
+        basis = RPCPolynomial.monomial_basis(
+            np.column_stack(
+                [
+                    (image_coordinates - image_offsets) / image_scales,
+                    (world_coordinates[:, 2] - elevation_offset) / elevation_scale,
+                ]
+            )
+        )
+        norm_lonlat = (world_coordinates[:, 0:2] - lonlat_offsets) / lonlat_scales
+
+        coefficients = np.empty((RPC_NUM_MONOMIALS, 4), dtype=np.float64)
+        for component in range(2):
+            targets = norm_lonlat[:, component]
+            design_matrix = np.column_stack([basis, -targets[:, np.newaxis] * basis[:, 1:]])
+            weights = np.ones(targets.shape[0], dtype=np.float64)
+            for iteration in range(num_reweighting_iterations + 1):
+                solution = np.linalg.lstsq(design_matrix * weights[:, np.newaxis], targets * weights, rcond=None)[0]
+                numerator = solution[0:RPC_NUM_MONOMIALS]
+                denominator = np.concatenate([[1.0], solution[RPC_NUM_MONOMIALS:]])
+                weights = 1.0 / np.maximum(np.abs(basis @ denominator), np.finfo(np.float64).eps)
+            coefficients[:, 2 * component] = numerator
+            coefficients[:, 2 * component + 1] = denominator
+
+        inverse = InverseRationalPolynomial(
+            image_offsets,
+            image_scales,
+            elevation_offset,
+            elevation_scale,
+            lonlat_offsets,
+            lonlat_scales,
+            coefficients,
+            rms_residual=float("inf"),
+            max_residual=float("inf"),
+        )
+
+        check_world_coordinates, check_image_coordinates = InverseRationalPolynomial._project_samples(
+            sensor_model, check_world_coordinates, image_bounds
+        )
+        if check_world_coordinates.shape[0] == 0:
+            check_world_coordinates, check_image_coordinates = world_coordinates, image_coordinates
+        inverse.rms_residual, inverse.max_residual = inverse.compute_residuals(
+            sensor_model, check_world_coordinates[:, 2], check_image_coordinates
+        )
+        logger.debug(
+            f"Fit inverse polynomial to {world_coordinates.shape[0]} samples. RMS residual: {inverse.rms_residual} "
+            f"pixels, maximum residual: {inverse.max_residual} pixels."
+        )
+        return inverse
+
+    def compute_residuals(
+        self, sensor_model: SensorModel, elevations: npt.ArrayLike, image_coordinates: npt.ArrayLike
+    ) -> Tuple[float, float]:
+        """
+        Measure how well this inverse matches a sensor model by reprojecting the inverse solutions for an array of
+        image coordinates back into the image.
+
+        :param sensor_model: the sensor model providing the world to image transform
+        :param elevations: the N elevations of the image coordinates
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+
+        :return: the root mean square and maximum reprojection error in pixels
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        elevations = np.asarray(elevations, dtype=np.float64).reshape(-1)
+        world_coordinates = np.column_stack([self.evaluate(image_coordinates, elevations), elevations])
+        distances = np.linalg.norm(sensor_model.world_to_image_batch(world_coordinates) - image_coordinates, axis=1)
+        if not np.all(np.isfinite(distances)):
+            return float("inf"), float("inf")
+        return float(np.sqrt(np.mean(distances * distances))), float(np.max(distances))
+
+    @staticmethod
+    def grid_coordinates(
+        lower_bounds: npt.ArrayLike, upper_bounds: npt.ArrayLike, grid_size: Sequence[int], staggered: bool = False
+    ) -> np.ndarray:
+        """
+        Create a regular grid of 3D coordinates spanning a box. A staggered grid places its samples at the centers of
+        the cells of the regular grid which makes it useful for checking the quality of a fit to the regular grid.
+
+        :param lower_bounds: the minimum value of each coordinate component
+        :param upper_bounds: the maximum value of each coordinate component
+        :param grid_size: the number of samples along each axis
+        :param staggered: true if the samples should be taken at the cell centers
+
+        :return: an Nx3 array of coordinates
+        """
+        axes = []
+        for lower, upper, size in zip(lower_bounds, upper_bounds, grid_size):
+            size = max(int(size), 2)
+            values = np.linspace(lower, upper, size)
+            if staggered:
+                values = (values[:-1] + values[1:]) / 2.0
+            axes.append(values)
+        return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+
+    @staticmethod
+    def _project_samples(
+        sensor_model: SensorModel, world_coordinates: npt.ArrayLike, image_bounds: Optional[Sequence[float]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Project sample world coordinates into the image and discard any that are not finite or that fall too far
+        outside the image bounds.
+
+        :param sensor_model: the sensor model providing the world to image transform
+        :param world_coordinates: an Nx3 array of world coordinates (longitude, latitude, elevation)
+        :param image_bounds: optional [min x, min y, max x, max y] of the image region the inverse should cover
+
+        :return: the retained world coordinates and the corresponding image coordinates
+        """
+        world_coordinates = np.array(as_coordinate_array(world_coordinates, 3), dtype=np.float64)
+        with np.errstate(all="ignore"):
+            image_coordinates = sensor_model.world_to_image_batch(world_coordinates)
+        keep = np.all(np.isfinite(image_coordinates), axis=1)
+        if image_bounds is not None:
+            min_x, min_y, max_x, max_y = image_bounds
+            margin_x = (max_x - min_x) * INVERSE_POLYNOMIAL_IMAGE_MARGIN
+            margin_y = (max_y - min_y) * INVERSE_POLYNOMIAL_IMAGE_MARGIN
+            with np.errstate(invalid="ignore"):
+                keep &= (image_coordinates[:, 0] >= min_x - margin_x) & (image_coordinates[:, 0] <= max_x + margin_x)
+                keep &= (image_coordinates[:, 1] >= min_y - margin_y) & (image_coordinates[:, 1] <= max_y + margin_y)
+        return world_coordinates[keep], image_coordinates[keep]
+
+    @staticmethod
+    def _wrap_longitudes(longitudes: np.ndarray, reference_longitude: float) -> np.ndarray:
+        """
+        Express longitudes as the closest equivalent angle to a reference longitude.
+
+        :param longitudes: the longitudes in radians
+        :param reference_longitude: the reference longitude in radians
+
+        :return: the wrapped longitudes in radians
+        """
+        return reference_longitude + np.mod(longitudes - reference_longitude + pi, 2.0 * pi) - pi
+
+    @staticmethod
+    def _normalization_parameters(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute offsets and scales that map the range of each column of values onto [-1, 1].
+
+        :param values: an array of values, either N or NxM
+
+        :return: the offsets and scales
+        """
+        lower = np.min(values, axis=0)
+        upper = np.max(values, axis=0)
+        scales = (upper - lower) / 2.0
+        return (lower + upper) / 2.0, np.where(scales > 0.0, scales, 1.0)
+
+
 class RPCSensorModel(SensorModel):
     """
     A Rational Polynomial Camera (RPC) sensor model is one where the world to image transform is approximated using
@@ -156,6 +606,61 @@ class RPCSensorModel(SensorModel):
         self.samp_denominator_poly = samp_den_poly
         self.default_elevation_model = ConstantElevationModel(self.height_off)
 
+        # The four polynomials share the same monomial basis so their coefficients are combined into a single 20x4
+        # matrix. Batch evaluations can then compute the basis once and apply all four polynomials with one product.
+        self.polynomial_coefficients = np.column_stack(
+            [
+                np.asarray(self.samp_numerator_poly.coefficients, dtype=np.float64),
+                np.asarray(self.samp_denominator_poly.coefficients, dtype=np.float64),
+                np.asarray(self.line_numerator_poly.coefficients, dtype=np.float64),
+                np.asarray(self.line_denominator_poly.coefficients, dtype=np.float64),
+            ]
+        )
+
+        # An optional inverse fit to the polynomials that replaces the iterative image to world solver
+        self.inverse_polynomial: Optional[InverseRationalPolynomial] = None
+        self.inverse_pixel_tolerance = INVERSE_POLYNOMIAL_PIXEL_TOLERANCE
+
+    def fit_inverse_polynomial(
+        self,
+        grid_size: Sequence[int] = INVERSE_POLYNOMIAL_GRID_SIZE,
+        pixel_tolerance: float = INVERSE_POLYNOMIAL_PIXEL_TOLERANCE,
+    ) -> InverseRationalPolynomial:
+        """
+        Fit an inverse rational polynomial to this camera. The inverse is fit on a grid of world coordinates spanning
+        the normalization range of the longitude, latitude, and height. Once fit, image to world transforms use the
+        inverse directly if its residuals are within the pixel tolerance. Otherwise the inverse is used to compute the
+        initial guesses for the iterative solver.
+
+        :param grid_size: the number of longitude, latitude, and height samples in the grid
+        :param pixel_tolerance: the maximum residual (in pixels) of an inverse that can be used without iteration
+
+        :return: the fitted inverse, its residuals are available as rms_residual and max_residual
+        """
+        lower_bounds = [
+            radians(self.long_off - self.long_scale),
+            radians(self.lat_off - self.lat_scale),
+            self.height_off - self.height_scale,
+        ]
+        upper_bounds = [
+            radians(self.long_off + self.long_scale),
+            radians(self.lat_off + self.lat_scale),
+            self.height_off + self.height_scale,
+        ]
+        self.inverse_polynomial = InverseRationalPolynomial.fit(
+            self,
+            InverseRationalPolynomial.grid_coordinates(lower_bounds, upper_bounds, grid_size),
+            InverseRationalPolynomial.grid_coordinates(lower_bounds, upper_bounds, grid_size, staggered=True),
+            image_bounds=[
+                self.samp_off - self.samp_scale,
+                self.line_off - self.line_scale,
+                self.samp_off + self.samp_scale,
+                self.line_off + self.line_scale,
+            ],
+        )
+        self.inverse_pixel_tolerance = pixel_tolerance
+        return self.inverse_polynomial
+
     def world_to_image(self, geodetic_coordinate: GeodeticWorldCoordinate) -> ImageCoordinate:
         """
         This function transforms a geodetic world coordinate (longitude, latitude, elevation) into an image coordinate
@@ -184,6 +689,18 @@ class RPCSensorModel(SensorModel):
         row = rn * self.line_scale + self.line_off
         return ImageCoordinate([col, row])
 
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function transforms an array of geodetic world coordinates (longitude, latitude, elevation) into an
+        array of image coordinates (x, y). The rational polynomials are evaluated for all coordinates at once.
+
+        :param world_coordinates: an Nx3 array of world coordinates (longitude, latitude, elevation)
+
+        :return: an Nx2 array of image coordinates (x, y)
+        """
+        image_coordinates, _ = self._evaluate_normalized(self._normalize_world_coordinates(world_coordinates))
+        return image_coordinates
+
     def image_to_world(
         self,
         image_coordinate: ImageCoordinate,
@@ -191,9 +708,12 @@ class RPCSensorModel(SensorModel):
         options: Optional[Dict[str, Any]] = None,
     ) -> GeodeticWorldCoordinate:
         """
-        This function implements the image to world transform by iteratively invoking world to image within a
-        minimization routine to find a matching image coordinate. The longitude and latitude parameters are searched
-        independently while the elevation of the world coordinate comes from the elevation model.
+        This function implements the image to world transform using a Newton-Raphson iteration driven by the analytic
+        partial derivatives of the rational polynomials. The longitude and latitude are solved for while the elevation
+        of the world coordinate comes from the elevation model. If the iteration does not converge the transform
+        falls back to a minimization routine that iteratively invokes world to image to find a matching image
+        coordinate. If an inverse polynomial has been fit to this camera it is evaluated first and the iteration is
+        only needed when the inverse is not accurate enough.
 
         :param image_coordinate: the image coordinate (x, y)
         :param elevation_model: an optional elevation model used to transform the coordinate
@@ -201,16 +721,261 @@ class RPCSensorModel(SensorModel):
 
         :return: the corresponding world coordinate
         """
+        elevation_model = self._select_elevation_model(elevation_model)
+        initial_guess = self._get_initial_guesses(options, 1)[0]
+
+        world_coordinates, converged = self._solve_image_to_world(
+            image_coordinate.coordinate.reshape(1, 2), elevation_model, initial_guess.reshape(1, 2)
+        )
+        if converged[0]:
+            return GeodeticWorldCoordinate(world_coordinates[0])
+
+        return self._minimize_image_to_world(image_coordinate, elevation_model, initial_guess, options)
+
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This function implements the image to world transform for an array of image coordinates. All coordinates are
+        solved together using the Newton-Raphson iteration. Any coordinates that fail to converge are then solved
+        individually using the minimization routine.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevation_model: an optional elevation model used to transform the coordinates
+        :param options: optional hints, supports initial_guess (either [lon, lat] or an Nx2 array) and
+                        initial_search_distance
 
+        :return: an Nx3 array of world coordinates (longitude, latitude, elevation)
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        elevation_model = self._select_elevation_model(elevation_model)
+        initial_guesses = self._get_initial_guesses(options, image_coordinates.shape[0])
+
+        world_coordinates, converged = self._solve_image_to_world(image_coordinates, elevation_model, initial_guesses)
+        for index in np.flatnonzero(~converged):
+            world_coordinates[index] = self._minimize_image_to_world(
+                ImageCoordinate(image_coordinates[index]), elevation_model, initial_guesses[index], options
+            ).coordinate
+
+        return world_coordinates
+
+    def _select_elevation_model(self, elevation_model: Optional[ElevationModel]) -> ElevationModel:
+        """
+        Combine the caller's elevation model with the default elevation model for this camera.
+
+        :param elevation_model: the optional elevation model provided by the caller
+
+        :return: the elevation model to use when transforming image coordinates
+        """
         if elevation_model is None:
-            elevation_model = self.default_elevation_model
-        else:
-            elevation_model = MultiElevationModel(
-                [
-                    elevation_model,
-                    self.default_elevation_model,
-                ],
+            return self.default_elevation_model
+        return MultiElevationModel(
+            [
+                elevation_model,
+                self.default_elevation_model,
+            ],
+        )
+
+    def _get_initial_guesses(self, options: Optional[Dict[str, Any]], num_coordinates: int) -> np.ndarray:
+        """
+        Select initial guesses for the image to world search. If the caller has not provided a guess the normalization
+        offsets for this camera model are used. Normally these are values near an image corner or the center.
+
+        :param options: optional hints that may contain the initial_guess
+        :param num_coordinates: the number of image coordinates being transformed
+
+        :return: an Nx2 array of (longitude, latitude) guesses in radians
+        """
+        initial_guess = options.get(SensorModelOptions.INITIAL_GUESS) if options is not None else None
+        if initial_guess is None:
+            initial_guess = [radians(self.long_off), radians(self.lat_off)]
+        return np.broadcast_to(np.asarray(initial_guess, dtype=np.float64), (num_coordinates, 2)).copy()
+
+    def _normalize_world_coordinates(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        Normalize an array of world coordinates for use with the polynomials in this sensor model. The RPC spec
+        assumes the ground coordinates are latitude and longitude in units of decimal degrees and the geodetic
+        elevation in units of meters so the radian inputs are converted to degrees before normalizing.
+
+        :param world_coordinates: an Nx3 array of world coordinates (longitude, latitude, elevation)
+
+        :return: an Nx3 array of normalized world coordinates (L, P, H)
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        return np.column_stack(
+            [
+                (np.degrees(world_coordinates[:, 0]) - self.long_off) / self.long_scale,
+                (np.degrees(world_coordinates[:, 1]) - self.lat_off) / self.lat_scale,
+                (world_coordinates[:, 2] - self.height_off) / self.height_scale,
+            ]
+        )
+
+    def _evaluate_normalized(
+        self, norm_domain_coordinates: np.ndarray, compute_jacobians: bool = False
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Evaluate the rational polynomials for an array of normalized world coordinates and optionally compute the
+        Jacobian of the image coordinates with respect to the normalized longitude and latitude (L, P).
+
+        :param norm_domain_coordinates: an Nx3 array of normalized world coordinates (L, P, H)
+        :param compute_jacobians: true if the Nx2x2 array of Jacobians should be computed
+
+        :return: the Nx2 array of image coordinates (x, y) and the Jacobians (or None)
+        """
+        samp_num, samp_den, line_num, line_den = (
+            RPCPolynomial.monomial_basis(norm_domain_coordinates) @ self.polynomial_coefficients
+        ).T
+
+        image_coordinates = np.column_stack(
+            [
+                samp_num / samp_den * self.samp_scale + self.samp_off,
+                line_num / line_den * self.line_scale + self.line_off,
+            ]
+        )
+        if not compute_jacobians:
+            return image_coordinates, None
+
+        # Partials of all four polynomials with respect to L and P, each an Nx2 array [d/dL, d/dP]
+        d_dl_basis, d_dp_basis, _ = RPCPolynomial.monomial_basis_partials(norm_domain_coordinates)
+        partials = np.stack([d_dl_basis @ self.polynomial_coefficients, d_dp_basis @ self.polynomial_coefficients], axis=2)
+        samp_num_partials, samp_den_partials, line_num_partials, line_den_partials = np.moveaxis(partials, 1, 0)
+
+        # Quotient rule: d(N/D) = (dN * D - N * dD) / D^2 applied to the L and P partials of each polynomial
+        jacobians = np.empty((norm_domain_coordinates.shape[0], 2, 2), dtype=np.float64)
+        jacobians[:, 0, :] = (
+            (samp_num_partials * samp_den[:, np.newaxis] - samp_num[:, np.newaxis] * samp_den_partials)
+            / (samp_den * samp_den)[:, np.newaxis]
+            * self.samp_scale
+        )
+        jacobians[:, 1, :] = (
+            (line_num_partials * line_den[:, np.newaxis] - line_num[:, np.newaxis] * line_den_partials)
+            / (line_den * line_den)[:, np.newaxis]
+            * self.line_scale
+        )
+        return image_coordinates, jacobians
+
+    def _denormalize_lonlat(self, normalized_lonlat: np.ndarray, elevation_model: ElevationModel) -> np.ndarray:
+        """
+        Convert an array of normalized (L, P) values into world coordinates with elevations assigned by the elevation
+        model.
+
+        :param normalized_lonlat: an Nx2 array of normalized longitude, latitude values
+        :param elevation_model: the elevation model used to assign the elevations
+
+        :return: an Nx3 array of world coordinates (longitude, latitude, elevation)
+        """
+        world_coordinates = np.column_stack(
+            [
+                np.radians(normalized_lonlat[:, 0] * self.long_scale + self.long_off),
+                np.radians(normalized_lonlat[:, 1] * self.lat_scale + self.lat_off),
+                np.zeros(normalized_lonlat.shape[0]),
+            ]
+        )
+        elevation_model.set_elevations(world_coordinates)
+        return world_coordinates
+
+    def _solve_image_to_world(
+        self, image_coordinates: np.ndarray, elevation_model: ElevationModel, initial_guesses: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve for the world coordinates of an array of image coordinates. The inverse polynomial is used if one has
+        been fit to this camera, otherwise the solution comes from the Newton-Raphson iteration.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevation_model: the elevation model used to assign elevations
+        :param initial_guesses: an Nx2 array of (longitude, latitude) guesses in radians
+
+        :return: the Nx3 array of world coordinates and a mask identifying the coordinates that converged
+        """
+        if self.inverse_polynomial is not None:
+            return self._solve_image_to_world_with_inverse(image_coordinates, elevation_model, initial_guesses)
+        return self._newton_image_to_world(image_coordinates, elevation_model, initial_guesses)
+
+    def _newton_image_to_world(
+        self, image_coordinates: np.ndarray, elevation_model: ElevationModel, initial_guesses: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve for the world coordinates of an array of image coordinates using a Newton-Raphson iteration in the
+        normalized (L, P) domain of the polynomials. At each step the elevation of the current estimate is taken
+        from the elevation model and held fixed while the step is computed.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevation_model: the elevation model used to assign elevations
+        :param initial_guesses: an Nx2 array of (longitude, latitude) guesses in radians
+
+        :return: the Nx3 array of world coordinates and a mask identifying the coordinates that converged
+        """
+
+        def residuals_and_jacobians(normalized_lonlat: np.ndarray, indexes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            world_coordinates = self._denormalize_lonlat(normalized_lonlat, elevation_model)
+            norm_domain_coordinates = np.column_stack(
+                [normalized_lonlat, (world_coordinates[:, 2] - self.height_off) / self.height_scale]
+            )
+            new_image_coordinates, jacobians = self._evaluate_normalized(norm_domain_coordinates, compute_jacobians=True)
+            return new_image_coordinates - image_coordinates[indexes], jacobians
+
+        normalized_guesses = np.column_stack(
+            [
+                (np.degrees(initial_guesses[:, 0]) - self.long_off) / self.long_scale,
+                (np.degrees(initial_guesses[:, 1]) - self.lat_off) / self.lat_scale,
+            ]
+        )
+        normalized_lonlat, converged = newton_raphson_2d(
+            residuals_and_jacobians, normalized_guesses, tolerance=RPC_IMAGE_TO_WORLD_PIXEL_TOLERANCE
+        )
+        return self._denormalize_lonlat(normalized_lonlat, elevation_model), converged
+
+    def _solve_image_to_world_with_inverse(
+        self, image_coordinates: np.ndarray, elevation_model: ElevationModel, initial_guesses: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve for the world coordinates of an array of image coordinates using the inverse polynomial. If the inverse
+        is accurate enough its solutions are returned directly, otherwise they become the initial guesses for the
+        Newton-Raphson iteration.
+
+        :param image_coordinates: an Nx2 array of image coordinates (x, y)
+        :param elevation_model: the elevation model used to assign elevations
+        :param initial_guesses: an Nx2 array of (longitude, latitude) guesses used if the inverse fails
+
+        :return: the Nx3 array of world coordinates and a mask identifying the coordinates that converged
+        """
+        world_coordinates, converged = self.inverse_polynomial.image_to_world(image_coordinates, elevation_model)
+        if self.inverse_polynomial.max_residual > self.inverse_pixel_tolerance:
+            converged[:] = False
+
+        remaining = np.flatnonzero(~converged)
+        if remaining.size > 0:
+            inverse_guesses = world_coordinates[remaining, 0:2]
+            usable_guesses = np.all(np.isfinite(inverse_guesses), axis=1)
+            initial_guesses = initial_guesses[remaining]
+            initial_guesses[usable_guesses] = inverse_guesses[usable_guesses]
+            world_coordinates[remaining], converged[remaining] = self._newton_image_to_world(
+                image_coordinates[remaining], elevation_model, initial_guesses
             )
+        return world_coordinates, converged
+
+    def _minimize_image_to_world(
+        self,
+        image_coordinate: ImageCoordinate,
+        elevation_model: ElevationModel,
+        initial_guess: np.ndarray,
+        options: Optional[Dict[str, Any]],
+    ) -> GeodeticWorldCoordinate:
+        """
+        This function implements the image to world transform by iteratively invoking world to image within a
+        minimization routine to find a matching image coordinate. It is slower than the Newton-Raphson iteration but
+        is more tolerant of poor initial guesses so it is used as a fallback.
+
+        :param image_coordinate: the image coordinate (x, y)
+        :param elevation_model: the elevation model used to assign elevations
+        :param initial_guess: the (longitude, latitude) guess in radians
+        :param options: optional hints, supports initial_search_distance
+
+        :return: the corresponding world coordinate
+        """
 
         # This is the function we will be minimizing. Given an x,y coordinate in the ground domain we use invoke the
         # ground_domain_to_image function to get a projection of that location in the image. Then we compute the
@@ -224,21 +989,13 @@ class RPCSensorModel(SensorModel):
                 (image_coordinate.x - new_image_coordinate.x) ** 2 + (image_coordinate.y - new_image_coordinate.y) ** 2
             )
 
-        # Select an initial guess using the normalization offsets for this camera model. Normally these are values
-        # near an image corner or the center
-        initial_guess = options.get(SensorModelOptions.INITIAL_GUESS) if options is not None else None
-        if initial_guess is None:
-            initial_guess = np.array([radians(self.long_off), radians(self.lat_off)])
-        if isinstance(initial_guess, List):
-            initial_guess = np.array(initial_guess)
-
         initial_search_distance = options.get(SensorModelOptions.INITIAL_SEARCH_DISTANCE) if options is not None else None
         if initial_search_distance is None:
             initial_search_distance = radians(0.5)
 
         # Iteratively adjust the initial guess to minimize the distance to the target image coordinate. We are only
         # allowing the x,y components to vary here and the z is fixed to the elevation model. The starting simplex
-        # is estimated as a triangle centered on the normalization offsets for this RPC.
+        # is estimated as a triangle centered on the initial guess.
         res = minimize(
             distance_to_target_coordinate,
             initial_guess,
@@ -6,7 +6,10 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any, Dict, Optional
 
-from .coordinates import GeodeticWorldCoordinate, ImageCoordinate
+import numpy as np
+import numpy.typing as npt
+
+from .coordinates import GeodeticWorldCoordinate, ImageCoordinate, as_coordinate_array
 from .elevation_model import ElevationModel
 
 logger = logging.getLogger(__name__)
@@ -52,6 +55,56 @@ class SensorModel(ABC):
         :return: the x, y image coordinate
         """
 
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This function returns the longitude, latitude, elevation world coordinates associated with an array of x, y
+        image coordinates. The default implementation loops over the coordinates calling image_to_world so it will work
+        for any sensor model. Implementations that can process many coordinates at once should override it.
+
+        If the initial_guess option is an Nx2 array each image coordinate will be given its own row as the hint.
+
+        :param image_coordinates: an Nx2 array of x, y image coordinates
+        :param elevation_model: optional elevation model used to transform the coordinates
+        :param options: optional dictionary of hints that will be passed on to sensor models
+
+        :return: an Nx3 array of longitude, latitude, elevation world coordinates
+        """
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        initial_guesses = options.get(SensorModelOptions.INITIAL_GUESS) if options is not None else None
+        if initial_guesses is not None and np.ndim(initial_guesses) != 2:
+            initial_guesses = None
+
+        world_coordinates = np.empty((image_coordinates.shape[0], 3), dtype=np.float64)
+        for index, image_coordinate in enumerate(image_coordinates):
+            coordinate_options = options
+            if initial_guesses is not None:
+                coordinate_options = {**options, SensorModelOptions.INITIAL_GUESS: list(initial_guesses[index])}
+            world_coordinates[index] = self.image_to_world(
+                ImageCoordinate(image_coordinate), elevation_model=elevation_model, options=coordinate_options
+            ).coordinate
+        return world_coordinates
+
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This function returns the x, y image coordinates associated with an array of longitude, latitude, elevation
+        world coordinates. The default implementation loops over the coordinates calling world_to_image so it will work
+        for any sensor model. Implementations that can process many coordinates at once should override it.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+
+        :return: an Nx2 array of x, y image coordinates
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        image_coordinates = np.empty((world_coordinates.shape[0], 2), dtype=np.float64)
+        for index, world_coordinate in enumerate(world_coordinates):
+            image_coordinates[index] = self.world_to_image(GeodeticWorldCoordinate(world_coordinate)).coordinate
+        return image_coordinates
+
 
 class SensorModelOptions(str, Enum):
     """
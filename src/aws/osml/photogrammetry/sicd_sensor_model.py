@@ -14,8 +14,10 @@ from .coordinates import (
     GeodeticWorldCoordinate,
     ImageCoordinate,
     WorldCoordinate,
+    as_coordinate_array,
     geocentric_to_geodetic,
-    geodetic_to_geocentric,
+    geocentric_to_geodetic_array,
+    geodetic_to_geocentric_array,
 )
 from .sensor_model import SensorModel
 
@@ -75,18 +77,19 @@ class PolynomialXYZ:
         self.y_polynomial = y_polynomial
         self.z_polynomial = z_polynomial
 
-    def __call__(self, t: float) -> np.ndarray:
+    def __call__(self, t: Union[float, np.ndarray]) -> np.ndarray:
         """
-        Evaluate the x, y, and z polynomials at t and return the result as a vector.
+        Evaluate the x, y, and z polynomials at t and return the result as a vector. If t is an array of N values
+        the result is an Nx3 array with one [x, y, z] vector per value.
 
-        :param t: the value
+        :param t: the value or array of values
         :return: the polynomial result
         """
         x = self.x_polynomial(t)
         y = self.y_polynomial(t)
         z = self.z_polynomial(t)
 
-        return np.array([x, y, z], dtype=x.dtype)
+        return np.stack([x, y, z], axis=-1)
 
     def deriv(self, m: int = 1):
         """
@@ -156,36 +159,33 @@ class SARImageCoordConverter:
         image coordinates (xrow, ycol) using equations (2) (3) in Section 2.2 of the SICD Specification
         Volume 3.
 
-        :param row_col: the [row, col] location as an array
-        :return: the [xrow, ycol] location as an array
+        :param row_col: the [row, col] location as an array or an Nx2 array of locations
+        :return: the [xrow, ycol] location as an array or an Nx2 array of locations
         """
-        xrow_ycol = np.zeros(2, dtype="float64")
-        xrow_ycol[0] = (row_col[0] - self.scp_pixel.r) * self.row_ss
-        xrow_ycol[1] = (row_col[1] - self.scp_pixel.c) * self.col_ss
-        return xrow_ycol
+        row_col = np.asarray(row_col, dtype="float64")
+        return (row_col - np.array([self.scp_pixel.r, self.scp_pixel.c])) * np.array([self.row_ss, self.col_ss])
 
     def xrowycol_to_rowcol(self, xrow_ycol: np.ndarray) -> np.ndarray:
         """
         This function converts the SCP centered image coordinates (xrow, ycol) to row and column indexes (row, col)
         in the global image grid using equations (2) (3) in Section 2.2 of the SICD Specification Volume 3.
 
-        :param xrow_ycol: the [xrow, ycol] location as an array
-        :return: the [row, col] location as an array
+        :param xrow_ycol: the [xrow, ycol] location as an array or an Nx2 array of locations
+        :return: the [row, col] location as an array or an Nx2 array of locations
         """
-        row_col = np.zeros(2, dtype="float64")
-        row_col[0] = xrow_ycol[0] / self.row_ss + self.scp_pixel.r
-        row_col[1] = xrow_ycol[1] / self.col_ss + self.scp_pixel.c
-        return row_col
+        xrow_ycol = np.asarray(xrow_ycol, dtype="float64")
+        return xrow_ycol / np.array([self.row_ss, self.col_ss]) + np.array([self.scp_pixel.r, self.scp_pixel.c])
 
     def xrowycol_to_ipp(self, xrow_ycol: np.ndarray) -> np.ndarray:
         """
         This function converts SCP centered image coordinates (xrow, ycol) to a ECF coordinate, image plane point (IPP),
         on the image plane using equations in Section 2.4 of the SICD Specification Volume 3.
 
-        :param xrow_ycol: the [xrow, ycol] location as an array
-        :return: the image plane point [x, y, z] ECF location on the image plane
+        :param xrow_ycol: the [xrow, ycol] location as an array or an Nx2 array of locations
+        :return: the image plane point [x, y, z] ECF location on the image plane, Nx3 if multiple locations were given
         """
-        delta_ipp = xrow_ycol[0] * self.u_row + xrow_ycol[1] * self.u_col
+        xrow_ycol = np.asarray(xrow_ycol, dtype="float64")
+        delta_ipp = xrow_ycol[..., 0, np.newaxis] * self.u_row + xrow_ycol[..., 1, np.newaxis] * self.u_col
         return self.scp_ecf.coordinate + delta_ipp
 
     def ipp_to_xrowycol(self, ipp: np.ndarray) -> np.ndarray:
@@ -193,8 +193,8 @@ class SARImageCoordConverter:
         This function converts an ECF location on the image plane into SCP centered image coordinates (xrow, ycol)
         using equations in Section 2.4 of the SICD Specification volume 3.
 
-        :param ipp: the image plane point [x, y, z] ECF location on the image plane
-        :return: the [xrow, ycol] location as an array
+        :param ipp: the image plane point [x, y, z] ECF location on the image plane or an Nx3 array of points
+        :return: the [xrow, ycol] location as an array or an Nx2 array of locations
         """
         delta_ipp = ipp - self.scp_ecf.coordinate
         xrow_ycol = np.dot(delta_ipp, self.matrix_transform)
@@ -241,12 +241,16 @@ class COAProjectionSet:
         the _grid_specific_projection() function implemented by subclasses which should handle the portions
         of the calculation that are dependent on the image grid and image formation algorithm.
 
-        :param xrow_ycol: the [xrow, ycol] location as an array
+        All of the calculations are vectorized so an Nx2 array of grid locations can be projected at once. In that
+        case Rcoa, Rdotcoa, and tcoa are length N arrays while arpcoa and varpcoa are Nx3 arrays.
+
+        :param xrow_ycol: the [xrow, ycol] location as an array or an Nx2 array of locations
         :return: the COA projection set { Rcoa, Rdotcoa, tcoa, arpcoa, varpcoa }
         """
         # These are the common calculations for image COA time (coa_time), COA ARP position and velocity
         # (arp_position and arp_velocity) as described in Section 2 of the SICD specification Volume 3.
-        coa_time = self.coa_time_poly(xrow_ycol[0], xrow_ycol[1])
+        xrow_ycol = np.asarray(xrow_ycol, dtype="float64")
+        coa_time = self.coa_time_poly(xrow_ycol[..., 0], xrow_ycol[..., 1])
         arp_position = self.arp_poly(coa_time)
         arp_velocity = self.varp_poly(coa_time)
 
@@ -331,8 +335,8 @@ class PFAProjectionSet(COAProjectionSet):
         """
         # For the RGAZIM grid, the image coordinates are range and azimuth. The row coordinate is the range
         # coordinate, xrow = rg. The column coordinate is the azimuth coordinate, ycol = az.
-        rg = xrow_ycol[0]
-        az = xrow_ycol[1]
+        rg = xrow_ycol[..., 0]
+        az = xrow_ycol[..., 1]
 
         # (2) Compute the range and range rate to the SCP at the pixel COA time
         arp_minus_scp = arp_position - self.scp_ecf.coordinate
@@ -412,8 +416,8 @@ class RGAZCOMPProjectionSet(COAProjectionSet):
         """
         # For the RGAZIM grid, the image coordinates are range and azimuth. The row coordinate is the range
         # coordinate, xrow = rg. The column coordinate is the azimuth coordinate, ycol = az.
-        rg = xrow_ycol[0]
-        az = xrow_ycol[1]
+        rg = xrow_ycol[..., 0]
+        az = xrow_ycol[..., 1]
 
         # (2) Compute the range and range rate to the SCP at COA.
         arp_minus_scp = arp_position - self.scp_ecf.coordinate
@@ -475,8 +479,8 @@ class INCAProjectionSet(COAProjectionSet):
         """
         # For the RGZERO grid, the image coordinates are range and azimuth. The row coordinate is the range
         # coordinate, xrow = rg. The column coordinates is the azimuth coordinate, ycol = az.
-        rg = xrow_ycol[0]
-        az = xrow_ycol[1]
+        rg = xrow_ycol[..., 0]
+        az = xrow_ycol[..., 1]
 
         # (2) Compute the range at closest approach and the time of closest approach for the image
         # grid location. The range at closest approach, R TGT , is computed from the range coordinate.
@@ -487,7 +491,7 @@ class INCAProjectionSet(COAProjectionSet):
         # (2 repeated in v1.3.0 of the spec) Compute the ARP velocity at the time of closest approach
         # and the magnitude of the vector.
         arp_velocity_ca_tgt = self.varp_poly(time_ca_tgt)
-        mag_arp_velocity_ca_tgt = np.linalg.norm(arp_velocity_ca_tgt)
+        mag_arp_velocity_ca_tgt = np.linalg.norm(arp_velocity_ca_tgt, axis=-1)
 
         # (3) Compute the Doppler Rate Scale Factor (drsf_tgt) for image grid location (rg, az).
         drsf_tgt = self.drate_sf_poly(rg, az)
@@ -553,7 +557,9 @@ class PlaneProjectionSet(COAProjectionSet):
         # formed by the SCP, and image plane vectors uRow and uCol. Vectors uRow and uCol are orthogonal. Compute
         # the point the image plane point for image grid location (xrgTGT, ycrTGT).
         image_plane_point = (
-            self.scp_ecf.coordinate + xrow_ycol[0] * self.image_plane_urow + xrow_ycol[1] * self.image_plane_ucol
+            self.scp_ecf.coordinate
+            + xrow_ycol[..., 0, np.newaxis] * self.image_plane_urow
+            + xrow_ycol[..., 1, np.newaxis] * self.image_plane_ucol
         )
 
         # (3) Compute the range and range rate relative to the ARP at COA (r_tgt_coa and rdot_tgt_coa) for image plane
@@ -634,50 +640,82 @@ class GroundPlaneRRDotSurfaceProjection(RRDotSurfaceProjection):
         """
         This method implements the R/RDot Contour Ground Plane Intersection described in section 5.2
 
-        :param r_tgt_coa: target COA range
-        :param r_dot_tgt_coa: target COA range rate
-        :param arp_position: ARP position
-        :param arp_velocity: ARP velocity
-        :return: the intersection between the R/Rdot Contour and the ground plane
+        :param r_tgt_coa: target COA range, scalar or length N array
+        :param r_dot_tgt_coa: target COA range rate, scalar or length N array
+        :param arp_position: ARP position, [x, y, z] or Nx3 array
+        :param arp_velocity: ARP velocity, [x, y, z] or Nx3 array
+        :return: the Nx3 array of intersections between the R/Rdot Contours and the ground plane
         """
-        # (1) Compute the unit vector in the +Z direction (normal to the ground plane).
-        uvect_z = self.u_gpn / np.linalg.norm(self.u_gpn)
+        return _rrdot_to_ground_planes(
+            self.ref_ecf.coordinate, self.u_gpn, r_tgt_coa, r_dot_tgt_coa, arp_position, arp_velocity
+        )
+
+
+def _rrdot_to_ground_planes(
+    ref_ecf: np.ndarray,
+    u_gpn: np.ndarray,
+    r_tgt_coa: Union[float, np.ndarray],
+    r_dot_tgt_coa: Union[float, np.ndarray],
+    arp_position: np.ndarray,
+    arp_velocity: np.ndarray,
+) -> np.ndarray:
+    """
+    This function implements the R/RDot Contour Ground Plane Intersection described in section 5.2 of the SICD
+    Specification Volume 3 for N contours at once. Each contour may be intersected with its own plane (Nx3 reference
+    points and normals) or all of them may share a single plane (a single reference point and normal).
+
+    :param ref_ecf: reference point in the plane(s), [x, y, z] or Nx3 array
+    :param u_gpn: vector normal to the plane(s), [x, y, z] or Nx3 array
+    :param r_tgt_coa: target COA range, scalar or length N array
+    :param r_dot_tgt_coa: target COA range rate, scalar or length N array
+    :param arp_position: ARP position, [x, y, z] or Nx3 array
+    :param arp_velocity: ARP velocity, [x, y, z] or Nx3 array
+    :return: the Nx3 array of intersections between the R/Rdot Contours and the ground plane(s), rows are NaN for
+             contours that have no solution
+    """
+    r_tgt_coa = np.atleast_1d(np.asarray(r_tgt_coa, dtype="float64"))
+    r_dot_tgt_coa = np.atleast_1d(np.asarray(r_dot_tgt_coa, dtype="float64"))
+    arp_position = np.atleast_2d(arp_position)
+    arp_velocity = np.atleast_2d(arp_velocity)
 
-        # (2) Compute the ARP distance from the plane (arp_z). Also compute the ARP ground plane nadir (agpn).
-        arp_z = np.sum((arp_position - self.ref_ecf.coordinate) * uvect_z, axis=-1)
-        if arp_z > r_tgt_coa:
-            raise ValueError("No solution exists. Distance between ARP and the plane is greater than range.")
+    # (1) Compute the unit vector in the +Z direction (normal to the ground plane).
+    uvect_z = u_gpn / np.linalg.norm(u_gpn, axis=-1, keepdims=True)
 
-        agpn = arp_position - np.outer(arp_z, uvect_z)
+    # (2) Compute the ARP distance from the plane (arp_z). Also compute the ARP ground plane nadir (agpn).
+    # No solution exists for contours where the distance between the ARP and the plane is greater than range.
+    arp_z = np.sum((arp_position - ref_ecf) * uvect_z, axis=-1)
+    arp_z = np.where(np.abs(arp_z) > r_tgt_coa, np.nan, arp_z)
 
-        # (3) Compute the ground plane distance (gp_distance) from the ARP nadir to the circle of constant range. Also
-        # compute the sine and cosine of the grazing angle (sin_graz and cos_graz).
-        gp_distance = np.sqrt(r_tgt_coa * r_tgt_coa - arp_z * arp_z)
-        sin_graz = arp_z / r_tgt_coa
-        cos_graz = gp_distance / r_tgt_coa
+    agpn = arp_position - arp_z[:, np.newaxis] * uvect_z
 
-        # (4) Compute velocity components normal to the ground plane (v_z) and parallel to the ground plane (v_x).
-        v_z = np.dot(arp_velocity, uvect_z)
-        v_mag = np.linalg.norm(arp_velocity, axis=-1)
-        v_x = np.sqrt(v_mag * v_mag - v_z * v_z)
+    # (3) Compute the ground plane distance (gp_distance) from the ARP nadir to the circle of constant range. Also
+    # compute the sine and cosine of the grazing angle (sin_graz and cos_graz).
+    gp_distance = np.sqrt(r_tgt_coa * r_tgt_coa - arp_z * arp_z)
+    sin_graz = arp_z / r_tgt_coa
+    cos_graz = gp_distance / r_tgt_coa
 
-        # (5) Orient the +X direction in the ground plane such that the v_x > 0. Compute unit vectors uvect_x
-        # and uvect_y.
-        uvect_x = (arp_velocity - (v_z * uvect_z)) / v_x
-        uvect_y = np.cross(uvect_z, uvect_x)
+    # (4) Compute velocity components normal to the ground plane (v_z) and parallel to the ground plane (v_x).
+    v_z = np.sum(arp_velocity * uvect_z, axis=-1)
+    v_mag = np.linalg.norm(arp_velocity, axis=-1)
+    v_x = np.sqrt(v_mag * v_mag - v_z * v_z)
 
-        # (6) Compute the cosine of the azimuth angle to the ground plane point.
-        cos_az = (-r_dot_tgt_coa + v_z * sin_graz) / (v_x * cos_graz)
-        if np.abs(cos_az) > 1:
-            raise ValueError("No solution exists. cos_az < -1 or cos_az > 1.")
+    # (5) Orient the +X direction in the ground plane such that the v_x > 0. Compute unit vectors uvect_x
+    # and uvect_y.
+    uvect_x = (arp_velocity - v_z[:, np.newaxis] * uvect_z) / v_x[:, np.newaxis]
+    uvect_y = np.cross(uvect_z, uvect_x)
 
-        # (7) Compute the sine of the azimuth angle. Use parameter LOOK to establish the correct sign corresponding
-        # to the correct Side of Track.
-        look = np.sign(np.dot(np.cross(arp_position - self.ref_ecf.coordinate, arp_velocity), uvect_z))
-        sin_az = look * np.sqrt(1 - cos_az * cos_az)
+    # (6) Compute the cosine of the azimuth angle to the ground plane point.
+    # No solution exists for contours where cos_az < -1 or cos_az > 1.
+    cos_az = (-r_dot_tgt_coa + v_z * sin_graz) / (v_x * cos_graz)
+    cos_az = np.where(np.abs(cos_az) > 1, np.nan, cos_az)
 
-        # (8) Compute GPPTGT at distance G from the AGPN and at the correct azimuth angle.
-        return agpn + uvect_x * (gp_distance * cos_az) + uvect_y * (gp_distance * sin_az)
+    # (7) Compute the sine of the azimuth angle. Use parameter LOOK to establish the correct sign corresponding
+    # to the correct Side of Track.
+    look = np.sign(np.sum(np.cross(arp_position - ref_ecf, arp_velocity) * uvect_z, axis=-1))
+    sin_az = look * np.sqrt(1 - cos_az * cos_az)
+
+    # (8) Compute GPPTGT at distance G from the AGPN and at the correct azimuth angle.
+    return agpn + uvect_x * (gp_distance * cos_az)[:, np.newaxis] + uvect_y * (gp_distance * sin_az)[:, np.newaxis]
 
 
 class HAERRDotSurfaceProjection(RRDotSurfaceProjection):
@@ -728,71 +766,88 @@ class HAERRDotSurfaceProjection(RRDotSurfaceProjection):
         The final surface position is computed by projecting from the final ground plane projection point down
         to the HAE surface.
 
-        :param r_tgt_coa: target COA range
-        :param r_dot_tgt_coa: target COA range rate
-        :param arp_position: ARP position
-        :param arp_velocity: ARP velocity
-        :return: the intersection between the R/Rdot Contour and the ground plane
+        Multiple contours can be projected at once; each one iterates independently until it converges.
+
+        :param r_tgt_coa: target COA range, scalar or length N array
+        :param r_dot_tgt_coa: target COA range rate, scalar or length N array
+        :param arp_position: ARP position, [x, y, z] or Nx3 array
+        :param arp_velocity: ARP velocity, [x, y, z] or Nx3 array
+        :return: the Nx3 array of intersections between the R/Rdot Contours and the constant height surface
         """
         # (1) Compute the geodetic ground plane normal at the SCP. Compute the parameters for the initial ground plane.
-        # The reference point position is gref and the unit normal is u_gpn.
-        u_gpn = np.array(
-            [
-                np.cos(self.scp_lle.latitude) * np.cos(self.scp_lle.longitude),
-                np.cos(self.scp_lle.latitude) * np.sin(self.scp_lle.longitude),
-                np.sin(self.scp_lle.latitude),
-            ]
-        )
-        gref = self.scp_ecf.coordinate + (self.hae - self.scp_lle.z) * u_gpn
-
-        cont = True
+        # The reference point position is gref and the unit normal is u_gpn. Each contour gets its own copy of these
+        # since they are refined independently below.
+        r_tgt_coa = np.atleast_1d(np.asarray(r_tgt_coa, dtype="float64"))
+        r_dot_tgt_coa = np.atleast_1d(np.asarray(r_dot_tgt_coa, dtype="float64"))
+        arp_position = np.atleast_2d(arp_position)
+        arp_velocity = np.atleast_2d(arp_velocity)
+        num_points = r_tgt_coa.shape[0]
+
+        scp_u_gpn = _geodetic_up_vectors(np.array([[self.scp_lle.longitude, self.scp_lle.latitude]]))[0]
+        u_gpn = np.tile(scp_u_gpn, (num_points, 1))
+        gref = np.tile(self.scp_ecf.coordinate + (self.hae - self.scp_lle.z) * scp_u_gpn, (num_points, 1))
+
+        gpp_ecf = np.empty((num_points, 3), dtype="float64")
+        u_up = np.empty((num_points, 3), dtype="float64")
+        delta_hae = np.empty(num_points, dtype="float64")
+        active = np.arange(num_points)
         n = 1
-        while cont:
+        while active.size > 0:
             # (2) Compute the precise projection along the R/Rdot contour to Ground Plane. The result is ground plane
             # point position gpp_ecf. Convert from ECF coordinates to geodetic coordinates (gpp_lle).
-            gp_surface_projection = GroundPlaneRRDotSurfaceProjection(ref_ecf=WorldCoordinate(gref), gpn=u_gpn)
-            gpp_ecf = gp_surface_projection.rrdot_to_ground(r_tgt_coa, r_dot_tgt_coa, arp_position, arp_velocity)[0]
-            gpp_lle = geocentric_to_geodetic(WorldCoordinate(coordinate=gpp_ecf))
+            gpp_ecf[active] = _rrdot_to_ground_planes(
+                gref[active],
+                u_gpn[active],
+                r_tgt_coa[active],
+                r_dot_tgt_coa[active],
+                arp_position[active],
+                arp_velocity[active],
+            )
+            gpp_lle = geocentric_to_geodetic_array(gpp_ecf[active])
 
             # (3) Compute the unit vector in the increasing height direction at point gpp_lle, (u_up). Also
             # compute the height difference at point gpp_lle relative to the desired surface height (delta_hae).
-            u_up = np.array(
-                [
-                    np.cos(gpp_lle.latitude) * np.cos(gpp_lle.longitude),
-                    np.cos(gpp_lle.latitude) * np.sin(gpp_lle.longitude),
-                    np.sin(gpp_lle.latitude),
-                ]
-            )
-            delta_hae = gpp_lle.elevation - self.hae
+            u_up[active] = _geodetic_up_vectors(gpp_lle)
+            delta_hae[active] = gpp_lle[:, 2] - self.hae
 
             # (4) Test to see if the point is sufficiently close the surface or if the maximum number of iterations
             # has been reached.  Otherwise, compute a new ground reference point (gref) and unit normal (u_up); repeat
             # Steps 2, 3 and 4.
-            if delta_hae <= self.delta_hae_max or n >= self.nlim:
-                cont = False
-            else:
-                gref = gpp_ecf - delta_hae * u_up
-                u_gpn = u_up
-                n += 1
+            if n >= self.nlim:
+                break
+            active = active[delta_hae[active] > self.delta_hae_max]
+            gref[active] = gpp_ecf[active] - delta_hae[active, np.newaxis] * u_up[active]
+            u_gpn[active] = u_up[active]
+            n += 1
 
         # (5) Compute the unit slant plane normal vector, u_spn, that is tangent to the R/Rdot contour at point gpp.
         # Unit vector u_spn points away from the center of the earth and in a direction of increasing HAE at gpp.
         spn = np.cross(self.look * arp_velocity, gpp_ecf - arp_position)
-        u_spn = spn / np.linalg.norm(spn)
+        u_spn = spn / np.linalg.norm(spn, axis=-1, keepdims=True)
 
         # (6) Compute the straight line projection from point gpp_ecf along the slant plane normal to point slp.
         # Point slp is very close to the precise R/Rdot contour intersection with the constant height surface.
         # Convert the position of point slp from ECF coordinates to geodetic coordinates (slp_lle).
-        sf = np.dot(u_up, u_spn)
-        slp = gpp_ecf - (delta_hae / sf) * u_spn
-        slp_lle = geocentric_to_geodetic(WorldCoordinate(slp))
+        sf = np.sum(u_up * u_spn, axis=-1)
+        slp = gpp_ecf - (delta_hae / sf)[:, np.newaxis] * u_spn
+        slp_lle = geocentric_to_geodetic_array(slp)
 
         # (7) Assign surface point spp position by adjusting the HAE to be on the desired surface. Convert from
         # geodetic coordinates to ECF coordinates.
-        spp_lle = GeodeticWorldCoordinate([slp_lle.longitude, slp_lle.latitude, self.hae])
-        spp_ecf = geodetic_to_geocentric(spp_lle)
+        slp_lle[:, 2] = self.hae
+        return geodetic_to_geocentric_array(slp_lle)
 
-        return np.array([spp_ecf.coordinate])
+
+def _geodetic_up_vectors(geodetic_coordinates: np.ndarray) -> np.ndarray:
+    """
+    Compute the unit vectors normal to the WGS-84 ellipsoid (the increasing height direction) at each geodetic location.
+
+    :param geodetic_coordinates: an Nx2 or Nx3 array of longitude, latitude (radians) values
+    :return: an Nx3 array of ECF unit vectors
+    """
+    longitude = geodetic_coordinates[:, 0]
+    latitude = geodetic_coordinates[:, 1]
+    return np.column_stack([np.cos(latitude) * np.cos(longitude), np.cos(latitude) * np.sin(longitude), np.sin(latitude)])
 
 
 class DEMRRDotSurfaceProjection(RRDotSurfaceProjection):
@@ -862,7 +917,8 @@ class DEMRRDotSurfaceProjection(RRDotSurfaceProjection):
         :param arp_position: ARP position
         :param arp_velocity: ARP velocity
         :return: the intersection between the R/Rdot Contour and the DEM, if multiple intersections occur they will
-                 be returned in order of increasing height above the WGS-84 ellipsoid.
+                 be returned in order of increasing height above the WGS-84 ellipsoid. The result is empty if the
+                 contour does not intersect the DEM.
         """
 
         # (1) Compute the center point (ctr) and the radius of the R/Rdot projection contour (rrrc).
@@ -884,6 +940,8 @@ class DEMRRDotSurfaceProjection(RRDotSurfaceProjection):
         # The projection point at height hae_max is point_a. Also compute the cosine and sine of the contour angle
         # to point_a, cos_caa and sin_caa.
         point_a = self.hae_max_surface_projection.rrdot_to_ground(r_tgt_coa, r_dot_tgt_coa, arp_position, arp_velocity)[0]
+        if np.any(np.isnan(point_a)):
+            return np.empty((0, 3), dtype="float64")
         cos_caa = np.dot(point_a - ctr, u_rrx) / rrrc
         # This variable is defined in the specification but it does not appear to be used anywhere
         # sin_caa = self.look * np.sqrt(1 - cos_caa * cos_caa)
@@ -892,6 +950,8 @@ class DEMRRDotSurfaceProjection(RRDotSurfaceProjection):
         # The projection point at height hae_min is point_b. Also compute the cosine and sine of the contour angle
         # to point_b, cos_cab and sin_cab.
         point_b = self.hae_min_surface_projection.rrdot_to_ground(r_tgt_coa, r_dot_tgt_coa, arp_position, arp_velocity)[0]
+        if np.any(np.isnan(point_b)):
+            return np.empty((0, 3), dtype="float64")
         cos_cab = np.dot(point_b - ctr, u_rrx) / rrrc
         sin_cab = self.look * np.sqrt(1 - cos_cab * cos_cab)
 
@@ -916,12 +976,9 @@ class DEMRRDotSurfaceProjection(RRDotSurfaceProjection):
         # located on the hae_min surface. The final point is located above the hae_max surface. Point Pn is computed
         # in ECF coordinates. Note that here n ranges from [0, npts-1] while in the specification n is [1, npts].
         # Equations have been modified accordingly.
-        points_ecf = []
-        for n in range(0, npts):
-            cos_can = cos_cab + n * delta_cos_ca  # n-1 is unnecessary since n is zero based here
-            sin_can = self.look * np.sqrt(1 - cos_can * cos_can)
-            pn = ctr + rrrc * (cos_can * u_rrx + sin_can * u_rry)
-            points_ecf.append(pn)
+        cos_can = cos_cab + np.arange(npts) * delta_cos_ca  # n-1 is unnecessary since n is zero based here
+        sin_can = self.look * np.sqrt(1 - cos_can * cos_can)
+        points_ecf = ctr + rrrc * (cos_can[:, np.newaxis] * u_rrx + sin_can[:, np.newaxis] * u_rry)
 
         # (8 - 10) For each of the NPTS points, convert from ECF coordinates to DEM coordinates (lon, lat, ele). Also
         # compute the DEM surface height for the point with DEM horizontal coordinates (lon, lat). Compute the
@@ -932,15 +989,17 @@ class DEMRRDotSurfaceProjection(RRDotSurfaceProjection):
         # will be added to the result set. Also compute a result point when points n and n+1 when both are “off”
         # the surface and the R/Rdot contour intersects the surface between them (i.e. indicator n-1 x indicator n = -1)
         #
-        # All height coordinates are in meters.
+        # All height coordinates are in meters. The DEM heights for all the contour points are looked up at once,
+        # if the DEM has no value for a point its height is left unchanged.
+        points_lle = geocentric_to_geodetic_array(points_ecf)
+        dem_elevations, dem_valid = self.elevation_model.get_elevations(points_lle[:, 0], points_lle[:, 1])
+        delta_heights = np.where(dem_valid, points_lle[:, 2] - dem_elevations, 0.0)
+
         intersection_points = []
         prev_indicator = None
         prev_delta_height = None
         for n in range(0, npts):
-            point_lle = geocentric_to_geodetic(WorldCoordinate(points_ecf[n]))
-            point_dem = GeodeticWorldCoordinate(point_lle.coordinate.copy())
-            self.elevation_model.set_elevation(point_dem)
-            delta_height = point_lle.elevation - point_dem.elevation
+            delta_height = delta_heights[n]
 
             # Determine if the contour point is ABOVE (indicator = 1), ON (indicator = 0), or BELOW (indicator = -1)
             if np.abs(delta_height) < self.delta_hd_lim:
@@ -1074,42 +1133,73 @@ class SICDSensorModel(SensorModel):
         :param elevation_model: the optional elevation model, if none supplied a plane tangent to SCP is assumed
         :param options: no additional options are supported at this time
         :return: the lon, lat, elev geodetic coordinate of the surface matching the image coordinate
+        :raises ValueError: if the R/RDot contour does not intersect the surface
+        """
+        world_coordinate = self.image_to_world_batch(
+            [image_coordinate.coordinate], elevation_model=elevation_model, options=options
+        )[0]
+        if np.any(np.isnan(world_coordinate)):
+            raise ValueError(f"No solution exists for image coordinate {image_coordinate}.")
+        return GeodeticWorldCoordinate(world_coordinate)
+
+    def image_to_world_batch(
+        self,
+        image_coordinates: npt.ArrayLike,
+        elevation_model: Optional[ElevationModel] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> np.ndarray:
+        """
+        This is a vectorized version of image_to_world. All of the image locations are projected to their R/RDot
+        contours at once and, when no elevation model is provided, intersected with the ground plane tangent to the
+        SCP in a single pass. Intersections with a DEM may produce a different number of solutions for each contour
+        so those are still computed one contour at a time.
+
+        :param image_coordinates: an Nx2 array of x, y image coordinates
+        :param elevation_model: the optional elevation model, if none supplied a plane tangent to SCP is assumed
+        :param options: no additional options are supported at this time
+        :return: an Nx3 array of longitude, latitude, elevation world coordinates, rows are NaN for image
+                 coordinates whose R/RDot contour does not intersect the surface
         """
-        row_col = np.array(
-            [
-                image_coordinate.r + self.coord_converter.first_pixel.r,
-                image_coordinate.c + self.coord_converter.first_pixel.c,
-            ]
+        image_coordinates = as_coordinate_array(image_coordinates, 2)
+        row_col = image_coordinates[:, ::-1] + np.array(
+            [self.coord_converter.first_pixel.r, self.coord_converter.first_pixel.c]
         )
         xrow_ycol = self.coord_converter.rowcol_to_xrowycol(row_col=row_col)
         r_tgt_coa, r_dot_tgt_coa, time_coa, arp_coa, varp_coa = self.coa_projection_set.precise_rrdot_computation(xrow_ycol)
 
-        if elevation_model is not None:
-            scp_lle = geocentric_to_geodetic(self.coord_converter.scp_ecf)
-            elevation_summary = elevation_model.describe_region(scp_lle)
-            if elevation_summary is not None:
-                extra_kwargs = {
-                    "min_height": elevation_summary.min_elevation,
-                    "max_height": elevation_summary.max_elevation,
-                    "max_horizontal_distance": 0.5 * elevation_summary.post_spacing,
-                }
-            else:
-                extra_kwargs = {}
-            surface_projection = DEMRRDotSurfaceProjection(
-                self.coord_converter.scp_ecf,
-                self.side_of_track,
-                elevation_model=elevation_model,
-                **extra_kwargs,
-            )
+        if elevation_model is None:
+            coords_ecf = self.default_surface_projection.rrdot_to_ground(r_tgt_coa, r_dot_tgt_coa, arp_coa, varp_coa)
+            return geocentric_to_geodetic_array(coords_ecf)
+
+        scp_lle = geocentric_to_geodetic(self.coord_converter.scp_ecf)
+        elevation_summary = elevation_model.describe_region(scp_lle)
+        if elevation_summary is not None:
+            extra_kwargs = {
+                "min_height": elevation_summary.min_elevation,
+                "max_height": elevation_summary.max_elevation,
+                "max_horizontal_distance": 0.5 * elevation_summary.post_spacing,
+            }
         else:
-            surface_projection = self.default_surface_projection
+            extra_kwargs = {}
+        surface_projection = DEMRRDotSurfaceProjection(
+            self.coord_converter.scp_ecf,
+            self.side_of_track,
+            elevation_model=elevation_model,
+            **extra_kwargs,
+        )
 
         # Note that for a DEM the r/rdot contour may intersect the surface at multiple locations
         # resulting in an ambiguous location. Here we are arbitrarily selecting the first result.
         # TODO: Is there a better way to handle multiple DEM intersections?
-        coords_ecf = surface_projection.rrdot_to_ground(r_tgt_coa, r_dot_tgt_coa, arp_coa, varp_coa)
+        coords_ecf = np.full((image_coordinates.shape[0], 3), np.nan, dtype="float64")
+        for index in range(image_coordinates.shape[0]):
+            intersections = surface_projection.rrdot_to_ground(
+                r_tgt_coa[index], r_dot_tgt_coa[index], arp_coa[index], varp_coa[index]
+            )
+            if len(intersections) > 0:
+                coords_ecf[index] = intersections[0]
 
-        return geocentric_to_geodetic(WorldCoordinate(coords_ecf[0]))
+        return geocentric_to_geodetic_array(coords_ecf)
 
     def world_to_image(self, world_coordinate: GeodeticWorldCoordinate) -> ImageCoordinate:
         """
@@ -1118,7 +1208,20 @@ class SICDSensorModel(SensorModel):
         :param world_coordinate: lon, lat, elevation coordinate of the scene point
         :return: the x,y pixel location in this image
         """
-        ecf_world_coordinate = geodetic_to_geocentric(world_coordinate)
+        return ImageCoordinate(self.world_to_image_batch([world_coordinate.coordinate])[0])
+
+    def world_to_image_batch(self, world_coordinates: npt.ArrayLike) -> np.ndarray:
+        """
+        This is an implementation of Section 6.1 Scene To Image Grid Projection for an array of points. All of the
+        points are iterated together; points stop being refined once their ground plane displacement is within the
+        tolerance and the iterations end as soon as every point has converged.
+
+        :param world_coordinates: an Nx3 array of longitude, latitude, elevation world coordinates
+        :return: an Nx2 array of x, y image coordinates, rows are NaN for scene points that have no solution
+        """
+        world_coordinates = as_coordinate_array(world_coordinates, 3)
+        scene_points = geodetic_to_geocentric_array(world_coordinates)
+        num_points = scene_points.shape[0]
 
         # TODO: Consider making these options like we have for image_to_world
         tolerance = 1e-2
@@ -1130,47 +1233,56 @@ class SICDSensorModel(SensorModel):
         uvect_proj = self.uvect_spn
         scale_factor = float(np.dot(uvect_proj, self.coord_converter.uvect_ipn))
 
-        # (3) Set initial ground plane position G1 to the scene point position S.
-        scene_point = np.array([ecf_world_coordinate.x, ecf_world_coordinate.y, ecf_world_coordinate.z])
-        g_n = scene_point.copy()
-        local_surface_projection = GroundPlaneRRDotSurfaceProjection(WorldCoordinate(scene_point), self.uvect_gpn)
-
-        xrow_ycol_n = None
-        cont = True
-        iteration = 0
-        while cont:
-            iteration += 1
+        # Each scene point S is contained in its own ground plane. If a ground plane normal was not provided it is
+        # the normal to the WGS-84 ellipsoid at S.
+        if self.uvect_gpn is not None:
+            plane_normals = np.broadcast_to(self.uvect_gpn, (num_points, 3))
+        else:
+            plane_normals = _geodetic_up_vectors(world_coordinates)
 
+        # (3) Set initial ground plane position G1 to the scene point position S.
+        g_n = scene_points.copy()
+        xrow_ycol_n = np.empty((num_points, 2), dtype="float64")
+        active = np.arange(num_points)
+        for iteration in range(max_iterations):
             # (4) Project ground plane point g_n to image plane point i_n. The projection distance is dist_n. Compute
             # image coordinates xrown and ycoln.
-            dist_n = np.dot(self.coord_converter.scp_ecf.coordinate - g_n, self.coord_converter.uvect_ipn) / scale_factor
-            i_n = g_n + dist_n * uvect_proj
-            xrow_ycol_n = self.coord_converter.ipp_to_xrowycol(i_n)
+            dist_n = np.dot(self.coord_converter.scp_ecf.coordinate - g_n[active], self.coord_converter.uvect_ipn)
+            i_n = g_n[active] + (dist_n / scale_factor)[:, np.newaxis] * uvect_proj
+            xrow_ycol_n[active] = self.coord_converter.ipp_to_xrowycol(i_n)
 
             # (5) Compute the precise projection for image grid location (xrown, ycoln) to the ground plane containing
             # the scene point S. The result is point p_n. For image grid location (xrown, ycoln), compute COA
             # parameters per Section 2. Compute the precise R/Rdot projection contour per Section 4. Compute the
             # R/Rdot intersection with the ground plane per Section 5.
             r_tgt_coa, r_dot_tgt_coa, time_coa, arp_coa, varp_coa = self.coa_projection_set.precise_rrdot_computation(
-                xrow_ycol_n
+                xrow_ycol_n[active]
+            )
+            p_n = _rrdot_to_ground_planes(
+                scene_points[active], plane_normals[active], r_tgt_coa, r_dot_tgt_coa, arp_coa, varp_coa
             )
-            p_n = local_surface_projection.rrdot_to_ground(r_tgt_coa, r_dot_tgt_coa, arp_coa, varp_coa)
+
+            # Scene points whose R/Rdot contour does not intersect their ground plane have no image location.
+            unsolvable = np.isnan(p_n[:, 0])
+            xrow_ycol_n[active[unsolvable]] = np.nan
 
             # (6) Compute the displacement between ground plane point Pn and the scene point S.
-            diff_n = scene_point - p_n[0]
-            delta_gpn = np.linalg.norm(diff_n)
-            g_n += diff_n
+            diff_n = scene_points[active] - p_n
+            delta_gpn = np.linalg.norm(diff_n, axis=-1)
+            g_n[active] += diff_n
 
-            # If the displacement is greater than the threshold (GP_MAX), compute point Gn+1 and repeat the
+            # If the displacement is greater than the threshold (GP_MAX), compute point Gn+1 and repeat the
             # projections in steps (4) and (5) above. If the displacement is less than the threshold, accept image
             # grid location (xrown, ycoln) as the precise image grid location for scene point S.
-            cont = delta_gpn > tolerance and (iteration < max_iterations)
+            active = active[delta_gpn > tolerance]
+            if active.size == 0:
+                break
 
         row_col = self.coord_converter.xrowycol_to_rowcol(xrow_ycol_n)
 
         # Convert the row_col image grid location to an x,y image coordinate. Note that row_col is in reference
         # to the full image, so we subtract off the first_pixel offset to make the image coordinate correct if this
         # is a chip.
-        return ImageCoordinate(
-            [row_col[1] - self.coord_converter.first_pixel.x, row_col[0] - self.coord_converter.first_pixel.y]
+        return np.column_stack(
+            [row_col[:, 1] - self.coord_converter.first_pixel.x, row_col[:, 0] - self.coord_converter.first_pixel.y]
         )
@@ -1,9 +1,12 @@
 #  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
 
 from math import degrees, floor
-from typing import Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from .coordinates import GeodeticWorldCoordinate
+from .dem_tile_availability import DEMTileAvailabilityIndex
 from .digital_elevation_model import DigitalElevationModelTileSet
 
 
@@ -12,7 +15,13 @@ class SRTMTileSet(DigitalElevationModelTileSet):
     A tile set for SRTM content downloaded from the USGS website.
     """
 
-    def __init__(self, prefix: str = "", version: str = "1arc_v3", format_extension: str = ".tif") -> None:
+    def __init__(
+        self,
+        prefix: str = "",
+        version: str = "1arc_v3",
+        format_extension: str = ".tif",
+        availability_index: Optional[DEMTileAvailabilityIndex] = None,
+    ) -> None:
         """
         Construct a tile set from a limited collection of configurable parameters. This implementation is flexible
         enough to support both SRTM 1-arc second and 3-arc second datasets in whatever raster format (e.g. GeoTIFF).
@@ -20,6 +29,7 @@ class SRTMTileSet(DigitalElevationModelTileSet):
         :param prefix: an optional prefix (possibly a subdirectory) for the tile set
         :param version: the version (e.g. 1arc_v3 or 3arc_v2)
         :param format_extension: the image extension (e.g. .tif)
+        :param availability_index: an optional index of the cells that have tiles, other cells are assumed missing
 
         :return: None
         """
@@ -27,6 +37,7 @@ class SRTMTileSet(DigitalElevationModelTileSet):
         self.prefix = prefix
         self.version = version
         self.format_extension = format_extension
+        self.availability_index = availability_index
 
     def find_tile_id(self, geodetic_world_coordinate: GeodeticWorldCoordinate) -> Optional[str]:
         """
@@ -49,6 +60,9 @@ class SRTMTileSet(DigitalElevationModelTileSet):
         if latitude_degrees > 59 or latitude_degrees < -56:
             return None
 
+        if self.availability_index is not None and (latitude_degrees, longitude_degrees) not in self.availability_index:
+            return None
+
         longitude_direction = "e"
         if longitude_degrees < 0:
             longitude_direction = "w"
@@ -64,3 +78,16 @@ class SRTMTileSet(DigitalElevationModelTileSet):
             f"{self.version}"
             f"{self.format_extension}"
         )
+
+    def find_tile_ids(self, longitudes: np.ndarray, latitudes: np.ndarray) -> Tuple[List[Optional[str]], np.ndarray]:
+        """
+        Identifies the tiles for arrays of longitude, latitude values. Each tile covers a 1-degree cell so the tile
+        id is only created once for each distinct cell.
+
+        :param longitudes: the longitude values in radians
+        :param latitudes: the latitude values in radians
+
+        :return: the list of distinct tile paths (None for locations without coverage) and, for each location, the
+                 index of its tile path in that list
+        """
+        return self._find_tile_ids_by_cell(longitudes, latitudes, cell_size_degrees=1.0)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Tuple
+
 import numpy as np
 import numpy.typing as npt
 
@@ -11,6 +13,11 @@ class ProjectiveTransform:
     This is a simple standalone projective transform class with an implementation that only depends on NumPy. There
     are equivalent classes in Open CV and Scikit Imaging but this class can be used when we don't want to include those
     dependencies.
+
+    The transform is represented by a 3x3 homography matrix that maps homogeneous source coordinates [x, y, 1] to
+    destination coordinates. The inverse matrix is computed once when the transform is created so both directions
+    cost the same. Transforms can be composed so a chain of them (e.g. a chip of a chip of an image) collapses into a
+    single matrix.
     """
 
     def __init__(self, matrix_parameters: npt.ArrayLike) -> None:
@@ -18,13 +25,74 @@ class ProjectiveTransform:
         Construct a projective transform from the given matrix parameters. Normally this constructor is not called
         directly. See the ProjectiveTransform.estimate() method instead.
 
-        :param matrix_parameters: the matrix parameters for this transformation
+        :param matrix_parameters: the 8 matrix parameters [a0, a1, a2, b0, b1, b2, c0, c1] for this transformation
+                                  where x' = (a0 + a1*x + a2*y) / (1 + c0*x + c1*y) and
+                                  y' = (b0 + b1*x + b2*y) / (1 + c0*x + c1*y)
 
         :return: None
         """
         self.matrix_parameters = matrix_parameters
 
-    def forward(self, src_coords: npt.ArrayLike):
+    @classmethod
+    def from_matrix(cls, matrix: npt.ArrayLike) -> ProjectiveTransform:
+        """
+        Construct a projective transform from a 3x3 homography matrix.
+
+        :param matrix: the 3x3 matrix that maps homogeneous source coordinates to destination coordinates
+
+        :return: the projective transform
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.shape != (3, 3):
+            raise ValueError(f"Projective transforms require a 3x3 matrix. Matrix with shape {matrix.shape} provided.")
+        if matrix[2, 2] == 0.0:
+            raise ValueError("Projective transform matrices must have a non-zero [2, 2] element.")
+        transform = cls.__new__(cls)
+        transform._set_matrix(matrix / matrix[2, 2])
+        return transform
+
+    def _set_matrix(self, matrix: np.ndarray) -> None:
+        """
+        Set the homography matrix of this transform and precompute its inverse.
+
+        :param matrix: the normalized 3x3 homography matrix
+
+        :return: None
+        """
+        try:
+            inverse_matrix = np.linalg.inv(matrix)
+        except np.linalg.LinAlgError:
+            raise ValueError("Projective transform matrix is singular and can not be inverted.")
+        self.matrix = matrix
+        self.inverse_matrix = inverse_matrix
+        # Plain Python copies of the matrices make transforming individual points much faster than NumPy
+        self._forward_elements = tuple(matrix.ravel().tolist())
+        self._inverse_elements = tuple(inverse_matrix.ravel().tolist())
+
+    @property
+    def matrix_parameters(self) -> np.ndarray:
+        """
+        The 8 matrix parameters [a0, a1, a2, b0, b1, b2, c0, c1] of this transformation.
+
+        :return: the matrix parameters
+        """
+        (a1, a2, a0), (b1, b2, b0), (c0, c1, _) = self.matrix
+        return np.array([a0, a1, a2, b0, b1, b2, c0, c1])
+
+    @matrix_parameters.setter
+    def matrix_parameters(self, matrix_parameters: npt.ArrayLike) -> None:
+        """
+        Replace the 8 matrix parameters [a0, a1, a2, b0, b1, b2, c0, c1] of this transformation. The homography and
+        its inverse are rebuilt from the new parameters.
+
+        :param matrix_parameters: the 8 matrix parameters of this transformation
+
+        :return: None
+        """
+        a0, a1, a2, b0, b1, b2, c0, c1 = np.asarray(matrix_parameters, dtype=np.float64).tolist()
+        self._set_matrix(np.array([[a1, a2, a0], [b1, b2, b0], [c0, c1, 1.0]]))
+
+    def forward(self, src_coords: npt.ArrayLike) -> np.ndarray:
         """
         Compute the forward src -> dst transformation for an array of source coordinates [[x, y], ...]
 
@@ -32,15 +100,9 @@ class ProjectiveTransform:
 
         :return: the array of transformed coordinates [[x',y'], ...]
         """
-        a0, a1, a2, b0, b1, b2, c0, c1 = self.matrix_parameters
-        x = src_coords[:, 0]
-        y = src_coords[:, 1]
-        out = np.zeros(src_coords.shape)
-        out[:, 0] = (a0 + a1 * x + a2 * y) / (1 + c0 * x + c1 * y)
-        out[:, 1] = (b0 + b1 * x + b2 * y) / (1 + c0 * x + c1 * y)
-        return out
+        return _apply_homography(self.matrix, src_coords)
 
-    def inverse(self, dst_coords: npt.ArrayLike):
+    def inverse(self, dst_coords: npt.ArrayLike) -> np.ndarray:
         """
         Compute the inverse, dst -> src, transformation for an array of destination coordinates [[x', y'], ...]
 
@@ -48,17 +110,54 @@ class ProjectiveTransform:
 
         :return: the array of transformed coordinates [[x,y], ...]
         """
-        a0, a1, a2, b0, b1, b2, c0, c1 = self.matrix_parameters
-        x = dst_coords[:, 0]
-        y = dst_coords[:, 1]
-        out = np.zeros(dst_coords.shape)
-        out[:, 0] = (a2 * b0 - a0 * b2 + (b2 - b0 * c1) * x + (a0 * c1 - a2) * y) / (
-            a1 * b2 - a2 * b1 + (b1 * c1 - b2 * c0) * x + (a2 * c0 - a1 * c1) * y
-        )
-        out[:, 1] = (a0 * b1 - a1 * b0 + (b0 * c0 - b1) * x + (a1 - a0 * c0) * y) / (
-            a1 * b2 - a2 * b1 + (b1 * c1 - b2 * c0) * x + (a2 * c0 - a1 * c1) * y
-        )
-        return out
+        return _apply_homography(self.inverse_matrix, dst_coords)
+
+    def forward_point(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Compute the forward src -> dst transformation for a single source coordinate.
+
+        :param x: the x component of the source coordinate
+        :param y: the y component of the source coordinate
+
+        :return: the transformed coordinate (x', y')
+        """
+        return _apply_homography_to_point(self._forward_elements, x, y)
+
+    def inverse_point(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Compute the inverse, dst -> src, transformation for a single destination coordinate.
+
+        :param x: the x component of the destination coordinate
+        :param y: the y component of the destination coordinate
+
+        :return: the transformed coordinate (x, y)
+        """
+        return _apply_homography_to_point(self._inverse_elements, x, y)
+
+    def then(self, other: ProjectiveTransform) -> ProjectiveTransform:
+        """
+        Compose this transform with another one. The result is a single transform equivalent to applying this
+        transform followed by the other.
+
+        :param other: the transform applied to the outputs of this transform
+
+        :return: the combined projective transform
+        """
+        return ProjectiveTransform.from_matrix(other.matrix @ self.matrix)
+
+    def inverted(self) -> ProjectiveTransform:
+        """
+        Create the transform that maps destination coordinates back to source coordinates.
+
+        :return: the inverse projective transform
+        """
+        return ProjectiveTransform.from_matrix(self.inverse_matrix)
+
+    def __getstate__(self):
+        return {"matrix": self.matrix}
+
+    def __setstate__(self, state):
+        self._set_matrix(state["matrix"])
 
     @classmethod
     def estimate(cls, src: npt.ArrayLike, dst: npt.ArrayLike) -> ProjectiveTransform:
@@ -72,6 +171,8 @@ class ProjectiveTransform:
 
         :return: the projective transform
         """
+        src = np.asarray(src, dtype=np.float64)
+        dst = np.asarray(dst, dtype=np.float64)
         xs = src[:, 0]
         ys = src[:, 1]
         num_points = src.shape[0]
@@ -98,3 +199,36 @@ class ProjectiveTransform:
         matrix_parameters = np.linalg.lstsq(a, b, rcond=None)[0]
 
         return cls(matrix_parameters)
+
+
+def _apply_homography(matrix: np.ndarray, coords: npt.ArrayLike) -> np.ndarray:
+    """
+    Apply a 3x3 homography to an array of coordinates [[x, y], ...]. The coordinates are never expanded into
+    homogeneous form; the linear part is applied with a single matrix multiply and then divided by the projective
+    scale.
+
+    :param matrix: the 3x3 homography matrix
+    :param coords: the Nx2 array of coordinates
+
+    :return: the Nx2 array of transformed coordinates
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    out = coords @ matrix[0:2, 0:2].T
+    out += matrix[0:2, 2]
+    out /= (coords @ matrix[2, 0:2] + matrix[2, 2])[:, np.newaxis]
+    return out
+
+
+def _apply_homography_to_point(elements: Tuple[float, ...], x: float, y: float) -> Tuple[float, float]:
+    """
+    Apply a 3x3 homography, flattened in row major order, to a single coordinate.
+
+    :param elements: the 9 elements of the homography matrix
+    :param x: the x component of the coordinate
+    :param y: the y component of the coordinate
+
+    :return: the transformed coordinate
+    """
+    m00, m01, m02, m10, m11, m12, m20, m21, m22 = elements
+    w = m20 * x + m21 * y + m22
+    return (m00 * x + m01 * y + m02) / w, (m10 * x + m11 * y + m12) / w
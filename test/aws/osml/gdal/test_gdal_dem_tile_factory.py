@@ -40,6 +40,67 @@ class TestGDALDemTileFactory(TestCase):
         # The 3-arc second test file used here is somewhere around 90 meter resolution
         assert abs(90.0 - summary.post_spacing) < 20.0
 
+    def test_cached_tile(self):
+        import tempfile
+
+        import numpy as np
+
+        from aws.osml.gdal.gdal_dem_tile_factory import GDALDigitalElevationModelTileFactory
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            tile_factory = GDALDigitalElevationModelTileFactory("./test/data", cache_directory=cache_directory)
+            elevation_array, sensor_model, summary = tile_factory.get_tile("n47_e034_3arc_v2.tif")
+            assert isinstance(elevation_array, np.memmap)
+
+            # A second factory sharing the cache directory opens the decoded tile without calling GDAL
+            cached_tile_factory = GDALDigitalElevationModelTileFactory("./test/data", cache_directory=cache_directory)
+            with patch("aws.osml.gdal.gdal_dem_tile_factory.gdal.Open") as mock_open:
+                cached_array, cached_sensor_model, cached_summary = cached_tile_factory.get_tile("n47_e034_3arc_v2.tif")
+                assert mock_open.call_count == 0
+
+            assert isinstance(cached_array, np.memmap)
+            assert np.array_equal(cached_array, elevation_array)
+            assert np.array_equal(cached_sensor_model.transform, sensor_model.transform)
+            assert cached_summary == summary
+
+            # Tiles that are not available are not cached
+            assert cached_tile_factory.get_tile("missing.tif") == (None, None, None)
+
+    def test_tile_window(self):
+        import tempfile
+
+        import numpy as np
+
+        from aws.osml.gdal.gdal_dem_tile_factory import GDALDigitalElevationModelTileFactory
+
+        bounds = (radians(34.25), radians(47.25), radians(34.5), radians(47.5))
+        tile_factory = GDALDigitalElevationModelTileFactory("./test/data")
+        elevation_array, sensor_model, summary = tile_factory.get_tile("n47_e034_3arc_v2.tif")
+
+        # Only the posts covering the window plus a margin are read and the sensor model is shifted to match
+        window_array, window_sensor_model, window_summary = tile_factory.get_tile_window("n47_e034_3arc_v2.tif", bounds)
+        assert window_array.shape == (306, 306)
+        assert np.array_equal(window_array, elevation_array[598:904, 298:604])
+        assert np.allclose(window_sensor_model.transform @ [0, 0, 1], sensor_model.transform @ [298, 598, 1])
+        assert summary.min_elevation <= window_summary.min_elevation <= window_summary.max_elevation
+        assert window_summary.max_elevation <= summary.max_elevation
+        assert abs(90.0 - window_summary.post_spacing) < 20.0
+
+        # Windows outside the tile have no elevations
+        outside = (radians(35.5), radians(47.25), radians(35.75), radians(47.5))
+        assert tile_factory.get_tile_window("n47_e034_3arc_v2.tif", outside) == (None, None, None)
+
+        # With a cache directory the window is a slice of the memory mapped tile
+        with tempfile.TemporaryDirectory() as cache_directory:
+            cached_tile_factory = GDALDigitalElevationModelTileFactory("./test/data", cache_directory=cache_directory)
+            cached_array, cached_sensor_model, cached_summary = cached_tile_factory.get_tile_window(
+                "n47_e034_3arc_v2.tif", bounds
+            )
+            assert isinstance(cached_array, np.memmap)
+            assert np.array_equal(cached_array, window_array)
+            assert np.allclose(cached_sensor_model.transform, window_sensor_model.transform)
+            assert cached_summary == summary
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -74,6 +74,38 @@ class TestSensorModelFactory(TestCase):
             assert sensor_model is not None
             assert isinstance(sensor_model, ProjectiveSensorModel)
 
+    def test_sensor_model_builder_inverse_polynomial(self):
+        from aws.osml.gdal.sensor_model_factory import SensorModelFactory, SensorModelTypes
+        from aws.osml.photogrammetry.coordinates import ImageCoordinate
+        from aws.osml.photogrammetry.replacement_sensor_model import RSMPolynomialSensorModel
+        from aws.osml.photogrammetry.rpc_sensor_model import RPCSensorModel
+
+        for xml_path, sensor_model_type, sensor_model_class in [
+            ("test/data/sample-metadata-ms-rpc00b.xml", SensorModelTypes.RPC, RPCSensorModel),
+            ("test/data/i_6130a_truncated_tres.xml", SensorModelTypes.RSM, RSMPolynomialSensorModel),
+        ]:
+            with open(xml_path, "rb") as xml_file:
+                xml_tres = ElementTree.parse(xml_file)
+
+            # By default the models use the iterative solver
+            sensor_model = SensorModelFactory(
+                2048, 2048, xml_tres=xml_tres, selected_sensor_model_types=[sensor_model_type]
+            ).build()
+            assert isinstance(sensor_model, sensor_model_class)
+            assert sensor_model.inverse_polynomial is None
+
+            # The inverse is fit when the model is built if a tolerance is provided
+            sensor_model = SensorModelFactory(
+                2048, 2048, xml_tres=xml_tres, selected_sensor_model_types=[sensor_model_type], inverse_pixel_tolerance=0.05
+            ).build()
+            assert isinstance(sensor_model, sensor_model_class)
+            assert sensor_model.inverse_polynomial is not None
+            assert sensor_model.inverse_pixel_tolerance == 0.05
+            assert sensor_model.inverse_polynomial.max_residual < 0.05
+
+            world_coordinate = sensor_model.image_to_world(ImageCoordinate([1024.0, 1024.0]))
+            assert np.allclose(sensor_model.world_to_image(world_coordinate).coordinate, [1024.0, 1024.0], atol=0.05)
+
     def test_sensor_model_builder_ms_rpc00b_with_chip(self):
         from aws.osml.gdal.sensor_model_factory import SensorModelFactory, SensorModelTypes
         from aws.osml.photogrammetry.chipped_image_sensor_model import ChippedImageSensorModel
@@ -132,6 +164,63 @@ class TestSensorModelFactory(TestCase):
                 geodetic_ground_domain_origin.latitude, abs=0.00001
             )
 
+    def test_sensor_model_builder_rsmgga(self):
+        from aws.osml.gdal.sensor_model_factory import SensorModelFactory, SensorModelTypes
+        from aws.osml.photogrammetry.replacement_sensor_model import RSMGridSensorModel
+
+        with open("test/data/i_6130a_truncated_tres.xml") as xml_file:
+            xml_tres = ElementTree.parse(xml_file).getroot()
+        polynomial_sensor_model = SensorModelFactory(
+            2048, 2048, xml_tres=xml_tres, selected_sensor_model_types=[SensorModelTypes.RSM]
+        ).build()
+
+        # Replace the RSMPCA TRE with a RSMGGA TRE sampled from the polynomial model on a 250m grid
+        xml_tres.remove(xml_tres.find("./tre[@name='RSMPCA']"))
+        rsmgg_tre = ElementTree.fromstring('<tre name="RSMGGA"/>')
+        header_fields = {
+            "GGRSN": "001",
+            "GGCSN": "001",
+            "INTORD": "3",
+            "NPLN": "009",
+            "DELTAZ": "+2.50000000000000E+02",
+            "DELTAX": "+2.50000000000000E+02",
+            "DELTAY": "+2.50000000000000E+02",
+            "ZPLN1": "-1.00000000000000E+03",
+            "XIPLN1": "-5.00000000000000E+02",
+            "YIPLN1": "-5.00000000000000E+02",
+            "REFROW": "000000000",
+            "REFCOL": "000000000",
+            "FNUMRD": "3",
+            "FNUMCD": "3",
+        }
+        for name, value in header_fields.items():
+            rsmgg_tre.append(ElementTree.fromstring(f'<field name="{name}" value="{value}"/>'))
+        for _ in range(8):
+            rsmgg_tre.append(ElementTree.fromstring('<field name="IXO" value="0000"/>'))
+            rsmgg_tre.append(ElementTree.fromstring('<field name="IYO" value="0000"/>'))
+        grid_x, grid_y = np.meshgrid(np.arange(-2, 24) * 250.0, np.arange(-2, 24) * 250.0, indexing="ij")
+        for plane_index in range(9):
+            rsmgg_tre.append(ElementTree.fromstring('<field name="NXPTS" value="026"/>'))
+            rsmgg_tre.append(ElementTree.fromstring('<field name="NYPTS" value="026"/>'))
+            domain_coordinates = np.column_stack(
+                [grid_x.ravel(), grid_y.ravel(), np.full(grid_x.size, -1000.0 + plane_index * 250.0)]
+            )
+            for column, row in polynomial_sensor_model.ground_domain_to_image_batch(domain_coordinates):
+                rsmgg_tre.append(ElementTree.fromstring(f'<field name="RCOORD" value="{round(row * 1000)}"/>'))
+                rsmgg_tre.append(ElementTree.fromstring(f'<field name="CCOORD" value="{round(column * 1000)}"/>'))
+        xml_tres.append(rsmgg_tre)
+
+        sensor_model = SensorModelFactory(
+            2048, 2048, xml_tres=xml_tres, selected_sensor_model_types=[SensorModelTypes.RSM]
+        ).build()
+        assert isinstance(sensor_model, RSMGridSensorModel)
+
+        world_coordinates = polynomial_sensor_model.image_to_world_batch([[0.5, 0.5], [1024.0, 1024.0], [4000.0, 3000.0]])
+        image_coordinates = sensor_model.world_to_image_batch(world_coordinates)
+        assert np.allclose(image_coordinates, [[0.5, 0.5], [1024.0, 1024.0], [4000.0, 3000.0]], atol=0.1)
+        new_world_coordinates = sensor_model.image_to_world_batch(image_coordinates)
+        assert np.allclose(new_world_coordinates[:, 0:2], world_coordinates[:, 0:2], atol=1.0e-8)
+
     def test_sensor_model_builder_cscrna(self):
         from aws.osml.gdal.sensor_model_factory import SensorModelFactory
         from aws.osml.photogrammetry.projective_sensor_model import ProjectiveSensorModel
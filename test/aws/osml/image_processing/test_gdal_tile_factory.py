@@ -7,6 +7,7 @@ from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
 from osgeo import gdal, gdalconst
 
 from aws.osml.gdal import GDALCompressionOptions, GDALImageFormats, RangeAdjustmentType, load_gdal_dataset
@@ -113,6 +114,33 @@ class TestGDALTileFactory(TestCase):
 
     # Test data here could be improved. We're reusing a nitf file for everything and just
     # testing a single raster scale
+    def test_precompute_tile_corners(self):
+        full_dataset, sensor_model = load_gdal_dataset("./test/data/small.ntf")
+        tile_factory = GDALTileFactory(full_dataset, sensor_model, GDALImageFormats.NITF, GDALCompressionOptions.NONE)
+
+        tile_windows = [[x, y, 64, 64] for y in range(0, 256, 64) for x in range(0, 256, 64)]
+        with patch.object(sensor_model, "image_to_world_batch", wraps=sensor_model.image_to_world_batch) as batch:
+            tile_factory.precompute_tile_corners(tile_windows)
+            assert batch.call_count == 1
+            # Adjacent tiles share corners so a 4x4 grid of tiles only has 5x5 unique corners
+            assert batch.call_args[0][0].shape == (25, 2)
+            igeolos = [tile_factory._create_new_igeolo(tile_window) for tile_window in tile_windows]
+            assert batch.call_count == 1
+
+        for tile_window, igeolo in zip(tile_windows, igeolos):
+            left_x, top_y, width, height = tile_window
+            expected_corners = [
+                [left_x, top_y],
+                [left_x + width, top_y],
+                [left_x + width, top_y + height],
+                [left_x, top_y + height],
+            ]
+            expected_igeolo = "".join(
+                sensor_model.image_to_world(ImageCoordinate(corner)).to_dms_string() for corner in expected_corners
+            )
+            assert igeolo == expected_igeolo
+            assert len(igeolo) == 60
+
     def test_create_gdal_translate_kwargs(self):
         full_dataset = gdal.Open("./test/data/GeogToWGS84GeoKey5.tif")
 
@@ -185,6 +213,78 @@ class TestGDALTileFactory(TestCase):
         encoded_tile_data = tile_factory.create_orthophoto_tile(geo_bbox=(0.0, 0.0, 0.01, 0.01), tile_size=(256, 256))
         assert encoded_tile_data is None
 
+    def test_create_orthophoto_tile_grid(self):
+        full_dataset, sensor_model = load_gdal_dataset("./test/data/small.ntf")
+        tile_factory = GDALTileFactory(
+            full_dataset,
+            sensor_model,
+            GDALImageFormats.PNG,
+            GDALCompressionOptions.NONE,
+            output_type=gdalconst.GDT_Byte,
+            range_adjustment=RangeAdjustmentType.DRA,
+            orthophoto_grid_size=5,
+            orthophoto_pixel_tolerance=0.5,
+        )
+        image_corners = [[0, 0], [full_dataset.RasterXSize, full_dataset.RasterYSize]]
+        world_corners = [sensor_model.image_to_world(ImageCoordinate(corner)) for corner in image_corners]
+        min_lon = min(world_corner.longitude for world_corner in world_corners)
+        max_lon = max(world_corner.longitude for world_corner in world_corners)
+        min_lat = min(world_corner.latitude for world_corner in world_corners)
+        max_lat = max(world_corner.latitude for world_corner in world_corners)
+
+        with patch.object(sensor_model, "image_to_world", wraps=sensor_model.image_to_world) as image_to_world, patch.object(
+            sensor_model, "world_to_image", wraps=sensor_model.world_to_image
+        ) as world_to_image:
+            for geo_bbox in [(min_lon, min_lat, max_lon, max_lat), (min_lon, min_lat, max_lon, (min_lat + max_lat) / 2)]:
+                encoded_tile_data = tile_factory.create_orthophoto_tile(geo_bbox=geo_bbox, tile_size=(256, 128))
+                temp_ds_name = "/vsimem/" + token_hex(16) + ".PNG"
+                gdal.FileFromMemBuffer(temp_ds_name, encoded_tile_data)
+                tile_dataset = gdal.Open(temp_ds_name)
+                assert tile_dataset.RasterXSize == 256
+                assert tile_dataset.RasterYSize == 128
+                gdal.Unlink(temp_ds_name)
+
+            # The default elevation is computed once and the control grid is transformed in batches
+            assert image_to_world.call_count == 1
+            assert world_to_image.call_count == 0
+
+        with pytest.raises(ValueError):
+            GDALTileFactory(full_dataset, sensor_model, GDALImageFormats.PNG, orthophoto_grid_size=1)
+
+    def test_create_orthophoto_tile_with_elevation_model(self):
+        from aws.osml.photogrammetry import ConstantElevationModel
+
+        full_dataset, sensor_model = load_gdal_dataset("./test/data/small.ntf")
+        elevation_model = ConstantElevationModel(100.0)
+        tile_factory = GDALTileFactory(
+            full_dataset,
+            sensor_model,
+            GDALImageFormats.PNG,
+            GDALCompressionOptions.NONE,
+            output_type=gdalconst.GDT_Byte,
+            range_adjustment=RangeAdjustmentType.DRA,
+            elevation_model=elevation_model,
+        )
+        # The control grid follows the terrain unless a different tolerance is requested
+        assert tile_factory.orthophoto_pixel_tolerance == 1.0
+
+        image_corners = [[0, 0], [full_dataset.RasterXSize, full_dataset.RasterYSize]]
+        world_corners = [sensor_model.image_to_world(ImageCoordinate(corner)) for corner in image_corners]
+        geo_bbox = (
+            min(world_corner.longitude for world_corner in world_corners),
+            min(world_corner.latitude for world_corner in world_corners),
+            max(world_corner.longitude for world_corner in world_corners),
+            max(world_corner.latitude for world_corner in world_corners),
+        )
+        with patch.object(elevation_model, "set_elevations", wraps=elevation_model.set_elevations) as set_elevations:
+            encoded_tile_data = tile_factory.create_orthophoto_tile(geo_bbox=geo_bbox, tile_size=(256, 256))
+            assert encoded_tile_data is not None
+
+            # The elevations of the initial grid are looked up in one batch
+            world_coordinates = set_elevations.call_args_list[0][0][0]
+            assert world_coordinates.shape == (9, 3)
+            assert np.all(world_coordinates[:, 2] == 100.0)
+
     def test_create_map_tiles_for_image(self):
         tile_set_id = "WebMercatorQuad"
         tile_set = MapTileSetFactory.get_for_id(tile_set_id)
@@ -225,6 +325,62 @@ class TestGDALTileFactory(TestCase):
                 assert tile_dataset.RasterYSize == 256
                 assert tile_dataset.GetDriver().ShortName == GDALImageFormats.PNG
 
+    def test_create_orthophoto_meta_tile(self):
+        tile_set = MapTileSetFactory.get_for_id("WebMercatorQuad")
+        full_dataset, sensor_model = load_gdal_dataset("./test/data/small.ntf")
+        tile_factory = GDALTileFactory(
+            full_dataset,
+            sensor_model,
+            GDALImageFormats.PNG,
+            GDALCompressionOptions.NONE,
+            output_type=gdalconst.GDT_Byte,
+            range_adjustment=RangeAdjustmentType.DRA,
+        )
+
+        tile_matrix = 14
+        image_corners = [
+            ImageCoordinate(coord)
+            for coord in [
+                [0, 0],
+                [full_dataset.RasterXSize, 0],
+                [full_dataset.RasterXSize, full_dataset.RasterYSize],
+                [0, full_dataset.RasterYSize],
+            ]
+        ]
+        world_corners = [sensor_model.image_to_world(image_coordinate) for image_coordinate in image_corners]
+        min_col, min_row, max_col, max_row = tile_set.get_tile_matrix_limits_for_area(
+            boundary_coordinates=world_corners, tile_matrix=tile_matrix
+        )
+        map_tiles = [
+            [
+                tile_set.get_tile(MapTileId(tile_matrix=tile_matrix, tile_row=tile_row, tile_col=tile_col))
+                for tile_col in range(min_col, max_col + 1)
+            ]
+            for tile_row in range(min_row, max_row + 1)
+        ]
+
+        with patch.object(
+            tile_factory, "_read_from_rlevel_as_array", wraps=tile_factory._read_from_rlevel_as_array
+        ) as read_from_rlevel:
+            encoded_tiles = tile_factory.create_orthophoto_meta_tile(map_tiles)
+            # The source pixels for the entire block are read once
+            assert read_from_rlevel.call_count == 1
+
+        assert len(encoded_tiles) == len(map_tiles) * len(map_tiles[0])
+        for tile_row in map_tiles:
+            for map_tile in tile_row:
+                encoded_tile_data = encoded_tiles[map_tile.id]
+                assert encoded_tile_data is not None
+                temp_ds_name = "/vsimem/" + token_hex(16) + ".PNG"
+                gdal.FileFromMemBuffer(temp_ds_name, encoded_tile_data)
+                tile_dataset = gdal.Open(temp_ds_name)
+                assert tile_dataset.RasterXSize == 256
+                assert tile_dataset.RasterYSize == 256
+                gdal.Unlink(temp_ds_name)
+
+        with pytest.raises(ValueError):
+            tile_factory.create_orthophoto_meta_tile([map_tiles[0], map_tiles[0][:1]])
+
     def test_create_map_tiles_for_color_image(self):
         tile_set_id = "WebMercatorQuad"
         tile_set = MapTileSetFactory.get_for_id(tile_set_id)
@@ -0,0 +1,201 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import os
+import sqlite3
+import tempfile
+from unittest import TestCase
+
+import pytest
+
+from aws.osml.image_processing import MapTileId, MBTilesMapTileSink, PMTilesMapTileSink
+
+
+class TestMBTilesMapTileSink(TestCase):
+    def test_write_tiles(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "tiles.mbtiles")
+            with MBTilesMapTileSink(file_path, metadata={"name": "sample"}, batch_size=2) as sink:
+                sink.write_tile(MapTileId(tile_matrix=10, tile_row=578, tile_col=856), b"tile")
+                sink.write_tile(MapTileId(tile_matrix=10, tile_row=578, tile_col=857), b"empty")
+                sink.write_tile(MapTileId(tile_matrix=10, tile_row=579, tile_col=857), b"empty")
+
+            connection = sqlite3.connect(file_path)
+            assert dict(connection.execute("SELECT name, value FROM metadata").fetchall()) == {
+                "format": "png",
+                "name": "sample",
+            }
+            tiles = connection.execute(
+                "SELECT zoom_level, tile_column, tile_row, tile_data FROM tiles ORDER BY tile_column, tile_row"
+            ).fetchall()
+            assert tiles == [(10, 856, 578, b"tile"), (10, 857, 578, b"empty"), (10, 857, 579, b"empty")]
+
+            # Tiles with the same contents share a single image
+            assert connection.execute("SELECT COUNT(*) FROM images").fetchone()[0] == 2
+            connection.close()
+
+    def test_append(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "tiles.mbtiles")
+            for deduplicate in [True, False]:
+                with MBTilesMapTileSink(file_path, deduplicate=deduplicate) as sink:
+                    sink.write_tile(MapTileId(tile_matrix=3, tile_row=1, tile_col=2), b"first")
+                    sink.write_tile(MapTileId(tile_matrix=3, tile_row=1, tile_col=3), b"second")
+                with MBTilesMapTileSink(file_path, metadata={"name": "appended"}, append=True) as sink:
+                    sink.write_tile(MapTileId(tile_matrix=3, tile_row=1, tile_col=3), b"replaced")
+                    sink.write_tile(MapTileId(tile_matrix=3, tile_row=2, tile_col=3), b"third")
+
+                connection = sqlite3.connect(file_path)
+                tiles = connection.execute(
+                    "SELECT tile_column, tile_row, tile_data FROM tiles ORDER BY tile_column, tile_row"
+                ).fetchall()
+                assert tiles == [(2, 1, b"first"), (3, 1, b"replaced"), (3, 2, b"third")]
+                if deduplicate:
+                    # The image of the replaced tile is removed
+                    images = connection.execute("SELECT tile_data FROM images ORDER BY tile_data").fetchall()
+                    assert images == [(b"first",), (b"replaced",), (b"third",)]
+                assert dict(connection.execute("SELECT name, value FROM metadata").fetchall()) == {
+                    "format": "png",
+                    "name": "appended",
+                }
+                connection.close()
+
+            # Without append the file is replaced
+            with MBTilesMapTileSink(file_path) as sink:
+                sink.write_tile(MapTileId(tile_matrix=3, tile_row=0, tile_col=0), b"only")
+            connection = sqlite3.connect(file_path)
+            assert connection.execute("SELECT COUNT(*) FROM tiles").fetchone()[0] == 1
+            connection.close()
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            MBTilesMapTileSink(":memory:", batch_size=0)
+
+    def test_default_metadata(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "sample-area.mbtiles")
+            with MBTilesMapTileSink(file_path) as sink:
+                sink.write_tile(MapTileId(tile_matrix=3, tile_row=1, tile_col=2), b"first")
+                sink.write_tile(MapTileId(tile_matrix=3, tile_row=1, tile_col=2), b"second")
+
+            connection = sqlite3.connect(file_path)
+            assert dict(connection.execute("SELECT name, value FROM metadata").fetchall()) == {
+                "format": "png",
+                "name": "sample-area",
+            }
+            assert connection.execute("SELECT tile_data FROM images").fetchall() == [(b"second",)]
+            connection.close()
+
+
+class TestPMTilesMapTileSink(TestCase):
+    def test_tile_ids(self):
+        from aws.osml.image_processing.map_tile_archive import _zxy_to_pmtiles_tile_id
+
+        assert _zxy_to_pmtiles_tile_id(0, 0, 0) == 0
+        assert _zxy_to_pmtiles_tile_id(1, 0, 0) == 1
+        assert _zxy_to_pmtiles_tile_id(1, 0, 1) == 2
+        assert _zxy_to_pmtiles_tile_id(1, 1, 1) == 3
+        assert _zxy_to_pmtiles_tile_id(1, 1, 0) == 4
+        assert _zxy_to_pmtiles_tile_id(2, 0, 0) == 5
+
+        # Each zoom level is a Hilbert curve so consecutive ids are adjacent tiles
+        zoom = 4
+        tiles_by_id = {_zxy_to_pmtiles_tile_id(zoom, x, y): (x, y) for x in range(1 << zoom) for y in range(1 << zoom)}
+        assert sorted(tiles_by_id) == list(
+            range(_zxy_to_pmtiles_tile_id(zoom, 0, 0), _zxy_to_pmtiles_tile_id(zoom + 1, 0, 0))
+        )
+        tiles = [tiles_by_id[tile_id] for tile_id in sorted(tiles_by_id)]
+        for (x0, y0), (x1, y1) in zip(tiles[:-1], tiles[1:]):
+            assert abs(x1 - x0) + abs(y1 - y0) == 1
+
+        with pytest.raises(ValueError):
+            _zxy_to_pmtiles_tile_id(1, 2, 0)
+
+    def test_write_tiles(self):
+        from aws.osml.image_processing.map_tile_archive import (
+            _read_pmtiles_entries,
+            _read_pmtiles_header,
+            _zxy_to_pmtiles_tile_id,
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "tiles.pmtiles")
+            with PMTilesMapTileSink(file_path, metadata={"name": "sample"}) as sink:
+                for tile_col in range(4):
+                    for tile_row in range(4):
+                        tile_data = b"empty" if tile_col < 2 else f"tile {tile_col} {tile_row}".encode()
+                        sink.write_tile(MapTileId(tile_matrix=2, tile_row=tile_row, tile_col=tile_col), tile_data)
+                sink.write_tile(MapTileId(tile_matrix=1, tile_row=1, tile_col=0), b"empty")
+
+            with open(file_path, "rb") as archive:
+                header = _read_pmtiles_header(archive)
+                assert header["clustered"] == 1
+                assert header["tile_type"] == 2
+                assert (header["min_zoom"], header["max_zoom"]) == (1, 2)
+                assert header["addressed_tiles_count"] == 17
+                assert header["tile_contents_count"] == 9
+                # The empty tiles at the western half of zoom 2 follow the Hilbert curve so they form a single run
+                assert header["tile_entries_count"] == 10
+                assert (header["min_lon_e7"], header["max_lon_e7"]) == (-1800000000, 1800000000)
+
+                tiles = {}
+                entries = _read_pmtiles_entries(archive, header)
+                assert [entry.tile_id for entry in entries] == sorted(entry.tile_id for entry in entries)
+                for entry in entries:
+                    archive.seek(header["tile_data_offset"] + entry.offset)
+                    tile_data = archive.read(entry.length)
+                    for tile_id in range(entry.tile_id, entry.tile_id + entry.run_length):
+                        tiles[tile_id] = tile_data
+
+            # PMTiles rows are numbered from the north
+            assert tiles[_zxy_to_pmtiles_tile_id(2, 3, 0)] == b"tile 3 3"
+            assert tiles[_zxy_to_pmtiles_tile_id(2, 2, 3)] == b"tile 2 0"
+            assert tiles[_zxy_to_pmtiles_tile_id(1, 0, 0)] == b"empty"
+
+    def test_append(self):
+        from aws.osml.image_processing.map_tile_archive import _read_pmtiles_entries, _read_pmtiles_header
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "tiles.pmtiles")
+            with PMTilesMapTileSink(file_path, metadata={"name": "sample"}) as sink:
+                sink.write_tile(MapTileId(tile_matrix=3, tile_row=1, tile_col=2), b"first")
+                sink.write_tile(MapTileId(tile_matrix=3, tile_row=1, tile_col=3), b"second")
+            with PMTilesMapTileSink(file_path, metadata={"attribution": "test"}, append=True) as sink:
+                assert sink.metadata == {"name": "sample", "attribution": "test"}
+                sink.write_tile(MapTileId(tile_matrix=3, tile_row=1, tile_col=3), b"replaced")
+                sink.write_tile(MapTileId(tile_matrix=5, tile_row=1, tile_col=3), b"third")
+
+            with open(file_path, "rb") as archive:
+                header = _read_pmtiles_header(archive)
+                assert (header["min_zoom"], header["max_zoom"]) == (3, 5)
+                assert header["addressed_tiles_count"] == 3
+                contents = set()
+                for entry in _read_pmtiles_entries(archive, header):
+                    archive.seek(header["tile_data_offset"] + entry.offset)
+                    contents.add(archive.read(entry.length))
+                assert contents == {b"first", b"replaced", b"third"}
+
+    def test_leaf_directories(self):
+        import gzip
+
+        from aws.osml.image_processing.map_tile_archive import (
+            _PMTILES_MAX_ROOT_DIRECTORY_LENGTH,
+            _build_pmtiles_directories,
+            _deserialize_pmtiles_directory,
+            _PMTilesEntry,
+        )
+
+        entries = [_PMTilesEntry(tile_id * 3, tile_id * 1000, 100 + tile_id % 997, 1) for tile_id in range(50000)]
+        root_directory, leaf_directories = _build_pmtiles_directories(entries)
+        assert len(root_directory) <= _PMTILES_MAX_ROOT_DIRECTORY_LENGTH
+        root_entries = _deserialize_pmtiles_directory(gzip.decompress(root_directory))
+        assert all(entry.run_length == 0 for entry in root_entries)
+
+        leaf_entries = []
+        for root_entry in root_entries:
+            leaf_directory = leaf_directories[root_entry.offset : root_entry.offset + root_entry.length]
+            leaf_entries.extend(_deserialize_pmtiles_directory(gzip.decompress(leaf_directory)))
+        assert leaf_entries == entries
+
+    def test_invalid_format(self):
+        with pytest.raises(ValueError):
+            PMTilesMapTileSink("tiles.pmtiles", tile_format="tiff")
@@ -0,0 +1,151 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+from unittest import TestCase
+
+import cv2
+import numpy as np
+import pytest
+
+from aws.osml.gdal import load_gdal_dataset
+from aws.osml.image_processing import CallbackMapTileSink, MapTileId, MapTilePyramidGenerator, MapTileSetFactory
+
+
+class TestMapTilePyramidGenerator(TestCase):
+    def test_generate(self):
+        tile_set = MapTileSetFactory.get_for_id("WebMercatorQuad")
+        generator = MapTilePyramidGenerator("./test/data/small.ntf", tile_set, 11, 14, max_workers=2, meta_tile_size=2)
+
+        tiles = {}
+        num_tiles = generator.generate(CallbackMapTileSink(lambda tile_id, tile_data: tiles.update({tile_id: tile_data})))
+        assert num_tiles == len(tiles)
+        assert {tile_id.tile_matrix for tile_id in tiles} == {11, 12, 13, 14}
+
+        # Every tile has a parent in the next less detailed tile matrix
+        for tile_id in tiles:
+            if tile_id.tile_matrix > 11:
+                parent_id = MapTileId(
+                    tile_matrix=tile_id.tile_matrix - 1, tile_row=tile_id.tile_row // 2, tile_col=tile_id.tile_col // 2
+                )
+                assert parent_id in tiles
+
+        for tile_data in tiles.values():
+            tile_pixels = cv2.imdecode(np.frombuffer(tile_data, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+            assert tile_pixels.shape == (256, 256, 4)
+            assert np.any(tile_pixels[..., 3] > 0)
+
+    def test_generate_holds_few_tiles(self):
+        from unittest.mock import MagicMock, patch
+
+        import aws.osml.image_processing.gdal_tile_factory as gdal_tile_factory
+        import aws.osml.image_processing.map_tile_pyramid as map_tile_pyramid
+        from aws.osml.photogrammetry import GeodeticWorldCoordinate, SensorModel
+
+        # A 3000x3000 pixel image with ~1m pixels covers a few hundred tiles in tile matrix 17
+        width = height = 3000
+        origin = np.radians([10.0, 45.0])
+        pixel_size = np.radians(0.00001)
+        pixels = (120 + 80 * np.sin(np.add.outer(np.arange(height) / 300.0, np.arange(width) / 450.0))).astype(np.uint8)
+
+        def image_to_world_batch(image_coordinates, elevation_model=None, options=None):
+            image_coordinates = np.asarray(image_coordinates)
+            return np.column_stack(
+                (
+                    origin[0] + image_coordinates[:, 0] * pixel_size,
+                    origin[1] - image_coordinates[:, 1] * pixel_size,
+                    np.zeros(image_coordinates.shape[0]),
+                )
+            )
+
+        def world_to_image_batch(world_coordinates):
+            world_coordinates = np.asarray(world_coordinates)
+            return np.column_stack(
+                ((world_coordinates[:, 0] - origin[0]) / pixel_size, (origin[1] - world_coordinates[:, 1]) / pixel_size)
+            )
+
+        def load_dataset(image_path):
+            raster_dataset = MagicMock()
+            raster_dataset.RasterXSize = width
+            raster_dataset.RasterYSize = height
+            raster_dataset.RasterCount = 1
+            raster_dataset.GetRasterBand.return_value.GetOverviewCount.return_value = 0
+            sensor_model = MagicMock(SensorModel)
+            sensor_model.image_to_world_batch.side_effect = image_to_world_batch
+            sensor_model.world_to_image_batch.side_effect = world_to_image_batch
+            sensor_model.image_to_world.side_effect = lambda image_coordinate, elevation_model=None: GeodeticWorldCoordinate(
+                image_to_world_batch([image_coordinate.coordinate])[0]
+            )
+            return raster_dataset, sensor_model
+
+        # Keep the collections of finished tiles created by the generator so their contents can be checked
+        pending_parent_tiles = []
+        pending_parent_tiles_class = map_tile_pyramid._PendingParentTiles
+
+        def create_pending_parent_tiles(*args):
+            pending_parent_tiles.append(pending_parent_tiles_class(*args))
+            return pending_parent_tiles[-1]
+
+        tiles = {}
+        with patch.object(map_tile_pyramid, "load_gdal_dataset", side_effect=load_dataset), patch.object(
+            gdal_tile_factory, "get_type_and_scales", return_value=(1, [[0, 255, 0, 255]])
+        ), patch.object(
+            gdal_tile_factory.GDALTileFactory,
+            "_read_from_rlevel_as_array",
+            lambda self, bbox, r_level: pixels[bbox[1] : bbox[3], bbox[0] : bbox[2]],
+        ), patch.object(
+            gdal_tile_factory.GDALTileFactory, "_normalize_image_for_display", lambda self, image: image
+        ), patch.object(
+            map_tile_pyramid, "_PendingParentTiles", side_effect=create_pending_parent_tiles
+        ):
+            tile_set = MapTileSetFactory.get_for_id("WebMercatorQuad")
+            generator = MapTilePyramidGenerator("./image.tif", tile_set, 12, 17, max_workers=2, meta_tile_size=2)
+            num_tiles = generator.generate(
+                CallbackMapTileSink(lambda tile_id, tile_data: tiles.update({tile_id: tile_data}))
+            )
+
+        assert num_tiles == len(tiles)
+        assert len([tile_id for tile_id in tiles if tile_id.tile_matrix == 17]) > 100
+        for tile_id in tiles:
+            if tile_id.tile_matrix > 12:
+                assert map_tile_pyramid._get_parent_id(tile_id) in tiles
+
+        # Only a few siblings in each tile matrix wait for the rest of their parent's tiles to be finished
+        assert len(pending_parent_tiles) == 1
+        assert 0 < pending_parent_tiles[0].max_held_tiles <= 3 * (17 - 12)
+        assert pending_parent_tiles[0].num_held_tiles == 0
+        assert not pending_parent_tiles[0].children
+
+    def test_meta_tiles_cover_footprint(self):
+        from aws.osml.photogrammetry import ImageCoordinate
+
+        tile_set = MapTileSetFactory.get_for_id("WebMercatorQuad")
+        generator = MapTilePyramidGenerator("./test/data/small.ntf", tile_set, 14, 14, meta_tile_size=2)
+        full_dataset, sensor_model = load_gdal_dataset("./test/data/small.ntf")
+        footprint_coordinates = [
+            sensor_model.image_to_world(ImageCoordinate(corner))
+            for corner in [
+                [0, 0],
+                [full_dataset.RasterXSize, 0],
+                [full_dataset.RasterXSize, full_dataset.RasterYSize],
+                [0, full_dataset.RasterYSize],
+            ]
+        ]
+        meta_tiles = generator.get_meta_tiles(footprint_coordinates, 14)
+        tile_ids = [map_tile.id for meta_tile in meta_tiles for tile_row in meta_tile for map_tile in tile_row]
+        assert len(tile_ids) == len(set(tile_ids))
+        for meta_tile in meta_tiles:
+            assert len(meta_tile) <= 2 and len(meta_tile[0]) <= 2
+            # Rows are ordered from north to south
+            assert [tile_row[0].bounds[3] for tile_row in meta_tile] == sorted(
+                [tile_row[0].bounds[3] for tile_row in meta_tile], reverse=True
+            )
+
+        # Every corner of the image is in one of the tiles
+        for coordinate in footprint_coordinates:
+            assert tile_set.get_tile_for_location(coordinate, 14).id in tile_ids
+
+    def test_invalid_options(self):
+        tile_set = MapTileSetFactory.get_for_id("WebMercatorQuad")
+        with pytest.raises(ValueError):
+            MapTilePyramidGenerator("./test/data/small.ntf", tile_set, 14, 10)
+        with pytest.raises(ValueError):
+            MapTilePyramidGenerator("./test/data/small.ntf", tile_set, 10, 14, meta_tile_size=0)
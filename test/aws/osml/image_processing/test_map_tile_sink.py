@@ -0,0 +1,22 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import os
+import tempfile
+from unittest import TestCase
+
+from aws.osml.image_processing import CallbackMapTileSink, DirectoryMapTileSink, MapTileId
+
+
+class TestMapTileSink(TestCase):
+    def test_directory_sink(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with DirectoryMapTileSink(temp_dir) as sink:
+                sink.write_tile(MapTileId(tile_matrix=10, tile_row=578, tile_col=856), b"tile")
+            with open(os.path.join(temp_dir, "10", "856", "578.png"), "rb") as tile_file:
+                assert tile_file.read() == b"tile"
+
+    def test_callback_sink(self):
+        tiles = {}
+        with CallbackMapTileSink(lambda tile_id, tile_data: tiles.update({tile_id: tile_data})) as sink:
+            sink.write_tile(MapTileId(tile_matrix=3, tile_row=1, tile_col=2), b"tile")
+        assert tiles == {MapTileId(tile_matrix=3, tile_row=1, tile_col=2): b"tile"}
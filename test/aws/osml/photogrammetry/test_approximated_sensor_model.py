@@ -0,0 +1,125 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import unittest
+from math import radians
+
+import numpy as np
+
+
+class TestApproximatedSensorModel(unittest.TestCase):
+    def setUp(self):
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate, ImageCoordinate
+        from aws.osml.photogrammetry.projective_sensor_model import ProjectiveSensorModel
+
+        # A perspective (non-affine) projection so the interpolated results are not exact
+        self.inner_sensor_model = ProjectiveSensorModel(
+            [
+                GeodeticWorldCoordinate([radians(10.0), radians(30.0), 0.0]),
+                GeodeticWorldCoordinate([radians(20.0), radians(30.0), 0.0]),
+                GeodeticWorldCoordinate([radians(19.0), radians(11.0), 0.0]),
+                GeodeticWorldCoordinate([radians(11.0), radians(10.0), 0.0]),
+            ],
+            [
+                ImageCoordinate([0.0, 0.0]),
+                ImageCoordinate([1000.0, 0.0]),
+                ImageCoordinate([1000.0, 800.0]),
+                ImageCoordinate([0.0, 800.0]),
+            ],
+        )
+
+    def test_approximated_sensor_model(self):
+        from aws.osml.photogrammetry.approximated_sensor_model import ApproximatedSensorModel
+        from aws.osml.photogrammetry.coordinates import ImageCoordinate
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+
+        elevation_model = ConstantElevationModel(42.0)
+        sensor_model = ApproximatedSensorModel(
+            self.inner_sensor_model, 1000, 800, elevation_model=elevation_model, grid_spacing=20.0, cell_size=8
+        )
+        assert len(sensor_model.image_cell_cache) == 0
+
+        image_coordinates = np.array([[0.0, 0.0], [500.5, 400.25], [999.0, 10.0], [1000.0, 800.0], [123.4, 567.8]])
+        world_coordinates = sensor_model.image_to_world_batch(image_coordinates, elevation_model=elevation_model)
+        expected_world_coordinates = self.inner_sensor_model.image_to_world_batch(
+            image_coordinates, elevation_model=elevation_model
+        )
+        assert np.allclose(world_coordinates, expected_world_coordinates, atol=1.0e-7)
+        assert 0.0 < sensor_model.max_image_to_world_error < 0.01
+        assert 0 < len(sensor_model.image_cell_cache) < sensor_model.num_cell_rows * sensor_model.num_cell_columns
+
+        image_coordinate = sensor_model.world_to_image(
+            sensor_model.image_to_world(ImageCoordinate([500.5, 400.25]), elevation_model=elevation_model)
+        )
+        assert np.allclose(image_coordinate.coordinate, [500.5, 400.25], atol=0.01)
+        assert np.allclose(sensor_model.world_to_image_batch(expected_world_coordinates), image_coordinates, atol=0.01)
+        assert 0.0 < sensor_model.max_world_to_image_error < 0.01
+
+    def test_approximated_sensor_model_bilinear(self):
+        from aws.osml.photogrammetry.approximated_sensor_model import ApproximatedSensorModel
+
+        bilinear_sensor_model = ApproximatedSensorModel(self.inner_sensor_model, 1000, 800, interpolation_order=1)
+        bicubic_sensor_model = ApproximatedSensorModel(self.inner_sensor_model, 1000, 800, interpolation_order=3)
+        image_coordinates = np.random.default_rng(0).uniform([0.0, 0.0], [1000.0, 800.0], (100, 2))
+        expected_world_coordinates = self.inner_sensor_model.image_to_world_batch(image_coordinates)
+        for sensor_model in [bilinear_sensor_model, bicubic_sensor_model]:
+            world_coordinates = sensor_model.image_to_world_batch(image_coordinates)
+            assert np.allclose(world_coordinates, expected_world_coordinates, atol=1.0e-4)
+        assert bicubic_sensor_model.max_image_to_world_error < bilinear_sensor_model.max_image_to_world_error
+
+    def test_approximated_sensor_model_cell_eviction(self):
+        from aws.osml.photogrammetry.approximated_sensor_model import ApproximatedSensorModel
+
+        sensor_model = ApproximatedSensorModel(
+            self.inner_sensor_model, 1000, 800, grid_spacing=10.0, cell_size=10, cell_cache_size=2
+        )
+        image_coordinates = np.array([[50.0, 50.0], [950.0, 50.0], [50.0, 750.0], [950.0, 750.0]])
+        world_coordinates = sensor_model.image_to_world_batch(image_coordinates)
+        assert len(sensor_model.image_cell_cache) == 2
+        assert np.allclose(world_coordinates, self.inner_sensor_model.image_to_world_batch(image_coordinates))
+
+    def test_approximated_sensor_model_fallback(self):
+        from aws.osml.photogrammetry.approximated_sensor_model import ApproximatedSensorModel
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+
+        sensor_model = ApproximatedSensorModel(self.inner_sensor_model, 1000, 800)
+
+        # Coordinates outside the image and requests using other elevation models go directly to the inner model
+        world_coordinates = sensor_model.image_to_world_batch(np.array([[-500.0, -500.0]]))
+        assert np.allclose(world_coordinates, self.inner_sensor_model.image_to_world_batch(np.array([[-500.0, -500.0]])))
+        world_coordinates = sensor_model.image_to_world_batch(
+            np.array([[500.0, 400.0]]), elevation_model=ConstantElevationModel(10.0)
+        )
+        assert np.allclose(world_coordinates[:, 2], 10.0)
+        assert len(sensor_model.image_cell_cache) == 0
+
+        outside_world_coordinates = np.array([[radians(50.0), radians(50.0), 0.0], [radians(15.0), radians(20.0), 1.0e6]])
+        assert np.allclose(
+            sensor_model.world_to_image_batch(outside_world_coordinates),
+            self.inner_sensor_model.world_to_image_batch(outside_world_coordinates),
+        )
+        assert len(sensor_model.world_cell_cache) == 0
+
+    def test_approximated_sensor_model_without_elevation_model(self):
+        from aws.osml.photogrammetry.approximated_sensor_model import ApproximatedSensorModel
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+
+        sensor_model = ApproximatedSensorModel(
+            self.inner_sensor_model, 1000, 800, elevation_model=ConstantElevationModel(42.0)
+        )
+
+        # Requests without an elevation model are not silently given the grid's elevation model
+        image_coordinates = np.array([[500.0, 400.0], [123.4, 567.8]])
+        world_coordinates = sensor_model.image_to_world_batch(image_coordinates)
+        assert np.allclose(world_coordinates, self.inner_sensor_model.image_to_world_batch(image_coordinates))
+        assert np.allclose(world_coordinates[:, 2], 0.0)
+        assert len(sensor_model.image_cell_cache) == 0
+
+        world_coordinates = sensor_model.image_to_world_batch(
+            image_coordinates, elevation_model=sensor_model.elevation_model
+        )
+        assert np.allclose(world_coordinates[:, 2], 42.0)
+        assert len(sensor_model.image_cell_cache) > 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -62,6 +62,58 @@ class TestChippedImageSensorModel(unittest.TestCase):
         new_image_coordinate = sensor_model.world_to_image(world_coordinate)
         assert np.allclose(image_coordinate.coordinate, new_image_coordinate.coordinate)
 
+        # Test the batch versions of the transforms
+        world_coordinates = sensor_model.image_to_world_batch(
+            np.array([[2.0, 2.0], [0.0, 5.0]]), elevation_model=elevation_model
+        )
+        assert np.allclose(world_coordinates, np.array([[14.0, 14.0, 42.0], [10.0, 20.0, 42.0]]))
+        assert np.allclose(sensor_model.world_to_image_batch(world_coordinates), np.array([[2.0, 2.0], [0.0, 5.0]]))
+
+    def test_chip_of_chip(self):
+        from aws.osml.photogrammetry.chipped_image_sensor_model import ChippedImageSensorModel
+        from aws.osml.photogrammetry.coordinates import ImageCoordinate
+
+        full_image_sensor_model = FakeSensorModel()
+        # The first chip is the 100x100 region at (10, 10) reduced by half
+        first_chip = ChippedImageSensorModel(
+            [
+                ImageCoordinate([10.0, 10.0]),
+                ImageCoordinate([110.0, 10.0]),
+                ImageCoordinate([110.0, 110.0]),
+                ImageCoordinate([10.0, 110.0]),
+            ],
+            [
+                ImageCoordinate([0.0, 0.0]),
+                ImageCoordinate([50.0, 0.0]),
+                ImageCoordinate([50.0, 50.0]),
+                ImageCoordinate([0.0, 50.0]),
+            ],
+            full_image_sensor_model,
+        )
+        # The second chip is the 20x20 region at (5, 5) of the first chip
+        second_chip = ChippedImageSensorModel(
+            [
+                ImageCoordinate([5.0, 5.0]),
+                ImageCoordinate([25.0, 5.0]),
+                ImageCoordinate([25.0, 25.0]),
+                ImageCoordinate([5.0, 25.0]),
+            ],
+            [
+                ImageCoordinate([0.0, 0.0]),
+                ImageCoordinate([20.0, 0.0]),
+                ImageCoordinate([20.0, 20.0]),
+                ImageCoordinate([0.0, 20.0]),
+            ],
+            first_chip,
+        )
+
+        # The chain of chips collapses into a single transform from the original image
+        assert second_chip.full_image_sensor_model is full_image_sensor_model
+        world_coordinate = second_chip.image_to_world(ImageCoordinate([2.0, 4.0]))
+        assert np.allclose(world_coordinate.coordinate, [24.0, 28.0, 0.0])
+        assert np.allclose(second_chip.world_to_image(world_coordinate).coordinate, [2.0, 4.0])
+        assert np.allclose(second_chip.image_to_world_batch([[2.0, 4.0], [0.0, 0.0]])[:, 0:2], [[24.0, 28.0], [20.0, 20.0]])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -30,6 +30,28 @@ class TestConditionalElevationModel(unittest.TestCase):
         assert world_coordinate.latitude == 2
         assert world_coordinate.elevation == 10.0
 
+    def test_true_false_batch(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.conditional_elevation_model import ConditionalElevationModel
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+        from aws.osml.photogrammetry.em_condition import EMConditionFalse, EMConditionTrue
+
+        inner_elevation_model = ConstantElevationModel(10.0)
+        elevation_model_false = ConditionalElevationModel(
+            inner_elevation_model=inner_elevation_model,
+            em_condition=EMConditionFalse(),
+        )
+        elevation_model_true = ConditionalElevationModel(
+            inner_elevation_model=inner_elevation_model,
+            em_condition=EMConditionTrue(),
+        )
+        world_coordinates = np.array([[1.0, 2.0, 0.0], [1.1, 2.1, 0.0]])
+        assert not elevation_model_false.set_elevations(world_coordinates).any()
+        assert np.array_equal(world_coordinates[:, 2], [0.0, 0.0])
+        assert elevation_model_true.set_elevations(world_coordinates).all()
+        assert np.array_equal(world_coordinates[:, 2], [10.0, 10.0])
+
 
 if __name__ == "__main__":
     unittest.main()
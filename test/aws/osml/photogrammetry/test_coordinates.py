@@ -216,6 +216,181 @@ class TestCoordinates(unittest.TestCase):
         assert ecef_world_coordinate.y == pytest.approx(547501.0, abs=1.0)
         assert ecef_world_coordinate.z == pytest.approx(1100249.0, abs=1.0)
 
+    def test_geocentric_conversions_match_pyproj(self):
+        import numpy as np
+        from pyproj.enums import TransformDirection
+
+        from aws.osml.photogrammetry.coordinates import (
+            GEODETIC_TO_GEOCENTRIC_TRANSFORM,
+            GeodeticWorldCoordinate,
+            WorldCoordinate,
+            geocentric_to_geodetic,
+            geocentric_to_geodetic_array,
+            geodetic_to_geocentric,
+            geodetic_to_geocentric_array,
+        )
+
+        rng = np.random.default_rng(0)
+        geodetic_coordinates = np.column_stack(
+            (
+                rng.uniform(-np.pi, np.pi, 1000),
+                rng.uniform(-np.pi / 2, np.pi / 2, 1000),
+                rng.uniform(-500.0, 10000.0, 1000),
+            )
+        )
+        geodetic_coordinates[:2, 1] = [np.pi / 2, -np.pi / 2]
+        expected_ecef = np.column_stack(GEODETIC_TO_GEOCENTRIC_TRANSFORM.transform(*geodetic_coordinates.T, radians=True))
+        ecef_coordinates = geodetic_to_geocentric_array(geodetic_coordinates)
+        assert np.allclose(ecef_coordinates, expected_ecef, rtol=0.0, atol=1.0e-4)
+
+        expected_geodetic = np.column_stack(
+            GEODETIC_TO_GEOCENTRIC_TRANSFORM.transform(*expected_ecef.T, radians=True, direction=TransformDirection.INVERSE)
+        )
+        round_trip = geocentric_to_geodetic_array(ecef_coordinates)
+        # 1e-10 radians is less than a millimeter on the surface of the Earth
+        assert np.allclose(round_trip[2:, 0], expected_geodetic[2:, 0], rtol=0.0, atol=1.0e-10)
+        assert np.allclose(round_trip[:, 1], expected_geodetic[:, 1], rtol=0.0, atol=1.0e-10)
+        assert np.allclose(round_trip[:, 2], expected_geodetic[:, 2], rtol=0.0, atol=1.0e-4)
+        assert np.allclose(round_trip[2:], geodetic_coordinates[2:], rtol=0.0, atol=1.0e-6)
+
+        for index in range(0, 1000, 97):
+            ecef_coordinate = geodetic_to_geocentric(GeodeticWorldCoordinate(geodetic_coordinates[index]))
+            assert np.allclose(ecef_coordinate.coordinate, ecef_coordinates[index], rtol=0.0, atol=1.0e-6)
+            geodetic_coordinate = geocentric_to_geodetic(WorldCoordinate(ecef_coordinates[index]))
+            assert np.allclose(geodetic_coordinate.coordinate, round_trip[index], rtol=0.0, atol=1.0e-9)
+
+        # Points in orbit, such as the SAR aperture reference points, are also converted exactly
+        orbit_coordinates = geodetic_coordinates.copy()
+        orbit_coordinates[:, 2] = 7.0e5
+        assert np.allclose(
+            geocentric_to_geodetic_array(geodetic_to_geocentric_array(orbit_coordinates))[2:],
+            orbit_coordinates[2:],
+            rtol=0.0,
+            atol=1.0e-6,
+        )
+
+    def test_ecef_origin_to_geodetic(self):
+        import warnings
+
+        import numpy as np
+
+        from aws.osml.photogrammetry.coordinates import WorldCoordinate, geocentric_to_geodetic, geocentric_to_geodetic_array
+
+        # The center of the Earth has no defined latitude or elevation
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            geodetic_world_coordinate = geocentric_to_geodetic(WorldCoordinate([0.0, 0.0, 0.0]))
+            geodetic_coordinates = geocentric_to_geodetic_array(
+                np.array([[0.0, 0.0, 0.0], [6257968.0, 547501.0, 1100249.0]])
+            )
+        assert geodetic_world_coordinate.longitude == 0.0
+        assert np.isnan(geodetic_world_coordinate.latitude)
+        assert np.isnan(geodetic_world_coordinate.elevation)
+        assert np.array_equal(geodetic_world_coordinate.coordinate, geodetic_coordinates[0], equal_nan=True)
+        assert geodetic_coordinates[1, 1] == pytest.approx(radians(10.0), abs=0.000001)
+
+    def test_geodetic_to_geocentric_jacobian(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.coordinates import geodetic_to_geocentric_array, geodetic_to_geocentric_jacobian
+
+        geodetic_coordinates = np.array([[radians(5.0), radians(10.0), 0.0], [radians(-120.0), radians(-45.0), 1500.0]])
+        jacobians = geodetic_to_geocentric_jacobian(geodetic_coordinates)
+        assert jacobians.shape == (2, 3, 3)
+
+        # Compare the closed form derivatives to central finite differences
+        deltas = [1.0e-7, 1.0e-7, 1.0]
+        for component, delta in enumerate(deltas):
+            offset = np.zeros(3)
+            offset[component] = delta
+            upper = geodetic_to_geocentric_array(geodetic_coordinates + offset)
+            lower = geodetic_to_geocentric_array(geodetic_coordinates - offset)
+            assert np.allclose(jacobians[:, :, component], (upper - lower) / (2.0 * delta), rtol=1.0e-6, atol=1.0e-3)
+
+    def test_normalize_geodetic_coordinates(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate, normalize_geodetic_coordinates
+
+        geodetic_coordinates = np.array(
+            [
+                [radians(0.0), radians(0.0), 1.0],
+                [radians(360.0), radians(0.0), 1.0],
+                [radians(1.0), radians(181.0), 1.0],
+                [radians(-700.0), radians(-91.0), 1.0],
+            ]
+        )
+        normalized_coordinates = normalize_geodetic_coordinates(geodetic_coordinates)
+        for geodetic_coordinate, normalized_coordinate in zip(geodetic_coordinates, normalized_coordinates):
+            expected = GeodeticWorldCoordinate(geodetic_coordinate).normalized()
+            assert np.allclose(expected.coordinate, normalized_coordinate)
+
+    def test_geodetic_world_coordinate_array(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate, GeodeticWorldCoordinateArray
+
+        coordinates = np.array(
+            [
+                [radians(-43.648601), radians(-22.999056), 42.0],
+                [radians(30.5), radians(1.5), 0.0],
+                [radians(1.0), radians(181.0), 1.0],
+            ]
+        )
+        coordinate_array = GeodeticWorldCoordinateArray(coordinates)
+        assert len(coordinate_array) == 3
+        assert coordinate_array.coordinates is coordinates
+        assert np.array_equal(coordinate_array.latitude, coordinates[:, 1])
+
+        coordinate_array.elevation = [1.0, 2.0, 3.0]
+        assert np.array_equal(coordinates[:, 2], [1.0, 2.0, 3.0])
+
+        # Indexing returns a copy of an individual coordinate while slices remain arrays
+        first = coordinate_array[0]
+        assert isinstance(first, GeodeticWorldCoordinate)
+        first.elevation = 100.0
+        assert coordinates[0, 2] == 1.0
+        assert isinstance(coordinate_array[1:], GeodeticWorldCoordinateArray)
+        assert len(coordinate_array[coordinate_array.longitude > 0]) == 2
+
+        round_trip = GeodeticWorldCoordinateArray.from_coordinates(list(coordinate_array))
+        assert np.array_equal(round_trip.coordinates, coordinates)
+
+        for format_spec in ["", "%ld%lm%ls%lH%od%om%os%oH", "%l %o %L %O %E %%", "dted/%oh%od/%lh%ld.dt2"]:
+            assert coordinate_array.format(format_spec) == [format(c, format_spec) for c in coordinate_array]
+        assert coordinate_array.to_dms_strings()[0] == "225956S0433854W"
+
+        normalized = coordinate_array.normalized()
+        adjusted = coordinate_array.range_adjusted(0.0, 2 * np.pi, -np.pi / 2, np.pi / 2)
+        for index, coordinate in enumerate(coordinate_array):
+            assert np.allclose(normalized.coordinates[index], coordinate.normalized().coordinate)
+            assert np.allclose(
+                adjusted.coordinates[index], coordinate.range_adjusted(0.0, 2 * np.pi, -np.pi / 2, np.pi / 2).coordinate
+            )
+
+        with pytest.raises(ValueError):
+            coordinate_array.range_adjusted(0.0, np.pi / 4, 0.0, np.pi / 4)
+
+    def test_image_coordinate_array(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.coordinates import ImageCoordinate, ImageCoordinateArray
+
+        coordinate_array = ImageCoordinateArray.from_coordinates([ImageCoordinate([1.0, 2.0]), ImageCoordinate([3.0, 4.0])])
+        assert np.array_equal(coordinate_array.c, [1.0, 3.0])
+        assert np.array_equal(coordinate_array.r, [2.0, 4.0])
+        assert np.array_equal(np.asarray(coordinate_array), [[1.0, 2.0], [3.0, 4.0]])
+        assert np.array_equal(coordinate_array[1].coordinate, [3.0, 4.0])
+
+        with pytest.raises(ValueError):
+            ImageCoordinateArray([[1.0, 2.0, 3.0]])
+
+    def test_coordinate_slots(self):
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate, ImageCoordinate, WorldCoordinate
+
+        for coordinate in [WorldCoordinate(), GeodeticWorldCoordinate(), ImageCoordinate()]:
+            assert not hasattr(coordinate, "__dict__")
+
 
 if __name__ == "__main__":
     unittest.main()
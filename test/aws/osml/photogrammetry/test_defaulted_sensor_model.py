@@ -78,3 +78,31 @@ class TestDefaultedSensorModel(unittest.TestCase):
         world_coordinate = GeodeticWorldCoordinate([20, 60, np.nan])
         image_coordinate = sensor_model.world_to_image(world_coordinate)
         assert np.allclose(image_coordinate.coordinate, [15, 20], atol=1e-6)
+
+    def test_nans_batch(self):
+        from unittest.mock import MagicMock, patch
+
+        from aws.osml.photogrammetry.defaulted_sensor_model import DefaultedSensorModel
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+
+        inner_sensor_model = MagicMock()
+        inner_sensor_model.world_to_image_batch.side_effect = lambda world_coordinates: world_coordinates[:, :2]
+        elevation_model = ConstantElevationModel(10)
+        sensor_model = DefaultedSensorModel(inner_sensor_model=inner_sensor_model, elevation_model=elevation_model)
+
+        world_coordinates = np.array([[0.1, 0.2, np.nan], [0.3, 0.4, 5.0], [0.5, 0.6, np.nan], [0.7, 0.8, np.nan]])
+        with patch.object(elevation_model, "set_elevations", wraps=elevation_model.set_elevations) as mock_set_elevations:
+            with patch.object(elevation_model, "set_elevation") as mock_set_elevation:
+                image_coordinates = sensor_model.world_to_image_batch(world_coordinates)
+
+        # All of the missing elevations are looked up with a single call and only those rows are updated
+        mock_set_elevations.assert_called_once()
+        mock_set_elevation.assert_not_called()
+        assert mock_set_elevations.call_args[0][0].shape == (3, 3)
+        updated_coordinates = inner_sensor_model.world_to_image_batch.call_args[0][0]
+        assert np.allclose(updated_coordinates[:, 2], [10.0, 5.0, 10.0, 10.0])
+        assert np.allclose(updated_coordinates[:, :2], world_coordinates[:, :2])
+        assert np.allclose(image_coordinates, world_coordinates[:, :2])
+
+        # The caller's coordinates are not modified
+        assert np.all(np.isnan(world_coordinates[[0, 2, 3], 2]))
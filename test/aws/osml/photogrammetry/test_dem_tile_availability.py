@@ -0,0 +1,40 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import os
+import tempfile
+import unittest
+
+
+class TestDEMTileAvailabilityIndex(unittest.TestCase):
+    def test_parse_cell(self):
+        from aws.osml.photogrammetry.dem_tile_availability import DEMTileAvailabilityIndex
+
+        assert DEMTileAvailabilityIndex.parse_cell("SRTM1N00E006V3") == (0, 6)
+        assert DEMTileAvailabilityIndex.parse_cell("SRTM1S56W180V3") == (-56, -180)
+        assert DEMTileAvailabilityIndex.parse_cell("n47_e034_3arc_v2.tif") == (47, 34)
+        assert DEMTileAvailabilityIndex.parse_cell("dted/w044/s23.dt2") == (-23, -44)
+        assert DEMTileAvailabilityIndex.parse_cell("115e/45s.dt2") == (-45, 115)
+        assert DEMTileAvailabilityIndex.parse_cell("README.txt") is None
+
+    def test_from_listing_file(self):
+        from aws.osml.photogrammetry.dem_tile_availability import DEMTileAvailabilityIndex
+
+        index = DEMTileAvailabilityIndex.from_listing_file("./test/data/SRTM1-list.txt")
+        assert len(index) == 14277
+        assert (0, 6) in index
+        assert (0, 0) not in index
+
+    def test_from_directory(self):
+        from aws.osml.photogrammetry.dem_tile_availability import DEMTileAvailabilityIndex
+
+        with tempfile.TemporaryDirectory() as tile_directory:
+            for tile_path in ["e030/n01.dt2", "w044/s23.dt2", "README.txt"]:
+                os.makedirs(os.path.dirname(os.path.join(tile_directory, tile_path)), exist_ok=True)
+                open(os.path.join(tile_directory, tile_path), "w").close()
+            index = DEMTileAvailabilityIndex.from_directory(tile_directory)
+
+        assert index.cells == {(1, 30), (-23, -44)}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+
+class TestDEMTileCache(unittest.TestCase):
+    def test_count_bounded(self):
+        from aws.osml.photogrammetry.dem_tile_cache import DEMTileCache
+
+        cache = DEMTileCache(2)
+        assert cache.get("a", lambda: 1) == 1
+        assert cache.get("b", lambda: 2) == 2
+        assert cache.get("a", lambda: -1) == 1
+        assert cache.get("c", lambda: 3) == 3
+
+        # The least recently used tile was evicted to make room for "c"
+        assert cache.get("b", lambda: 4) == 4
+        statistics = cache.statistics()
+        assert statistics.hits == 1
+        assert statistics.misses == 4
+        assert statistics.evictions == 2
+        assert statistics.tile_count == 2
+        assert len(cache) == 2
+
+    def test_byte_bounded(self):
+        from aws.osml.photogrammetry.dem_tile_cache import DEMTileCache
+
+        cache = DEMTileCache(1000, getsizeof=lambda value: value.nbytes)
+        cache.get("small", lambda: np.zeros(50))
+        cache.get("medium", lambda: np.zeros(60))
+        assert cache.statistics().current_size == 880
+        assert cache.statistics().evictions == 0
+
+        cache.get("another", lambda: np.zeros(20))
+        statistics = cache.statistics()
+        assert statistics.evictions == 1
+        assert statistics.current_size == 640
+
+        # Values larger than the entire cache are returned but not retained
+        assert cache.get("huge", lambda: np.zeros(200)).shape == (200,)
+        assert cache.statistics().tile_count == 2
+
+    def test_single_flight(self):
+        from aws.osml.photogrammetry.dem_tile_cache import DEMTileCache
+
+        cache = DEMTileCache(10)
+        load_started = threading.Event()
+        release_load = threading.Event()
+        load_count = []
+
+        def load():
+            load_count.append(1)
+            load_started.set()
+            release_load.wait(5)
+            return "tile"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(cache.get, "tile_path", load)
+            assert load_started.wait(5)
+            others = [executor.submit(cache.get, "tile_path", load) for _ in range(3)]
+            release_load.set()
+            results = [first.result(5)] + [other.result(5) for other in others]
+
+        assert results == ["tile"] * 4
+        assert len(load_count) == 1
+        assert cache.statistics().misses == 1
+        assert cache.statistics().hits == 3
+
+    def test_failed_load(self):
+        from aws.osml.photogrammetry.dem_tile_cache import DEMTileCache
+
+        cache = DEMTileCache(10)
+
+        def load():
+            raise RuntimeError("tile unavailable")
+
+        with pytest.raises(RuntimeError):
+            cache.get("tile_path", load)
+
+        # Failures are not cached so the next request tries again
+        assert cache.get("tile_path", lambda: "tile") == "tile"
+        assert cache.statistics().misses == 2
+
+    def test_missing_tiles(self):
+        from aws.osml.photogrammetry.dem_tile_cache import DEMTileCache
+
+        cache = DEMTileCache(1, is_missing=lambda value: value is None, missing_cache_size=2)
+        assert cache.get("tile", lambda: "tile") == "tile"
+
+        # Missing tiles are remembered without displacing the real tile
+        assert cache.get("missing_a", lambda: None) is None
+        assert cache.get("missing_b", lambda: None) is None
+        assert cache.get("missing_a", lambda: "unexpected") is None
+        assert cache.get("tile", lambda: "unexpected") == "tile"
+
+        statistics = cache.statistics()
+        assert statistics.hits == 1
+        assert statistics.misses == 3
+        assert statistics.missing_hits == 1
+        assert statistics.evictions == 0
+        assert statistics.tile_count == 1
+        assert statistics.missing_tile_count == 2
+
+    def test_peek(self):
+        from aws.osml.photogrammetry.dem_tile_cache import DEMTileCache
+
+        cache = DEMTileCache(max_size=2, is_missing=lambda value: value is None)
+        assert cache.peek("a") is None
+        cache.get("a", lambda: "A")
+        cache.get("b", lambda: None)
+        assert cache.peek("a") == "A"
+        assert cache.peek("b") is None
+        assert cache.peek("c") is None
+
+        statistics = cache.statistics()
+        assert statistics.hits == 1
+        assert statistics.missing_hits == 1
+        assert statistics.misses == 2
+
+    def test_invalid_size(self):
+        from aws.osml.photogrammetry.dem_tile_cache import DEMTileCache
+
+        with pytest.raises(ValueError):
+            DEMTileCache(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
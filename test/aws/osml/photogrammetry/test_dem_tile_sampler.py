@@ -0,0 +1,115 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import unittest
+from math import radians
+
+import mock
+import numpy as np
+import pytest
+
+
+class TestDEMTileSampler(unittest.TestCase):
+    def test_bilinear_matches_scipy(self):
+        from scipy.interpolate import RegularGridInterpolator
+
+        from aws.osml.photogrammetry.dem_tile_sampler import DEMTileSampler
+        from aws.osml.photogrammetry.sensor_model import SensorModel
+
+        rng = np.random.default_rng(42)
+        elevations = rng.uniform(-10.0, 100.0, size=(20, 30))
+        sampler = DEMTileSampler(elevations, mock.Mock(SensorModel))
+
+        x = rng.uniform(-2.0, 32.0, size=500)
+        y = rng.uniform(-2.0, 22.0, size=500)
+        scipy_interpolator = RegularGridInterpolator((np.arange(30), np.arange(20)), elevations.T)
+        expected = scipy_interpolator((np.clip(x, 0, 29), np.clip(y, 0, 19)))
+
+        assert np.allclose(sampler.interpolate(x, y), expected)
+        assert np.allclose(sampler(x, y, grid=False), expected)
+        assert sampler(x[0], y[0]).shape == (1, 1)
+        assert sampler(x[0:3], y[0:4]).shape == (3, 4)
+        for x_value, y_value, expected_value in zip(x[0:20], y[0:20], expected[0:20]):
+            geodetic_world_coordinate = mock.Mock()
+            sampler.sensor_model.world_to_image.return_value = mock.Mock(x=x_value, y=y_value)
+            assert sampler.elevation_at(geodetic_world_coordinate) == pytest.approx(expected_value)
+
+    def test_missing_posts(self):
+        from aws.osml.photogrammetry.dem_tile_sampler import DEMTileSampler
+        from aws.osml.photogrammetry.sensor_model import SensorModel
+
+        elevations = np.array([[0.0, 1.0, 4.0], [1.0, 2.0, 3.0], [2.0, 3.0, -9999]])
+        x = np.array([-1.0, 0.5, 1.0, 1.0, 1.5, 1.5, 2.5, 0.0, 2.0, np.nan])
+        y = np.array([-1.0, 0.5, 0.5, 1.5, 0.0, 1.5, 2.5, 0.0, 2.0, 1.0])
+
+        sampler = DEMTileSampler(elevations, mock.Mock(SensorModel), no_data_value=-9999)
+        assert np.allclose(
+            sampler.interpolate(x, y), [0.0, 1.0, 1.5, np.nan, 2.5, np.nan, np.nan, 0.0, np.nan, np.nan], equal_nan=True
+        )
+
+        # The no data value is treated as an ordinary elevation if it isn't being propagated
+        sampler = DEMTileSampler(elevations, mock.Mock(SensorModel), no_data_value=-9999, propagate_nans=False)
+        assert sampler.interpolate(1.5, 1.5) == pytest.approx((2.0 + 3.0 + 3.0 - 9999) / 4.0)
+
+    def test_integer_elevations_not_copied(self):
+        from aws.osml.photogrammetry.dem_tile_sampler import DEMTileSampler
+        from aws.osml.photogrammetry.sensor_model import SensorModel
+
+        # Tiles without missing posts are sampled in place so memory mapped tiles can be shared between processes
+        elevations = np.array([[0, 10, 20], [10, 20, 30], [20, 30, 40]], dtype=np.int16)
+        sampler = DEMTileSampler(elevations, mock.Mock(SensorModel), no_data_value=-32767)
+        assert np.shares_memory(sampler.elevations, elevations)
+        assert np.allclose(sampler.interpolate([0.5, 1.25], [0.5, 2.0]), [10.0, 32.5])
+
+        elevations[2, 2] = -32767
+        sampler = DEMTileSampler(elevations, mock.Mock(SensorModel), no_data_value=-32767)
+        assert not np.shares_memory(sampler.elevations, elevations)
+        assert np.isnan(sampler.interpolate(1.5, 1.5))
+
+    def test_bicubic(self):
+        from aws.osml.photogrammetry.dem_tile_sampler import DEMInterpolationMethod, DEMTileSampler
+        from aws.osml.photogrammetry.sensor_model import SensorModel
+
+        # Cubic convolution reproduces a quadratic surface exactly away from the tile edges
+        rows, columns = np.mgrid[0:10, 0:12]
+        elevations = 0.5 * columns**2 - 0.25 * rows**2 + columns * rows + 3.0
+        sampler = DEMTileSampler(elevations, mock.Mock(SensorModel), interpolation_method=DEMInterpolationMethod.BICUBIC)
+
+        x = np.array([2.25, 5.5, 7.0, 8.9])
+        y = np.array([1.5, 4.75, 6.0, 7.1])
+        expected = 0.5 * x**2 - 0.25 * y**2 + x * y + 3.0
+        assert np.allclose(sampler.interpolate(x, y), expected)
+
+        # Missing posts anywhere in the 4x4 neighborhood propagate to the result
+        elevations[5, 5] = -32767
+        sampler = DEMTileSampler(
+            elevations, mock.Mock(SensorModel), no_data_value=-32767, interpolation_method=DEMInterpolationMethod.BICUBIC
+        )
+        assert np.isnan(sampler.interpolate(3.5, 3.5))
+        assert np.isfinite(sampler.interpolate(2.5, 2.5))
+
+    def test_affine_world_to_grid(self):
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+        from aws.osml.photogrammetry.dem_tile_sampler import DEMTileSampler
+        from aws.osml.photogrammetry.gdal_sensor_model import GDALAffineSensorModel
+
+        sensor_model = GDALAffineSensorModel([10.0, 0.1, 0.0, 20.0, 0.0, -0.1])
+        elevations = np.arange(100, dtype=np.float64).reshape(10, 10)
+        sampler = DEMTileSampler(elevations, sensor_model)
+        assert sampler.inv_transform is not None
+
+        longitudes = np.radians([10.05, 10.5, 10.73])
+        latitudes = np.radians([19.95, 19.5, 19.32])
+        world_coordinates = np.column_stack([longitudes, latitudes, np.zeros(3)])
+        image_coordinates = sensor_model.world_to_image_batch(world_coordinates)
+
+        x, y = sampler.world_to_grid(longitudes, latitudes)
+        assert np.allclose(np.column_stack([x, y]), image_coordinates)
+        expected = sampler.interpolate(image_coordinates[:, 0], image_coordinates[:, 1])
+        assert np.allclose(sampler.sample(longitudes, latitudes), expected)
+        assert sampler.elevation_at(GeodeticWorldCoordinate([radians(10.5), radians(19.5), 0.0])) == pytest.approx(
+            expected[1]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -132,7 +132,8 @@ class TestDigitalElevationModel(unittest.TestCase):
         assert not dem.set_elevation(world_coordinate)
         assert world_coordinate.elevation == 0.0
         assert mock_tile_set.find_tile_id.call_count == 2
-        assert mock_tile_factory.get_tile.call_count == 1
+        # Errors are not remembered as missing tiles so the tile is requested again
+        assert mock_tile_factory.get_tile.call_count == 2
 
     def test_missing_elevation(self):
         from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate, ImageCoordinate
@@ -209,6 +210,270 @@ class TestDigitalElevationModel(unittest.TestCase):
         assert mock_tile_set.find_tile_id.call_count == len(test_grid_coordinates)
         assert mock_tile_factory.get_tile.call_count == 1
 
+    def test_dem_interpolation_batch(self):
+        from aws.osml.photogrammetry.digital_elevation_model import DigitalElevationModel, DigitalElevationModelTileFactory
+        from aws.osml.photogrammetry.elevation_model import ElevationRegionSummary
+        from aws.osml.photogrammetry.generic_dem_tile_set import GenericDEMTileSet
+        from aws.osml.photogrammetry.sensor_model import SensorModel
+
+        # This is a sample 3x3 grid of elevation data with a no data value at 2,2
+        test_elevation_data = np.array([[0.0, 1.0, 4.0], [1.0, 2.0, 3.0], [2.0, 3.0, -9999]])
+        test_elevation_summary = ElevationRegionSummary(0.0, 4.0, -9999, 30.0)
+
+        # These are the grid locations the mock sensor model will return for the points in the tile
+        test_grid_coordinates = np.array([[-1.0, -1.0], [0.5, 0.5], [1.0, 0.5], [1.0, 1.5], [1.5, 0.0], [0.0, 0.0]])
+        expected_values = [0.0, 1.0, 1.5, np.nan, 2.5, 0.0]
+
+        mock_sensor_model = mock.Mock(SensorModel)
+        mock_sensor_model.world_to_image_batch.return_value = test_grid_coordinates
+        mock_tile_factory = mock.Mock(DigitalElevationModelTileFactory)
+        mock_tile_factory.get_tile.return_value = test_elevation_data, mock_sensor_model, test_elevation_summary
+
+        dem = DigitalElevationModel(GenericDEMTileSet(max_latitude_degrees=60.0), mock_tile_factory)
+
+        # The first six points are in the same tile, the last one is outside the tile set coverage
+        longitudes = np.radians([142.1, 142.2, 142.3, 142.4, 142.5, 142.6, 142.1])
+        latitudes = np.radians([3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 70.0])
+        elevations, valid = dem.get_elevations(longitudes, latitudes)
+
+        assert np.array_equal(valid, [True, True, True, False, True, True, False])
+        assert np.allclose(elevations[:6], expected_values, equal_nan=True)
+        assert np.isnan(elevations[6])
+
+        # All the points in the tile were converted to grid locations in a single call and the tile was only loaded once
+        assert mock_sensor_model.world_to_image_batch.call_count == 1
+        assert mock_sensor_model.world_to_image_batch.call_args[0][0].shape == (6, 3)
+        assert mock_tile_factory.get_tile.call_count == 1
+        mock_tile_factory.get_tile.assert_called_with("142e/03n.dt2")
+
+    def test_raster_cache_bytes(self):
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+        from aws.osml.photogrammetry.digital_elevation_model import (
+            DigitalElevationModel,
+            DigitalElevationModelTileFactory,
+            DigitalElevationModelTileSet,
+        )
+        from aws.osml.photogrammetry.elevation_model import ElevationRegionSummary
+        from aws.osml.photogrammetry.sensor_model import SensorModel
+
+        mock_tile_set = mock.Mock(DigitalElevationModelTileSet)
+        mock_sensor_model = mock.Mock(SensorModel)
+        mock_sensor_model.world_to_image.return_value = mock.Mock(x=1.0, y=1.0)
+        mock_tile_factory = mock.Mock(DigitalElevationModelTileFactory)
+        mock_tile_factory.get_tile.return_value = (
+            np.ones((100, 100), dtype=np.int16),
+            mock_sensor_model,
+            ElevationRegionSummary(1.0, 1.0, -32767, 30.0),
+        )
+
+        # Each tile is 20000 bytes so only two of them fit in the cache
+        dem = DigitalElevationModel(mock_tile_set, mock_tile_factory, raster_cache_bytes=50000)
+        for tile_id in ["a", "b", "c", "a"]:
+            mock_tile_set.find_tile_id.return_value = tile_id
+            assert dem.set_elevation(GeodeticWorldCoordinate([1.0, 2.0, 0.0]))
+
+        statistics = dem.raster_cache.statistics()
+        assert statistics.misses == 4
+        assert statistics.evictions == 2
+        assert statistics.current_size == 40000
+        assert mock_tile_factory.get_tile.call_count == 4
+
+    def test_prefetch(self):
+        from concurrent.futures import wait
+        from math import radians
+
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+        from aws.osml.photogrammetry.digital_elevation_model import DigitalElevationModel, DigitalElevationModelTileFactory
+        from aws.osml.photogrammetry.elevation_model import ElevationRegionSummary
+        from aws.osml.photogrammetry.generic_dem_tile_set import GenericDEMTileSet
+        from aws.osml.photogrammetry.sensor_model import SensorModel
+
+        mock_sensor_model = mock.Mock(SensorModel)
+        mock_sensor_model.world_to_image.return_value = mock.Mock(x=1.0, y=1.0)
+        mock_tile_factory = mock.Mock(DigitalElevationModelTileFactory)
+        mock_tile_factory.get_tile.return_value = (
+            np.full((3, 3), 5.0),
+            mock_sensor_model,
+            ElevationRegionSummary(5.0, 5.0, -32767, 30.0),
+        )
+        dem = DigitalElevationModel(GenericDEMTileSet(), mock_tile_factory)
+
+        # The bounding box covers 4 tiles which are loaded in the background
+        futures = dem.prefetch((radians(142.5), radians(3.5), radians(143.5), radians(4.5)))
+        assert len(futures) == 4
+        wait(futures, timeout=5)
+        assert mock_tile_factory.get_tile.call_count == 4
+        assert sorted(call[0][0] for call in mock_tile_factory.get_tile.call_args_list) == [
+            "142e/03n.dt2",
+            "142e/04n.dt2",
+            "143e/03n.dt2",
+            "143e/04n.dt2",
+        ]
+
+        # Elevation lookups in the region use the prefetched tiles
+        world_coordinate = GeodeticWorldCoordinate([radians(143.2), radians(3.7), 0.0])
+        assert dem.set_elevation(world_coordinate)
+        assert world_coordinate.elevation == pytest.approx(5.0)
+        assert mock_tile_factory.get_tile.call_count == 4
+        assert dem.raster_cache.statistics().hits == 1
+
+    def test_close(self):
+        import threading
+        from concurrent.futures import wait
+        from math import radians
+
+        from aws.osml.photogrammetry.digital_elevation_model import DigitalElevationModel, DigitalElevationModelTileFactory
+        from aws.osml.photogrammetry.elevation_model import ElevationRegionSummary
+        from aws.osml.photogrammetry.generic_dem_tile_set import GenericDEMTileSet
+        from aws.osml.photogrammetry.sensor_model import SensorModel
+
+        mock_tile_factory = mock.Mock(DigitalElevationModelTileFactory)
+        mock_tile_factory.get_tile.return_value = (
+            np.full((3, 3), 5.0),
+            mock.Mock(SensorModel),
+            ElevationRegionSummary(5.0, 5.0, -32767, 30.0),
+        )
+
+        def prefetch_threads():
+            return [thread for thread in threading.enumerate() if thread.name.startswith("dem-prefetch")]
+
+        # Leaving the context stops the prefetch threads
+        with DigitalElevationModel(GenericDEMTileSet(), mock_tile_factory) as dem:
+            futures = dem.prefetch((radians(142.5), radians(3.5), radians(143.5), radians(4.5)))
+            wait(futures, timeout=5)
+            assert len(prefetch_threads()) > 0
+        assert dem._prefetch_executor is None
+        assert len(prefetch_threads()) == 0
+        assert dem.raster_cache.statistics().current_size == 4
+
+        # Prefetching after the model was closed starts new threads that can be closed again
+        futures = dem.prefetch((radians(144.5), radians(3.5), radians(145.5), radians(4.5)))
+        wait(futures, timeout=5)
+        assert mock_tile_factory.get_tile.call_count == 8
+        dem.close()
+        dem.close()
+        assert len(prefetch_threads()) == 0
+
+    def test_missing_tiles_do_not_evict(self):
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+        from aws.osml.photogrammetry.digital_elevation_model import (
+            DigitalElevationModel,
+            DigitalElevationModelTileFactory,
+            DigitalElevationModelTileSet,
+        )
+        from aws.osml.photogrammetry.elevation_model import ElevationRegionSummary
+        from aws.osml.photogrammetry.sensor_model import SensorModel
+
+        mock_sensor_model = mock.Mock(SensorModel)
+        mock_sensor_model.world_to_image.return_value = mock.Mock(x=1.0, y=1.0)
+        tiles = {"valid.tif": (np.full((3, 3), 5.0), mock_sensor_model, ElevationRegionSummary(5.0, 5.0, -32767, 30.0))}
+        mock_tile_set = mock.Mock(DigitalElevationModelTileSet)
+        mock_tile_factory = mock.Mock(DigitalElevationModelTileFactory)
+        mock_tile_factory.get_tile.side_effect = lambda tile_path: tiles.get(tile_path, (None, None, None))
+
+        # The cache only has room for a single tile but lookups over missing tiles don't displace it
+        dem = DigitalElevationModel(mock_tile_set, mock_tile_factory, raster_cache_size=1)
+        for tile_id, expected in [("valid.tif", True), ("ocean1.tif", False), ("ocean2.tif", False), ("valid.tif", True)]:
+            mock_tile_set.find_tile_id.return_value = tile_id
+            assert dem.set_elevation(GeodeticWorldCoordinate([1.0, 2.0, 0.0])) == expected
+
+        assert mock_tile_factory.get_tile.call_count == 3
+        assert dem.raster_cache.statistics().missing_tile_count == 2
+
+    def test_load_errors_are_not_cached(self):
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+        from aws.osml.photogrammetry.digital_elevation_model import (
+            DigitalElevationModel,
+            DigitalElevationModelTileFactory,
+            DigitalElevationModelTileSet,
+        )
+        from aws.osml.photogrammetry.elevation_model import ElevationRegionSummary
+        from aws.osml.photogrammetry.sensor_model import SensorModel
+
+        mock_sensor_model = mock.Mock(SensorModel)
+        mock_sensor_model.world_to_image.return_value = mock.Mock(x=1.0, y=1.0)
+        mock_tile_set = mock.Mock(DigitalElevationModelTileSet)
+        mock_tile_set.find_tile_id.return_value = "valid.tif"
+        mock_tile_factory = mock.Mock(DigitalElevationModelTileFactory)
+        mock_tile_factory.get_tile.side_effect = [
+            IOError("Transient read failure"),
+            (np.full((3, 3), 5.0), mock_sensor_model, ElevationRegionSummary(5.0, 5.0, -32767, 30.0)),
+        ]
+
+        # The first load fails but the tile is not remembered as missing so the next lookup loads it
+        dem = DigitalElevationModel(mock_tile_set, mock_tile_factory)
+        world_coordinate = GeodeticWorldCoordinate([1.0, 2.0, 0.0])
+        assert not dem.set_elevation(world_coordinate)
+        assert dem.raster_cache.statistics().missing_tile_count == 0
+        assert dem.set_elevation(world_coordinate)
+        assert world_coordinate.elevation == pytest.approx(5.0)
+        assert dem.set_elevation(world_coordinate)
+        assert mock_tile_factory.get_tile.call_count == 2
+        assert dem.raster_cache.statistics().tile_count == 1
+
+    def test_elevation_window(self):
+        from math import radians
+
+        from aws.osml.photogrammetry.digital_elevation_model import DigitalElevationModel, DigitalElevationModelTileFactory
+        from aws.osml.photogrammetry.elevation_model import ElevationRegionSummary
+        from aws.osml.photogrammetry.gdal_sensor_model import GDALAffineSensorModel
+        from aws.osml.photogrammetry.generic_dem_tile_set import GenericDEMTileSet
+
+        def create_tile(longitude, latitude, posts):
+            # The elevations are a linear function of longitude, latitude so any interpolation reproduces them
+            spacing = 1.0 / (posts - 1)
+            longitudes, latitudes = np.meshgrid(
+                longitude + np.arange(posts) * spacing, latitude + 1.0 - np.arange(posts) * spacing
+            )
+            return (
+                10.0 * longitudes + 100.0 * latitudes,
+                GDALAffineSensorModel([longitude, spacing, 0.0, latitude + 1.0, 0.0, -spacing]),
+                ElevationRegionSummary(0.0, 1000.0, -32767, 30.0),
+            )
+
+        tiles = {
+            "142e/03n.dt2": create_tile(142.0, 3.0, 5),
+            "143e/03n.dt2": create_tile(143.0, 3.0, 5),
+            "142e/04n.dt2": create_tile(142.0, 4.0, 9),
+        }
+        mock_tile_factory = mock.Mock(DigitalElevationModelTileFactory)
+        mock_tile_factory.get_tile.side_effect = lambda tile_path: tiles.get(tile_path, (None, None, None))
+        mock_tile_factory.get_tile_window.side_effect = (
+            lambda tile_path, bounds: DigitalElevationModelTileFactory.get_tile_window(mock_tile_factory, tile_path, bounds)
+        )
+        dem = DigitalElevationModel(GenericDEMTileSet(), mock_tile_factory)
+
+        # Tiles sharing a grid are copied into a mosaic that is expanded to the surrounding posts
+        window = dem.get_elevation_window((radians(142.6), radians(3.3), radians(143.4), radians(3.9)))
+        assert mock_tile_factory.get_tile_window.call_count == 2
+        assert dem.raster_cache.statistics().tile_count == 0
+        assert window.elevations.shape == (4, 5)
+        assert window.sensor_model.transform[0, 2] == pytest.approx(142.5)
+        assert window.sensor_model.transform[1, 2] == pytest.approx(4.0)
+        assert np.array_equal(window.elevations[:, 0:3], tiles["142e/03n.dt2"][0][0:4, 2:5])
+        assert np.array_equal(window.elevations[:, 2:5], tiles["143e/03n.dt2"][0][0:4, 0:3])
+
+        # The finer tile sets the mosaic grid and the coarser tiles are resampled onto it
+        window = dem.get_elevation_window((radians(142.6), radians(3.3), radians(143.4), radians(4.2)))
+        assert window.sensor_model.transform[0, 0] == pytest.approx(0.125)
+        assert not np.any(np.isnan(window.elevations[3:, :]))
+
+        rng = np.random.default_rng(0)
+        longitudes = rng.uniform(142.6, 143.4, 100)
+        latitudes = rng.uniform(3.3, 4.0, 100)
+        elevations = window.sample(np.radians(longitudes), np.radians(latitudes))
+        assert np.allclose(elevations, 10.0 * longitudes + 100.0 * latitudes)
+        assert np.allclose(elevations, dem.get_elevations(np.radians(longitudes), np.radians(latitudes))[0])
+
+        # Tiles that are already cached are reused instead of being read again
+        mock_tile_factory.get_tile_window.reset_mock()
+        dem.get_elevation_window((radians(142.6), radians(3.3), radians(143.4), radians(3.9)))
+        assert mock_tile_factory.get_tile_window.call_count == 0
+
+        # There is no tile for 143e/04n so that part of the window is missing
+        assert np.isnan(window.sample(radians(143.3), radians(4.2)))
+        assert dem.get_elevation_window((radians(150.1), radians(3.1), radians(150.2), radians(3.2))) is None
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -17,6 +17,62 @@ class TestElevationModel(unittest.TestCase):
         assert world_coordinate.latitude == 2
         assert world_coordinate.elevation == 10.0
 
+    def test_constant_elevation_model_batch(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+
+        elevation_model = ConstantElevationModel(10.0)
+        elevations, valid = elevation_model.get_elevations(np.array([1.0, 1.1, 1.2]), np.array([2.0, 2.1, 2.2]))
+        assert np.array_equal(elevations, [10.0, 10.0, 10.0])
+        assert valid.all()
+
+        world_coordinates = np.array([[1.0, 2.0, 0.0], [1.1, 2.1, 0.0]])
+        assert elevation_model.set_elevations(world_coordinates).all()
+        assert np.array_equal(world_coordinates, [[1.0, 2.0, 10.0], [1.1, 2.1, 10.0]])
+
+        with self.assertRaises(ValueError):
+            elevation_model.set_elevations([[1.0, 2.0, 0.0]])
+
+    def test_set_elevations_coordinate_array(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinateArray
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+        from aws.osml.photogrammetry.gdal_sensor_model import GDALAffineSensorModel
+
+        world_coordinates = GeodeticWorldCoordinateArray([[1.0, 2.0, 0.0], [1.1, 2.1, 0.0]])
+        assert ConstantElevationModel(10.0).set_elevations(world_coordinates).all()
+        assert np.array_equal(world_coordinates.elevation, [10.0, 10.0])
+
+        # Sensor models accept the coordinate arrays in place of Nx3 numpy arrays
+        sensor_model = GDALAffineSensorModel([0.0, 1.0, 0.0, 10.0, 0.0, -1.0])
+        world_coordinates.longitude = np.radians([2.0, 4.0])
+        world_coordinates.latitude = np.radians([7.0, 5.0])
+        image_coordinates = sensor_model.world_to_image_batch(world_coordinates)
+        assert np.allclose(image_coordinates, [[2.0, 3.0], [4.0, 5.0]])
+
+    def test_default_batch_implementation(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+        from aws.osml.photogrammetry.elevation_model import ElevationModel
+
+        class NorthernElevationModel(ElevationModel):
+            def set_elevation(self, world_coordinate: GeodeticWorldCoordinate) -> bool:
+                if world_coordinate.latitude < 0.0:
+                    return False
+                world_coordinate.elevation = 100.0 * world_coordinate.latitude
+                return True
+
+            def describe_region(self, world_coordinate: GeodeticWorldCoordinate):
+                return None
+
+        world_coordinates = np.array([[0.1, 0.5, -1.0], [0.1, -0.5, -1.0], [0.1, 0.25, -1.0]])
+        valid = NorthernElevationModel().set_elevations(world_coordinates)
+        assert np.array_equal(valid, [True, False, True])
+        assert np.allclose(world_coordinates[:, 2], [50.0, -1.0, 25.0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -22,6 +22,12 @@ class TestGDALSensorModel(unittest.TestCase):
         new_image_coordinate = sensor_model.world_to_image(world_coordinate)
         assert np.array_equal(image_coordinate.coordinate, new_image_coordinate.coordinate)
 
+        world_coordinates = sensor_model.image_to_world_batch(
+            np.array([[200, 300], [0, 0]]), elevation_model=elevation_model
+        )
+        assert np.allclose(world_coordinates, np.array([[radians(0.4), radians(0.9), 42.0], [0.0, 0.0, 42.0]]))
+        assert np.allclose(sensor_model.world_to_image_batch(world_coordinates), np.array([[200, 300], [0, 0]]))
+
     def test_gdal_sensor_model_real_example(self):
         from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate, ImageCoordinate
         from aws.osml.photogrammetry.gdal_sensor_model import GDALAffineSensorModel
@@ -32,6 +32,77 @@ class TestGenericDEMTileSet(unittest.TestCase):
         tile_path = tile_set.find_tile_id(GeodeticWorldCoordinate([radians(30.5), radians(1.5), 0.0]))
         assert "dted/e030/n01.dt2" == tile_path
 
+    def test_find_tile_ids(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.generic_dem_tile_set import GenericDEMTileSet
+
+        tile_set = GenericDEMTileSet(format_spec="dted/%oh%od/%lh%ld.dt2", max_latitude_degrees=60.0)
+        longitudes = np.radians([30.5, -43.648601, 30.25, 10.0, 30.75])
+        latitudes = np.radians([1.5, -22.999056, 1.75, 75.0, 1.25])
+        tile_ids, tile_indexes = tile_set.find_tile_ids(longitudes, latitudes)
+        assert [tile_ids[index] for index in tile_indexes] == [
+            "dted/e030/n01.dt2",
+            "dted/w044/s23.dt2",
+            "dted/e030/n01.dt2",
+            None,
+            "dted/e030/n01.dt2",
+        ]
+        assert len(tile_ids) == 3
+
+    def test_find_tile_ids_in_region(self):
+        from math import radians
+
+        import shapely
+
+        from aws.osml.photogrammetry.generic_dem_tile_set import GenericDEMTileSet
+
+        tile_set = GenericDEMTileSet(format_spec="dted/%oh%od/%lh%ld.dt2", max_latitude_degrees=60.0)
+        region = shapely.box(radians(10.5), radians(59.2), radians(12.2), radians(61.5))
+        assert sorted(tile_set.find_tile_ids_in_region(region)) == [
+            "dted/e010/n59.dt2",
+            "dted/e010/n60.dt2",
+            "dted/e011/n59.dt2",
+            "dted/e011/n60.dt2",
+            "dted/e012/n59.dt2",
+            "dted/e012/n60.dt2",
+        ]
+
+        # Only the tiles touched by a triangle are returned, not every tile in its bounding box
+        triangle = shapely.Polygon(
+            [(radians(10.5), radians(20.5)), (radians(12.5), radians(20.5)), (radians(10.5), radians(22.7))]
+        )
+        assert sorted(tile_set.find_tile_ids_in_region(triangle)) == [
+            "dted/e010/n20.dt2",
+            "dted/e010/n21.dt2",
+            "dted/e010/n22.dt2",
+            "dted/e011/n20.dt2",
+            "dted/e011/n21.dt2",
+            "dted/e011/n22.dt2",
+            "dted/e012/n20.dt2",
+            "dted/e012/n21.dt2",
+        ]
+        assert tile_set.find_tile_ids_in_region(shapely.Point(radians(30.5), radians(1.5))) == ["dted/e030/n01.dt2"]
+
+    def test_availability_index(self):
+        from math import radians
+
+        import numpy as np
+
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+        from aws.osml.photogrammetry.dem_tile_availability import DEMTileAvailabilityIndex
+        from aws.osml.photogrammetry.generic_dem_tile_set import GenericDEMTileSet
+
+        tile_set = GenericDEMTileSet(
+            format_spec="dted/%oh%od/%lh%ld.dt2",
+            availability_index=DEMTileAvailabilityIndex.from_tile_names(["dted/e030/n01.dt2"]),
+        )
+        assert tile_set.find_tile_id(GeodeticWorldCoordinate([radians(30.5), radians(1.5), 0.0])) == "dted/e030/n01.dt2"
+        assert tile_set.find_tile_id(GeodeticWorldCoordinate([radians(31.5), radians(1.5), 0.0])) is None
+
+        tile_ids, tile_indexes = tile_set.find_tile_ids(np.radians([30.5, 31.5]), np.radians([1.5, 1.5]))
+        assert [tile_ids[index] for index in tile_indexes] == ["dted/e030/n01.dt2", None]
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,46 @@ class TestMathUtils(unittest.TestCase):
         assert np.allclose(triangle[1], [7.5, 8.556624327025936])
         assert np.allclose(triangle[2], [12.5, 8.556624327025936])
 
+    def test_newton_raphson_2d(self):
+        from aws.osml.photogrammetry.math_utils import newton_raphson_2d
+
+        # Solve x^2 + y = a, x - y^3 = b for several (a, b) targets at once. The last target is given a non-finite
+        # starting point, so it should be reported as not converged.
+        targets = np.array([[5.0, 1.0], [2.0, 0.0], [10.0, -6.0], [1.0, 1.0]])
+
+        def residuals_and_jacobians(xy, indexes):
+            x = xy[:, 0]
+            y = xy[:, 1]
+            residuals = np.column_stack([x * x + y, x - y**3]) - targets[indexes]
+            jacobians = np.zeros((xy.shape[0], 2, 2))
+            jacobians[:, 0, 0] = 2.0 * x
+            jacobians[:, 0, 1] = 1.0
+            jacobians[:, 1, 0] = 1.0
+            jacobians[:, 1, 1] = -3.0 * y * y
+            return residuals, jacobians
+
+        initial_guesses = np.array([[1.5, 0.5], [1.5, 0.5], [1.5, 0.5], [np.nan, 0.5]])
+        solutions, converged = newton_raphson_2d(residuals_and_jacobians, initial_guesses, tolerance=1.0e-10)
+        assert np.array_equal(converged, [True, True, True, False])
+        residuals, _ = residuals_and_jacobians(solutions[0:3], np.arange(3))
+        assert np.allclose(residuals, 0.0, atol=1.0e-10)
+
+    def test_lagrange_interpolation_weights(self):
+        from aws.osml.photogrammetry.math_utils import lagrange_interpolation_weights
+
+        # Cubic weights should reproduce a cubic exactly, including the derivative and extrapolation past the ends
+        samples = np.arange(10.0) ** 3 - 2.0 * np.arange(10.0)
+        positions = np.array([0.0, 0.5, 4.25, 8.9, 10.5])
+        indexes, weights, derivatives = lagrange_interpolation_weights(positions, samples.shape[0], 3)
+        assert indexes.shape == (5, 4)
+        assert np.allclose(np.sum(weights * samples[indexes], axis=1), positions**3 - 2.0 * positions)
+        assert np.allclose(np.sum(derivatives * samples[indexes], axis=1), 3.0 * positions**2 - 2.0)
+
+        # The order is reduced when there are not enough samples
+        indexes, weights, _ = lagrange_interpolation_weights([0.25], 2, 5)
+        assert np.array_equal(indexes, [[0, 1]])
+        assert np.allclose(weights, [[0.75, 0.25]])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -34,6 +34,43 @@ class TestMultiElevationModel(unittest.TestCase):
         assert world_coordinate.latitude == 2
         assert world_coordinate.elevation == 1.0
 
+    def test_batch_fall_through(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel, ElevationModel
+        from aws.osml.photogrammetry.multi_elevation_model import MultiElevationModel
+
+        class EasternElevationModel(ElevationModel):
+            def __init__(self):
+                super().__init__()
+                self.requested_longitudes = []
+
+            def set_elevation(self, world_coordinate: GeodeticWorldCoordinate) -> bool:
+                return False
+
+            def get_elevations(self, longitudes, latitudes):
+                self.requested_longitudes.append(np.array(longitudes))
+                valid = longitudes > 0.0
+                return np.where(valid, 5.0, np.nan), valid
+
+            def describe_region(self, world_coordinate: GeodeticWorldCoordinate):
+                return None
+
+        eastern_model = EasternElevationModel()
+        fallback_model = EasternElevationModel()
+        elevation_model = MultiElevationModel([eastern_model, ConstantElevationModel(1.0), fallback_model])
+
+        elevations, valid = elevation_model.get_elevations(np.array([-1.0, 1.0, -2.0, 2.0]), np.zeros(4))
+        assert valid.all()
+        assert np.array_equal(elevations, [1.0, 5.0, 1.0, 5.0])
+        assert len(eastern_model.requested_longitudes) == 1
+        assert len(fallback_model.requested_longitudes) == 0
+
+        elevations, valid = MultiElevationModel([eastern_model]).get_elevations(np.array([-1.0, 1.0]), np.zeros(2))
+        assert np.array_equal(valid, [False, True])
+        assert np.isnan(elevations[0]) and elevations[1] == 5.0
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -40,6 +40,38 @@ class TestNormalizedElevationModel(unittest.TestCase):
         assert world_coordinate.latitude == 2
         assert world_coordinate.elevation == 3.0
 
+    def test_restricted_range_batch(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.conditional_elevation_model import ConditionalElevationModel
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+        from aws.osml.photogrammetry.em_condition import ElevationModelCondition
+        from aws.osml.photogrammetry.normalized_elevation_model import NormalizedElevationModel
+
+        class BoundedCondition(ElevationModelCondition):
+            def is_true(self, world_coordinate) -> bool:
+                raise NotImplementedError("The batch condition should be used")
+
+            def are_true(self, world_coordinates) -> np.ndarray:
+                world_coordinates = np.asarray(world_coordinates)
+                return (np.abs(world_coordinates[:, 1]) <= pi / 2) & (np.abs(world_coordinates[:, 0]) <= pi)
+
+        conditional_model = ConditionalElevationModel(
+            inner_elevation_model=ConstantElevationModel(3.0),
+            em_condition=BoundedCondition(),
+        )
+        normalized_model = NormalizedElevationModel(
+            inner_elevation_model=conditional_model,
+        )
+
+        longitudes = np.array([1.0, 1.0, 4.0])
+        latitudes = np.array([0.5, 2.0, 0.5])
+        elevations, valid = conditional_model.get_elevations(longitudes, latitudes)
+        assert np.array_equal(valid, [True, False, False])
+        elevations, valid = normalized_model.get_elevations(longitudes, latitudes)
+        assert valid.all()
+        assert np.array_equal(elevations, [3.0, 3.0, 3.0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,6 +21,31 @@ class TestOffsetElevationModel(unittest.TestCase):
         assert world_coordinate.latitude == 2
         assert world_coordinate.elevation == 15.0
 
+    def test_constant_offset_batch(self):
+        import numpy as np
+
+        from aws.osml.photogrammetry.conditional_elevation_model import ConditionalElevationModel
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+        from aws.osml.photogrammetry.elevation_offset_provider import ConstantOffsetProvider
+        from aws.osml.photogrammetry.em_condition import EMConditionFalse
+        from aws.osml.photogrammetry.offset_elevation_model import OffsetElevationModel
+
+        elevation_model = OffsetElevationModel(
+            inner_elevation_model=ConstantElevationModel(10.0),
+            offset_provider=ConstantOffsetProvider(5.0),
+        )
+        world_coordinates = np.array([[1.0, 2.0, 0.0], [1.1, 2.1, 0.0]])
+        assert elevation_model.set_elevations(world_coordinates).all()
+        assert np.array_equal(world_coordinates[:, 2], [15.0, 15.0])
+
+        missing_model = OffsetElevationModel(
+            inner_elevation_model=ConditionalElevationModel(ConstantElevationModel(10.0), EMConditionFalse()),
+            offset_provider=ConstantOffsetProvider(5.0),
+        )
+        elevations, valid = missing_model.get_elevations(np.array([1.0]), np.array([2.0]))
+        assert not valid.any()
+        assert np.isnan(elevations).all()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -41,3 +41,12 @@ def test_projective_sensor_model():
     image_coordinate = ImageCoordinate([50.0, 100.0])
     world_coordinate = sensor_model.image_to_world(image_coordinate)
     assert np.allclose(world_coordinate.coordinate, np.array([radians(15.0), radians(20.0), 0.0]))
+
+    # Test the batch versions of the transforms
+    world_coordinates = sensor_model.image_to_world_batch(
+        np.array([[50.0, 0.0], [50.0, 100.0]]), elevation_model=elevation_model
+    )
+    assert np.allclose(
+        world_coordinates, np.array([[radians(15.0), radians(30.0), 42.0], [radians(15.0), radians(20.0), 42.0]])
+    )
+    assert np.allclose(sensor_model.world_to_image_batch(world_coordinates), np.array([[50.0, 0.0], [50.0, 100.0]]))
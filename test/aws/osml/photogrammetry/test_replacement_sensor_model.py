@@ -64,6 +64,17 @@ class TestMathUtils(unittest.TestCase):
 
         # TODO: More Testing!!!
 
+    def test_rectangular_ground_domain_batch(self):
+        world_coordinates = np.array([[radians(5.0), radians(10.0), 0.0], [radians(5.0001), radians(10.0001), 10.0]])
+        domain_coordinates = self.sample_rectangular_ground_domain.geodetic_to_ground_domain_coordinates(world_coordinates)
+        assert np.allclose(domain_coordinates[0], np.array([0.0, 0.0, 0.0]), atol=1.0e-6)
+
+        new_world_coordinates = self.sample_rectangular_ground_domain.ground_domain_coordinates_to_geodetic(
+            domain_coordinates
+        )
+        assert np.allclose(new_world_coordinates[:, 0:2], world_coordinates[:, 0:2], atol=0.000001)
+        assert np.allclose(new_world_coordinates[:, 2], world_coordinates[:, 2], atol=0.1)
+
     def test_rsmpolynomial_eval(self):
         from aws.osml.photogrammetry.coordinates import WorldCoordinate
         from aws.osml.photogrammetry.replacement_sensor_model import RSMPolynomial
@@ -91,6 +102,18 @@ class TestMathUtils(unittest.TestCase):
         world_coordinate = WorldCoordinate([10, 20, 30])
         assert polynomial(world_coordinate) == 1.0 + 10.0 + 40.0 + 90.0 + (100.0 * 20.0 * 30.0)
 
+    def test_rsmpolynomial_evaluate_array(self):
+        from aws.osml.photogrammetry.coordinates import WorldCoordinate
+        from aws.osml.photogrammetry.replacement_sensor_model import RSMPolynomial
+
+        polynomial = RSMPolynomial(3, 2, 1, [0.5 * i - 3.0 for i in range(24)])
+        coordinates = np.array([[0.1, -0.2, 0.3], [-0.5, 0.4, 0.9], [1.0, 1.0, 1.0]])
+        basis = polynomial.monomial_basis(coordinates)
+        assert basis.shape == (3, 24)
+        values = polynomial.evaluate_array(coordinates)
+        for coordinate, value in zip(coordinates, values):
+            assert value == pytest.approx(polynomial(WorldCoordinate(coordinate)))
+
     def test_rsmloworderpolynomial_eval(self):
         from aws.osml.photogrammetry.coordinates import WorldCoordinate
         from aws.osml.photogrammetry.replacement_sensor_model import RSMLowOrderPolynomial
@@ -144,6 +167,164 @@ class TestMathUtils(unittest.TestCase):
         )
         assert np.allclose(world_coordinate.coordinate, new_world_coordinate.coordinate)
 
+    def test_polynomial_sensor_models_batch(self):
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+
+        world_coordinates = np.array([[radians(5.0), radians(5.0), 42.0], [radians(2.0), radians(8.0), -10.0]])
+        for sensor_model in [self.sample_polynomial_sensor_model, self.sample_sectioned_polynomial_sensor_model]:
+            image_coordinates = sensor_model.world_to_image_batch(world_coordinates)
+            assert image_coordinates.shape == (2, 2)
+            for world_coordinate, image_coordinate in zip(world_coordinates, image_coordinates):
+                expected = sensor_model.world_to_image(GeodeticWorldCoordinate(world_coordinate))
+                assert np.allclose(expected.coordinate, image_coordinate)
+
+    def test_polynomial_sensor_models_batch_image_to_world(self):
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+
+        elevation_model = ConstantElevationModel(42.0)
+        world_coordinates = np.array([[radians(5.0), radians(5.0), 42.0], [radians(2.0), radians(8.0), 42.0]])
+        for sensor_model in [self.sample_polynomial_sensor_model, self.sample_sectioned_polynomial_sensor_model]:
+            image_coordinates = sensor_model.world_to_image_batch(world_coordinates)
+            new_world_coordinates = sensor_model.image_to_world_batch(image_coordinates, elevation_model=elevation_model)
+            assert np.allclose(world_coordinates, new_world_coordinates)
+
+    def test_polynomial_sensor_models_inverse_polynomial(self):
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+
+        inverse_polynomial = self.sample_polynomial_sensor_model.fit_inverse_polynomial()
+        assert inverse_polynomial.max_residual < 0.01
+        section_inverse_polynomials = self.sample_sectioned_polynomial_sensor_model.fit_inverse_polynomial()
+        assert section_inverse_polynomials[0][0] is not None
+        # None of the samples project into the second section so it continues to use the iterative solver
+        assert section_inverse_polynomials[1][0] is None
+
+        elevation_model = ConstantElevationModel(42.0)
+        world_coordinates = np.array([[radians(5.0), radians(5.0), 42.0], [radians(2.0), radians(8.0), 42.0]])
+        for sensor_model in [self.sample_polynomial_sensor_model, self.sample_sectioned_polynomial_sensor_model]:
+            image_coordinates = sensor_model.world_to_image_batch(world_coordinates)
+            new_world_coordinates = sensor_model.image_to_world_batch(image_coordinates, elevation_model=elevation_model)
+            assert np.allclose(world_coordinates, new_world_coordinates)
+
+    def test_ground_domain_to_image_jacobian(self):
+        from aws.osml.photogrammetry.replacement_sensor_model import RSMContext, RSMPolynomial, RSMPolynomialSensorModel
+
+        context = RSMContext(self.sample_rectangular_ground_domain, self.sample_image_domain)
+        sensor_model = RSMPolynomialSensorModel(
+            context,
+            1,
+            1,
+            10.0,
+            20.0,
+            1.0,
+            2.0,
+            3.0,
+            100.0,
+            200.0,
+            10.0,
+            20.0,
+            30.0,
+            RSMPolynomial(1, 1, 1, [0.1, 0.2, 1.0, 0.3, 0.01, 0.02, 0.03, 0.001]),
+            RSMPolynomial(1, 1, 0, [1.0, 0.01, 0.02, 0.001]),
+            RSMPolynomial(2, 1, 1, [0.1, 1.0, 0.05, 0.2, 0.01, 0.02, 0.3, 0.01, 0.02, 0.03, 0.01, 0.001]),
+            RSMPolynomial(0, 0, 0, [1.0]),
+        )
+        domain_coordinates = np.array([[10.0, 20.0, 30.0], [-5.0, 3.0, 100.0]])
+        image_coordinates, jacobians = sensor_model.ground_domain_to_image_with_jacobian(domain_coordinates)
+        assert np.allclose(image_coordinates, sensor_model.ground_domain_to_image_batch(domain_coordinates))
+
+        # Compare the analytic partial derivatives to central finite differences
+        delta = 1.0e-4
+        for component in range(3):
+            offset = np.zeros(3)
+            offset[component] = delta
+            upper = sensor_model.ground_domain_to_image_batch(domain_coordinates + offset)
+            lower = sensor_model.ground_domain_to_image_batch(domain_coordinates - offset)
+            assert np.allclose(jacobians[:, :, component], (upper - lower) / (2.0 * delta), atol=1.0e-6)
+
+        # The Newton-Raphson iteration should converge on the rectangular ground domain when elevations are fixed
+        world_coordinates = np.array([[radians(5.0), radians(10.0), 0.0], [radians(5.0001), radians(10.0001), 0.0]])
+        image_coordinates = sensor_model.world_to_image_batch(world_coordinates)
+        new_world_coordinates, converged = sensor_model._solve_image_to_world(
+            image_coordinates,
+            self.sample_geodetic_ground_domain.default_elevation_model,
+            world_coordinates[:, 0:2] + radians(0.00001),
+        )
+        assert np.all(converged)
+        assert np.allclose(new_world_coordinates, world_coordinates, atol=1.0e-6)
+
+    def test_grid_sensor_model(self):
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate, WorldCoordinate
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+        from aws.osml.photogrammetry.replacement_sensor_model import (
+            RSMContext,
+            RSMGridPlane,
+            RSMGridSensorModel,
+            RSMPolynomial,
+            RSMPolynomialSensorModel,
+        )
+
+        # Sample a polynomial that is cubic or less in x, y and linear in z on a grid. Cubic Lagrange interpolation
+        # within the planes and linear interpolation between them should reproduce it exactly.
+        context = RSMContext(self.sample_geodetic_ground_domain, self.sample_image_domain)
+        polynomial_sensor_model = RSMPolynomialSensorModel(
+            context,
+            1,
+            1,
+            0.0,
+            0.0,
+            0.0,
+            0.0,
+            0.0,
+            1.0,
+            1.0,
+            1.0,
+            1.0,
+            1.0,
+            RSMPolynomial(1, 1, 1, [0.0, 0.0, 100.0, 30.0, 0.02, 0.0, 0.0, 0.0]),
+            RSMPolynomial(0, 0, 0, [1.0]),
+            RSMPolynomial(2, 1, 1, [0.0, 100.0, 20.0, 0.0, 0.0, 0.0, 0.01, 0.0, 0.0, 0.0, 0.0, 0.0]),
+            RSMPolynomial(0, 0, 0, [1.0]),
+        )
+        spacing = radians(0.5)
+        grid_x, grid_y = np.meshgrid(np.arange(-2, 23) * spacing, np.arange(-2, 23) * spacing, indexing="ij")
+        grid_planes = []
+        for z in [-100.0, 0.0, 100.0]:
+            domain_coordinates = np.column_stack([grid_x.ravel(), grid_y.ravel(), np.full(grid_x.size, z)])
+            image_coordinates = polynomial_sensor_model.ground_domain_to_image_batch(domain_coordinates)
+            grid_planes.append(
+                RSMGridPlane(
+                    -2 * spacing,
+                    -2 * spacing,
+                    image_coordinates[:, 1].reshape(grid_x.shape),
+                    image_coordinates[:, 0].reshape(grid_x.shape),
+                )
+            )
+        grid_sensor_model = RSMGridSensorModel(context, 1, 1, 3, -100.0, spacing, spacing, 100.0, grid_planes)
+
+        world_coordinates = np.array(
+            [[radians(5.1), radians(4.3), 42.0], [radians(0.2), radians(9.7), -80.0], [radians(8.0), radians(2.0), 150.0]]
+        )
+        image_coordinates = grid_sensor_model.world_to_image_batch(world_coordinates)
+        assert np.allclose(image_coordinates, polynomial_sensor_model.world_to_image_batch(world_coordinates))
+        image_coordinate = grid_sensor_model.world_to_image(GeodeticWorldCoordinate(world_coordinates[0]))
+        assert np.allclose(image_coordinate.coordinate, image_coordinates[0])
+
+        domain_coordinates = np.array([[0.09, 0.07, 42.0], [0.1, 0.12, -30.0]])
+        image_coordinates, jacobians = grid_sensor_model.ground_domain_to_image_with_jacobian(domain_coordinates)
+        expected_image_coordinates, expected_jacobians = polynomial_sensor_model.ground_domain_to_image_with_jacobian(
+            domain_coordinates
+        )
+        assert np.allclose(image_coordinates, expected_image_coordinates)
+        assert np.allclose(jacobians, expected_jacobians)
+        image_coordinate = grid_sensor_model.ground_domain_to_image(WorldCoordinate(domain_coordinates[1]))
+        assert np.allclose(image_coordinate.coordinate, expected_image_coordinates[1])
+
+        elevation_model = ConstantElevationModel(42.0)
+        world_coordinates = np.array([[radians(5.0), radians(5.0), 42.0], [radians(2.0), radians(8.0), 42.0]])
+        image_coordinates = grid_sensor_model.world_to_image_batch(world_coordinates)
+        new_world_coordinates = grid_sensor_model.image_to_world_batch(image_coordinates, elevation_model=elevation_model)
+        assert np.allclose(world_coordinates, new_world_coordinates)
+
     def test_build_rsm_ground_domain_invalid_count_exception(self):
         from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
         from aws.osml.photogrammetry.replacement_sensor_model import RSMGroundDomain, RSMGroundDomainForm
@@ -46,6 +46,34 @@ class TestRPCSensorModel(unittest.TestCase):
         world_coordinate = WorldCoordinate([10, 20, 30])
         assert polynomial(world_coordinate) == 42.0 + 10.0 + 40.0 + 90.0 + (100.0 * 10.0 * 20.0 * 20.0)
 
+    def test_rpc_polynomial_evaluate_array(self):
+        from aws.osml.photogrammetry.coordinates import WorldCoordinate
+        from aws.osml.photogrammetry.rpc_sensor_model import RPCPolynomial
+
+        polynomial = RPCPolynomial([0.25 * i - 2.0 for i in range(20)])
+        coordinates = np.array([[0.1, -0.2, 0.3], [-0.5, 0.4, 0.9], [10.0, 20.0, 30.0]])
+        assert RPCPolynomial.monomial_basis(coordinates).shape == (3, 20)
+        values = polynomial.evaluate_array(coordinates)
+        for coordinate, value in zip(coordinates, values):
+            assert np.isclose(value, polynomial(WorldCoordinate(coordinate)))
+
+    def test_rpc_polynomial_partials(self):
+        from aws.osml.photogrammetry.rpc_sensor_model import RPCPolynomial
+
+        polynomial = RPCPolynomial([float(i + 1) for i in range(20)])
+        coordinates = np.array([[0.1, -0.2, 0.3], [-0.5, 0.4, 0.9]])
+        partials = polynomial.evaluate_partials_array(coordinates)
+
+        # Compare the analytic partial derivatives to central finite differences
+        delta = 1.0e-6
+        for component in range(3):
+            offset = np.zeros(3)
+            offset[component] = delta
+            upper = polynomial.evaluate_array(coordinates + offset)
+            lower = polynomial.evaluate_array(coordinates - offset)
+            expected = (upper - lower) / (2.0 * delta)
+            assert np.allclose(partials[:, component], expected, atol=1.0e-6)
+
     def test_rpc_sensor_model(self):
         from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
         from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
@@ -78,6 +106,91 @@ class TestRPCSensorModel(unittest.TestCase):
 
         assert np.allclose(world_coordinate.coordinate, new_world_coordinate.coordinate)
 
+    def test_rpc_sensor_model_batch(self):
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+
+        world_coordinates = np.array(
+            [
+                [radians(56.305048278781925), radians(27.15809908265984), -9.0],
+                [radians(56.3653), radians(27.2197), 0.0],
+                [radians(56.4), radians(27.25), 100.0],
+            ]
+        )
+        image_coordinates = self.realworld_rpc_sensor_model.world_to_image_batch(world_coordinates)
+        assert image_coordinates.shape == (3, 2)
+        for world_coordinate, image_coordinate in zip(world_coordinates, image_coordinates):
+            expected = self.realworld_rpc_sensor_model.world_to_image(GeodeticWorldCoordinate(world_coordinate))
+            assert np.allclose(expected.coordinate, image_coordinate)
+
+        new_world_coordinates = self.sample_rpc_sensor_model.image_to_world_batch(
+            np.array([[0.1, 0.2], [-0.1, 0.05]]), elevation_model=ConstantElevationModel(42.0)
+        )
+        assert np.allclose(
+            new_world_coordinates,
+            np.array([[radians(0.1), radians(0.2), 42.0], [radians(-0.1), radians(0.05), 42.0]]),
+            atol=1.0e-6,
+        )
+
+    def test_rpc_sensor_model_realworld_batch_image_to_world(self):
+        image_coordinates = np.array([[0.0, 13854.0], [6163.0, 6927.0], [12000.0, 100.0], [500.0, 7000.0]])
+        world_coordinates = self.realworld_rpc_sensor_model.image_to_world_batch(image_coordinates)
+        assert np.allclose(world_coordinates[:, 2], -9.0)
+        assert np.allclose(
+            self.realworld_rpc_sensor_model.world_to_image_batch(world_coordinates), image_coordinates, atol=0.001
+        )
+
+    def test_rpc_sensor_model_minimization_fallback(self):
+        from aws.osml.photogrammetry.coordinates import ImageCoordinate
+
+        # A non-finite starting point prevents the Newton-Raphson iteration from converging, so the result must come
+        # from the fallback minimization routine
+        _, converged = self.realworld_rpc_sensor_model._solve_image_to_world(
+            np.array([[6163.0, 6927.0]]),
+            self.realworld_rpc_sensor_model.default_elevation_model,
+            np.array([[np.nan, np.nan]]),
+        )
+        assert not converged[0]
+
+        world_coordinate = self.realworld_rpc_sensor_model._minimize_image_to_world(
+            ImageCoordinate([6163.0, 6927.0]),
+            self.realworld_rpc_sensor_model.default_elevation_model,
+            np.array([radians(56.3653), radians(27.2197)]),
+            None,
+        )
+        new_image_coordinate = self.realworld_rpc_sensor_model.world_to_image(world_coordinate)
+        assert np.allclose(new_image_coordinate.coordinate, [6163.0, 6927.0], atol=1.0)
+
+    def test_rpc_sensor_model_inverse_polynomial(self):
+        from aws.osml.photogrammetry.coordinates import ImageCoordinate
+        from aws.osml.photogrammetry.elevation_model import ConstantElevationModel
+
+        inverse_polynomial = self.realworld_rpc_sensor_model.fit_inverse_polynomial()
+        assert inverse_polynomial.rms_residual <= inverse_polynomial.max_residual < 0.01
+
+        image_coordinates = np.array([[0.0, 13854.0], [6163.0, 6927.0], [12000.0, 100.0], [500.0, 7000.0]])
+        elevation_model = ConstantElevationModel(25.0)
+        world_coordinates = self.realworld_rpc_sensor_model.image_to_world_batch(
+            image_coordinates, elevation_model=elevation_model
+        )
+        assert np.allclose(world_coordinates[:, 2], 25.0)
+        assert np.allclose(
+            self.realworld_rpc_sensor_model.world_to_image_batch(world_coordinates), image_coordinates, atol=0.01
+        )
+        world_coordinate = self.realworld_rpc_sensor_model.image_to_world(
+            ImageCoordinate(image_coordinates[1]), elevation_model=elevation_model
+        )
+        assert np.allclose(world_coordinate.coordinate, world_coordinates[1])
+
+        # An inverse that does not meet the tolerance only provides the initial guesses for the iterative solver
+        self.realworld_rpc_sensor_model.inverse_pixel_tolerance = 0.0
+        refined_world_coordinates = self.realworld_rpc_sensor_model.image_to_world_batch(
+            image_coordinates, elevation_model=elevation_model
+        )
+        assert np.allclose(
+            self.realworld_rpc_sensor_model.world_to_image_batch(refined_world_coordinates), image_coordinates, atol=0.001
+        )
+
     @staticmethod
     def build_rpc_sensor_model():
         from aws.osml.photogrammetry.rpc_sensor_model import RPCPolynomial, RPCSensorModel
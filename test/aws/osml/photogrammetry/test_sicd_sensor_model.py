@@ -23,8 +23,10 @@ from aws.osml.photogrammetry import (
     SICDSensorModel,
     WorldCoordinate,
     geocentric_to_geodetic,
+    geocentric_to_geodetic_array,
     geodetic_to_geocentric,
 )
+from aws.osml.photogrammetry.sicd_sensor_model import HAERRDotSurfaceProjection
 
 
 class TestSICDSensorModel(unittest.TestCase):
@@ -277,3 +279,190 @@ class TestSICDSensorModel(unittest.TestCase):
         calculated_image_scp = sicd_sensor_model.world_to_image(geo_scp_world_coordinate)
 
         assert np.allclose(calculated_image_scp.coordinate, scp_pixel.coordinate)
+
+    def test_image_to_world_batch(self):
+        sicd: sicd121.SICD = sicd_parser.from_path(Path("./test/data/sicd/example.sicd121.capella.xml"))
+
+        scp_ecf = WorldCoordinate(xyztype_to_ndarray(sicd.geo_data.scp.ecf))
+        scp_pixel = ImageCoordinate([sicd.image_data.scppixel.col, sicd.image_data.scppixel.row])
+
+        image_plane = SARImageCoordConverter(
+            scp_pixel=scp_pixel,
+            scp_ecf=scp_ecf,
+            u_row=xyztype_to_ndarray(sicd.grid.row.uvect_ecf),
+            u_col=xyztype_to_ndarray(sicd.grid.col.uvect_ecf),
+            row_ss=sicd.grid.row.ss,
+            col_ss=sicd.grid.col.ss,
+            first_pixel=ImageCoordinate([sicd.image_data.first_col, sicd.image_data.first_row]),
+        )
+
+        projection_set = INCAProjectionSet(
+            r_ca_scp=sicd.rma.inca.r_ca_scp,
+            inca_time_coa_poly=poly1d_to_native(sicd.rma.inca.time_capoly),
+            drate_sf_poly=poly2d_to_native(sicd.rma.inca.drate_sfpoly),
+            coa_time_poly=poly2d_to_native(sicd.grid.time_coapoly),
+            arp_poly=xyzpoly_to_native(sicd.position.arppoly),
+        )
+
+        sicd_sensor_model = SICDSensorModel(
+            coord_converter=image_plane,
+            coa_projection_set=projection_set,
+            u_spn=SICDSensorModel.compute_u_spn(
+                scp_ecf=scp_ecf,
+                scp_arp=xyztype_to_ndarray(sicd.scpcoa.arppos),
+                scp_varp=xyztype_to_ndarray(sicd.scpcoa.arpvel),
+                side_of_track=str(sicd.scpcoa.side_of_track.value),
+            ),
+            side_of_track=str(sicd.scpcoa.side_of_track.value),
+        )
+
+        xs, ys = np.meshgrid(
+            np.linspace(0, sicd.image_data.num_cols, 5), np.linspace(0, sicd.image_data.num_rows, 5), indexing="xy"
+        )
+        image_coordinates = np.column_stack([xs.ravel(), ys.ravel()])
+
+        world_coordinates = sicd_sensor_model.image_to_world_batch(image_coordinates)
+        assert world_coordinates.shape == (25, 3)
+        for image_coordinate, world_coordinate in zip(image_coordinates, world_coordinates):
+            expected = sicd_sensor_model.image_to_world(ImageCoordinate(image_coordinate))
+            assert np.allclose(world_coordinate, expected.coordinate)
+
+        # Projecting the same pixels onto a surface of constant height should keep every point on that surface
+        scp_lle = geocentric_to_geodetic(scp_ecf)
+        hae_surface_projection = HAERRDotSurfaceProjection(
+            scp_ecf=scp_ecf, side_of_track=str(sicd.scpcoa.side_of_track.value), hae=scp_lle.elevation + 100.0
+        )
+        row_col = image_coordinates[:, ::-1]
+        r_tgt_coa, r_dot_tgt_coa, time_coa, arp_coa, varp_coa = projection_set.precise_rrdot_computation(
+            image_plane.rowcol_to_xrowycol(row_col)
+        )
+        hae_points = geocentric_to_geodetic_array(
+            hae_surface_projection.rrdot_to_ground(r_tgt_coa, r_dot_tgt_coa, arp_coa, varp_coa)
+        )
+        assert np.allclose(hae_points[:, 2], scp_lle.elevation + 100.0, atol=0.001)
+        for index in [0, 12, 24]:
+            single_point = hae_surface_projection.rrdot_to_ground(
+                r_tgt_coa[index], r_dot_tgt_coa[index], arp_coa[index], varp_coa[index]
+            )
+            assert np.allclose(geocentric_to_geodetic_array(single_point)[0], hae_points[index])
+
+    def test_world_to_image_batch(self):
+        sicd: sicd121.SICD = sicd_parser.from_path(Path("./test/data/sicd/example.sicd121.pfa.xml"))
+
+        scp_ecf = WorldCoordinate(xyztype_to_ndarray(sicd.geo_data.scp.ecf))
+        scp_pixel = ImageCoordinate([sicd.image_data.scppixel.col, sicd.image_data.scppixel.row])
+
+        image_plane = SARImageCoordConverter(
+            scp_pixel=scp_pixel,
+            scp_ecf=scp_ecf,
+            u_row=xyztype_to_ndarray(sicd.grid.row.uvect_ecf),
+            u_col=xyztype_to_ndarray(sicd.grid.col.uvect_ecf),
+            row_ss=sicd.grid.row.ss,
+            col_ss=sicd.grid.col.ss,
+            first_pixel=ImageCoordinate([sicd.image_data.first_col, sicd.image_data.first_row]),
+        )
+
+        projection_set = PFAProjectionSet(
+            scp_ecf=scp_ecf,
+            polar_ang_poly=poly1d_to_native(sicd.pfa.polar_ang_poly),
+            spatial_freq_sf_poly=poly1d_to_native(sicd.pfa.spatial_freq_sfpoly),
+            coa_time_poly=poly2d_to_native(sicd.grid.time_coapoly),
+            arp_poly=xyzpoly_to_native(sicd.position.arppoly),
+        )
+
+        sicd_sensor_model = SICDSensorModel(
+            coord_converter=image_plane,
+            coa_projection_set=projection_set,
+            u_spn=SICDSensorModel.compute_u_spn(
+                scp_ecf=scp_ecf,
+                scp_arp=xyztype_to_ndarray(sicd.scpcoa.arppos),
+                scp_varp=xyztype_to_ndarray(sicd.scpcoa.arpvel),
+                side_of_track=str(sicd.scpcoa.side_of_track.value),
+            ),
+            side_of_track=str(sicd.scpcoa.side_of_track.value),
+            u_gpn=xyztype_to_ndarray(sicd.pfa.fpn),
+        )
+
+        xs, ys = np.meshgrid(
+            np.linspace(0, sicd.image_data.num_cols, 5), np.linspace(0, sicd.image_data.num_rows, 5), indexing="xy"
+        )
+        image_coordinates = np.column_stack([xs.ravel(), ys.ravel()])
+
+        # Move the points off the ground plane so the projection has to iterate to find the image locations
+        world_coordinates = sicd_sensor_model.image_to_world_batch(image_coordinates)
+        world_coordinates[:, 2] += np.linspace(-50.0, 50.0, world_coordinates.shape[0])
+
+        new_image_coordinates = sicd_sensor_model.world_to_image_batch(world_coordinates)
+        assert new_image_coordinates.shape == (25, 2)
+        for world_coordinate, image_coordinate in zip(world_coordinates, new_image_coordinates):
+            expected = sicd_sensor_model.world_to_image(GeodeticWorldCoordinate(world_coordinate))
+            assert np.allclose(image_coordinate, expected.coordinate)
+
+        # The scene center point should still map back to the SCP pixel when mixed in with the other points
+        scp_lle = geocentric_to_geodetic(scp_ecf)
+        mixed_image_coordinates = sicd_sensor_model.world_to_image_batch(
+            np.vstack([world_coordinates[:3], scp_lle.coordinate])
+        )
+        assert np.allclose(mixed_image_coordinates[3], scp_pixel.coordinate)
+
+    def test_unsolvable_points_in_batch(self):
+        sicd: sicd121.SICD = sicd_parser.from_path(Path("./test/data/sicd/example.sicd121.capella.xml"))
+
+        scp_ecf = WorldCoordinate(xyztype_to_ndarray(sicd.geo_data.scp.ecf))
+        scp_pixel = ImageCoordinate([sicd.image_data.scppixel.col, sicd.image_data.scppixel.row])
+
+        image_plane = SARImageCoordConverter(
+            scp_pixel=scp_pixel,
+            scp_ecf=scp_ecf,
+            u_row=xyztype_to_ndarray(sicd.grid.row.uvect_ecf),
+            u_col=xyztype_to_ndarray(sicd.grid.col.uvect_ecf),
+            row_ss=sicd.grid.row.ss,
+            col_ss=sicd.grid.col.ss,
+            first_pixel=ImageCoordinate([sicd.image_data.first_col, sicd.image_data.first_row]),
+        )
+
+        projection_set = INCAProjectionSet(
+            r_ca_scp=sicd.rma.inca.r_ca_scp,
+            inca_time_coa_poly=poly1d_to_native(sicd.rma.inca.time_capoly),
+            drate_sf_poly=poly2d_to_native(sicd.rma.inca.drate_sfpoly),
+            coa_time_poly=poly2d_to_native(sicd.grid.time_coapoly),
+            arp_poly=xyzpoly_to_native(sicd.position.arppoly),
+        )
+
+        sicd_sensor_model = SICDSensorModel(
+            coord_converter=image_plane,
+            coa_projection_set=projection_set,
+            u_spn=SICDSensorModel.compute_u_spn(
+                scp_ecf=scp_ecf,
+                scp_arp=xyztype_to_ndarray(sicd.scpcoa.arppos),
+                scp_varp=xyztype_to_ndarray(sicd.scpcoa.arpvel),
+                side_of_track=str(sicd.scpcoa.side_of_track.value),
+            ),
+            side_of_track=str(sicd.scpcoa.side_of_track.value),
+        )
+
+        # The range to a pixel a million rows before the first row is shorter than the ARP's height above the
+        # ground plane so that row has no solution. It should not prevent the other points from being projected.
+        image_coordinates = np.array([[0.0, 0.0], [0.0, -1.0e6], [100.0, 100.0], [0.0, -1.0e6]])
+        world_coordinates = sicd_sensor_model.image_to_world_batch(image_coordinates)
+        assert world_coordinates.shape == (4, 3)
+        assert np.all(np.isnan(world_coordinates[[1, 3]]))
+        for index in [0, 2]:
+            expected = sicd_sensor_model.image_to_world(ImageCoordinate(image_coordinates[index]))
+            assert np.allclose(world_coordinates[index], expected.coordinate)
+
+        dem_world_coordinates = sicd_sensor_model.image_to_world_batch(
+            image_coordinates, elevation_model=ConstantElevationModel(10.0)
+        )
+        assert np.all(np.isnan(dem_world_coordinates[[1, 3]]))
+        assert np.allclose(dem_world_coordinates[[0, 2], 2], 10.0)
+
+        # The single point projection still reports an error for a point that has no solution
+        with self.assertRaises(ValueError):
+            sicd_sensor_model.image_to_world(ImageCoordinate(image_coordinates[1]))
+
+        # A scene point far above the image has no image location but the other points still do
+        scene_points = np.vstack([world_coordinates[[0, 2]], world_coordinates[0] + np.array([0.0, 0.0, 2.0e6])])
+        new_image_coordinates = sicd_sensor_model.world_to_image_batch(scene_points)
+        assert np.allclose(new_image_coordinates[:2], image_coordinates[[0, 2]], atol=0.01)
+        assert np.all(np.isnan(new_image_coordinates[2]))
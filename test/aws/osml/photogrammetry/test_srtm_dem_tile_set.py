@@ -29,6 +29,18 @@ class TestSRTMDEMTileSet(unittest.TestCase):
         tile_path = tile_set.find_tile_id(GeodeticWorldCoordinate([radians(0.0), radians(0.0), 0.0]))
         assert "CustomPrefix_n00_e000_?.foo" == tile_path
 
+    def test_availability_index(self):
+        from aws.osml.photogrammetry.coordinates import GeodeticWorldCoordinate
+        from aws.osml.photogrammetry.dem_tile_availability import DEMTileAvailabilityIndex
+        from aws.osml.photogrammetry.srtm_dem_tile_set import SRTMTileSet
+
+        tile_set = SRTMTileSet(availability_index=DEMTileAvailabilityIndex.from_listing_file("./test/data/SRTM1-list.txt"))
+        tile_path = tile_set.find_tile_id(GeodeticWorldCoordinate([radians(6.5), radians(0.5), 0.0]))
+        assert "n00_e006_1arc_v3.tif" == tile_path
+
+        # There is no tile for this open ocean location in the listing
+        assert tile_set.find_tile_id(GeodeticWorldCoordinate([radians(0.5), radians(0.5), 0.0])) is None
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,83 @@
+#  Copyright 2025-2025 General Atomics Integrated Intelligence, Inc.
+
+import pickle
+import unittest
+
+import numpy as np
+import pytest
+
+
+class TestProjectiveTransform(unittest.TestCase):
+    def test_estimate(self):
+        from aws.osml.photogrammetry.transforms import ProjectiveTransform
+
+        src = np.array([[0.0, 0.0], [100.0, 0.0], [100.0, 50.0], [0.0, 50.0]])
+        dst = np.array([[10.0, 20.0], [60.0, 20.0], [60.0, 45.0], [10.0, 45.0]])
+        transform = ProjectiveTransform.estimate(src, dst)
+        assert np.allclose(transform.forward(src), dst)
+        assert np.allclose(transform.inverse(dst), src)
+        assert np.allclose(transform.matrix_parameters, [10.0, 0.5, 0.0, 20.0, 0.0, 0.5, 0.0, 0.0], atol=1.0e-9)
+        assert np.allclose(transform.matrix @ transform.inverse_matrix, np.eye(3))
+
+    def test_matches_parameter_equations(self):
+        from aws.osml.photogrammetry.transforms import ProjectiveTransform
+
+        a0, a1, a2, b0, b1, b2, c0, c1 = [5.0, 1.2, 0.1, -3.0, 0.05, 0.9, 1.0e-4, -2.0e-4]
+        transform = ProjectiveTransform([a0, a1, a2, b0, b1, b2, c0, c1])
+        coordinates = np.array([[0.0, 0.0], [120.0, 40.0], [-15.0, 300.0]])
+        x = coordinates[:, 0]
+        y = coordinates[:, 1]
+        expected = np.column_stack(
+            ((a0 + a1 * x + a2 * y) / (1 + c0 * x + c1 * y), (b0 + b1 * x + b2 * y) / (1 + c0 * x + c1 * y))
+        )
+        assert np.allclose(transform.forward(coordinates), expected)
+        assert np.allclose(transform.inverse(expected), coordinates)
+
+        # The single point versions match the array versions
+        for coordinate, expected_coordinate in zip(coordinates, expected):
+            assert np.allclose(transform.forward_point(*coordinate), expected_coordinate)
+            assert np.allclose(transform.inverse_point(*expected_coordinate), coordinate)
+
+    def test_composition(self):
+        from aws.osml.photogrammetry.transforms import ProjectiveTransform
+
+        first = ProjectiveTransform([5.0, 1.2, 0.1, -3.0, 0.05, 0.9, 1.0e-4, -2.0e-4])
+        second = ProjectiveTransform([-10.0, 0.5, 0.0, 7.0, 0.0, 0.5, 0.0, 0.0])
+        combined = first.then(second)
+        coordinates = np.array([[0.0, 0.0], [120.0, 40.0], [-15.0, 300.0]])
+        assert np.allclose(combined.forward(coordinates), second.forward(first.forward(coordinates)))
+        assert np.allclose(combined.inverse(combined.forward(coordinates)), coordinates)
+        assert np.allclose(first.inverted().forward(first.forward(coordinates)), coordinates)
+
+    def test_invalid_matrices(self):
+        from aws.osml.photogrammetry.transforms import ProjectiveTransform
+
+        with pytest.raises(ValueError):
+            ProjectiveTransform.from_matrix(np.eye(2))
+        with pytest.raises(ValueError):
+            ProjectiveTransform([0.0, 1.0, 2.0, 0.0, 2.0, 4.0, 0.0, 0.0])
+
+    def test_set_matrix_parameters(self):
+        from aws.osml.photogrammetry.transforms import ProjectiveTransform
+
+        transform = ProjectiveTransform([5.0, 1.2, 0.1, -3.0, 0.05, 0.9, 1.0e-4, -2.0e-4])
+        transform.matrix_parameters = [10.0, 0.5, 0.0, 20.0, 0.0, 0.5, 0.0, 0.0]
+        assert np.allclose(transform.matrix_parameters, [10.0, 0.5, 0.0, 20.0, 0.0, 0.5, 0.0, 0.0])
+        assert np.allclose(transform.forward([[100.0, 50.0]]), [[60.0, 45.0]])
+        assert np.allclose(transform.inverse_point(60.0, 45.0), [100.0, 50.0])
+        assert np.allclose(transform.matrix @ transform.inverse_matrix, np.eye(3))
+
+        with pytest.raises(ValueError):
+            transform.matrix_parameters = [0.0, 1.0, 2.0, 0.0, 2.0, 4.0, 0.0, 0.0]
+
+    def test_pickle(self):
+        from aws.osml.photogrammetry.transforms import ProjectiveTransform
+
+        transform = ProjectiveTransform([5.0, 1.2, 0.1, -3.0, 0.05, 0.9, 1.0e-4, -2.0e-4])
+        copy = pickle.loads(pickle.dumps(transform))
+        assert np.array_equal(copy.matrix, transform.matrix)
+        assert copy.inverse_point(10.0, 20.0) == transform.inverse_point(10.0, 20.0)
+
+
+if __name__ == "__main__":
+    unittest.main()